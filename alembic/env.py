@@ -14,8 +14,12 @@ import app.modules.aula.models
 import app.modules.auth.models
 import app.modules.calendario.models
 import app.modules.centro.models
+import app.modules.changes.models
 import app.modules.clase.models
+import app.modules.conflicto.models
 import app.modules.edificio.models
+import app.modules.historial.models
+import app.modules.horario.models
 import app.modules.materia.models
 import app.modules.profesor.models
 import app.modules.seccion.models
@@ -0,0 +1,51 @@
+"""Add commit-ordered change versions
+
+Revision ID: 4b8e1d6c2f90
+Revises: d751f0478d1e
+Create Date: 2026-10-20 09:31:52.640118
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "4b8e1d6c2f90"
+down_revision: Union[str, None] = "d751f0478d1e"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "changecounter",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("version", sa.Integer(), nullable=False),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    with op.batch_alter_table("changelog") as batch_op:
+        batch_op.add_column(sa.Column("version", sa.Integer(), nullable=True))
+
+    # Entries logged so far keep their id as version; the counter goes on
+    # from the newest
+    op.execute("UPDATE changelog SET version = id")
+    op.execute(
+        "INSERT INTO changecounter (id, version) "
+        "SELECT 1, COALESCE(MAX(version), 0) FROM changelog"
+    )
+
+    with op.batch_alter_table("changelog") as batch_op:
+        batch_op.alter_column("version", existing_type=sa.Integer(), nullable=False)
+        batch_op.create_index(
+            batch_op.f("ix_changelog_version"), ["version"], unique=True
+        )
+
+
+def downgrade() -> None:
+    with op.batch_alter_table("changelog") as batch_op:
+        batch_op.drop_index(batch_op.f("ix_changelog_version"))
+        batch_op.drop_column("version")
+    op.drop_table("changecounter")
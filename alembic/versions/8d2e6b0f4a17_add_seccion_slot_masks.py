@@ -0,0 +1,105 @@
+"""Add seccion slot masks
+
+Revision ID: 8d2e6b0f4a17
+Revises: 3c1f9a7d52e4
+Create Date: 2026-10-19 15:40:08.203114
+
+"""
+
+from collections import defaultdict
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "8d2e6b0f4a17"
+down_revision: Union[str, None] = "3c1f9a7d52e4"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+SLOT_COLUMNS = ("slots_0", "slots_1", "slots_2")
+
+# The grid as of this revision: 30 minute cells from 07:00, 32 per dia, for
+# dias 1 to 6, stored as three signed 64-bit words of two dias each
+SLOT_MINUTES = 30
+DAY_START = 7 * 60
+SLOTS_PER_DAY = 32
+DIAS = 6
+WORD_BITS = 64
+WORD_MASK = (1 << WORD_BITS) - 1
+
+
+def _slot(minutes):
+    return min(max((minutes - DAY_START) // SLOT_MINUTES, 0), SLOTS_PER_DAY - 1)
+
+
+def _mask(clases):
+    mask = 0
+    for dia, hora_inicio, hora_fin in clases:
+        if not dia or not 1 <= dia <= DIAS or hora_inicio is None or hora_fin is None:
+            continue
+        start = hora_inicio.hour * 60 + hora_inicio.minute
+        end = hora_fin.hour * 60 + hora_fin.minute
+        if end <= start:
+            continue
+        first, last = _slot(start), _slot(end - 1)
+        cells = ((1 << (last - first + 1)) - 1) << first
+        mask |= cells << ((dia - 1) * SLOTS_PER_DAY)
+    return mask
+
+
+def _words(mask):
+    words = []
+    for index in range(len(SLOT_COLUMNS)):
+        word = (mask >> (index * WORD_BITS)) & WORD_MASK
+        words.append(word - (1 << WORD_BITS) if word >> (WORD_BITS - 1) else word)
+    return words
+
+
+def upgrade() -> None:
+    for column in SLOT_COLUMNS:
+        op.add_column(
+            "seccion",
+            sa.Column(column, sa.BigInteger(), server_default="0", nullable=False),
+        )
+
+    # Backfill from the existing clases
+    connection = op.get_bind()
+    clase = sa.table(
+        "clase",
+        sa.column("seccion_id"),
+        sa.column("dia"),
+        sa.column("hora_inicio", sa.Time()),
+        sa.column("hora_fin", sa.Time()),
+    )
+    seccion = sa.table(
+        "seccion", sa.column("id"), *(sa.column(column) for column in SLOT_COLUMNS)
+    )
+
+    clases = defaultdict(list)
+    rows = connection.execute(
+        sa.select(
+            clase.c.seccion_id, clase.c.dia, clase.c.hora_inicio, clase.c.hora_fin
+        )
+    )
+    for seccion_id, *schedule in rows:
+        clases[seccion_id].append(schedule)
+
+    parameters = [
+        {"seccion_id": seccion_id, **dict(zip(SLOT_COLUMNS, _words(_mask(schedule))))}
+        for seccion_id, schedule in clases.items()
+    ]
+    if parameters:
+        connection.execute(
+            seccion.update()
+            .where(seccion.c.id == sa.bindparam("seccion_id"))
+            .values({column: sa.bindparam(column) for column in SLOT_COLUMNS}),
+            parameters,
+        )
+
+
+def downgrade() -> None:
+    for column in reversed(SLOT_COLUMNS):
+        op.drop_column("seccion", column)
@@ -0,0 +1,146 @@
+"""
+Streaming NDJSON / CSV exports.
+
+Rows are pulled from the repository cursor in batches and encoded into ~64 KB
+chunks (gzip compressed when the client accepts it), so an export of a whole
+calendario holds only one batch of rows in memory at a time.
+"""
+
+import csv
+import io
+import zlib
+from collections.abc import Iterable, Iterator
+from enum import Enum
+
+from fastapi import Request
+from fastapi.responses import StreamingResponse
+from pydantic_core import to_json
+from sqlmodel import SQLModel
+
+from app.core.exceptions import BadRequestException
+
+CHUNK_SIZE = 64 * 1024
+
+
+class ExportFormat(str, Enum):
+    ndjson = "ndjson"
+    csv = "csv"
+
+
+MEDIA_TYPES = {
+    ExportFormat.ndjson: "application/x-ndjson",
+    ExportFormat.csv: "text/csv; charset=utf-8",
+}
+
+
+def parse_columns(model: type[SQLModel], columns: str | None) -> list[str]:
+    """Columns requested as a comma separated list, all of them by default"""
+    available = list(model.__table__.columns.keys())
+    if not columns:
+        return available
+
+    selected = [column.strip() for column in columns.split(",") if column.strip()]
+    unknown = [column for column in selected if column not in available]
+
+    if unknown or not selected:
+        raise BadRequestException(
+            f"Unknown columns: {', '.join(unknown)}. "
+            f"Available: {', '.join(available)}."
+        )
+
+    return selected
+
+
+def _csv_value(value):
+    return value.isoformat() if hasattr(value, "isoformat") else value
+
+
+def _ndjson_lines(rows: Iterable[tuple], columns: list[str]) -> Iterator[bytes]:
+    for row in rows:
+        yield to_json(dict(zip(columns, row))) + b"\n"
+
+
+def _csv_lines(rows: Iterable[tuple], columns: list[str]) -> Iterator[bytes]:
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(columns)
+
+    for row in rows:
+        writer.writerow([_csv_value(value) for value in row])
+        if buffer.tell() >= CHUNK_SIZE:
+            yield buffer.getvalue().encode()
+            buffer.seek(0)
+            buffer.truncate()
+
+    yield buffer.getvalue().encode()
+
+
+def _chunked(lines: Iterable[bytes]) -> Iterator[bytes]:
+    chunk = bytearray()
+    for line in lines:
+        chunk += line
+        if len(chunk) >= CHUNK_SIZE:
+            yield bytes(chunk)
+            chunk.clear()
+    if chunk:
+        yield bytes(chunk)
+
+
+def _gzipped(chunks: Iterable[bytes]) -> Iterator[bytes]:
+    compressor = zlib.compressobj(6, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+    for chunk in chunks:
+        data = compressor.compress(chunk)
+        if data:
+            yield data
+    yield compressor.flush()
+
+
+def accepts_gzip(request: Request) -> bool:
+    return "gzip" in request.headers.get("accept-encoding", "").lower()
+
+
+def _response(
+    request: Request,
+    chunks: Iterable[bytes],
+    media_type: str,
+    headers: dict[str, str] | None = None,
+) -> StreamingResponse:
+    headers = {**(headers or {}), "vary": "Accept-Encoding"}
+
+    if accepts_gzip(request):
+        chunks = _gzipped(chunks)
+        headers["content-encoding"] = "gzip"
+
+    return StreamingResponse(chunks, media_type=media_type, headers=headers)
+
+
+def export_response(
+    request: Request,
+    rows: Iterable[tuple],
+    columns: list[str],
+    format: ExportFormat,
+    filename: str,
+) -> StreamingResponse:
+    if format == ExportFormat.csv:
+        chunks = _chunked(_csv_lines(rows, columns))
+    else:
+        chunks = _chunked(_ndjson_lines(rows, columns))
+
+    return _response(
+        request,
+        chunks,
+        MEDIA_TYPES[format],
+        {"content-disposition": f'attachment; filename="{filename}.{format.value}"'},
+    )
+
+
+def ndjson_response(
+    request: Request,
+    documents: Iterable[dict],
+    headers: dict[str, str] | None = None,
+) -> StreamingResponse:
+    """Stream JSON documents one per line"""
+    lines = (to_json(document) + b"\n" for document in documents)
+    return _response(
+        request, _chunked(lines), MEDIA_TYPES[ExportFormat.ndjson], headers
+    )
@@ -0,0 +1,59 @@
+from datetime import time
+
+from app.core.exceptions import BadRequestException
+from app.modules.seccion import slots
+
+
+def parse_list(value: str | None) -> list[str] | None:
+    """Comma separated query parameter, None when absent"""
+    if value is None:
+        return None
+    return [item.strip() for item in value.split(",") if item.strip()]
+
+
+def parse_int_list(value: str | None, name: str) -> list[int] | None:
+    items = parse_list(value)
+    if items is None:
+        return None
+
+    try:
+        return [int(item) for item in items]
+    except ValueError:
+        raise BadRequestException(f"{name} must be a comma separated list of integers.")
+
+
+def parse_slots(value: str | None, name: str, whole_cells: bool = False) -> int | None:
+    """
+    Weekly slot mask from a comma separated list of ``dia`` (the whole dia) or
+    ``dia:HH:MM-HH:MM`` items, e.g. ``1:07:00-11:00,3,5:16:00-18:00``. With
+    ``whole_cells`` only the cells entirely inside each window are set, as
+    needed for free time; otherwise every cell a window touches is.
+    """
+    items = parse_list(value)
+    if items is None:
+        return None
+
+    mask = 0
+    try:
+        for item in items:
+            dia, _, window = item.partition(":")
+            dia = int(dia)
+            if not 1 <= dia <= slots.DIAS:
+                raise ValueError
+            if not window:
+                mask |= slots.dias_mask([dia])
+                continue
+
+            inicio, fin = (time.fromisoformat(part) for part in window.split("-"))
+            if fin <= inicio:
+                raise ValueError
+            if whole_cells:
+                mask |= slots.window_mask(dia, inicio, fin)
+            else:
+                mask |= slots.clase_mask(dia, inicio, fin)
+    except ValueError:
+        raise BadRequestException(
+            f"{name} must be a comma separated list of dia or dia:HH:MM-HH:MM items."
+        )
+
+    return mask
@@ -0,0 +1,119 @@
+"""
+Direct JSON serialization of ORM rows.
+
+Routes returning ORM objects pay for two Pydantic validations per row (the
+route's own model construction and FastAPI's response_model check) before the
+JSON is dumped. The builders here read the attributes declared by a read schema
+straight off the rows and dump the result in one ``to_json`` call, producing
+the same JSON document. Routes keep their ``response_model`` so the OpenAPI
+schema does not change.
+"""
+
+import types
+from collections.abc import Callable, Iterable
+from functools import cache
+from inspect import isclass
+from typing import Any, Union, get_args, get_origin
+
+from fastapi import Response
+from pydantic import BaseModel, TypeAdapter
+from pydantic_core import to_json
+
+
+def _identity(value: Any) -> Any:
+    return value
+
+
+def _value_builder(annotation: Any) -> Callable[[Any], Any]:
+    origin = get_origin(annotation)
+
+    if origin in (Union, types.UnionType):
+        args = [arg for arg in get_args(annotation) if arg is not type(None)]
+        if len(args) != 1:
+            return _identity
+        inner = _value_builder(args[0])
+        if inner is _identity:
+            return _identity
+        return lambda value: None if value is None else inner(value)
+
+    if origin is list:
+        (item_annotation,) = get_args(annotation)
+        item = _value_builder(item_annotation)
+        if item is _identity:
+            return list
+        return lambda value: [item(v) for v in value]
+
+    if isclass(annotation) and issubclass(annotation, BaseModel):
+        return row_builder(annotation)
+
+    return _identity
+
+
+def _is_plain(schema: type[BaseModel]) -> bool:
+    """Whether attribute copying reproduces the schema's serialization"""
+    decorators = schema.__pydantic_decorators__
+    if (
+        decorators.field_serializers
+        or decorators.model_serializers
+        or decorators.model_validators
+        or decorators.computed_fields
+    ):
+        return False
+    if any(
+        field.alias or field.serialization_alias
+        for field in schema.model_fields.values()
+    ):
+        return False
+    return all(
+        validator.info.mode == "before"
+        for validator in decorators.field_validators.values()
+    )
+
+
+@cache
+def row_builder(schema: type[BaseModel]) -> Callable[[Any], dict]:
+    """Compile a function turning an ORM row into the schema's JSON document"""
+    if not _is_plain(schema):
+        adapter = TypeAdapter(schema)
+        return lambda row: adapter.dump_python(
+            adapter.validate_python(row, from_attributes=True), mode="json"
+        )
+
+    before: dict[str, list[Callable[[Any], Any]]] = {}
+    for validator in schema.__pydantic_decorators__.field_validators.values():
+        for name in validator.info.fields:
+            before.setdefault(name, []).append(validator.func)
+
+    fields = [
+        (name, _value_builder(field.annotation), before.get(name, []))
+        for name, field in schema.model_fields.items()
+    ]
+
+    def build(row: Any) -> dict:
+        # Loaded attributes are read from the instance dict, skipping the ORM
+        # descriptors; anything unloaded goes through getattr and lazy loads.
+        loaded = row.__dict__
+        data = {}
+        for name, convert, validators in fields:
+            value = loaded[name] if name in loaded else getattr(row, name)
+            for validator in validators:
+                value = validator(value)
+            data[name] = convert(value) if convert is not _identity else value
+        return data
+
+    return build
+
+
+def model_response(schema: type[BaseModel], row: Any) -> Response:
+    return Response(
+        content=to_json(row_builder(schema)(row)), media_type="application/json"
+    )
+
+
+def page_response(schema: type[BaseModel], rows: Iterable[Any], total: int) -> Response:
+    """Response with the shape of ``Pagination[schema]``"""
+    build = row_builder(schema)
+    return Response(
+        content=to_json({"total": total, "results": [build(row) for row in rows]}),
+        media_type="application/json",
+    )
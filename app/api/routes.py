@@ -1,17 +1,33 @@
-from fastapi import APIRouter
+from typing import Annotated
 
-from app.api.schemas import Info
+from fastapi import APIRouter, Depends
+
+from app.api.dependencies.auth import user_is_staff
+from app.api.schemas import CacheStats, Info
+from app.core.cache import response_cache
 from app.modules.aula.api.routes import router as aulas_router
 from app.modules.auth.api.routes import router as auth_router
+from app.modules.availability.api.routes import router as availability_router
 from app.modules.calendario.api.routes import router as calendarios_router
 from app.modules.centro.api.routes import router as centros_router
+from app.modules.changes.api.routes import router as changes_router
 from app.modules.clase.api.routes import router as clases_router
+from app.modules.conflicto.api.routes import router as conflictos_router
 from app.modules.edificio.api.routes import router as edificios_router
+from app.modules.historial.api.routes import router as historial_router
+from app.modules.horario.api.routes import router as horarios_router
+from app.modules.ics.api.routes import router as ics_router
+from app.modules.live.api.routes import router as live_router
 from app.modules.materia.api.routes import router as materias_router
+from app.modules.occupancy.api.routes import router as occupancy_router
 from app.modules.profesor.api.routes import router as profesores_router
 from app.modules.seccion.api.routes import router as secciones_router
+from app.modules.snapshot.api.routes import router as snapshots_router
+from app.modules.stream.api.routes import router as stream_router
 from app.modules.tasks.api.routes import router as tasks_router
+from app.modules.timetable.api.routes import router as timetables_router
 from app.modules.users.api.routes import router as users_router
+from app.modules.users.models import User
 
 router = APIRouter()
 
@@ -21,6 +37,11 @@ async def get_info():
     return Info()
 
 
+@router.get("/cache", response_model=CacheStats, tags=["Cache"])
+async def get_cache_stats(user: Annotated[User, Depends(user_is_staff)]):
+    return CacheStats(**response_cache.stats())
+
+
 router.include_router(calendarios_router, prefix="/calendarios", tags=["Calendarios"])
 router.include_router(
     centros_router, prefix="/centros", tags=["Centros Universitarios"]
@@ -31,6 +52,19 @@ router.include_router(profesores_router, prefix="/profesores", tags=["Profesores
 router.include_router(clases_router, prefix="/clases", tags=["Clases"])
 router.include_router(edificios_router, prefix="/edificios", tags=["Edificios"])
 router.include_router(aulas_router, prefix="/aulas", tags=["Aulas"])
+router.include_router(
+    availability_router, prefix="/availability", tags=["Availability"]
+)
+router.include_router(conflictos_router, prefix="/conflictos", tags=["Conflictos"])
+router.include_router(occupancy_router, prefix="/occupancy", tags=["Occupancy"])
+router.include_router(live_router, prefix="/live", tags=["Live"])
+router.include_router(horarios_router, prefix="/horarios", tags=["Horarios"])
+router.include_router(ics_router, prefix="/ics", tags=["iCalendar"])
+router.include_router(historial_router, prefix="/historial", tags=["Historial"])
+router.include_router(changes_router, prefix="/changes", tags=["Changes"])
+router.include_router(stream_router, prefix="/stream", tags=["Stream"])
+router.include_router(timetables_router, prefix="/timetables", tags=["Timetables"])
+router.include_router(snapshots_router, prefix="/snapshots", tags=["Snapshots"])
 router.include_router(auth_router, prefix="/auth", tags=["Auth"])
 router.include_router(users_router, prefix="/users", tags=["Users"])
 router.include_router(tasks_router, prefix="/tasks", tags=["Tasks"])
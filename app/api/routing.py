@@ -0,0 +1,100 @@
+import time
+from collections.abc import Callable, Coroutine, Iterable
+from typing import Any
+
+from fastapi import Request, Response, status
+from fastapi.routing import APIRoute
+from sqlmodel import SQLModel
+
+from app.core.cache import response_cache
+from app.core.config import settings
+
+
+def etag_matches(if_none_match: str | None, etag: str) -> bool:
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    return etag in (tag.strip().removeprefix("W/") for tag in if_none_match.split(","))
+
+
+def cached_route(
+    *models: type[SQLModel],
+    cache_control: str | None = None,
+    key_params: Callable[[Request], Iterable[tuple[str, str]]] | None = None,
+) -> type[APIRoute]:
+    """
+    Route class serving GET responses from the response cache.
+
+    ``models`` are every table the router's responses are built from; a write
+    to any of them invalidates the cached responses of the router. Responses
+    carry a strong ETag derived from those data versions, so a matching
+    ``If-None-Match`` is answered with 304 before any dependency or query runs,
+    as long as the response is in the cache. Streamed responses (exports) are
+    never cached, so they are always sent.
+
+    ``key_params`` replaces the query parameters a response is keyed by, for
+    routes whose result also depends on something else (e.g. the clock).
+    """
+    tables = tuple(model.__tablename__ for model in models)
+
+    class CachedRoute(APIRoute):
+        def get_route_handler(
+            self,
+        ) -> Callable[[Request], Coroutine[Any, Any, Response]]:
+            handler = super().get_route_handler()
+
+            async def route_handler(request: Request) -> Response:
+                if request.method != "GET" or not settings.CACHE_ENABLED:
+                    return await handler(request)
+
+                params = (
+                    key_params(request)
+                    if key_params
+                    else request.query_params.multi_items()
+                )
+                key = response_cache.key(request.url.path, params, tables)
+                headers = {
+                    "etag": response_cache.etag(key),
+                    "cache-control": cache_control or settings.CACHE_CONTROL,
+                }
+
+                if etag_matches(
+                    request.headers.get("if-none-match"), headers["etag"]
+                ) and response_cache.record_not_modified(key):
+                    return Response(
+                        status_code=status.HTTP_304_NOT_MODIFIED, headers=headers
+                    )
+
+                cached = response_cache.get(key)
+
+                if cached:
+                    return Response(
+                        content=cached.body,
+                        headers={
+                            **headers,
+                            "content-type": cached.content_type,
+                            "x-cache": "HIT",
+                        },
+                    )
+
+                start = time.perf_counter()
+                response = await handler(request)
+                elapsed = time.perf_counter() - start
+
+                if response.status_code != 200 or not hasattr(response, "body"):
+                    return response
+
+                response_cache.set(
+                    key,
+                    response.headers.get("content-type", "application/json"),
+                    response.body,
+                    elapsed,
+                )
+                response.headers.update({**headers, "x-cache": "MISS"})
+
+                return response
+
+            return route_handler
+
+    return CachedRoute
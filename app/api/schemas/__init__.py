@@ -1,4 +1,5 @@
+from .cache import CacheStats
 from .info import Info
 from .pagination import Pagination
 
-__all__ = ["Pagination", "Info"]
+__all__ = ["Pagination", "Info", "CacheStats"]
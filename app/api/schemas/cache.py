@@ -0,0 +1,11 @@
+from pydantic import BaseModel
+
+
+class CacheStats(BaseModel):
+    hits: int
+    misses: int
+    not_modified: int
+    bytes_saved: int
+    latency_saved: float
+    entries: int | None
+    bytes: int | None
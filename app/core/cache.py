@@ -0,0 +1,338 @@
+"""
+Versioned read-through response cache.
+
+Cached responses are keyed by route, normalized query parameters and the data
+version of every table the route reads. Committed writes bump the version of
+the tables they touched, so stale entries simply stop being addressed and age
+out of the backend.
+"""
+
+import fnmatch
+import hashlib
+import struct
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from collections.abc import Iterable
+from dataclasses import dataclass
+from urllib.parse import urlencode
+
+from app.core import events
+from app.core.config import settings
+
+
+class CacheBackend:
+    """Byte store used for cached responses and data version counters"""
+
+    def get(self, key: str) -> bytes | None:
+        raise NotImplementedError
+
+    def set(self, key: str, value: bytes) -> None:
+        raise NotImplementedError
+
+    def delete(self, key: str) -> None:
+        raise NotImplementedError
+
+    def incr(self, key: str) -> int:
+        raise NotImplementedError
+
+    def counter(self, key: str) -> int:
+        raise NotImplementedError
+
+    def clear(self) -> None:
+        raise NotImplementedError
+
+    def usage(self) -> dict[str, int | None]:
+        return {"entries": None, "bytes": None}
+
+
+class MemoryCacheBackend(CacheBackend):
+    """In-process LRU bounded by entry count and total value size"""
+
+    def __init__(self, max_entries: int = 2048, max_bytes: int = 64 * 1024 * 1024):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._entries: OrderedDict[str, bytes] = OrderedDict()
+        self._counters: dict[str, int] = {}
+        self._size = 0
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> bytes | None:
+        with self._lock:
+            value = self._entries.get(key)
+            if value is not None:
+                self._entries.move_to_end(key)
+            return value
+
+    def set(self, key: str, value: bytes) -> None:
+        if len(value) > self.max_bytes:
+            return
+
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self._size -= len(previous)
+
+            self._entries[key] = value
+            self._size += len(value)
+
+            while self._entries and (
+                len(self._entries) > self.max_entries or self._size > self.max_bytes
+            ):
+                _, evicted = self._entries.popitem(last=False)
+                self._size -= len(evicted)
+
+    def delete(self, key: str) -> None:
+        with self._lock:
+            value = self._entries.pop(key, None)
+            if value is not None:
+                self._size -= len(value)
+
+    def incr(self, key: str) -> int:
+        with self._lock:
+            self._counters[key] = self._counters.get(key, 0) + 1
+            return self._counters[key]
+
+    def counter(self, key: str) -> int:
+        return self._counters.get(key, 0)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._counters.clear()
+            self._size = 0
+
+    def usage(self) -> dict[str, int | None]:
+        return {"entries": len(self._entries), "bytes": self._size}
+
+
+class SharedCacheBackend(CacheBackend):
+    """
+    Backend over a Redis compatible client shared by every worker.
+
+    The client only needs ``get``, ``set(ex=)``, ``incr``, ``delete`` and
+    ``keys``; ``LocalCacheClient`` implements the same surface in-process.
+    """
+
+    def __init__(self, client, prefix: str = "siiapi:", ttl: int | None = None):
+        self.client = client
+        self.prefix = prefix
+        self.ttl = ttl
+
+    def get(self, key: str) -> bytes | None:
+        return self.client.get(self.prefix + key)
+
+    def set(self, key: str, value: bytes) -> None:
+        self.client.set(self.prefix + key, value, ex=self.ttl)
+
+    def delete(self, key: str) -> None:
+        self.client.delete(self.prefix + key)
+
+    def incr(self, key: str) -> int:
+        return int(self.client.incr(self.prefix + key))
+
+    def counter(self, key: str) -> int:
+        value = self.client.get(self.prefix + key)
+        return int(value) if value is not None else 0
+
+    def clear(self) -> None:
+        keys = self.client.keys(self.prefix + "*")
+        if keys:
+            self.client.delete(*keys)
+
+
+class LocalCacheClient:
+    """In-process stand-in for a Redis client, used in tests and single workers"""
+
+    def __init__(self):
+        self._data: dict[str, tuple[bytes, float | None]] = {}
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> bytes | None:
+        with self._lock:
+            item = self._data.get(key)
+            if item is None:
+                return None
+            value, expires_at = item
+            if expires_at is not None and expires_at <= time.monotonic():
+                del self._data[key]
+                return None
+            return value
+
+    def set(self, key: str, value: bytes | str | int, ex: int | None = None) -> bool:
+        if not isinstance(value, bytes):
+            value = str(value).encode()
+        expires_at = time.monotonic() + ex if ex else None
+        with self._lock:
+            self._data[key] = (value, expires_at)
+        return True
+
+    def incr(self, key: str) -> int:
+        with self._lock:
+            value, expires_at = self._data.get(key, (b"0", None))
+            value = int(value) + 1
+            self._data[key] = (str(value).encode(), expires_at)
+            return value
+
+    def delete(self, *keys: str) -> int:
+        with self._lock:
+            return sum(1 for key in keys if self._data.pop(key, None) is not None)
+
+    def keys(self, pattern: str = "*") -> list[str]:
+        with self._lock:
+            return [key for key in self._data if fnmatch.fnmatchcase(key, pattern)]
+
+
+class DataVersions:
+    """Per-table version counters stored in the cache backend"""
+
+    EPOCH_KEY = "version:epoch"
+
+    def __init__(self, backend: CacheBackend):
+        self.backend = backend
+
+    def epoch(self) -> str:
+        # The epoch changes whenever the counters are lost (restart, flush), so
+        # a restarted counter can never reproduce a version seen before.
+        value = self.backend.get(self.EPOCH_KEY)
+        if value is None:
+            value = uuid.uuid4().hex[:12].encode()
+            self.backend.set(self.EPOCH_KEY, value)
+        return value.decode()
+
+    def get(self, table: str) -> int:
+        return self.backend.counter(f"version:{table}")
+
+    def bump(self, tables: Iterable[str]) -> None:
+        for table in set(tables):
+            self.backend.incr(f"version:{table}")
+
+    def stamp(self, tables: Iterable[str]) -> str:
+        """Version stamp covering every given table"""
+        versions = ".".join(str(self.get(table)) for table in sorted(tables))
+        return f"{self.epoch()}-{versions}"
+
+
+@dataclass
+class CachedResponse:
+    content_type: str
+    body: bytes
+    elapsed: float = 0.0
+
+
+# elapsed seconds of the original computation, length of the content type
+_ENTRY_HEADER = struct.Struct("!dH")
+
+
+class ResponseCache:
+    def __init__(self, backend: CacheBackend):
+        self.backend = backend
+        self.versions = DataVersions(backend)
+        self.hits = 0
+        self.misses = 0
+        self.not_modified = 0
+        self.bytes_saved = 0
+        self.latency_saved = 0.0
+
+    def key(
+        self,
+        path: str,
+        query_params: Iterable[tuple[str, str]],
+        tables: Iterable[str],
+    ) -> str:
+        query = urlencode(sorted(query_params))
+        digest = hashlib.sha1(f"{path}?{query}".encode()).hexdigest()
+        return f"response:{self.versions.stamp(tables)}:{digest}"
+
+    @staticmethod
+    def etag(key: str) -> str:
+        """Strong ETag of the data version addressed by a cache key"""
+        return '"' + hashlib.sha1(key.encode()).hexdigest()[:32] + '"'
+
+    def _load(self, key: str) -> CachedResponse | None:
+        value = self.backend.get(key)
+        if value is None:
+            return None
+
+        elapsed, length = _ENTRY_HEADER.unpack_from(value)
+        offset = _ENTRY_HEADER.size
+        return CachedResponse(
+            content_type=value[offset : offset + length].decode(),
+            body=value[offset + length :],
+            elapsed=elapsed,
+        )
+
+    def get(self, key: str) -> CachedResponse | None:
+        cached = self._load(key)
+        if cached is None:
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        self.latency_saved += cached.elapsed
+        return cached
+
+    def set(
+        self, key: str, content_type: str, body: bytes, elapsed: float = 0.0
+    ) -> None:
+        header = content_type.encode()
+        self.backend.set(key, _ENTRY_HEADER.pack(elapsed, len(header)) + header + body)
+
+    def record_not_modified(self, key: str) -> bool:
+        """
+        Account a 304 for a key with the savings of its cached response;
+        False, and nothing accounted, when no response is cached for it
+        """
+        cached = self._load(key)
+        if cached is None:
+            return False
+
+        self.not_modified += 1
+        self.bytes_saved += len(cached.body)
+        self.latency_saved += cached.elapsed
+        return True
+
+    def clear(self) -> None:
+        self.backend.clear()
+        self.hits = 0
+        self.misses = 0
+        self.not_modified = 0
+        self.bytes_saved = 0
+        self.latency_saved = 0.0
+
+    def stats(self) -> dict[str, int | float | None]:
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "not_modified": self.not_modified,
+            "bytes_saved": self.bytes_saved,
+            "latency_saved": round(self.latency_saved, 6),
+            **self.backend.usage(),
+        }
+
+
+def build_cache_backend() -> CacheBackend:
+    if settings.CACHE_BACKEND == "local":
+        return SharedCacheBackend(LocalCacheClient(), ttl=settings.CACHE_TTL)
+
+    if settings.CACHE_BACKEND == "redis":
+        try:
+            import redis
+        except ImportError as e:
+            raise RuntimeError("CACHE_BACKEND=redis requires the redis package") from e
+        return SharedCacheBackend(
+            redis.Redis.from_url(settings.CACHE_URL), ttl=settings.CACHE_TTL
+        )
+
+    return MemoryCacheBackend(
+        max_entries=settings.CACHE_MAX_ENTRIES, max_bytes=settings.CACHE_MAX_BYTES
+    )
+
+
+response_cache = ResponseCache(build_cache_backend())
+
+
+@events.on_commit
+def _bump_versions(changes: list[events.Change]) -> None:
+    response_cache.versions.bump(change.table for change in changes)
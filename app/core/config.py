@@ -18,6 +18,13 @@ def get_float(value, default=0.0):
         return default
 
 
+def get_int(value, default=0):
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return default
+
+
 class Settings:
     DB_URL: str = os.getenv("DB_URL", "sqlite:///./db.sqlite3")
 
@@ -36,6 +43,62 @@ class Settings:
     ALGORITHM: str = "HS256"
 
     SIIAU_URL: str = os.getenv("SIIAU_URL")
+    # SIIAU client: seconds to connect and between bytes of a response, retries
+    # of failed requests with jittered exponential backoff (base and cap in
+    # seconds), pooled keep-alive connections, and a circuit breaker opening
+    # after this many consecutive failed requests for SIIAU_BREAKER_RESET seconds
+    SIIAU_CONNECT_TIMEOUT: float = get_float(os.getenv("SIIAU_CONNECT_TIMEOUT"), 5.0)
+    SIIAU_READ_TIMEOUT: float = get_float(os.getenv("SIIAU_READ_TIMEOUT"), 120.0)
+    SIIAU_RETRIES: int = get_int(os.getenv("SIIAU_RETRIES"), 3)
+    SIIAU_BACKOFF: float = get_float(os.getenv("SIIAU_BACKOFF"), 1.0)
+    SIIAU_BACKOFF_MAX: float = get_float(os.getenv("SIIAU_BACKOFF_MAX"), 30.0)
+    SIIAU_POOL_SIZE: int = get_int(os.getenv("SIIAU_POOL_SIZE"), 4)
+    SIIAU_BREAKER_THRESHOLD: int = get_int(os.getenv("SIIAU_BREAKER_THRESHOLD"), 5)
+    SIIAU_BREAKER_RESET: float = get_float(os.getenv("SIIAU_BREAKER_RESET"), 60.0)
+    # Oferta pulls: secciones per page (0 asks for everything in one response)
+    # and most requests in flight at once per process
+    SIIAU_PAGE_SIZE: int = get_int(os.getenv("SIIAU_PAGE_SIZE"), 1000)
+    SIIAU_CONCURRENCY: int = get_int(os.getenv("SIIAU_CONCURRENCY"), 3)
+    # Oferta pages of at least this many characters are parsed in this many
+    # processes (0 for one per CPU, 1 to always parse in place)
+    SIIAU_PARSE_THRESHOLD: int = get_int(os.getenv("SIIAU_PARSE_THRESHOLD"), 2000000)
+    SIIAU_PARSE_PROCESSES: int = get_int(os.getenv("SIIAU_PARSE_PROCESSES"), 0)
+
+    # Local time of the campus, used to resolve "now" for schedules
+    TIMEZONE: str = os.getenv("TIMEZONE", "America/Mexico_City")
+
+    # Response cache for public GET endpoints. "memory" keeps entries and data
+    # versions per process; use "redis" (or "local" in tests) to share them
+    # between workers.
+    CACHE_ENABLED: bool = get_bool(os.getenv("CACHE_ENABLED", "true"))
+    CACHE_BACKEND: str = os.getenv("CACHE_BACKEND", "memory")
+    CACHE_URL: str = os.getenv("CACHE_URL", "redis://localhost:6379/0")
+    CACHE_TTL: int | None = get_int(os.getenv("CACHE_TTL"), None)
+    CACHE_MAX_ENTRIES: int = get_int(os.getenv("CACHE_MAX_ENTRIES"), 2048)
+    CACHE_MAX_BYTES: int = get_int(os.getenv("CACHE_MAX_BYTES"), 64 * 1024 * 1024)
+    # Default Cache-Control of cached routers; "no-cache" makes clients
+    # revalidate every poll with If-None-Match and get a 304 when unchanged.
+    CACHE_CONTROL: str = os.getenv("CACHE_CONTROL", "no-cache")
+
+    # Precompressed (calendario, centro) snapshots written by the import tasks
+    SNAPSHOT_ENABLED: bool = get_bool(os.getenv("SNAPSHOT_ENABLED", "true"))
+    SNAPSHOT_DIR: str = os.getenv("SNAPSHOT_DIR", "./snapshots")
+
+    # Cupos history: raw samples are kept this many days, then compacted into
+    # delta-encoded runs holding at most one sample per resolution (seconds)
+    CUPOS_HISTORY_RETENTION_DAYS: int = get_int(
+        os.getenv("CUPOS_HISTORY_RETENTION_DAYS"), 7
+    )
+    CUPOS_HISTORY_RESOLUTION: int = get_int(os.getenv("CUPOS_HISTORY_RESOLUTION"), 60)
+
+    # Change log entries older than this are pruned; clients further behind
+    # are told to resync
+    CHANGES_RETENTION_DAYS: int = get_int(os.getenv("CHANGES_RETENTION_DAYS"), 30)
+
+    # Seccion event streams: messages buffered per client before it is dropped
+    # as too slow, and seconds between keep-alive comments
+    STREAM_BUFFER_SIZE: int = get_int(os.getenv("STREAM_BUFFER_SIZE"), 256)
+    STREAM_HEARTBEAT: int = get_int(os.getenv("STREAM_HEARTBEAT"), 15)
 
 
 settings = Settings()
@@ -1,4 +1,6 @@
-from sqlmodel import SQLModel, create_engine
+from collections.abc import Iterator
+
+from sqlmodel import Session, SQLModel, create_engine
 
 from app.core.config import settings
 
@@ -16,11 +18,28 @@ def init_db():
     import app.modules.auth.models
     import app.modules.calendario.models
     import app.modules.centro.models
+    import app.modules.changes.models
     import app.modules.clase.models
+    import app.modules.conflicto.models
     import app.modules.edificio.models
+    import app.modules.historial.models
+    import app.modules.horario.models
     import app.modules.materia.models
     import app.modules.profesor.models
     import app.modules.seccion.models
     import app.modules.users.models
 
     SQLModel.metadata.create_all(engine)
+
+
+# Rows fetched per round trip by streaming exports; with PostgreSQL yield_per
+# also switches to a server-side cursor so memory stays flat.
+EXPORT_BATCH_SIZE = 1000
+
+
+def stream_rows(session: Session, statement, width: int) -> Iterator[tuple]:
+    """Iterate a column select as tuples, whatever the number of columns"""
+    result = session.exec(statement)
+    if width == 1:
+        return ((value,) for value in result)
+    return (tuple(row) for row in result)
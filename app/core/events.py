@@ -0,0 +1,167 @@
+"""
+Commit-time change tracking for ORM sessions.
+
+Every write flushed through a Session (repository CRUD, imports, bulk DML) is
+recorded on the session and handed to the registered listeners only after the
+transaction commits, so caches and read models never observe rolled back data.
+
+Listeners that keep derived rows in step with each flush or commit check
+``is_deferred``: writers that commit every row on their own, like the imports,
+wrap their work in ``deferred`` and the listeners do theirs once, batched, in
+its last commit. Commit listeners registered with ``on_commit_batched`` get
+the changes of such a block at once too, after its last commit.
+"""
+
+import logging
+from collections.abc import Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from typing import Any, Callable
+
+from sqlalchemy import event, inspect
+from sqlalchemy.orm import Session
+
+logger = logging.getLogger(__name__)
+
+CREATE = "create"
+UPDATE = "update"
+DELETE = "delete"
+
+_SESSION_KEY = "tracked_changes"
+_DEFERRED_KEY = "deferred"
+_HELD_KEY = "held_changes"
+
+
+@dataclass(frozen=True)
+class Change:
+    table: str
+    op: str
+    id: int | None = None
+    values: dict[str, Any] = field(default_factory=dict, compare=False, hash=False)
+
+
+Listener = Callable[[list[Change]], None]
+
+_listeners: list[Listener] = []
+_batched_listeners: list[Listener] = []
+
+
+def on_commit(listener: Listener) -> Listener:
+    """Register a listener called with the committed changes of a transaction"""
+    _listeners.append(listener)
+    return listener
+
+
+def on_commit_batched(listener: Listener) -> Listener:
+    """
+    Register a commit listener that, inside a ``deferred`` block, is called
+    once with the changes of all its commits, after the last one
+    """
+    _batched_listeners.append(listener)
+    return listener
+
+
+def track(
+    session: Session,
+    table: str,
+    op: str,
+    id: int | None = None,
+    values: dict[str, Any] | None = None,
+) -> None:
+    """Record a change that the ORM cannot see (e.g. raw SQL writes)"""
+    session.info.setdefault(_SESSION_KEY, []).append(
+        Change(table=table, op=op, id=id, values=values or {})
+    )
+
+
+def pending(session: Session) -> list[Change]:
+    """Changes recorded so far in the session's current transaction"""
+    return list(session.info.get(_SESSION_KEY, ()))
+
+
+@contextmanager
+def deferred(session: Session) -> Iterator[None]:
+    """
+    Put off the listeners' work on the enclosed commits until the block ends,
+    when one last commit does it, also if the block fails after some of them
+    """
+    session.info[_DEFERRED_KEY] = True
+    try:
+        yield
+    except Exception:
+        # Drops the unfinished work but keeps what was committed
+        session.rollback()
+        raise
+    finally:
+        session.info.pop(_DEFERRED_KEY, None)
+        session.commit()
+
+
+def is_deferred(session: Session) -> bool:
+    """Whether the session is inside a ``deferred`` block"""
+    return session.info.get(_DEFERRED_KEY, False)
+
+
+@event.listens_for(Session, "after_flush")
+def _collect_flushed(session: Session, flush_context) -> None:
+    for op, objects in (
+        (CREATE, session.new),
+        (UPDATE, session.dirty),
+        (DELETE, session.deleted),
+    ):
+        for obj in objects:
+            table = getattr(obj, "__tablename__", None)
+            if table is None:
+                continue
+            if op == UPDATE and not session.is_modified(obj, include_collections=False):
+                continue
+            state = inspect(obj)
+            values = {
+                attr.key: state.dict[attr.key]
+                for attr in state.mapper.column_attrs
+                if attr.key in state.dict
+            }
+            track(session, table, op, values.get("id"), values)
+
+
+@event.listens_for(Session, "do_orm_execute")
+def _collect_bulk(orm_execute_state) -> None:
+    if orm_execute_state.is_insert:
+        op = CREATE
+    elif orm_execute_state.is_update:
+        op = UPDATE
+    elif orm_execute_state.is_delete:
+        op = DELETE
+    else:
+        return
+
+    table = getattr(orm_execute_state.statement, "table", None)
+    if table is not None:
+        track(orm_execute_state.session, table.name, op)
+
+
+def _call(listeners: list[Listener], changes: list[Change]) -> None:
+    for listener in listeners:
+        try:
+            listener(changes)
+        except Exception as e:
+            logger.error(f"Error dispatching committed changes: {e}")
+
+
+@event.listens_for(Session, "after_commit")
+def _dispatch(session: Session) -> None:
+    changes = session.info.pop(_SESSION_KEY, None) or []
+    if changes:
+        _call(_listeners, changes)
+
+    if is_deferred(session):
+        session.info.setdefault(_HELD_KEY, []).extend(changes)
+        return
+    changes = session.info.pop(_HELD_KEY, []) + changes
+    if changes:
+        _call(_batched_listeners, changes)
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard(session: Session) -> None:
+    session.info.pop(_SESSION_KEY, None)
@@ -29,3 +29,23 @@ class NotFoundException(HTTPException):
 class ConflictException(HTTPException):
     def __init__(self, detail: str):
         super().__init__(status_code=409, detail=detail)
+
+
+class GoneException(HTTPException):
+    def __init__(self, detail: str):
+        super().__init__(status_code=410, detail=detail)
+
+
+class UnsupportedMediaTypeException(HTTPException):
+    def __init__(self, detail: str):
+        super().__init__(status_code=415, detail=detail)
+
+
+class BadGatewayException(HTTPException):
+    def __init__(self, detail: str):
+        super().__init__(status_code=502, detail=detail)
+
+
+class ServiceUnavailableException(HTTPException):
+    def __init__(self, detail: str):
+        super().__init__(status_code=503, detail=detail)
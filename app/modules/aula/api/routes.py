@@ -1,16 +1,22 @@
 from typing import Annotated
 
-from fastapi import APIRouter, Depends, Query, status
+from fastapi import APIRouter, Depends, Query, Request, status
 
 from app.api.dependencies.auth import user_is_staff
+from app.api.exports import ExportFormat, export_response, parse_columns
+from app.api.responses import model_response, page_response
+from app.api.routing import cached_route
 from app.api.schemas import Pagination
+from app.modules.aula.models import Aula
 from app.modules.aula.schemas import AulaCreate, AulaRead, AulaUpdate
 from app.modules.aula.services.aula_service import AulaService
+from app.modules.clase.models import Clase
+from app.modules.edificio.models import Edificio
 from app.modules.users.models import User
 
 from .dependencies import get_aula_service
 
-router = APIRouter()
+router = APIRouter(route_class=cached_route(Aula, Edificio, Clase))
 
 
 @router.post("/", response_model=AulaRead, status_code=status.HTTP_201_CREATED)
@@ -22,12 +28,36 @@ async def create_aula(
     return service.create_aula(data)
 
 
+@router.get("/export")
+async def export_aulas(
+    request: Request,
+    service: Annotated[AulaService, Depends(get_aula_service)],
+    format: ExportFormat = ExportFormat.ndjson,
+    columns: str | None = None,
+    edificio_id: int | None = None,
+    name: str | None = None,
+    centro_id: int | None = None,
+    calendario_id: int | None = None,
+    search: str | None = None,
+):
+    selected = parse_columns(Aula, columns)
+    rows = service.export_aulas(
+        selected,
+        edificio_id=edificio_id,
+        name=name,
+        centro_id=centro_id,
+        calendario_id=calendario_id,
+        search=search,
+    )
+    return export_response(request, rows, selected, format, "aulas")
+
+
 @router.get("/{aula_id}", response_model=AulaRead)
 async def get_aula(
     aula_id: int,
     service: Annotated[AulaService, Depends(get_aula_service)],
 ):
-    return service.get_aula(aula_id)
+    return model_response(AulaRead, service.get_aula(aula_id))
 
 
 @router.get("/", response_model=Pagination[AulaRead])
@@ -35,6 +65,8 @@ async def list_aulas(
     service: Annotated[AulaService, Depends(get_aula_service)],
     edificio_id: int | None = None,
     name: str | None = None,
+    calendario_id: int | None = None,
+    centro_id: int | None = None,
     search: str | None = None,
     skip: int = Query(default=0, ge=0),
     limit: int = Query(default=100, ge=1, le=100),
@@ -42,14 +74,13 @@ async def list_aulas(
     aulas, total = service.list_aulas(
         edificio_id=edificio_id,
         name=name,
+        calendario_id=calendario_id,
+        centro_id=centro_id,
         search=search,
         skip=skip,
         limit=limit,
     )
-    return Pagination(
-        total=total,
-        results=aulas,
-    )
+    return page_response(AulaRead, aulas, total)
 
 
 @router.put("/{aula_id}", response_model=AulaRead)
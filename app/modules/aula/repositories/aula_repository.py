@@ -1,6 +1,12 @@
+from collections.abc import Iterator
+
 from sqlmodel import Session, func, or_, select
 
+from app.core.database import EXPORT_BATCH_SIZE, stream_rows
 from app.modules.aula.models import Aula
+from app.modules.clase.models import Clase
+from app.modules.edificio.models import Edificio
+from app.modules.seccion.models import Seccion
 
 
 class AulaRepository:
@@ -17,33 +23,57 @@ class AulaRepository:
         statement = select(Aula).where(Aula.id == aula_id)
         return self.session.exec(statement).first()
 
-    def list(self, filters: dict) -> tuple[list[Aula], int]:
-        statement = select(Aula)
-        total_statement = select(func.count()).select_from(Aula)
+    def _conditions(self, filters: dict) -> list:
+        conditions = []
 
         if filters.get("edificio_id") is not None:
-            statement = statement.where(Aula.edificio_id == filters["edificio_id"])
-            total_statement = total_statement.where(
-                Aula.edificio_id == filters["edificio_id"]
-            )
+            conditions.append(Aula.edificio_id == filters["edificio_id"])
 
         if filters.get("name") is not None:
-            statement = statement.where(Aula.name == filters["name"])
-            total_statement = total_statement.where(Aula.name == filters["name"])
+            conditions.append(Aula.name == filters["name"])
 
         if filters.get("search"):
             search = f"%{filters['search']}%"
-            statement = statement.where(
+            conditions.append(
                 or_(
                     Aula.name.ilike(search),
                 )
             )
-            total_statement = total_statement.where(
-                or_(
-                    Aula.name.ilike(search),
+
+        if filters.get("centro_id") is not None:
+            conditions.append(
+                Aula.edificio_id.in_(
+                    select(Edificio.id).where(
+                        Edificio.centro_id == filters["centro_id"]
+                    )
+                )
+            )
+
+        if filters.get("calendario_id") is not None:
+            conditions.append(
+                Aula.id.in_(
+                    select(Clase.aula_id)
+                    .join(Seccion, Seccion.id == Clase.seccion_id)
+                    .where(Seccion.calendario_id == filters["calendario_id"])
                 )
             )
 
+        return conditions
+
+    def stream(self, filters: dict, columns: list[str]) -> Iterator[tuple]:
+        statement = (
+            select(*[getattr(Aula, column) for column in columns])
+            .where(*self._conditions(filters))
+            .order_by(Aula.id)
+            .execution_options(yield_per=EXPORT_BATCH_SIZE)
+        )
+        return stream_rows(self.session, statement, len(columns))
+
+    def list(self, filters: dict) -> tuple[list[Aula], int]:
+        conditions = self._conditions(filters)
+        statement = select(Aula).where(*conditions)
+        total_statement = select(func.count()).select_from(Aula).where(*conditions)
+
         statement = statement.offset(filters.get("skip", 0)).limit(
             filters.get("limit", 100)
         )
@@ -1,3 +1,5 @@
+from collections.abc import Iterator
+
 from app.core.exceptions import ConflictException, NotFoundException
 from app.modules.aula.models import Aula
 from app.modules.aula.repositories.aula_repository import AulaRepository
@@ -43,6 +45,9 @@ class AulaService:
     def list_aulas(self, **filters) -> tuple[list[Aula], int]:
         return self.repository.list(filters)
 
+    def export_aulas(self, columns: list[str], **filters) -> Iterator[tuple]:
+        return self.repository.stream(filters, columns)
+
     def update_aula(self, aula_id: int, data: AulaUpdate) -> Aula:
         aula = self.repository.get(aula_id)
         if not aula:
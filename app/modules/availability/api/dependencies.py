@@ -0,0 +1,14 @@
+from fastapi import Depends
+from sqlmodel import Session
+
+from app.api.dependencies.database import get_session
+from app.modules.availability.repositories.availability_repository import \
+    AvailabilityRepository
+from app.modules.availability.services.availability_service import \
+    AvailabilityService
+
+
+def get_availability_service(
+    session: Session = Depends(get_session),
+) -> AvailabilityService:
+    return AvailabilityService(repository=AvailabilityRepository(session=session))
@@ -0,0 +1,54 @@
+from datetime import time
+from typing import Annotated
+
+from fastapi import APIRouter, Depends, Query
+
+from app.modules.availability.schemas import AulaAvailability, FreeAula
+from app.modules.availability.services.availability_service import (
+    DAY_END, DAY_START, AvailabilityService)
+
+from .dependencies import get_availability_service
+
+router = APIRouter()
+
+
+@router.get("/aulas", response_model=list[FreeAula])
+async def list_free_aulas(
+    service: Annotated[AvailabilityService, Depends(get_availability_service)],
+    calendario_id: int,
+    dia: int = Query(ge=1, le=6),
+    hora_inicio: time = Query(),
+    hora_fin: time = Query(),
+    centro_id: int | None = None,
+    edificio_id: int | None = None,
+    duracion: int | None = Query(default=None, ge=1),
+):
+    return service.free_aulas(
+        calendario_id=calendario_id,
+        dia=dia,
+        hora_inicio=hora_inicio,
+        hora_fin=hora_fin,
+        centro_id=centro_id,
+        edificio_id=edificio_id,
+        duracion=duracion,
+    )
+
+
+@router.get("/aulas/{aula_id}", response_model=list[AulaAvailability])
+async def get_aula_availability(
+    aula_id: int,
+    service: Annotated[AvailabilityService, Depends(get_availability_service)],
+    calendario_id: int,
+    dia: int | None = Query(default=None, ge=1, le=6),
+    hora_inicio: time = DAY_START,
+    hora_fin: time = DAY_END,
+    duracion: int | None = Query(default=None, ge=1),
+):
+    return service.aula_windows(
+        aula_id=aula_id,
+        calendario_id=calendario_id,
+        dia=dia,
+        hora_inicio=hora_inicio,
+        hora_fin=hora_fin,
+        duracion=duracion,
+    )
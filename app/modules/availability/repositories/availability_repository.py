@@ -0,0 +1,38 @@
+from collections.abc import Iterator
+from datetime import time
+
+from sqlmodel import Session, select
+
+from app.modules.aula.models import Aula
+from app.modules.clase.models import Clase
+from app.modules.edificio.models import Edificio
+from app.modules.seccion.models import Seccion
+
+
+class AvailabilityRepository:
+    def __init__(self, session: Session):
+        self.session = session
+
+    def aulas(self) -> Iterator[tuple[int, str, int, str, int]]:
+        """(id, name, edificio_id, edificio, centro_id) of every aula"""
+        statement = select(
+            Aula.id, Aula.name, Aula.edificio_id, Edificio.name, Edificio.centro_id
+        ).join(Edificio, Aula.edificio_id == Edificio.id)
+        return iter(self.session.exec(statement))
+
+    def secciones(self, calendario_id: int) -> list[int]:
+        statement = select(Seccion.id).where(Seccion.calendario_id == calendario_id)
+        return list(self.session.exec(statement))
+
+    def clases(
+        self, calendario_id: int
+    ) -> Iterator[tuple[int, int | None, int | None, time | None, time | None]]:
+        """(id, aula_id, dia, hora_inicio, hora_fin) of the clases of a calendario"""
+        statement = (
+            select(
+                Clase.id, Clase.aula_id, Clase.dia, Clase.hora_inicio, Clase.hora_fin
+            )
+            .join(Seccion, Clase.seccion_id == Seccion.id)
+            .where(Seccion.calendario_id == calendario_id)
+        )
+        return iter(self.session.exec(statement))
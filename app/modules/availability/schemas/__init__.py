@@ -0,0 +1,7 @@
+from .availability import AulaAvailability, AvailabilityWindow, FreeAula
+
+__all__ = [
+    "AulaAvailability",
+    "AvailabilityWindow",
+    "FreeAula",
+]
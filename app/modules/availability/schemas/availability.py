@@ -0,0 +1,21 @@
+from datetime import time
+
+from sqlmodel import SQLModel
+
+
+class AvailabilityWindow(SQLModel):
+    hora_inicio: time
+    hora_fin: time
+
+
+class FreeAula(SQLModel):
+    aula_id: int
+    aula: str
+    edificio_id: int
+    edificio: str
+    ventanas: list[AvailabilityWindow]
+
+
+class AulaAvailability(SQLModel):
+    dia: int
+    ventanas: list[AvailabilityWindow]
@@ -0,0 +1,219 @@
+"""
+In-memory interval index of aula occupancy.
+
+For every loaded calendario the index keeps the busy intervals of each
+(aula, dia) sorted by start time, so free aulas and free windows are answered
+by walking a handful of intervals instead of scanning clase rows. Calendarios
+are loaded from the database on first use and then kept current from the
+committed changes of this process; writes made by other workers are detected
+through the shared data versions and trigger a reload.
+"""
+
+import bisect
+import threading
+from collections.abc import Callable, Iterable, Iterator
+from dataclasses import dataclass, field
+from datetime import time
+
+from app.core import events
+from app.core.cache import response_cache
+
+# Tables whose rows change what the index holds
+TABLES = ("clase", "seccion", "aula", "edificio")
+
+Interval = tuple[int, int, int]  # (start minute, end minute, clase id)
+
+
+def to_minutes(value: time) -> int:
+    return value.hour * 60 + value.minute
+
+
+def to_time(minutes: int) -> time:
+    return time(minutes // 60, minutes % 60)
+
+
+@dataclass(frozen=True)
+class AulaInfo:
+    id: int
+    name: str
+    edificio_id: int
+    edificio: str
+    centro_id: int
+
+
+@dataclass
+class CalendarioIndex:
+    busy: dict[tuple[int, int], list[Interval]] = field(default_factory=dict)
+    clases: dict[int, tuple[int, int, int, int]] = field(default_factory=dict)
+
+    def add(
+        self,
+        clase_id: int,
+        aula_id: int | None,
+        dia: int | None,
+        hora_inicio: time | None,
+        hora_fin: time | None,
+    ) -> None:
+        if aula_id is None or not dia or hora_inicio is None or hora_fin is None:
+            return
+        start, end = to_minutes(hora_inicio), to_minutes(hora_fin)
+        if end <= start:
+            return
+        bisect.insort(self.busy.setdefault((aula_id, dia), []), (start, end, clase_id))
+        self.clases[clase_id] = (aula_id, dia, start, end)
+
+    def remove(self, clase_id: int) -> None:
+        entry = self.clases.pop(clase_id, None)
+        if entry is None:
+            return
+        aula_id, dia, start, end = entry
+        intervals = self.busy[(aula_id, dia)]
+        del intervals[bisect.bisect_left(intervals, (start, end, clase_id))]
+
+
+def free_windows(
+    intervals: Iterable[Interval], lo: int, hi: int
+) -> Iterator[tuple[int, int]]:
+    """Gaps between busy intervals (sorted by start) inside [lo, hi)"""
+    cursor = lo
+    for start, end, _ in intervals:
+        if start >= hi:
+            break
+        if end <= cursor:
+            continue
+        if start > cursor:
+            yield cursor, start
+        cursor = end
+        if cursor >= hi:
+            return
+    if cursor < hi:
+        yield cursor, hi
+
+
+class AvailabilityIndex:
+    def __init__(self):
+        self.lock = threading.RLock()
+        self.reset()
+
+    def reset(self) -> None:
+        with self.lock:
+            self._aulas: dict[int, AulaInfo] | None = None
+            self._calendarios: dict[int, CalendarioIndex] = {}
+            # seccion -> calendario of every seccion of the loaded calendarios
+            self._secciones: dict[int, int] = {}
+            self._versions: dict[str, int | str] | None = None
+
+    @staticmethod
+    def _current_versions() -> dict[str, int | str]:
+        versions = response_cache.versions
+        return {"epoch": versions.epoch()} | {
+            table: versions.get(table) for table in TABLES
+        }
+
+    def _sync(self) -> None:
+        current = self._current_versions()
+        if current != self._versions:
+            self.reset()
+            self._versions = current
+
+    def aulas(self, load: Callable[[], Iterable[tuple]]) -> dict[int, AulaInfo]:
+        with self.lock:
+            self._sync()
+            if self._aulas is None:
+                self._aulas = {row[0]: AulaInfo(*row) for row in load()}
+            return self._aulas
+
+    def calendario(
+        self,
+        calendario_id: int,
+        load_secciones: Callable[[], Iterable[int]],
+        load_clases: Callable[[], Iterable[tuple]],
+    ) -> CalendarioIndex:
+        with self.lock:
+            self._sync()
+            index = self._calendarios.get(calendario_id)
+            if index is None:
+                index = CalendarioIndex()
+                for seccion_id in load_secciones():
+                    self._secciones[seccion_id] = calendario_id
+                for row in load_clases():
+                    index.add(*row)
+                self._calendarios[calendario_id] = index
+            return index
+
+    def _apply(self, change: events.Change) -> bool:
+        """Apply a committed change, False when it cannot be applied in place"""
+        if change.table not in TABLES:
+            return True
+        if change.id is None:
+            return False
+
+        # Deletes cascade to clases in the database, out of sight of the ORM
+        if change.table in ("aula", "edificio"):
+            self._aulas = None
+            return change.op != events.DELETE
+
+        if change.table == "seccion":
+            calendario_id = change.values.get("calendario_id")
+            known = self._secciones.get(change.id)
+            if change.op == events.DELETE:
+                return known is None
+            if known is not None and calendario_id not in (None, known):
+                return False
+            if calendario_id in self._calendarios:
+                self._secciones[change.id] = calendario_id
+            return True
+
+        for index in self._calendarios.values():
+            index.remove(change.id)
+
+        if change.op == events.DELETE:
+            return True
+
+        values = change.values
+        calendario_id = self._secciones.get(values.get("seccion_id"))
+        if calendario_id is None:
+            # Seccion of a calendario that is not loaded
+            return "seccion_id" in values
+        if not {"aula_id", "dia", "hora_inicio", "hora_fin"} <= values.keys():
+            return False
+
+        self._calendarios[calendario_id].add(
+            change.id,
+            values["aula_id"],
+            values["dia"],
+            values["hora_inicio"],
+            values["hora_fin"],
+        )
+        return True
+
+    def apply(self, changes: list[events.Change]) -> None:
+        touched = {change.table for change in changes}
+        if not touched & set(TABLES):
+            return
+
+        with self.lock:
+            if self._versions is None:
+                return
+
+            # Every commit bumps each table it touched exactly once; anything
+            # else means another worker wrote in between.
+            expected = {
+                key: value + 1 if key in touched else value
+                for key, value in self._versions.items()
+            }
+            current = self._current_versions()
+
+            # Secciones first, so clases created with them find their calendario
+            ordered = sorted(changes, key=lambda change: change.table != "seccion")
+            if current != expected or not all(map(self._apply, ordered)):
+                self.reset()
+            self._versions = current
+
+
+availability_index = AvailabilityIndex()
+
+
+@events.on_commit
+def _apply_changes(changes: list[events.Change]) -> None:
+    availability_index.apply(changes)
@@ -0,0 +1,117 @@
+from datetime import time
+
+from app.core.exceptions import BadRequestException, NotFoundException
+from app.modules.availability.repositories.availability_repository import \
+    AvailabilityRepository
+from app.modules.availability.schemas import (AulaAvailability,
+                                              AvailabilityWindow, FreeAula)
+from app.modules.availability.services.availability_index import (
+    AvailabilityIndex, CalendarioIndex, availability_index, free_windows,
+    to_minutes, to_time)
+
+DIAS = range(1, 7)
+DAY_START = time(7, 0)
+DAY_END = time(21, 0)
+
+
+class AvailabilityService:
+    def __init__(
+        self,
+        repository: AvailabilityRepository,
+        index: AvailabilityIndex = availability_index,
+    ):
+        self.repository = repository
+        self.index = index
+
+    def _calendario(self, calendario_id: int) -> CalendarioIndex:
+        return self.index.calendario(
+            calendario_id,
+            lambda: self.repository.secciones(calendario_id),
+            lambda: self.repository.clases(calendario_id),
+        )
+
+    @staticmethod
+    def _range(hora_inicio: time, hora_fin: time) -> tuple[int, int]:
+        lo, hi = to_minutes(hora_inicio), to_minutes(hora_fin)
+        if hi <= lo:
+            raise BadRequestException("hora_fin must be later than hora_inicio.")
+        return lo, hi
+
+    @staticmethod
+    def _windows(
+        intervals: list, lo: int, hi: int, duracion: int
+    ) -> list[AvailabilityWindow]:
+        return [
+            AvailabilityWindow(hora_inicio=to_time(start), hora_fin=to_time(end))
+            for start, end in free_windows(intervals, lo, hi)
+            if end - start >= duracion
+        ]
+
+    def free_aulas(
+        self,
+        calendario_id: int,
+        dia: int,
+        hora_inicio: time,
+        hora_fin: time,
+        centro_id: int | None = None,
+        edificio_id: int | None = None,
+        duracion: int | None = None,
+    ) -> list[FreeAula]:
+        """
+        Aulas with a free window of at least ``duracion`` minutes between
+        hora_inicio and hora_fin; without duracion the whole range must be free.
+        """
+        lo, hi = self._range(hora_inicio, hora_fin)
+        duracion = hi - lo if duracion is None else duracion
+
+        result = []
+        with self.index.lock:
+            aulas = self.index.aulas(self.repository.aulas)
+            busy = self._calendario(calendario_id).busy
+
+            for aula in aulas.values():
+                if centro_id is not None and aula.centro_id != centro_id:
+                    continue
+                if edificio_id is not None and aula.edificio_id != edificio_id:
+                    continue
+
+                ventanas = self._windows(busy.get((aula.id, dia), ()), lo, hi, duracion)
+                if ventanas:
+                    result.append(
+                        FreeAula(
+                            aula_id=aula.id,
+                            aula=aula.name,
+                            edificio_id=aula.edificio_id,
+                            edificio=aula.edificio,
+                            ventanas=ventanas,
+                        )
+                    )
+
+        return sorted(result, key=lambda free: (free.edificio, free.aula))
+
+    def aula_windows(
+        self,
+        aula_id: int,
+        calendario_id: int,
+        dia: int | None = None,
+        hora_inicio: time = DAY_START,
+        hora_fin: time = DAY_END,
+        duracion: int | None = None,
+    ) -> list[AulaAvailability]:
+        """Free windows of an aula on each dia"""
+        lo, hi = self._range(hora_inicio, hora_fin)
+
+        with self.index.lock:
+            if aula_id not in self.index.aulas(self.repository.aulas):
+                raise NotFoundException("Aula not found.")
+
+            busy = self._calendario(calendario_id).busy
+            return [
+                AulaAvailability(
+                    dia=d,
+                    ventanas=self._windows(
+                        busy.get((aula_id, d), ()), lo, hi, duracion or 1
+                    ),
+                )
+                for d in ([dia] if dia is not None else DIAS)
+            ]
@@ -3,16 +3,20 @@ from typing import Annotated
 from fastapi import APIRouter, Depends, Query, status
 
 from app.api.dependencies.auth import user_is_staff
+from app.api.responses import model_response, page_response
+from app.api.routing import cached_route
 from app.api.schemas import Pagination
+from app.modules.calendario.models import Calendario
 from app.modules.calendario.schemas import (CalendarioCreate, CalendarioRead,
                                             CalendarioUpdate)
 from app.modules.calendario.services.calendario_service import \
     CalendarioService
+from app.modules.seccion.models import Seccion
 from app.modules.users.models import User
 
 from .dependencies import get_calendario_service
 
-router = APIRouter()
+router = APIRouter(route_class=cached_route(Calendario, Seccion))
 
 
 @router.post("/", response_model=CalendarioRead, status_code=status.HTTP_201_CREATED)
@@ -29,7 +33,7 @@ async def get_calendario(
     calendario_id: int,
     service: Annotated[CalendarioService, Depends(get_calendario_service)],
 ):
-    return service.get_calendario(calendario_id)
+    return model_response(CalendarioRead, service.get_calendario(calendario_id))
 
 
 @router.get("/", response_model=Pagination[CalendarioRead])
@@ -46,10 +50,7 @@ async def list_calendarios(
         skip=skip,
         limit=limit,
     )
-    return Pagination(
-        total=total,
-        results=calendarios,
-    )
+    return page_response(CalendarioRead, calendarios, total)
 
 
 @router.put("/{calendario_id}", response_model=CalendarioRead)
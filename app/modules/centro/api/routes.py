@@ -3,17 +3,22 @@ from typing import Annotated
 from fastapi import APIRouter, Depends, Query, status
 
 from app.api.dependencies.auth import user_is_staff
+from app.api.responses import model_response, page_response
+from app.api.routing import cached_route
 from app.api.schemas import Pagination
+from app.modules.centro.models import CentroUniversitario
 from app.modules.centro.schemas import (CentroUniversitarioCreate,
                                         CentroUniversitarioRead,
                                         CentroUniversitarioUpdate)
 from app.modules.centro.services.centro_service import \
     CentroUniversitarioService
+from app.modules.edificio.models import Edificio
+from app.modules.seccion.models import Seccion
 from app.modules.users.models import User
 
 from .dependencies import get_centro_service
 
-router = APIRouter()
+router = APIRouter(route_class=cached_route(CentroUniversitario, Seccion, Edificio))
 
 
 @router.post(
@@ -32,7 +37,7 @@ async def get_centro(
     centro_id: int,
     service: Annotated[CentroUniversitarioService, Depends(get_centro_service)],
 ):
-    return service.get_centro(centro_id)
+    return model_response(CentroUniversitarioRead, service.get_centro(centro_id))
 
 
 @router.get("/", response_model=Pagination[CentroUniversitarioRead])
@@ -49,10 +54,7 @@ async def list_centros(
         skip=skip,
         limit=limit,
     )
-    return Pagination(
-        total=total,
-        results=centros,
-    )
+    return page_response(CentroUniversitarioRead, centros, total)
 
 
 @router.put("/{centro_id}", response_model=CentroUniversitarioRead)
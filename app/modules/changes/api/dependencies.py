@@ -0,0 +1,10 @@
+from fastapi import Depends
+from sqlmodel import Session
+
+from app.api.dependencies.database import get_session
+from app.modules.changes.repositories.change_repository import ChangeRepository
+from app.modules.changes.services.change_service import ChangeService
+
+
+def get_change_service(session: Session = Depends(get_session)) -> ChangeService:
+    return ChangeService(repository=ChangeRepository(session=session))
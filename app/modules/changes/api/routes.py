@@ -0,0 +1,35 @@
+from typing import Annotated
+
+from fastapi import APIRouter, Depends, Query
+
+from app.api.routing import cached_route
+from app.modules.changes.models import ChangeLog
+from app.modules.changes.schemas import ChangeFeed, ChangeVersion
+from app.modules.changes.services.change_service import (DEFAULT_LIMIT,
+                                                         MAX_LIMIT,
+                                                         ChangeService)
+
+from .dependencies import get_change_service
+
+# Every logged write appends to the change log, which also covers the rows
+router = APIRouter(route_class=cached_route(ChangeLog))
+
+
+@router.get("/", response_model=ChangeFeed)
+async def get_changes(
+    service: Annotated[ChangeService, Depends(get_change_service)],
+    since: Annotated[int, Query(ge=0)] = 0,
+    calendario_id: int | None = None,
+    rows: bool = False,
+    limit: Annotated[int, Query(ge=1, le=MAX_LIMIT)] = DEFAULT_LIMIT,
+):
+    return service.changes(
+        since=since, calendario_id=calendario_id, rows=rows, limit=limit
+    )
+
+
+@router.get("/version", response_model=ChangeVersion)
+async def get_change_version(
+    service: Annotated[ChangeService, Depends(get_change_service)],
+):
+    return service.version()
@@ -0,0 +1,4 @@
+from . import change_sync  # noqa: F401  (registers the commit listener)
+from .change_log import ChangeCounter, ChangeLog
+
+__all__ = ["ChangeCounter", "ChangeLog"]
@@ -0,0 +1,31 @@
+from datetime import datetime
+
+from pydantic import ConfigDict
+from sqlmodel import Field, SQLModel
+
+
+class ChangeLog(SQLModel, table=True):
+    """
+    One committed write to a catalog table, appended by
+    app.modules.changes.models.change_sync; the version orders the entries
+    by commit
+    """
+
+    id: int | None = Field(default=None, primary_key=True)
+    version: int = Field(unique=True, index=True)
+    table_name: str
+    # None when a bulk write did not tell which rows it touched
+    record_id: int | None = Field(default=None, nullable=True)
+    op: str
+    # None for tables shared by every calendario (aulas, materias, ...)
+    calendario_id: int | None = Field(default=None, nullable=True, index=True)
+    created_at: datetime = Field(index=True)
+
+    model_config = ConfigDict(from_attributes=True)
+
+
+class ChangeCounter(SQLModel, table=True):
+    """The single row holding the last change version handed out"""
+
+    id: int | None = Field(default=None, primary_key=True)
+    version: int = 0
@@ -0,0 +1,200 @@
+"""
+Appends committed catalog writes to the change log.
+
+Right before a transaction commits, the changes tracked on its session (see
+app.core.events) that touch a logged table are written to ``changelog`` with
+one batched insert, so the log commits or rolls back with the writes. Several
+changes of a row within a transaction collapse into its last one.
+
+Entries are numbered from the single ``changecounter`` row, not by their
+autoincrement id, which is drawn when the row is inserted: a transaction could
+draw lower ids than one that commits before it, and a client that synced past
+the later ids would never see them. The counter row is incremented right
+before the commit and stays locked until the transaction ends, so committing
+transactions take their versions one after the other, in commit order, and
+without gaps. Entries of
+secciones and clases carry their calendario, so clients can follow a single
+one; the other tables are shared by every calendario.
+
+Inside ``app.core.events.deferred``, as in imports, the changes of each commit
+are kept instead, and its last commit logs them all with a single reservation
+and insert, collapsed as if they were one transaction. Until then, clients
+only miss them: their versions still come after every version handed out
+before.
+
+Entries older than CHANGES_RETENTION_DAYS are pruned, at most once per
+PRUNE_INTERVAL seconds per process. The newest entry is always kept, so the
+oldest remaining version tells whether a client has fallen behind the log.
+"""
+
+import time
+from datetime import datetime, timedelta
+
+from sqlalchemy import delete, event, func, insert, select, update
+from sqlalchemy.orm import Session
+
+from app.core import events
+from app.core.config import settings
+from app.modules.aula.models import Aula
+from app.modules.clase.models import Clase
+from app.modules.edificio.models import Edificio
+from app.modules.materia.models import Materia
+from app.modules.profesor.models import Profesor
+from app.modules.seccion.models import Seccion
+
+from .change_log import ChangeCounter, ChangeLog
+
+LOGGED_TABLES = {
+    model.__tablename__: model
+    for model in (Seccion, Clase, Aula, Edificio, Materia, Profesor)
+}
+PRUNE_INTERVAL = 3600
+COUNTER_ID = 1
+# Ids per calendario lookup, keeping IN lists small
+CHUNK_SIZE = 500
+
+# Changes of the current transaction, and of the ones committed while deferred
+_STAGED_KEY = "changelog_staged"
+_COMMITTED_KEY = "changelog_committed"
+
+_next_prune = 0.0
+
+
+def _chunks(ids) -> list[list[int]]:
+    ids = sorted(ids)
+    return [ids[start : start + CHUNK_SIZE] for start in range(0, len(ids), CHUNK_SIZE)]
+
+
+def _calendarios(
+    session: Session, changes: list[events.Change]
+) -> dict[tuple[str, int], int]:
+    """Calendario of every seccion and clase change, by (table, id)"""
+    found: dict[tuple[str, int], int] = {}
+    secciones: dict[int, list[tuple[str, int]]] = {}
+    clases = set()
+    for change in changes:
+        if change.id is None:
+            continue
+        key = (change.table, change.id)
+        if change.table == Seccion.__tablename__:
+            if change.values.get("calendario_id") is not None:
+                found[key] = change.values["calendario_id"]
+            else:
+                secciones.setdefault(change.id, []).append(key)
+        elif change.table == Clase.__tablename__:
+            if change.values.get("seccion_id") is not None:
+                secciones.setdefault(change.values["seccion_id"], []).append(key)
+            else:
+                clases.add(change.id)
+
+    connection = session.connection()
+    for chunk in _chunks(clases):
+        for clase_id, seccion_id in connection.execute(
+            select(Clase.id, Clase.seccion_id).where(Clase.id.in_(chunk))
+        ):
+            secciones.setdefault(seccion_id, []).append((Clase.__tablename__, clase_id))
+    for chunk in _chunks(secciones):
+        for seccion_id, calendario_id in connection.execute(
+            select(Seccion.id, Seccion.calendario_id).where(Seccion.id.in_(chunk))
+        ):
+            for key in secciones[seccion_id]:
+                found[key] = calendario_id
+    return found
+
+
+def reserve_versions(session: Session, count: int) -> int:
+    """
+    Take the next ``count`` versions and return the first; the counter row
+    stays locked until the transaction ends
+    """
+    table = ChangeCounter.__table__
+    connection = session.connection()
+    result = connection.execute(
+        update(table)
+        .where(table.c.id == COUNTER_ID)
+        .values(version=table.c.version + count)
+    )
+    if not result.rowcount:
+        # A database created without the migrations that seed the counter
+        last = connection.execute(select(func.max(ChangeLog.version))).scalar() or 0
+        connection.execute(insert(table).values(id=COUNTER_ID, version=last + count))
+    version = connection.execute(
+        select(table.c.version).where(table.c.id == COUNTER_ID)
+    ).scalar_one()
+    return version - count + 1
+
+
+def prune(session: Session, before: datetime) -> int:
+    """Delete the entries older than ``before`` but the newest one"""
+    table = ChangeLog.__table__
+    newest = session.connection().execute(select(func.max(table.c.version))).scalar()
+    if newest is None:
+        return 0
+    result = session.connection().execute(
+        delete(table).where(table.c.created_at < before, table.c.version < newest)
+    )
+    if result.rowcount:
+        events.track(session, table.name, events.DELETE)
+    return result.rowcount
+
+
+@event.listens_for(Session, "before_commit")
+def _append_changes(session: Session) -> None:
+    global _next_prune
+
+    if not session.in_transaction():
+        return
+    # Commit flushes after this hook; flush first so its writes are included
+    session.flush()
+    changes = [
+        change for change in events.pending(session) if change.table in LOGGED_TABLES
+    ]
+    if events.is_deferred(session):
+        session.info[_STAGED_KEY] = changes
+        return
+
+    latest: dict[tuple[str, int | None, str | None], events.Change] = {}
+    for change in session.info.pop(_COMMITTED_KEY, []) + changes:
+        # Bulk writes without ids are kept per operation
+        key = (change.table, change.id, change.op if change.id is None else None)
+        latest.pop(key, None)
+        latest[key] = change
+
+    if latest:
+        changes = list(latest.values())
+        calendarios = _calendarios(session, changes)
+        now = datetime.now()
+        first = reserve_versions(session, len(changes))
+        session.connection().execute(
+            insert(ChangeLog.__table__),
+            [
+                {
+                    "version": version,
+                    "table_name": change.table,
+                    "record_id": change.id,
+                    "op": change.op,
+                    "calendario_id": calendarios.get((change.table, change.id)),
+                    "created_at": now,
+                }
+                for version, change in enumerate(changes, first)
+            ],
+        )
+        events.track(session, ChangeLog.__tablename__, events.CREATE)
+
+        if time.monotonic() >= _next_prune:
+            _next_prune = time.monotonic() + PRUNE_INTERVAL
+            prune(session, now - timedelta(days=settings.CHANGES_RETENTION_DAYS))
+
+
+@event.listens_for(Session, "after_commit")
+def _keep_committed(session: Session) -> None:
+    changes = session.info.pop(_STAGED_KEY, None)
+    if changes:
+        session.info.setdefault(_COMMITTED_KEY, []).extend(changes)
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard(session: Session) -> None:
+    session.info.pop(_STAGED_KEY, None)
+    if not events.is_deferred(session):
+        session.info.pop(_COMMITTED_KEY, None)
@@ -0,0 +1,44 @@
+from sqlmodel import Session, SQLModel, func, or_, select
+
+from app.modules.changes.models import ChangeLog
+
+# Rows loaded per statement, keeping IN lists small
+CHUNK_SIZE = 500
+
+
+class ChangeRepository:
+    def __init__(self, session: Session):
+        self.session = session
+
+    def bounds(self) -> tuple[int | None, int | None]:
+        """Oldest and newest versions in the log"""
+        return self.session.exec(
+            select(func.min(ChangeLog.version), func.max(ChangeLog.version))
+        ).one()
+
+    def entries(
+        self, since: int, calendario_id: int | None = None, limit: int | None = None
+    ) -> list[tuple[int, str, int | None, str]]:
+        statement = select(
+            ChangeLog.version, ChangeLog.table_name, ChangeLog.record_id, ChangeLog.op
+        ).where(ChangeLog.version > since)
+        if calendario_id is not None:
+            statement = statement.where(
+                or_(
+                    ChangeLog.calendario_id == calendario_id,
+                    ChangeLog.calendario_id.is_(None),
+                )
+            )
+        statement = statement.order_by(ChangeLog.version).limit(limit)
+        return list(self.session.exec(statement))
+
+    def rows(self, model: type[SQLModel], ids: list[int]) -> list[SQLModel]:
+        found = []
+        for start in range(0, len(ids), CHUNK_SIZE):
+            end = start + CHUNK_SIZE
+            found.extend(
+                self.session.exec(
+                    select(model).where(model.id.in_(ids[start:end])).order_by(model.id)
+                )
+            )
+        return found
@@ -0,0 +1,3 @@
+from .changes import ChangeFeed, ChangeSet, ChangeVersion
+
+__all__ = ["ChangeFeed", "ChangeSet", "ChangeVersion"]
@@ -0,0 +1,23 @@
+from typing import Any
+
+from sqlmodel import SQLModel
+
+
+class ChangeSet(SQLModel):
+    table: str
+    upserted: list[int]
+    deleted: list[int]
+    # A bulk write did not tell which rows it touched: reload the table
+    reload: bool = False
+    rows: list[dict[str, Any]] | None = None
+
+
+class ChangeFeed(SQLModel):
+    since: int
+    version: int
+    more: bool
+    changes: list[ChangeSet]
+
+
+class ChangeVersion(SQLModel):
+    version: int
@@ -0,0 +1,85 @@
+"""
+Incremental sync over the change log.
+
+A client keeps the version of its last sync and asks for the changes after
+it. Entries are collapsed per row into its last operation, so the response
+lists each changed id once, as upserted or deleted, however many times it was
+written. Clients more than CHANGES_RETENTION_DAYS behind, or ahead of a log
+that was reset, get a 410: they read the latest version, download everything
+and continue from that version.
+
+Deleting a seccion also deletes its clases in the database, which logs only
+the seccion: clients drop the clases of deleted secciones themselves.
+"""
+
+from app.core import events
+from app.core.exceptions import GoneException
+from app.modules.changes.models.change_sync import LOGGED_TABLES
+from app.modules.changes.repositories.change_repository import ChangeRepository
+from app.modules.changes.schemas import ChangeFeed, ChangeSet, ChangeVersion
+
+DEFAULT_LIMIT = 10000
+MAX_LIMIT = 100000
+
+
+class ChangeService:
+    def __init__(self, repository: ChangeRepository):
+        self.repository = repository
+
+    def version(self) -> ChangeVersion:
+        """Latest version, to continue from after a full download"""
+        return ChangeVersion(version=self.repository.bounds()[1] or 0)
+
+    def changes(
+        self,
+        since: int = 0,
+        calendario_id: int | None = None,
+        rows: bool = False,
+        limit: int = DEFAULT_LIMIT,
+    ) -> ChangeFeed:
+        oldest, newest = self.repository.bounds()
+        if since > (newest or 0) or (oldest is not None and since < oldest - 1):
+            raise GoneException(
+                f"Version {since} is no longer in the change log; resync."
+            )
+
+        entries = self.repository.entries(since, calendario_id, limit + 1)
+        more = len(entries) > limit
+        entries = entries[:limit]
+
+        latest: dict[str, dict[int, str]] = {}
+        reload: set[str] = set()
+        for _, table, record_id, op in entries:
+            if record_id is None:
+                reload.add(table)
+                continue
+            ops = latest.setdefault(table, {})
+            # Keep the ids in the order of their last change
+            ops.pop(record_id, None)
+            ops[record_id] = op
+
+        change_sets = []
+        for table in sorted(latest.keys() | reload):
+            ops = latest.get(table, {})
+            change_set = ChangeSet(
+                table=table,
+                upserted=[id for id, op in ops.items() if op != events.DELETE],
+                deleted=[id for id, op in ops.items() if op == events.DELETE],
+                reload=table in reload,
+            )
+            if rows:
+                change_set.rows = [
+                    row.model_dump()
+                    for row in self.repository.rows(
+                        LOGGED_TABLES[table], change_set.upserted
+                    )
+                ]
+            change_sets.append(change_set)
+
+        return ChangeFeed(
+            since=since,
+            # A filtered page may end before the newest entry: resume after it
+            version=entries[-1][0] if more else max(newest or 0, since),
+            more=more,
+            changes=change_sets,
+        )
@@ -1,17 +1,26 @@
 from datetime import time
 from typing import Annotated
 
-from fastapi import APIRouter, Depends, Query, status
+from fastapi import APIRouter, Depends, Query, Request, status
 
 from app.api.dependencies.auth import user_is_staff
+from app.api.exports import ExportFormat, export_response, parse_columns
+from app.api.params import parse_int_list
+from app.api.responses import model_response, page_response
+from app.api.routing import cached_route
 from app.api.schemas import Pagination
+from app.modules.aula.models import Aula
+from app.modules.clase.models import Clase
 from app.modules.clase.schemas import ClaseCreate, ClaseRead, ClaseUpdate
 from app.modules.clase.services.clase_service import ClaseService
+from app.modules.edificio.models import Edificio
+from app.modules.materia.models import Materia
+from app.modules.seccion.models import Seccion
 from app.modules.users.models import User
 
 from .dependencies import get_clase_service
 
-router = APIRouter()
+router = APIRouter(route_class=cached_route(Clase, Seccion, Aula, Edificio, Materia))
 
 
 @router.post("/", response_model=ClaseRead, status_code=status.HTTP_201_CREATED)
@@ -23,40 +32,83 @@ async def create_clase(
     return service.create_clase(data)
 
 
+@router.get("/export")
+async def export_clases(
+    request: Request,
+    service: Annotated[ClaseService, Depends(get_clase_service)],
+    format: ExportFormat = ExportFormat.ndjson,
+    columns: str | None = None,
+    seccion_id: int | None = None,
+    aula_id: str | None = None,
+    hora_inicio: time | None = None,
+    hora_fin: time | None = None,
+    hora_desde: time | None = None,
+    hora_hasta: time | None = None,
+    dia: str | None = None,
+    calendario_id: int | None = None,
+    centro_id: int | None = None,
+    edificio_id: str | None = None,
+    search: str | None = None,
+):
+    selected = parse_columns(Clase, columns)
+    rows = service.export_clases(
+        selected,
+        seccion_id=seccion_id,
+        aula_id=parse_int_list(aula_id, "aula_id"),
+        hora_inicio=hora_inicio,
+        hora_fin=hora_fin,
+        hora_desde=hora_desde,
+        hora_hasta=hora_hasta,
+        dia=parse_int_list(dia, "dia"),
+        calendario_id=calendario_id,
+        centro_id=centro_id,
+        edificio_id=parse_int_list(edificio_id, "edificio_id"),
+        search=search,
+    )
+    return export_response(request, rows, selected, format, "clases")
+
+
 @router.get("/{clase_id}", response_model=ClaseRead)
 async def get_clase(
     clase_id: int,
     service: Annotated[ClaseService, Depends(get_clase_service)],
 ):
-    return service.get_clase(clase_id)
+    return model_response(ClaseRead, service.get_clase(clase_id))
 
 
 @router.get("/", response_model=Pagination[ClaseRead])
 async def list_clases(
     service: Annotated[ClaseService, Depends(get_clase_service)],
     seccion_id: int | None = None,
-    aula_id: int | None = None,
+    aula_id: str | None = None,
     hora_inicio: time | None = None,
     hora_fin: time | None = None,
-    dia: int | None = None,
+    hora_desde: time | None = None,
+    hora_hasta: time | None = None,
+    dia: str | None = None,
+    calendario_id: int | None = None,
+    centro_id: int | None = None,
+    edificio_id: str | None = None,
     search: str | None = None,
     skip: int = Query(default=0, ge=0),
     limit: int = Query(default=100, ge=1, le=100),
 ):
     clases, total = service.list_clases(
         seccion_id=seccion_id,
-        aula_id=aula_id,
+        aula_id=parse_int_list(aula_id, "aula_id"),
         hora_inicio=hora_inicio,
         hora_fin=hora_fin,
-        dia=dia,
+        hora_desde=hora_desde,
+        hora_hasta=hora_hasta,
+        dia=parse_int_list(dia, "dia"),
+        calendario_id=calendario_id,
+        centro_id=centro_id,
+        edificio_id=parse_int_list(edificio_id, "edificio_id"),
         search=search,
         skip=skip,
         limit=limit,
     )
-    return Pagination(
-        total=total,
-        results=clases,
-    )
+    return page_response(ClaseRead, clases, total)
 
 
 @router.put("/{clase_id}", response_model=ClaseRead)
@@ -1,10 +1,18 @@
 from datetime import time
 
 from pydantic import ConfigDict
+from sqlalchemy import Index
 from sqlmodel import Field, Relationship, SQLModel
 
 
 class Clase(SQLModel, table=True):
+    # Clases in session on a dia at a given time, and time-range searches
+    # within a set of aulas (room search)
+    __table_args__ = (
+        Index("ix_clase_dia_hora_inicio_hora_fin", "dia", "hora_inicio", "hora_fin"),
+        Index("ix_clase_aula_id_dia_hora_inicio", "aula_id", "dia", "hora_inicio"),
+    )
+
     id: int | None = Field(default=None, primary_key=True)
     sesion: int | None = Field(default=None, nullable=True)
     hora_inicio: time | None = Field(default=None, nullable=True)
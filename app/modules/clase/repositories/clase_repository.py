@@ -1,6 +1,13 @@
-from sqlmodel import Session, func, select
+from collections.abc import Iterator
 
+from sqlmodel import Session, func, or_, select
+
+from app.core.database import EXPORT_BATCH_SIZE, stream_rows
+from app.modules.aula.models import Aula
 from app.modules.clase.models import Clase
+from app.modules.edificio.models import Edificio
+from app.modules.materia.models import Materia
+from app.modules.seccion.models import Seccion
 
 
 class ClaseRepository:
@@ -17,35 +24,91 @@ class ClaseRepository:
         statement = select(Clase).where(Clase.id == clase_id)
         return self.session.exec(statement).first()
 
-    def list(self, filters: dict) -> tuple[list[Clase], int]:
-        statement = select(Clase)
-        total_statement = select(func.count()).select_from(Clase)
+    @staticmethod
+    def _matches(column, value):
+        """Equality, or membership when the filter is a list of values"""
+        if isinstance(value, (list, tuple, set)):
+            return column.in_(value)
+        return column == value
+
+    def _filtered(self, statement, filters: dict):
+        """Apply the filters to a statement over Clase, joining what they need"""
+        conditions = []
+        seccion = aula = edificio = materia = False
 
         if filters.get("seccion_id") is not None:
-            statement = statement.where(Clase.seccion_id == filters["seccion_id"])
-            total_statement = total_statement.where(
-                Clase.seccion_id == filters["seccion_id"]
-            )
+            conditions.append(self._matches(Clase.seccion_id, filters["seccion_id"]))
 
         if filters.get("aula_id") is not None:
-            statement = statement.where(Clase.aula_id == filters["aula_id"])
-            total_statement = total_statement.where(Clase.aula_id == filters["aula_id"])
+            conditions.append(self._matches(Clase.aula_id, filters["aula_id"]))
 
         if filters.get("hora_inicio") is not None:
-            statement = statement.where(Clase.hora_inicio == filters["hora_inicio"])
-            total_statement = total_statement.where(
-                Clase.hora_inicio == filters["hora_inicio"]
-            )
+            conditions.append(Clase.hora_inicio == filters["hora_inicio"])
 
         if filters.get("hora_fin") is not None:
-            statement = statement.where(Clase.hora_fin == filters["hora_fin"])
-            total_statement = total_statement.where(
-                Clase.hora_fin == filters["hora_fin"]
-            )
+            conditions.append(Clase.hora_fin == filters["hora_fin"])
+
+        # Clases entirely inside [hora_desde, hora_hasta]
+        if filters.get("hora_desde") is not None:
+            conditions.append(Clase.hora_inicio >= filters["hora_desde"])
+
+        if filters.get("hora_hasta") is not None:
+            conditions.append(Clase.hora_fin <= filters["hora_hasta"])
 
         if filters.get("dia") is not None:
-            statement = statement.where(Clase.dia == filters["dia"])
-            total_statement = total_statement.where(Clase.dia == filters["dia"])
+            conditions.append(self._matches(Clase.dia, filters["dia"]))
+
+        if filters.get("calendario_id") is not None:
+            seccion = True
+            conditions.append(Seccion.calendario_id == filters["calendario_id"])
+
+        if filters.get("centro_id") is not None:
+            seccion = True
+            conditions.append(self._matches(Seccion.centro_id, filters["centro_id"]))
+
+        if filters.get("edificio_id") is not None:
+            aula = True
+            conditions.append(self._matches(Aula.edificio_id, filters["edificio_id"]))
+
+        if filters.get("search"):
+            seccion = aula = edificio = materia = True
+            search = f"%{filters['search']}%"
+            conditions.append(
+                or_(
+                    Aula.name.ilike(search),
+                    Edificio.name.ilike(search),
+                    Seccion.nrc.ilike(search),
+                    Materia.name.ilike(search),
+                    Materia.clave.ilike(search),
+                )
+            )
+
+        if seccion:
+            statement = statement.join(Seccion, Clase.seccion_id == Seccion.id)
+        if materia:
+            statement = statement.join(Materia, Seccion.materia_id == Materia.id)
+        if aula:
+            statement = statement.outerjoin(Aula, Clase.aula_id == Aula.id)
+        if edificio:
+            statement = statement.outerjoin(Edificio, Aula.edificio_id == Edificio.id)
+
+        return statement.where(*conditions)
+
+    def stream(self, filters: dict, columns: list[str]) -> Iterator[tuple]:
+        statement = (
+            self._filtered(
+                select(*[getattr(Clase, column) for column in columns]), filters
+            )
+            .order_by(Clase.id)
+            .execution_options(yield_per=EXPORT_BATCH_SIZE)
+        )
+        return stream_rows(self.session, statement, len(columns))
+
+    def list(self, filters: dict) -> tuple[list[Clase], int]:
+        statement = self._filtered(select(Clase), filters).order_by(Clase.id)
+        total_statement = self._filtered(
+            select(func.count(Clase.id)).select_from(Clase), filters
+        )
 
         statement = statement.offset(filters.get("skip", 0)).limit(
             filters.get("limit", 100)
@@ -1,3 +1,5 @@
+from collections.abc import Iterator
+
 from app.core.exceptions import ConflictException, NotFoundException
 from app.modules.aula.repositories.aula_repository import AulaRepository
 from app.modules.clase.models import Clase
@@ -55,6 +57,9 @@ class ClaseService:
     def list_clases(self, **filters) -> tuple[list[Clase], int]:
         return self.repository.list(filters)
 
+    def export_clases(self, columns: list[str], **filters) -> Iterator[tuple]:
+        return self.repository.stream(filters, columns)
+
     def update_clase(self, clase_id: int, data: ClaseUpdate) -> Clase:
         clase = self.repository.get(clase_id)
         if not clase:
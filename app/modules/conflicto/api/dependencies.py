@@ -0,0 +1,18 @@
+from fastapi import Depends
+from sqlmodel import Session
+
+from app.api.dependencies.database import get_session
+from app.modules.calendario.repositories.calendario_repository import \
+    CalendarioRepository
+from app.modules.conflicto.repositories.conflicto_repository import \
+    ConflictoRepository
+from app.modules.conflicto.services.conflicto_service import ConflictoService
+
+
+def get_conflicto_service(
+    session: Session = Depends(get_session),
+) -> ConflictoService:
+    return ConflictoService(
+        repository=ConflictoRepository(session=session),
+        calendario_repository=CalendarioRepository(session=session),
+    )
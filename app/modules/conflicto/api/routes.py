@@ -0,0 +1,48 @@
+from typing import Annotated
+
+from fastapi import APIRouter, Depends, Query
+
+from app.api.dependencies.auth import user_is_staff
+from app.api.responses import page_response
+from app.api.schemas import Pagination
+from app.modules.conflicto.schemas import (ConflictoRead, ConflictoSummary,
+                                           ConflictoTipo)
+from app.modules.conflicto.services.conflicto_service import ConflictoService
+from app.modules.users.models import User
+
+from .dependencies import get_conflicto_service
+
+router = APIRouter()
+
+
+@router.post("/detectar", response_model=ConflictoSummary)
+async def detect_conflictos(
+    calendario_id: int,
+    service: Annotated[ConflictoService, Depends(get_conflicto_service)],
+    user: Annotated[User, Depends(user_is_staff)],
+):
+    return service.detect_conflictos(calendario_id)
+
+
+@router.get("/", response_model=Pagination[ConflictoRead])
+async def list_conflictos(
+    service: Annotated[ConflictoService, Depends(get_conflicto_service)],
+    user: Annotated[User, Depends(user_is_staff)],
+    calendario_id: int | None = None,
+    tipo: ConflictoTipo | None = None,
+    aula_id: int | None = None,
+    profesor_id: int | None = None,
+    nrc: str | None = None,
+    skip: int = Query(default=0, ge=0),
+    limit: int = Query(default=100, ge=1, le=100),
+):
+    conflictos, total = service.list_conflictos(
+        calendario_id=calendario_id,
+        tipo=tipo.value if tipo else None,
+        aula_id=aula_id,
+        profesor_id=profesor_id,
+        nrc=nrc,
+        skip=skip,
+        limit=limit,
+    )
+    return page_response(ConflictoRead, conflictos, total)
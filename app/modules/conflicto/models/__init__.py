@@ -0,0 +1,3 @@
+from .conflicto import Conflicto
+
+__all__ = ["Conflicto"]
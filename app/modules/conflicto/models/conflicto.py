@@ -0,0 +1,32 @@
+from datetime import datetime, time
+
+from pydantic import ConfigDict
+from sqlmodel import Field, SQLModel
+
+
+class Conflicto(SQLModel, table=True):
+    id: int | None = Field(default=None, primary_key=True)
+    tipo: str = Field(index=True)
+    dia: int
+    hora_inicio: time
+    hora_fin: time
+
+    calendario_id: int = Field(
+        index=True, foreign_key="calendario.id", ondelete="CASCADE"
+    )
+    aula_id: int | None = Field(
+        foreign_key="aula.id", ondelete="CASCADE", default=None, nullable=True
+    )
+    profesor_id: int | None = Field(
+        foreign_key="profesor.id", ondelete="CASCADE", default=None, nullable=True
+    )
+    clase_id: int = Field(foreign_key="clase.id", ondelete="CASCADE")
+    otra_clase_id: int = Field(foreign_key="clase.id", ondelete="CASCADE")
+    seccion_id: int = Field(foreign_key="seccion.id", ondelete="CASCADE")
+    otra_seccion_id: int = Field(foreign_key="seccion.id", ondelete="CASCADE")
+    nrc: str
+    otro_nrc: str
+
+    created_at: datetime = Field(default_factory=datetime.now)
+
+    model_config = ConfigDict(from_attributes=True)
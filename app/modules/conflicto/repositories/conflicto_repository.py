@@ -0,0 +1,86 @@
+from sqlmodel import Session, delete, func, select
+
+from app.modules.clase.models import Clase
+from app.modules.conflicto.models import Conflicto
+from app.modules.seccion.models import Seccion
+
+
+class ConflictoRepository:
+    def __init__(self, session: Session):
+        self.session = session
+
+    def clases(self, calendario_id: int) -> list[tuple]:
+        """
+        Scheduled clases of a calendario as (id, dia, hora_inicio, hora_fin,
+        aula_id, seccion_id, nrc, profesor_id, periodo_inicio, periodo_fin)
+        """
+        statement = (
+            select(
+                Clase.id,
+                Clase.dia,
+                Clase.hora_inicio,
+                Clase.hora_fin,
+                Clase.aula_id,
+                Seccion.id,
+                Seccion.nrc,
+                Seccion.profesor_id,
+                Seccion.periodo_inicio,
+                Seccion.periodo_fin,
+            )
+            .join(Seccion, Clase.seccion_id == Seccion.id)
+            .where(
+                Seccion.calendario_id == calendario_id,
+                Clase.dia.is_not(None),
+                Clase.hora_inicio.is_not(None),
+                Clase.hora_fin.is_not(None),
+            )
+        )
+        return list(self.session.exec(statement))
+
+    def replace(self, calendario_id: int, conflictos: list[Conflicto]) -> None:
+        """Swap the stored conflictos of a calendario in one transaction"""
+        self.session.exec(
+            delete(Conflicto).where(Conflicto.calendario_id == calendario_id)
+        )
+        self.session.add_all(conflictos)
+        self.session.commit()
+
+    def _conditions(self, filters: dict) -> list:
+        conditions = []
+
+        if filters.get("calendario_id") is not None:
+            conditions.append(Conflicto.calendario_id == filters["calendario_id"])
+
+        if filters.get("tipo") is not None:
+            conditions.append(Conflicto.tipo == filters["tipo"])
+
+        if filters.get("aula_id") is not None:
+            conditions.append(Conflicto.aula_id == filters["aula_id"])
+
+        if filters.get("profesor_id") is not None:
+            conditions.append(Conflicto.profesor_id == filters["profesor_id"])
+
+        if filters.get("nrc") is not None:
+            conditions.append(
+                (Conflicto.nrc == filters["nrc"])
+                | (Conflicto.otro_nrc == filters["nrc"])
+            )
+
+        return conditions
+
+    def list(self, filters: dict) -> tuple[list[Conflicto], int]:
+        conditions = self._conditions(filters)
+        statement = select(Conflicto).where(*conditions)
+        total_statement = select(func.count()).select_from(Conflicto).where(*conditions)
+
+        statement = statement.order_by(
+            Conflicto.tipo, Conflicto.dia, Conflicto.hora_inicio, Conflicto.id
+        )
+        statement = statement.offset(filters.get("skip", 0)).limit(
+            filters.get("limit", 100)
+        )
+
+        results = self.session.exec(statement).all()
+        total = self.session.exec(total_statement).one()
+
+        return list(results), total
@@ -0,0 +1,7 @@
+from .conflicto import ConflictoRead, ConflictoSummary, ConflictoTipo
+
+__all__ = [
+    "ConflictoRead",
+    "ConflictoSummary",
+    "ConflictoTipo",
+]
@@ -0,0 +1,34 @@
+from datetime import datetime, time
+from enum import Enum
+
+from sqlmodel import SQLModel
+
+
+class ConflictoTipo(str, Enum):
+    aula = "aula"
+    profesor = "profesor"
+
+
+class ConflictoRead(SQLModel):
+    id: int
+    tipo: ConflictoTipo
+    dia: int
+    hora_inicio: time
+    hora_fin: time
+    calendario_id: int
+    aula_id: int | None
+    profesor_id: int | None
+    clase_id: int
+    otra_clase_id: int
+    seccion_id: int
+    otra_seccion_id: int
+    nrc: str
+    otro_nrc: str
+    created_at: datetime
+
+
+class ConflictoSummary(SQLModel):
+    calendario_id: int
+    aulas: int
+    profesores: int
+    total: int
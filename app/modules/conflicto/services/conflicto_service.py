@@ -0,0 +1,115 @@
+"""
+Schedule conflict detection.
+
+Clases of a calendario are grouped by (aula, dia) and by (profesor, dia) and
+each group is swept once in start order, keeping a heap of the clases still in
+progress: every clase overlaps exactly the ones left in the heap when it
+starts. That is O(n log n + k) for k conflicts instead of comparing every pair.
+"""
+
+import heapq
+from collections import defaultdict
+from collections.abc import Iterator
+from datetime import datetime, time
+
+from app.core.exceptions import NotFoundException
+from app.modules.calendario.repositories.calendario_repository import \
+    CalendarioRepository
+from app.modules.conflicto.models import Conflicto
+from app.modules.conflicto.repositories.conflicto_repository import \
+    ConflictoRepository
+from app.modules.conflicto.schemas import ConflictoSummary, ConflictoTipo
+
+# Column positions of ConflictoRepository.clases rows
+ID, DIA, HORA_INICIO, HORA_FIN, AULA, SECCION, NRC, PROFESOR, DESDE, HASTA = range(10)
+
+
+def sweep(clases: list[tuple]) -> Iterator[tuple[tuple, tuple]]:
+    """Overlapping pairs of a group of clases"""
+    active: list[tuple[time, int]] = []
+    ordered = sorted(clases, key=lambda clase: (clase[HORA_INICIO], clase[ID]))
+
+    for position, clase in enumerate(ordered):
+        while active and active[0][0] <= clase[HORA_INICIO]:
+            heapq.heappop(active)
+        for _, other in active:
+            yield ordered[other], clase
+        heapq.heappush(active, (clase[HORA_FIN], position))
+
+
+def _periodos_overlap(a: tuple, b: tuple) -> bool:
+    if None in (a[DESDE], a[HASTA], b[DESDE], b[HASTA]):
+        return True
+    return a[DESDE] <= b[HASTA] and b[DESDE] <= a[HASTA]
+
+
+class ConflictoService:
+    def __init__(
+        self,
+        repository: ConflictoRepository,
+        calendario_repository: CalendarioRepository,
+    ):
+        self.repository = repository
+        self.calendario_repository = calendario_repository
+
+    def find_conflictos(self, calendario_id: int) -> list[Conflicto]:
+        groups: dict[tuple[ConflictoTipo, int, int], list[tuple]] = defaultdict(list)
+        for clase in self.repository.clases(calendario_id):
+            if clase[HORA_FIN] <= clase[HORA_INICIO]:
+                continue
+            if clase[AULA] is not None:
+                groups[(ConflictoTipo.aula, clase[AULA], clase[DIA])].append(clase)
+            if clase[PROFESOR] is not None:
+                groups[(ConflictoTipo.profesor, clase[PROFESOR], clase[DIA])].append(
+                    clase
+                )
+
+        now = datetime.now()
+        conflictos = []
+        for (tipo, recurso_id, dia), clases in groups.items():
+            for a, b in sweep(clases):
+                # Sessions of the same seccion are a single teaching event, and
+                # secciones in disjoint periodos never meet.
+                if a[SECCION] == b[SECCION] or not _periodos_overlap(a, b):
+                    continue
+                conflictos.append(
+                    Conflicto(
+                        tipo=tipo.value,
+                        dia=dia,
+                        hora_inicio=max(a[HORA_INICIO], b[HORA_INICIO]),
+                        hora_fin=min(a[HORA_FIN], b[HORA_FIN]),
+                        calendario_id=calendario_id,
+                        aula_id=recurso_id if tipo == ConflictoTipo.aula else None,
+                        profesor_id=(
+                            recurso_id if tipo == ConflictoTipo.profesor else None
+                        ),
+                        clase_id=a[ID],
+                        otra_clase_id=b[ID],
+                        seccion_id=a[SECCION],
+                        otra_seccion_id=b[SECCION],
+                        nrc=a[NRC],
+                        otro_nrc=b[NRC],
+                        created_at=now,
+                    )
+                )
+
+        return conflictos
+
+    def detect_conflictos(self, calendario_id: int) -> ConflictoSummary:
+        """Recompute and store the conflictos of a calendario"""
+        if not self.calendario_repository.get(calendario_id):
+            raise NotFoundException("Calendario not found.")
+
+        conflictos = self.find_conflictos(calendario_id)
+        self.repository.replace(calendario_id, conflictos)
+
+        aulas = sum(1 for c in conflictos if c.tipo == ConflictoTipo.aula.value)
+        return ConflictoSummary(
+            calendario_id=calendario_id,
+            aulas=aulas,
+            profesores=len(conflictos) - aulas,
+            total=len(conflictos),
+        )
+
+    def list_conflictos(self, **filters) -> tuple[list[Conflicto], int]:
+        return self.repository.list(filters)
@@ -3,7 +3,12 @@ from typing import Annotated
 from fastapi import APIRouter, Depends, Query, status
 
 from app.api.dependencies.auth import user_is_staff
+from app.api.responses import model_response, page_response
+from app.api.routing import cached_route
 from app.api.schemas import Pagination
+from app.modules.aula.models import Aula
+from app.modules.centro.models import CentroUniversitario
+from app.modules.edificio.models import Edificio
 from app.modules.edificio.schemas import (EdificioCreate, EdificioRead,
                                           EdificioUpdate)
 from app.modules.edificio.services.edificio_service import EdificioService
@@ -11,7 +16,7 @@ from app.modules.users.models import User
 
 from .dependencies import get_edificio_service
 
-router = APIRouter()
+router = APIRouter(route_class=cached_route(Edificio, CentroUniversitario, Aula))
 
 
 @router.post("/", response_model=EdificioRead, status_code=status.HTTP_201_CREATED)
@@ -28,7 +33,7 @@ async def get_edificio(
     edificio_id: int,
     service: Annotated[EdificioService, Depends(get_edificio_service)],
 ):
-    return service.get_edificio(edificio_id)
+    return model_response(EdificioRead, service.get_edificio(edificio_id))
 
 
 @router.get("/", response_model=Pagination[EdificioRead])
@@ -47,10 +52,7 @@ async def list_edificios(
         skip=skip,
         limit=limit,
     )
-    return Pagination(
-        total=total,
-        results=edificios,
-    )
+    return page_response(EdificioRead, edificios, total)
 
 
 @router.put("/{edificio_id}", response_model=EdificioRead)
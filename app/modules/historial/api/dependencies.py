@@ -0,0 +1,10 @@
+from fastapi import Depends
+from sqlmodel import Session
+
+from app.api.dependencies.database import get_session
+from app.modules.historial.repositories.cupos_repository import CuposRepository
+from app.modules.historial.services.cupos_service import CuposService
+
+
+def get_cupos_service(session: Session = Depends(get_session)) -> CuposService:
+    return CuposService(repository=CuposRepository(session=session))
@@ -0,0 +1,61 @@
+from datetime import datetime
+from typing import Annotated
+
+from fastapi import APIRouter, Depends, Query
+
+from app.api.dependencies.auth import user_is_staff
+from app.api.routing import cached_route
+from app.modules.historial.models import CuposRegistro, CuposTramo
+from app.modules.historial.schemas import (CuposCompactacion,
+                                           CuposEstadisticas, CuposSerie)
+from app.modules.historial.services.cupos_service import (DEFAULT_PUNTOS,
+                                                          MAX_PUNTOS,
+                                                          CuposService)
+from app.modules.seccion.models import Seccion
+from app.modules.users.models import User
+
+from .dependencies import get_cupos_service
+
+router = APIRouter()
+# Cached responses skip dependencies, so staff routes live outside the cache
+series_router = APIRouter(route_class=cached_route(CuposRegistro, CuposTramo, Seccion))
+
+
+@series_router.get("/cupos", response_model=CuposSerie)
+async def get_cupos_serie(
+    service: Annotated[CuposService, Depends(get_cupos_service)],
+    nrc: str | None = None,
+    materia_id: int | None = None,
+    calendario_id: int | None = None,
+    desde: datetime | None = None,
+    hasta: datetime | None = None,
+    puntos: Annotated[int, Query(ge=2, le=MAX_PUNTOS)] = DEFAULT_PUNTOS,
+):
+    return service.serie(
+        nrc=nrc,
+        materia_id=materia_id,
+        calendario_id=calendario_id,
+        desde=desde,
+        hasta=hasta,
+        puntos=puntos,
+    )
+
+
+@router.get("/cupos/estadisticas", response_model=CuposEstadisticas)
+async def get_cupos_stats(
+    service: Annotated[CuposService, Depends(get_cupos_service)],
+    user: Annotated[User, Depends(user_is_staff)],
+    calendario_id: int | None = None,
+):
+    return service.stats(calendario_id)
+
+
+@router.post("/cupos/compactar", response_model=CuposCompactacion)
+async def compact_cupos(
+    service: Annotated[CuposService, Depends(get_cupos_service)],
+    user: Annotated[User, Depends(user_is_staff)],
+):
+    return service.compact()
+
+
+router.include_router(series_router)
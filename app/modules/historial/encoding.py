@@ -0,0 +1,79 @@
+"""
+Delta encoding of cupos series.
+
+A run of samples is stored as its first timestamp and value plus, for every
+following sample, the seconds elapsed since the previous one and the change in
+cupos_disponibles, each as a LEB128 varint (the change zigzag encoded, as it
+can be negative). Syncs record a sample a minute apart at most and values move
+by a few seats, so most samples take two or three bytes instead of a row.
+"""
+
+from collections.abc import Iterable
+from datetime import datetime, timedelta
+
+Sample = tuple[datetime, int]
+
+_EPOCH = datetime(2000, 1, 1)
+
+
+def _zigzag(value: int) -> int:
+    return value * 2 if value >= 0 else -value * 2 - 1
+
+
+def _unzigzag(value: int) -> int:
+    return value // 2 if not value & 1 else -(value + 1) // 2
+
+
+def _write_varint(value: int, out: bytearray) -> None:
+    while value > 0x7F:
+        out.append(value & 0x7F | 0x80)
+        value >>= 7
+    out.append(value)
+
+
+def encode(samples: list[Sample]) -> bytes:
+    """Deltas of the samples after the first, which the run stores as is"""
+    out = bytearray()
+    for (previous_at, previous), (at, value) in zip(samples, samples[1:]):
+        _write_varint(int((at - previous_at).total_seconds()), out)
+        _write_varint(_zigzag(value - previous), out)
+    return bytes(out)
+
+
+def decode(inicio: datetime, valor_inicial: int, deltas: bytes) -> list[Sample]:
+    samples = [(inicio, valor_inicial)]
+    at, value = inicio, valor_inicial
+    numbers = []
+    current = shift = 0
+    for byte in deltas:
+        current |= (byte & 0x7F) << shift
+        if byte & 0x80:
+            shift += 7
+            continue
+        numbers.append(current)
+        current = shift = 0
+
+    for seconds, change in zip(numbers[::2], numbers[1::2]):
+        at += timedelta(seconds=seconds)
+        value += _unzigzag(change)
+        samples.append((at, value))
+    return samples
+
+
+def thin(samples: Iterable[Sample], resolution: int) -> list[Sample]:
+    """
+    Keep the last sample of every ``resolution`` seconds window, and drop the
+    ones that repeat the previous value
+    """
+    by_window: dict[int, Sample] = {}
+    for at, value in samples:
+        # Whole seconds: deltas are stored at that precision
+        at = at.replace(microsecond=0)
+        by_window[int((at - _EPOCH).total_seconds()) // resolution] = (at, value)
+
+    kept: list[Sample] = []
+    for window in sorted(by_window):
+        sample = by_window[window]
+        if not kept or kept[-1][1] != sample[1]:
+            kept.append(sample)
+    return kept
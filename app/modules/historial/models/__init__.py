@@ -0,0 +1,4 @@
+from . import cupos_sync  # noqa: F401  (registers the flush listener)
+from .cupos import CuposRegistro, CuposTramo
+
+__all__ = ["CuposRegistro", "CuposTramo"]
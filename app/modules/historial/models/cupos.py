@@ -0,0 +1,40 @@
+from datetime import datetime
+
+from pydantic import ConfigDict
+from sqlalchemy import Index, LargeBinary
+from sqlmodel import Field, SQLModel
+
+
+class CuposRegistro(SQLModel, table=True):
+    """
+    A change of cupos_disponibles, recorded by
+    app.modules.historial.models.cupos_sync and compacted into CuposTramo once
+    older than CUPOS_HISTORY_RETENTION_DAYS
+    """
+
+    __table_args__ = (
+        Index(
+            "ix_cuposregistro_seccion_id_registrado_at", "seccion_id", "registrado_at"
+        ),
+    )
+
+    id: int | None = Field(default=None, primary_key=True)
+    seccion_id: int = Field(foreign_key="seccion.id", ondelete="CASCADE")
+    registrado_at: datetime = Field(index=True)
+    cupos_disponibles: int
+
+    model_config = ConfigDict(from_attributes=True)
+
+
+class CuposTramo(SQLModel, table=True):
+    """A compacted run of cupos samples (see app.modules.historial.encoding)"""
+
+    id: int | None = Field(default=None, primary_key=True)
+    seccion_id: int = Field(index=True, foreign_key="seccion.id", ondelete="CASCADE")
+    inicio: datetime
+    fin: datetime
+    muestras: int
+    valor_inicial: int
+    deltas: bytes = Field(sa_type=LargeBinary)
+
+    model_config = ConfigDict(from_attributes=True)
@@ -0,0 +1,100 @@
+"""
+Records cupos_disponibles changes of secciones.
+
+Flushes that create secciones or change their cupos_disponibles append one
+sample each to the cupos history in the same transaction, so imports and CRUD
+keep it without calling anything. Bulk paths that write with Core statements,
+like the cupos sync, call ``record_cupos`` with the changes they made.
+
+Inside ``app.core.events.deferred``, as in imports, the samples of each commit
+are kept instead, with the time they were taken, and its last commit appends
+them all with one insert. Samples of rolled back work are dropped.
+"""
+
+from datetime import datetime
+
+from sqlalchemy import event, insert, inspect
+from sqlalchemy.orm import Session
+
+from app.core import events
+from app.modules.seccion.models import Seccion
+
+from .cupos import CuposRegistro
+
+# Samples of the current transaction, and of the ones committed while deferred
+_PENDING_KEY = "cupos_pending"
+_COMMITTED_KEY = "cupos_committed"
+
+
+@event.listens_for(Seccion.cupos_disponibles, "set", active_history=True)
+def _load_previous_cupos(target, value, oldvalue, initiator) -> None:
+    # Registered for active_history only: an update that rewrites the same
+    # value must not be recorded as a change
+    pass
+
+
+def _rows(samples: list[tuple[int, int]], at: datetime) -> list[dict]:
+    return [
+        {"seccion_id": seccion_id, "registrado_at": at, "cupos_disponibles": value}
+        for seccion_id, value in samples
+    ]
+
+
+def _insert(session: Session, rows: list[dict]) -> None:
+    if not rows:
+        return
+
+    session.connection().execute(insert(CuposRegistro.__table__), rows)
+    events.track(session, CuposRegistro.__tablename__, events.CREATE)
+
+
+def record_cupos(
+    session: Session, samples: list[tuple[int, int]], at: datetime | None = None
+) -> None:
+    """Append (seccion_id, cupos_disponibles) samples taken at ``at`` (now)"""
+    _insert(session, _rows(samples, at or datetime.now()))
+
+
+@event.listens_for(Session, "after_flush")
+def _record_flushed(session: Session, flush_context) -> None:
+    samples = []
+    for obj in session.new:
+        if isinstance(obj, Seccion):
+            samples.append((obj.id, obj.cupos_disponibles))
+    for obj in session.dirty:
+        if not isinstance(obj, Seccion):
+            continue
+        history = inspect(obj).attrs.cupos_disponibles.history
+        if history.added and history.added[0] not in history.deleted:
+            samples.append((obj.id, obj.cupos_disponibles))
+
+    if not events.is_deferred(session):
+        record_cupos(session, samples)
+    elif samples:
+        pending = session.info.setdefault(_PENDING_KEY, [])
+        pending.extend(_rows(samples, datetime.now()))
+
+
+@event.listens_for(Session, "before_commit")
+def _record_pending(session: Session) -> None:
+    if events.is_deferred(session):
+        return
+    # Whatever the commit still flushes is recorded as it is written
+    _insert(
+        session,
+        session.info.pop(_COMMITTED_KEY, []) + session.info.pop(_PENDING_KEY, []),
+    )
+
+
+@event.listens_for(Session, "after_commit")
+def _keep_committed(session: Session) -> None:
+    rows = session.info.pop(_PENDING_KEY, None)
+    if rows:
+        session.info.setdefault(_COMMITTED_KEY, []).extend(rows)
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard(session: Session) -> None:
+    session.info.pop(_PENDING_KEY, None)
+    if not events.is_deferred(session):
+        session.info.pop(_COMMITTED_KEY, None)
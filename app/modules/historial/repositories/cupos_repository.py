@@ -0,0 +1,170 @@
+from collections import defaultdict
+from datetime import datetime
+
+from sqlalchemy import delete, func, insert
+from sqlmodel import Session, select
+
+from app.core import events
+from app.modules.historial.encoding import Sample, decode, encode, thin
+from app.modules.historial.models import CuposRegistro, CuposTramo
+from app.modules.seccion.models import Seccion
+
+# Secciones compacted per statement
+COMPACT_BATCH_SIZE = 500
+# Column payload of a stored row, ignoring per-row and index overhead: ids and
+# timestamps take 8 bytes, counts 4
+REGISTRO_BYTES = 8 + 8 + 8 + 4
+TRAMO_BYTES = 8 + 8 + 8 + 8 + 4 + 4
+
+
+class CuposRepository:
+    def __init__(self, session: Session):
+        self.session = session
+
+    def secciones(
+        self,
+        nrc: str | None = None,
+        materia_id: int | None = None,
+        calendario_id: int | None = None,
+    ) -> list[int]:
+        statement = select(Seccion.id)
+        if nrc is not None:
+            statement = statement.where(Seccion.nrc == nrc)
+        if materia_id is not None:
+            statement = statement.where(Seccion.materia_id == materia_id)
+        if calendario_id is not None:
+            statement = statement.where(Seccion.calendario_id == calendario_id)
+        return list(self.session.exec(statement.order_by(Seccion.id)))
+
+    def samples(
+        self, seccion_ids: list[int], hasta: datetime | None = None
+    ) -> dict[int, list[Sample]]:
+        """Samples up to ``hasta`` by seccion, from both runs and raw rows"""
+        hasta = hasta or datetime.max
+        found: dict[int, list[Sample]] = defaultdict(list)
+        tramos = self.session.exec(
+            select(
+                CuposTramo.seccion_id,
+                CuposTramo.inicio,
+                CuposTramo.valor_inicial,
+                CuposTramo.deltas,
+            )
+            .where(CuposTramo.seccion_id.in_(seccion_ids), CuposTramo.inicio <= hasta)
+            .order_by(CuposTramo.seccion_id, CuposTramo.inicio)
+        )
+        for seccion_id, inicio, valor_inicial, deltas in tramos:
+            found[seccion_id].extend(
+                sample
+                for sample in decode(inicio, valor_inicial, deltas)
+                if sample[0] <= hasta
+            )
+
+        registros = self.session.exec(
+            select(
+                CuposRegistro.seccion_id,
+                CuposRegistro.registrado_at,
+                CuposRegistro.cupos_disponibles,
+            )
+            .where(
+                CuposRegistro.seccion_id.in_(seccion_ids),
+                CuposRegistro.registrado_at <= hasta,
+            )
+            .order_by(CuposRegistro.seccion_id, CuposRegistro.registrado_at)
+        )
+        for seccion_id, at, value in registros:
+            found[seccion_id].append((at, value))
+        return found
+
+    def compact(self, before: datetime, resolution: int) -> tuple[int, int, int, int]:
+        """
+        Replace the raw rows older than ``before`` with one run per seccion;
+        returns the secciones, rows, runs and samples involved
+        """
+        seccion_ids = list(
+            self.session.exec(
+                select(CuposRegistro.seccion_id)
+                .where(CuposRegistro.registrado_at < before)
+                .distinct()
+            )
+        )
+        connection = self.session.connection()
+        registros = tramos = muestras = 0
+        for start in range(0, len(seccion_ids), COMPACT_BATCH_SIZE):
+            end = start + COMPACT_BATCH_SIZE
+            batch = seccion_ids[start:end]
+            conditions = (
+                CuposRegistro.seccion_id.in_(batch),
+                CuposRegistro.registrado_at < before,
+            )
+            rows: dict[int, list[Sample]] = defaultdict(list)
+            for seccion_id, at, value in connection.execute(
+                select(
+                    CuposRegistro.seccion_id,
+                    CuposRegistro.registrado_at,
+                    CuposRegistro.cupos_disponibles,
+                )
+                .where(*conditions)
+                .order_by(CuposRegistro.seccion_id, CuposRegistro.registrado_at)
+            ):
+                rows[seccion_id].append((at, value))
+                registros += 1
+
+            values = []
+            for seccion_id, samples in rows.items():
+                kept = thin(samples, resolution)
+                values.append(
+                    {
+                        "seccion_id": seccion_id,
+                        "inicio": kept[0][0],
+                        "fin": kept[-1][0],
+                        "muestras": len(kept),
+                        "valor_inicial": kept[0][1],
+                        "deltas": encode(kept),
+                    }
+                )
+                muestras += len(kept)
+            connection.execute(insert(CuposTramo.__table__), values)
+            connection.execute(delete(CuposRegistro).where(*conditions))
+            tramos += len(values)
+
+        if seccion_ids:
+            # Core writes bypass change tracking
+            events.track(self.session, CuposTramo.__tablename__, events.CREATE)
+            events.track(self.session, CuposRegistro.__tablename__, events.DELETE)
+        self.session.commit()
+        return len(seccion_ids), registros, tramos, muestras
+
+    def stats(self, calendario_id: int | None = None) -> dict[str, int]:
+        registro_filter, tramo_filter = [], []
+        if calendario_id is not None:
+            in_calendario = select(Seccion.id).where(
+                Seccion.calendario_id == calendario_id
+            )
+            registro_filter.append(CuposRegistro.seccion_id.in_(in_calendario))
+            tramo_filter.append(CuposTramo.seccion_id.in_(in_calendario))
+
+        registros = self.session.exec(
+            select(func.count()).select_from(CuposRegistro).where(*registro_filter)
+        ).one()
+        tramos, muestras, delta_bytes = self.session.exec(
+            select(
+                func.count(),
+                func.coalesce(func.sum(CuposTramo.muestras), 0),
+                func.coalesce(func.sum(func.length(CuposTramo.deltas)), 0),
+            ).where(*tramo_filter)
+        ).one()
+        secciones = (
+            select(CuposRegistro.seccion_id)
+            .where(*registro_filter)
+            .union(select(CuposTramo.seccion_id).where(*tramo_filter))
+        )
+        return {
+            "secciones": self.session.exec(
+                select(func.count()).select_from(secciones.subquery())
+            ).one(),
+            "registros": registros,
+            "tramos": tramos,
+            "muestras": registros + muestras,
+            "bytes_registros": registros * REGISTRO_BYTES,
+            "bytes_tramos": tramos * TRAMO_BYTES + delta_bytes,
+        }
@@ -0,0 +1,8 @@
+from .cupos import CuposCompactacion, CuposEstadisticas, CuposPunto, CuposSerie
+
+__all__ = [
+    "CuposCompactacion",
+    "CuposEstadisticas",
+    "CuposPunto",
+    "CuposSerie",
+]
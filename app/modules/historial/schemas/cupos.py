@@ -0,0 +1,35 @@
+from datetime import datetime
+
+from sqlmodel import SQLModel
+
+
+class CuposPunto(SQLModel):
+    at: datetime
+    cupos_disponibles: int | None
+
+
+class CuposSerie(SQLModel):
+    nrc: str | None
+    materia_id: int | None
+    calendario_id: int | None
+    secciones: int
+    desde: datetime | None
+    hasta: datetime | None
+    puntos: list[CuposPunto]
+
+
+class CuposCompactacion(SQLModel):
+    secciones: int
+    registros: int
+    tramos: int
+    muestras: int
+
+
+class CuposEstadisticas(SQLModel):
+    calendario_id: int | None
+    secciones: int
+    registros: int
+    tramos: int
+    muestras: int
+    bytes_registros: int
+    bytes_tramos: int
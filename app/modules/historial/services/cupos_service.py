@@ -0,0 +1,116 @@
+"""
+Cupos history queries and maintenance.
+
+Samples are kept raw for CUPOS_HISTORY_RETENTION_DAYS and then compacted, per
+seccion, into delta-encoded runs thinned to one sample per
+CUPOS_HISTORY_RESOLUTION seconds. The cutoff is rounded down to midnight, so
+daily compactions write at most one run per seccion and day, and a
+registration period costs at most ``secciones * seconds / resolution`` samples
+of two or three bytes each, however often cupos are synced. The cupos sync
+compacts at most once per COMPACT_INTERVAL seconds per process.
+
+Series are downsampled to ``puntos`` evenly spaced instants: every point holds
+cupos_disponibles as of that instant, summed over the requested secciones, or
+None before any of them has a sample.
+"""
+
+import time
+from bisect import bisect_right
+from datetime import datetime, timedelta
+
+from app.core.config import settings
+from app.core.exceptions import BadRequestException, NotFoundException
+from app.modules.historial.repositories.cupos_repository import CuposRepository
+from app.modules.historial.schemas import (CuposCompactacion,
+                                           CuposEstadisticas, CuposPunto,
+                                           CuposSerie)
+
+DEFAULT_PUNTOS = 100
+MAX_PUNTOS = 1000
+COMPACT_INTERVAL = 3600
+
+_next_compaction = 0.0
+
+
+class CuposService:
+    def __init__(self, repository: CuposRepository):
+        self.repository = repository
+
+    def serie(
+        self,
+        nrc: str | None = None,
+        materia_id: int | None = None,
+        calendario_id: int | None = None,
+        desde: datetime | None = None,
+        hasta: datetime | None = None,
+        puntos: int = DEFAULT_PUNTOS,
+    ) -> CuposSerie:
+        if (nrc is None) == (materia_id is None):
+            raise BadRequestException("Provide either nrc or materia_id.")
+        if not 2 <= puntos <= MAX_PUNTOS:
+            raise BadRequestException(f"puntos must be between 2 and {MAX_PUNTOS}.")
+
+        seccion_ids = self.repository.secciones(nrc, materia_id, calendario_id)
+        if not seccion_ids:
+            raise NotFoundException("Secciones not found.")
+
+        samples = self.repository.samples(seccion_ids, hasta)
+        # Defaults span the recorded samples, so responses only change with them
+        if desde is None:
+            desde = min((series[0][0] for series in samples.values()), default=None)
+        if hasta is None:
+            hasta = max((series[-1][0] for series in samples.values()), default=None)
+        serie = CuposSerie(
+            nrc=nrc,
+            materia_id=materia_id,
+            calendario_id=calendario_id,
+            secciones=len(seccion_ids),
+            desde=desde,
+            hasta=hasta,
+            puntos=[],
+        )
+        if desde is None or hasta is None or desde > hasta:
+            return serie
+
+        step = (hasta - desde) / (puntos - 1)
+        instants = [desde + step * i for i in range(puntos)]
+        totals: list[int | None] = [None] * puntos
+        for series in samples.values():
+            times = [at for at, _ in series]
+            for i, instant in enumerate(instants):
+                position = bisect_right(times, instant)
+                if position:
+                    totals[i] = (totals[i] or 0) + series[position - 1][1]
+
+        serie.puntos = [
+            CuposPunto(at=instant, cupos_disponibles=total)
+            for instant, total in zip(instants, totals)
+        ]
+        return serie
+
+    def compact(self, now: datetime | None = None) -> CuposCompactacion:
+        """Compact the raw samples older than the retention window"""
+        now = now or datetime.now()
+        before = datetime.combine(
+            (now - timedelta(days=settings.CUPOS_HISTORY_RETENTION_DAYS)).date(),
+            datetime.min.time(),
+        )
+        secciones, registros, tramos, muestras = self.repository.compact(
+            before, settings.CUPOS_HISTORY_RESOLUTION
+        )
+        return CuposCompactacion(
+            secciones=secciones, registros=registros, tramos=tramos, muestras=muestras
+        )
+
+    def compact_if_due(self) -> CuposCompactacion | None:
+        """Compact, unless this process already did in the last COMPACT_INTERVAL"""
+        global _next_compaction
+        if time.monotonic() < _next_compaction:
+            return None
+        _next_compaction = time.monotonic() + COMPACT_INTERVAL
+        return self.compact()
+
+    def stats(self, calendario_id: int | None = None) -> CuposEstadisticas:
+        return CuposEstadisticas(
+            calendario_id=calendario_id, **self.repository.stats(calendario_id)
+        )
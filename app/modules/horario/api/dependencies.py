@@ -0,0 +1,16 @@
+from fastapi import Depends
+from sqlmodel import Session
+
+from app.api.dependencies.database import get_session
+from app.modules.horario.repositories.horario_repository import \
+    HorarioRepository
+from app.modules.horario.services.horario_service import HorarioService
+from app.modules.profesor.repositories.profesor_repository import \
+    ProfesorRepository
+
+
+def get_horario_service(session: Session = Depends(get_session)) -> HorarioService:
+    return HorarioService(
+        repository=HorarioRepository(session=session),
+        profesor_repository=ProfesorRepository(session=session),
+    )
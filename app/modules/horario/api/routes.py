@@ -0,0 +1,32 @@
+from typing import Annotated
+
+from fastapi import APIRouter, Depends
+
+from app.api.dependencies.auth import user_is_staff
+from app.api.routing import cached_route
+from app.modules.horario.models import ProfesorHorario
+from app.modules.horario.schemas import HorarioRebuild, ProfesorHorarioRead
+from app.modules.horario.services.horario_service import HorarioService
+from app.modules.profesor.models import Profesor
+from app.modules.users.models import User
+
+from .dependencies import get_horario_service
+
+router = APIRouter(route_class=cached_route(ProfesorHorario, Profesor))
+
+
+@router.get("/profesores/{profesor_id}", response_model=list[ProfesorHorarioRead])
+async def get_profesor_horarios(
+    profesor_id: int,
+    service: Annotated[HorarioService, Depends(get_horario_service)],
+    calendario_id: int | None = None,
+):
+    return service.get_profesor_horarios(profesor_id, calendario_id)
+
+
+@router.post("/reconstruir", response_model=HorarioRebuild)
+async def rebuild_horarios(
+    service: Annotated[HorarioService, Depends(get_horario_service)],
+    user: Annotated[User, Depends(user_is_staff)],
+):
+    return service.rebuild()
@@ -0,0 +1,4 @@
+from . import horario_sync  # noqa: F401  (registers the flush listeners)
+from .profesor_horario import ProfesorHorario
+
+__all__ = ["ProfesorHorario"]
@@ -0,0 +1,287 @@
+"""
+Keeps the profesor_horario read model current.
+
+Flushes writing secciones, clases, or the materias, aulas and edificios shown
+in a timetable mark the profesores they touch (before and after the write), or
+the rows to look them up from. Right before the transaction commits, the rows
+of those profesores are rebuilt from the normalized tables, so the read model
+commits or rolls back together with the writes it reflects. Inside
+``app.core.events.deferred``, as in imports, the marks add up over the commits
+and each touched profesor is rebuilt once at the end.
+"""
+
+from dataclasses import dataclass, field
+from datetime import datetime
+
+from sqlalchemy import delete, event, insert, inspect, select
+from sqlalchemy.orm import Session
+
+from app.core import events
+from app.modules.aula.models import Aula
+from app.modules.clase.models import Clase
+from app.modules.edificio.models import Edificio
+from app.modules.materia.models import Materia
+from app.modules.seccion.models import Seccion
+
+from .profesor_horario import ProfesorHorario
+
+_PENDING_KEY = "profesor_horario_pending"
+
+# Ids per statement, keeping IN lists small
+CHUNK_SIZE = 500
+
+# Columns whose changes show in a timetable; cupos updates are left alone
+_SHOWN = {
+    Seccion: (
+        "name",
+        "nrc",
+        "periodo_inicio",
+        "periodo_fin",
+        "materia_id",
+        "profesor_id",
+        "calendario_id",
+    ),
+    Materia: ("name", "clave", "creditos"),
+    Aula: ("name", "edificio_id"),
+    Edificio: ("name",),
+}
+
+
+@event.listens_for(Seccion.profesor_id, "set", active_history=True)
+def _load_previous_profesor(target, value, oldvalue, initiator) -> None:
+    # Registered for active_history only: reassigning a seccion must still
+    # tell which profesor lost it
+    pass
+
+
+def _changed(obj, fields: tuple[str, ...]) -> bool:
+    attrs = inspect(obj).attrs
+    return any(attrs[field].history.has_changes() for field in fields)
+
+
+@dataclass
+class _Marks:
+    """Profesores touched by some flushes, and rows to look more of them up from"""
+
+    profesores: set[int] = field(default_factory=set)
+    secciones: set[int] = field(default_factory=set)
+    related: dict[type, set[int]] = field(
+        default_factory=lambda: {Materia: set(), Aula: set(), Edificio: set()}
+    )
+
+    def add(self, session: Session) -> None:
+        """Mark what the session is flushing"""
+        for objects, dirty in (
+            (session.new, False),
+            (session.dirty, True),
+            (session.deleted, False),
+        ):
+            for obj in objects:
+                if isinstance(obj, Seccion):
+                    if dirty and not _changed(obj, _SHOWN[Seccion]):
+                        continue
+                    attrs = inspect(obj).attrs
+                    self.profesores.update(attrs.profesor_id.history.deleted)
+                    self.profesores.add(obj.profesor_id)
+                elif isinstance(obj, Clase):
+                    self.secciones.update(inspect(obj).attrs.seccion_id.history.deleted)
+                    self.secciones.add(obj.seccion_id)
+                elif (
+                    dirty
+                    and type(obj) in self.related
+                    and _changed(obj, _SHOWN[type(obj)])
+                ):
+                    self.related[type(obj)].add(obj.id)
+
+    def resolve(self, session: Session) -> set[int]:
+        """The marked profesores, and those of the marked rows as they are now"""
+        lookups = [
+            (Seccion.id, select(Seccion.profesor_id), self.secciones),
+            (
+                Seccion.materia_id,
+                select(Seccion.profesor_id),
+                self.related[Materia],
+            ),
+            (
+                Clase.aula_id,
+                select(Seccion.profesor_id).join(Clase, Clase.seccion_id == Seccion.id),
+                self.related[Aula],
+            ),
+            (
+                Aula.edificio_id,
+                select(Seccion.profesor_id)
+                .join(Clase, Clase.seccion_id == Seccion.id)
+                .join(Aula, Clase.aula_id == Aula.id),
+                self.related[Edificio],
+            ),
+        ]
+        profesores = set(self.profesores)
+        for column, statement, ids in lookups:
+            ids = sorted(ids - {None})
+            for start in range(0, len(ids), CHUNK_SIZE):
+                chunk = ids[start : start + CHUNK_SIZE]
+                rows = session.connection().execute(
+                    statement.where(column.in_(chunk)).distinct()
+                )
+                profesores.update(rows.scalars())
+
+        profesores.discard(None)
+        return profesores
+
+
+def _iso(value) -> str | None:
+    return value.isoformat() if value is not None else None
+
+
+def _build(rows) -> list[dict]:
+    """profesor_horario rows from the clases of some profesores"""
+    horarios: dict[tuple[int, int], dict] = {}
+    for (
+        profesor_id,
+        calendario_id,
+        seccion_id,
+        nrc,
+        seccion,
+        periodo_inicio,
+        periodo_fin,
+        clave,
+        materia,
+        creditos,
+        clase_id,
+        dia,
+        hora_inicio,
+        hora_fin,
+        aula,
+        edificio,
+    ) in rows:
+        horario = horarios.setdefault(
+            (profesor_id, calendario_id),
+            {"creditos": {}, "minutos": 0, "clases": []},
+        )
+        horario["creditos"][seccion_id] = creditos
+        if clase_id is None:
+            continue
+
+        if dia is not None and hora_inicio is not None and hora_fin is not None:
+            horario["minutos"] += max(
+                (hora_fin.hour - hora_inicio.hour) * 60
+                + hora_fin.minute
+                - hora_inicio.minute,
+                0,
+            )
+        horario["clases"].append(
+            {
+                "clase_id": clase_id,
+                "dia": dia,
+                "hora_inicio": _iso(hora_inicio),
+                "hora_fin": _iso(hora_fin),
+                "aula": aula,
+                "edificio": edificio,
+                "seccion_id": seccion_id,
+                "nrc": nrc,
+                "seccion": seccion,
+                "clave": clave,
+                "materia": materia,
+                "periodo_inicio": _iso(periodo_inicio),
+                "periodo_fin": _iso(periodo_fin),
+            }
+        )
+
+    now = datetime.now()
+    values = []
+    for (profesor_id, calendario_id), horario in horarios.items():
+        horario["clases"].sort(
+            key=lambda clase: (
+                clase["dia"] is None,
+                clase["dia"] or 0,
+                clase["hora_inicio"] or "",
+                clase["nrc"],
+                clase["clase_id"],
+            )
+        )
+        values.append(
+            {
+                "profesor_id": profesor_id,
+                "calendario_id": calendario_id,
+                "secciones": len(horario["creditos"]),
+                "creditos": sum(horario["creditos"].values()),
+                "horas_semana": round(horario["minutos"] / 60, 2),
+                "clases": horario["clases"],
+                "updated_at": now,
+            }
+        )
+    return values
+
+
+def rebuild_horarios(session: Session, profesor_ids: set[int]) -> int:
+    """
+    Replace the profesor_horario rows of the given profesores, in the current
+    transaction; returns the number of rows written
+    """
+    if not profesor_ids:
+        return 0
+
+    connection = session.connection()
+    table = ProfesorHorario.__table__
+    ids = sorted(profesor_ids)
+    written = 0
+    for start in range(0, len(ids), CHUNK_SIZE):
+        end = start + CHUNK_SIZE
+        chunk = ids[start:end]
+        rows = connection.execute(
+            select(
+                Seccion.profesor_id,
+                Seccion.calendario_id,
+                Seccion.id,
+                Seccion.nrc,
+                Seccion.name,
+                Seccion.periodo_inicio,
+                Seccion.periodo_fin,
+                Materia.clave,
+                Materia.name,
+                Materia.creditos,
+                Clase.id,
+                Clase.dia,
+                Clase.hora_inicio,
+                Clase.hora_fin,
+                Aula.name,
+                Edificio.name,
+            )
+            .join(Materia, Seccion.materia_id == Materia.id)
+            .outerjoin(Clase, Clase.seccion_id == Seccion.id)
+            .outerjoin(Aula, Clase.aula_id == Aula.id)
+            .outerjoin(Edificio, Aula.edificio_id == Edificio.id)
+            .where(Seccion.profesor_id.in_(chunk))
+        )
+        values = _build(rows)
+
+        connection.execute(delete(table).where(table.c.profesor_id.in_(chunk)))
+        if values:
+            connection.execute(insert(table), values)
+        written += len(values)
+
+    events.track(session, table.name, events.UPDATE)
+    return written
+
+
+@event.listens_for(Session, "after_flush")
+def _collect_flushed(session: Session, flush_context) -> None:
+    session.info.setdefault(_PENDING_KEY, _Marks()).add(session)
+
+
+@event.listens_for(Session, "before_commit")
+def _rebuild_pending(session: Session) -> None:
+    if events.is_deferred(session):
+        return
+    # Commit flushes after this hook; flush first so its writes are included
+    session.flush()
+    marks = session.info.pop(_PENDING_KEY, None)
+    if marks is not None:
+        rebuild_horarios(session, marks.resolve(session))
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard(session: Session) -> None:
+    # Deferred work keeps its marks: the rows committed so far still count
+    if not events.is_deferred(session):
+        session.info.pop(_PENDING_KEY, None)
@@ -0,0 +1,32 @@
+from datetime import datetime
+from typing import Any
+
+from pydantic import ConfigDict
+from sqlalchemy import JSON, UniqueConstraint
+from sqlmodel import Field, SQLModel
+
+
+class ProfesorHorario(SQLModel, table=True):
+    """
+    Read model with the timetable and workload of a profesor in a calendario,
+    kept current by app.modules.horario.models.horario_sync
+    """
+
+    __table_args__ = (UniqueConstraint("profesor_id", "calendario_id"),)
+
+    id: int | None = Field(default=None, primary_key=True)
+    profesor_id: int = Field(index=True, foreign_key="profesor.id", ondelete="CASCADE")
+    calendario_id: int = Field(
+        index=True, foreign_key="calendario.id", ondelete="CASCADE"
+    )
+
+    secciones: int
+    creditos: int
+    horas_semana: float
+    # Flattened clases with their seccion, materia, aula and edificio, in
+    # timetable order (see app.modules.horario.schemas.HorarioClase)
+    clases: list[dict[str, Any]] = Field(default_factory=list, sa_type=JSON)
+
+    updated_at: datetime = Field(default_factory=datetime.now)
+
+    model_config = ConfigDict(from_attributes=True)
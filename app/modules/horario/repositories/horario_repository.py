@@ -0,0 +1,34 @@
+from sqlmodel import Session, select
+
+from app.modules.horario.models import ProfesorHorario
+from app.modules.horario.models.horario_sync import rebuild_horarios
+from app.modules.seccion.models import Seccion
+
+
+class HorarioRepository:
+    def __init__(self, session: Session):
+        self.session = session
+
+    def list_by_profesor(
+        self, profesor_id: int, calendario_id: int | None = None
+    ) -> list[ProfesorHorario]:
+        statement = select(ProfesorHorario).where(
+            ProfesorHorario.profesor_id == profesor_id
+        )
+        if calendario_id is not None:
+            statement = statement.where(ProfesorHorario.calendario_id == calendario_id)
+        statement = statement.order_by(ProfesorHorario.calendario_id)
+        return list(self.session.exec(statement))
+
+    def profesores(self) -> set[int]:
+        """Profesores with secciones or with stored horarios"""
+        with_secciones = select(Seccion.profesor_id).where(
+            Seccion.profesor_id.is_not(None)
+        )
+        stored = select(ProfesorHorario.profesor_id)
+        return {row[0] for row in self.session.exec(with_secciones.union(stored))}
+
+    def rebuild(self, profesor_ids: set[int]) -> int:
+        written = rebuild_horarios(self.session, profesor_ids)
+        self.session.commit()
+        return written
@@ -0,0 +1,7 @@
+from .horario import HorarioClase, HorarioRebuild, ProfesorHorarioRead
+
+__all__ = [
+    "HorarioClase",
+    "HorarioRebuild",
+    "ProfesorHorarioRead",
+]
@@ -0,0 +1,34 @@
+from datetime import datetime, time
+
+from sqlmodel import SQLModel
+
+
+class HorarioClase(SQLModel):
+    clase_id: int
+    dia: int | None
+    hora_inicio: time | None
+    hora_fin: time | None
+    aula: str | None
+    edificio: str | None
+    seccion_id: int
+    nrc: str
+    seccion: str
+    clave: str
+    materia: str
+    periodo_inicio: datetime | None
+    periodo_fin: datetime | None
+
+
+class ProfesorHorarioRead(SQLModel):
+    profesor_id: int
+    calendario_id: int
+    secciones: int
+    creditos: int
+    horas_semana: float
+    clases: list[HorarioClase]
+    updated_at: datetime
+
+
+class HorarioRebuild(SQLModel):
+    profesores: int
+    horarios: int
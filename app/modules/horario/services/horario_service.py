@@ -0,0 +1,33 @@
+from app.core.exceptions import NotFoundException
+from app.modules.horario.models import ProfesorHorario
+from app.modules.horario.repositories.horario_repository import \
+    HorarioRepository
+from app.modules.horario.schemas import HorarioRebuild
+from app.modules.profesor.repositories.profesor_repository import \
+    ProfesorRepository
+
+
+class HorarioService:
+    def __init__(
+        self,
+        repository: HorarioRepository,
+        profesor_repository: ProfesorRepository,
+    ):
+        self.repository = repository
+        self.profesor_repository = profesor_repository
+
+    def get_profesor_horarios(
+        self, profesor_id: int, calendario_id: int | None = None
+    ) -> list[ProfesorHorario]:
+        horarios = self.repository.list_by_profesor(profesor_id, calendario_id)
+        if not horarios and not self.profesor_repository.get(profesor_id):
+            raise NotFoundException("Profesor not found.")
+        return horarios
+
+    def rebuild(self) -> HorarioRebuild:
+        """Rebuild the horarios of every profesor, e.g. after a migration"""
+        profesores = self.repository.profesores()
+        return HorarioRebuild(
+            profesores=len(profesores),
+            horarios=self.repository.rebuild(profesores),
+        )
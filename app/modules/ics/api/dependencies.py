@@ -0,0 +1,23 @@
+from fastapi import Depends
+from sqlmodel import Session
+
+from app.api.dependencies.database import get_session
+from app.modules.aula.repositories.aula_repository import AulaRepository
+from app.modules.horario.repositories.horario_repository import \
+    HorarioRepository
+from app.modules.ics.repositories.ics_repository import IcsRepository
+from app.modules.ics.services.ics_service import IcsService
+from app.modules.profesor.repositories.profesor_repository import \
+    ProfesorRepository
+from app.modules.seccion.repositories.seccion_repository import \
+    SeccionRepository
+
+
+def get_ics_service(session: Session = Depends(get_session)) -> IcsService:
+    return IcsService(
+        repository=IcsRepository(session=session),
+        horario_repository=HorarioRepository(session=session),
+        seccion_repository=SeccionRepository(session=session),
+        profesor_repository=ProfesorRepository(session=session),
+        aula_repository=AulaRepository(session=session),
+    )
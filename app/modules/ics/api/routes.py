@@ -0,0 +1,69 @@
+from typing import Annotated
+
+from fastapi import APIRouter, Depends, Response
+
+from app.api.params import parse_list
+from app.api.routing import cached_route
+from app.modules.aula.models import Aula
+from app.modules.clase.models import Clase
+from app.modules.edificio.models import Edificio
+from app.modules.horario.models import ProfesorHorario
+from app.modules.ics.services.ics_service import IcsService
+from app.modules.materia.models import Materia
+from app.modules.profesor.models import Profesor
+from app.modules.seccion.models import Seccion
+
+from .dependencies import get_ics_service
+
+MEDIA_TYPE = "text/calendar"
+
+# Feeds are keyed on the versions of the tables they are rendered from, so
+# polling calendar apps get a 304 or the cached body until those change
+clases_router = APIRouter(
+    route_class=cached_route(Clase, Seccion, Materia, Profesor, Aula, Edificio)
+)
+horarios_router = APIRouter(route_class=cached_route(ProfesorHorario, Profesor))
+
+
+@clases_router.get("/secciones.ics", response_class=Response)
+async def get_nrcs_feed(
+    nrc: str,
+    service: Annotated[IcsService, Depends(get_ics_service)],
+    calendario_id: int | None = None,
+):
+    return Response(
+        service.nrcs_feed(parse_list(nrc), calendario_id), media_type=MEDIA_TYPE
+    )
+
+
+@clases_router.get("/secciones/{seccion_id}.ics", response_class=Response)
+async def get_seccion_feed(
+    seccion_id: int,
+    service: Annotated[IcsService, Depends(get_ics_service)],
+):
+    return Response(service.seccion_feed(seccion_id), media_type=MEDIA_TYPE)
+
+
+@clases_router.get("/aulas/{aula_id}.ics", response_class=Response)
+async def get_aula_feed(
+    aula_id: int,
+    service: Annotated[IcsService, Depends(get_ics_service)],
+    calendario_id: int | None = None,
+):
+    return Response(service.aula_feed(aula_id, calendario_id), media_type=MEDIA_TYPE)
+
+
+@horarios_router.get("/profesores/{profesor_id}.ics", response_class=Response)
+async def get_profesor_feed(
+    profesor_id: int,
+    service: Annotated[IcsService, Depends(get_ics_service)],
+    calendario_id: int | None = None,
+):
+    return Response(
+        service.profesor_feed(profesor_id, calendario_id), media_type=MEDIA_TYPE
+    )
+
+
+router = APIRouter()
+router.include_router(clases_router)
+router.include_router(horarios_router)
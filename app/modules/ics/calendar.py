@@ -0,0 +1,161 @@
+"""
+iCalendar (RFC 5545) rendering of clases.
+
+Every clase becomes one recurring event: its first occurrence is the first
+``dia`` on or after the seccion's ``periodo_inicio`` and an ``RRULE`` repeats it
+weekly until ``periodo_fin``. Clases without a schedule or a periodo cannot be
+placed on a calendar and are left out.
+
+Times are campus local (``settings.TIMEZONE``) and carry its ``TZID``. The
+``VTIMEZONE`` describes a single fixed offset, taken at the first event, which
+holds for zones without daylight saving time such as America/Mexico_City.
+"""
+
+from collections.abc import Iterable
+from datetime import datetime, timedelta, timezone
+from zoneinfo import ZoneInfo
+
+from app.core.config import settings
+from app.modules.ics.schemas import IcsClase
+
+PRODID = "-//SIIAPI//Horarios//ES"
+# Polling interval suggested to calendar apps
+REFRESH_INTERVAL = "PT15M"
+# Octets per content line before folding
+LINE_LIMIT = 75
+
+
+def escape(value: str) -> str:
+    """Escape a TEXT property value"""
+    return (
+        value.replace("\\", "\\\\")
+        .replace(";", "\\;")
+        .replace(",", "\\,")
+        .replace("\r\n", "\\n")
+        .replace("\n", "\\n")
+    )
+
+
+def fold(line: str) -> str:
+    """Fold a content line into chunks of at most LINE_LIMIT octets"""
+    if len(line.encode()) <= LINE_LIMIT:
+        return line
+
+    chunks = []
+    current = ""
+    size = 0
+    for char in line:
+        width = len(char.encode())
+        # Continuation lines start with a space, which counts towards the limit
+        if size + width > (LINE_LIMIT if not chunks else LINE_LIMIT - 1):
+            chunks.append(current)
+            current = ""
+            size = 0
+        current += char
+        size += width
+    chunks.append(current)
+    return "\r\n ".join(chunks)
+
+
+def _local(value: datetime) -> str:
+    return value.strftime("%Y%m%dT%H%M%S")
+
+
+def _utc(value: datetime) -> str:
+    return value.astimezone(timezone.utc).strftime("%Y%m%dT%H%M%SZ")
+
+
+def _offset(value: timedelta) -> str:
+    minutes = int(value.total_seconds()) // 60
+    sign = "+" if minutes >= 0 else "-"
+    return f"{sign}{abs(minutes) // 60:02d}{abs(minutes) % 60:02d}"
+
+
+def first_occurrence(clase: IcsClase) -> datetime | None:
+    """Start of the first session of a clase, None when it cannot be placed"""
+    if (
+        not clase.dia
+        or not 1 <= clase.dia <= 7
+        or clase.hora_inicio is None
+        or clase.hora_fin is None
+        or clase.periodo_inicio is None
+        or clase.periodo_fin is None
+    ):
+        return None
+
+    start = clase.periodo_inicio.date()
+    start += timedelta(days=(clase.dia - start.isoweekday()) % 7)
+    if start > clase.periodo_fin.date():
+        return None
+    return datetime.combine(start, clase.hora_inicio)
+
+
+def _event(clase: IcsClase, start: datetime, zone: ZoneInfo, stamp: str) -> list[str]:
+    end = datetime.combine(start.date(), clase.hora_fin)
+    until = datetime.combine(clase.periodo_fin.date(), clase.hora_fin, tzinfo=zone)
+    tzid = zone.key
+
+    description = [f"NRC {clase.nrc}", f"Sección {clase.seccion}"]
+    if clase.profesor:
+        description.append(f"Profesor: {clase.profesor}")
+    location = " ".join(part for part in (clase.edificio, clase.aula) if part)
+
+    lines = [
+        "BEGIN:VEVENT",
+        f"UID:clase-{clase.clase_id}@siiapi",
+        f"DTSTAMP:{stamp}",
+        f"DTSTART;TZID={tzid}:{_local(start)}",
+        f"DTEND;TZID={tzid}:{_local(end)}",
+        f"RRULE:FREQ=WEEKLY;UNTIL={_utc(until)}",
+        f"SUMMARY:{escape(f'{clase.clave} {clase.materia} ({clase.seccion})')}",
+        f"DESCRIPTION:{escape(chr(10).join(description))}",
+    ]
+    if location:
+        lines.append(f"LOCATION:{escape(location)}")
+    lines.append("END:VEVENT")
+    return lines
+
+
+def render(name: str, clases: Iterable[IcsClase]) -> str:
+    """A VCALENDAR with one recurring event per placeable clase"""
+    zone = ZoneInfo(settings.TIMEZONE)
+    now = datetime.now(timezone.utc)
+    stamp = _utc(now)
+
+    events = []
+    first = None
+    for clase in clases:
+        start = first_occurrence(clase)
+        if start is None:
+            continue
+        first = start if first is None else min(first, start)
+        events.extend(_event(clase, start, zone, stamp))
+
+    reference = (first or now.astimezone(zone).replace(tzinfo=None)).replace(
+        tzinfo=zone
+    )
+    offset = _offset(reference.utcoffset())
+    lines = [
+        "BEGIN:VCALENDAR",
+        "VERSION:2.0",
+        f"PRODID:{PRODID}",
+        "CALSCALE:GREGORIAN",
+        "METHOD:PUBLISH",
+        f"NAME:{escape(name)}",
+        f"X-WR-CALNAME:{escape(name)}",
+        f"X-WR-TIMEZONE:{zone.key}",
+        f"REFRESH-INTERVAL;VALUE=DURATION:{REFRESH_INTERVAL}",
+        f"X-PUBLISHED-TTL:{REFRESH_INTERVAL}",
+        "BEGIN:VTIMEZONE",
+        f"TZID:{zone.key}",
+        "BEGIN:STANDARD",
+        "DTSTART:19700101T000000",
+        f"TZOFFSETFROM:{offset}",
+        f"TZOFFSETTO:{offset}",
+        f"TZNAME:{reference.tzname()}",
+        "END:STANDARD",
+        "END:VTIMEZONE",
+        *events,
+        "END:VCALENDAR",
+    ]
+    return "\r\n".join(fold(line) for line in lines) + "\r\n"
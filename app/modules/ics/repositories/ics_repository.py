@@ -0,0 +1,79 @@
+from sqlmodel import Session, select
+
+from app.modules.aula.models import Aula
+from app.modules.clase.models import Clase
+from app.modules.edificio.models import Edificio
+from app.modules.ics.schemas import IcsClase
+from app.modules.materia.models import Materia
+from app.modules.profesor.models import Profesor
+from app.modules.seccion.models import Seccion
+
+_FIELDS = (
+    "clase_id",
+    "dia",
+    "hora_inicio",
+    "hora_fin",
+    "aula",
+    "edificio",
+    "seccion_id",
+    "nrc",
+    "seccion",
+    "clave",
+    "materia",
+    "periodo_inicio",
+    "periodo_fin",
+    "profesor",
+)
+
+
+class IcsRepository:
+    def __init__(self, session: Session):
+        self.session = session
+
+    def clases(self, *conditions) -> list[IcsClase]:
+        """Clases matching ``conditions`` with everything a feed shows"""
+        statement = (
+            select(
+                Clase.id,
+                Clase.dia,
+                Clase.hora_inicio,
+                Clase.hora_fin,
+                Aula.name,
+                Edificio.name,
+                Seccion.id,
+                Seccion.nrc,
+                Seccion.name,
+                Materia.clave,
+                Materia.name,
+                Seccion.periodo_inicio,
+                Seccion.periodo_fin,
+                Profesor.name,
+            )
+            .join(Seccion, Clase.seccion_id == Seccion.id)
+            .join(Materia, Seccion.materia_id == Materia.id)
+            .outerjoin(Profesor, Seccion.profesor_id == Profesor.id)
+            .outerjoin(Aula, Clase.aula_id == Aula.id)
+            .outerjoin(Edificio, Aula.edificio_id == Edificio.id)
+            .where(*conditions)
+            .order_by(Clase.dia, Clase.hora_inicio, Seccion.nrc, Clase.id)
+        )
+        return [
+            IcsClase(**dict(zip(_FIELDS, row))) for row in self.session.exec(statement)
+        ]
+
+    def by_seccion(self, seccion_id: int) -> list[IcsClase]:
+        return self.clases(Seccion.id == seccion_id)
+
+    def by_nrcs(
+        self, nrcs: list[str], calendario_id: int | None = None
+    ) -> list[IcsClase]:
+        conditions = [Seccion.nrc.in_(nrcs)]
+        if calendario_id is not None:
+            conditions.append(Seccion.calendario_id == calendario_id)
+        return self.clases(*conditions)
+
+    def by_aula(self, aula_id: int, calendario_id: int | None = None) -> list[IcsClase]:
+        conditions = [Clase.aula_id == aula_id]
+        if calendario_id is not None:
+            conditions.append(Seccion.calendario_id == calendario_id)
+        return self.clases(*conditions)
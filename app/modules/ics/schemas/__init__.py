@@ -0,0 +1,3 @@
+from .ics import IcsClase
+
+__all__ = ["IcsClase"]
@@ -0,0 +1,5 @@
+from app.modules.horario.schemas import HorarioClase
+
+
+class IcsClase(HorarioClase):
+    profesor: str | None = None
@@ -0,0 +1,70 @@
+from app.core.exceptions import BadRequestException, NotFoundException
+from app.modules.aula.repositories.aula_repository import AulaRepository
+from app.modules.horario.repositories.horario_repository import \
+    HorarioRepository
+from app.modules.ics.calendar import render
+from app.modules.ics.repositories.ics_repository import IcsRepository
+from app.modules.ics.schemas import IcsClase
+from app.modules.profesor.repositories.profesor_repository import \
+    ProfesorRepository
+from app.modules.seccion.repositories.seccion_repository import \
+    SeccionRepository
+
+# NRCs a single feed may combine, e.g. a student's whole schedule
+MAX_NRCS = 50
+
+
+class IcsService:
+    def __init__(
+        self,
+        repository: IcsRepository,
+        horario_repository: HorarioRepository,
+        seccion_repository: SeccionRepository,
+        profesor_repository: ProfesorRepository,
+        aula_repository: AulaRepository,
+    ):
+        self.repository = repository
+        self.horario_repository = horario_repository
+        self.seccion_repository = seccion_repository
+        self.profesor_repository = profesor_repository
+        self.aula_repository = aula_repository
+
+    def seccion_feed(self, seccion_id: int) -> str:
+        seccion = self.seccion_repository.get(seccion_id)
+        if not seccion:
+            raise NotFoundException("Seccion not found.")
+        return render(f"NRC {seccion.nrc}", self.repository.by_seccion(seccion_id))
+
+    def nrcs_feed(self, nrcs: list[str], calendario_id: int | None = None) -> str:
+        if not nrcs:
+            raise BadRequestException("nrc is required.")
+        if len(nrcs) > MAX_NRCS:
+            raise BadRequestException(f"At most {MAX_NRCS} NRCs per feed.")
+
+        clases = self.repository.by_nrcs(nrcs, calendario_id)
+        if not clases:
+            raise NotFoundException("No clases found for the given NRCs.")
+        return render("Horario", clases)
+
+    def profesor_feed(self, profesor_id: int, calendario_id: int | None = None) -> str:
+        profesor = self.profesor_repository.get(profesor_id)
+        if not profesor:
+            raise NotFoundException("Profesor not found.")
+
+        # Served from the profesor horario read model rather than the clases
+        clases = [
+            IcsClase(**clase, profesor=profesor.name)
+            for horario in self.horario_repository.list_by_profesor(
+                profesor_id, calendario_id
+            )
+            for clase in horario.clases
+        ]
+        return render(profesor.name, clases)
+
+    def aula_feed(self, aula_id: int, calendario_id: int | None = None) -> str:
+        aula = self.aula_repository.get(aula_id)
+        if not aula:
+            raise NotFoundException("Aula not found.")
+
+        name = f"{aula.edificio.name} {aula.name}" if aula.edificio else aula.name
+        return render(name, self.repository.by_aula(aula_id, calendario_id))
@@ -0,0 +1,15 @@
+from fastapi import Depends
+from sqlmodel import Session
+
+from app.api.dependencies.database import get_session
+from app.modules.edificio.repositories.edificio_repository import \
+    EdificioRepository
+from app.modules.live.repositories.live_repository import LiveRepository
+from app.modules.live.services.live_service import LiveService
+
+
+def get_live_service(session: Session = Depends(get_session)) -> LiveService:
+    return LiveService(
+        repository=LiveRepository(session=session),
+        edificio_repository=EdificioRepository(session=session),
+    )
@@ -0,0 +1,45 @@
+from datetime import datetime
+from typing import Annotated
+
+from fastapi import APIRouter, Depends, Request
+
+from app.api.routing import cached_route
+from app.modules.aula.models import Aula
+from app.modules.clase.models import Clase
+from app.modules.edificio.models import Edificio
+from app.modules.live.schemas import LiveEdificio
+from app.modules.live.services.live_service import LiveService, minute_bucket
+from app.modules.materia.models import Materia
+from app.modules.profesor.models import Profesor
+from app.modules.seccion.models import Seccion
+
+from .dependencies import get_live_service
+
+
+def _minute_key(request: Request) -> list[tuple[str, str]]:
+    """Key responses by the minute they describe rather than the raw ``at``"""
+    params = [(k, v) for k, v in request.query_params.multi_items() if k != "at"]
+    at = request.query_params.get("at")
+    try:
+        bucket = minute_bucket(datetime.fromisoformat(at) if at else None)
+    except ValueError:
+        # Rejected by validation; key it as given
+        return request.query_params.multi_items()
+    return params + [("at", bucket.isoformat())]
+
+
+router = APIRouter(
+    route_class=cached_route(
+        Clase, Seccion, Aula, Edificio, Materia, Profesor, key_params=_minute_key
+    )
+)
+
+
+@router.get("/edificios/{edificio_id}", response_model=LiveEdificio)
+async def get_live_edificio(
+    edificio_id: int,
+    service: Annotated[LiveService, Depends(get_live_service)],
+    at: datetime | None = None,
+    calendario_id: int | None = None,
+):
+    return service.edificio(edificio_id, at=at, calendario_id=calendario_id)
@@ -0,0 +1,60 @@
+from datetime import datetime
+
+from sqlmodel import Session, or_, select
+
+from app.modules.aula.models import Aula
+from app.modules.clase.models import Clase
+from app.modules.materia.models import Materia
+from app.modules.profesor.models import Profesor
+from app.modules.seccion.models import Seccion
+
+
+class LiveRepository:
+    def __init__(self, session: Session):
+        self.session = session
+
+    def remaining(
+        self,
+        edificio_id: int,
+        at: datetime,
+        calendario_id: int | None = None,
+    ) -> list[tuple]:
+        """
+        Clases of an edificio not yet over at ``at`` on its dia, in running
+        secciones, as (aula_id, aula, clase_id, hora_inicio, hora_fin,
+        seccion_id, nrc, seccion, clave, materia, profesor), by aula and start.
+        """
+        day = at.replace(hour=0, minute=0, second=0, microsecond=0)
+        conditions = [
+            Aula.edificio_id == edificio_id,
+            Clase.dia == at.isoweekday(),
+            Clase.hora_fin > at.time(),
+            Clase.hora_inicio.is_not(None),
+            or_(Seccion.periodo_inicio.is_(None), Seccion.periodo_inicio <= at),
+            or_(Seccion.periodo_fin.is_(None), Seccion.periodo_fin >= day),
+        ]
+        if calendario_id is not None:
+            conditions.append(Seccion.calendario_id == calendario_id)
+
+        statement = (
+            select(
+                Aula.id,
+                Aula.name,
+                Clase.id,
+                Clase.hora_inicio,
+                Clase.hora_fin,
+                Seccion.id,
+                Seccion.nrc,
+                Seccion.name,
+                Materia.clave,
+                Materia.name,
+                Profesor.name,
+            )
+            .join(Aula, Clase.aula_id == Aula.id)
+            .join(Seccion, Clase.seccion_id == Seccion.id)
+            .join(Materia, Seccion.materia_id == Materia.id)
+            .outerjoin(Profesor, Seccion.profesor_id == Profesor.id)
+            .where(*conditions)
+            .order_by(Aula.name, Aula.id, Clase.hora_inicio, Clase.id)
+        )
+        return list(self.session.exec(statement))
@@ -0,0 +1,7 @@
+from .live import LiveAula, LiveEdificio, LiveSession
+
+__all__ = [
+    "LiveAula",
+    "LiveEdificio",
+    "LiveSession",
+]
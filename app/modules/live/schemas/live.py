@@ -0,0 +1,30 @@
+from datetime import datetime, time
+
+from sqlmodel import SQLModel
+
+
+class LiveSession(SQLModel):
+    clase_id: int
+    hora_inicio: time
+    hora_fin: time
+    seccion_id: int
+    nrc: str
+    seccion: str
+    clave: str
+    materia: str
+    profesor: str | None
+
+
+class LiveAula(SQLModel):
+    aula_id: int
+    aula: str
+    actual: LiveSession | None
+    siguiente: LiveSession | None
+
+
+class LiveEdificio(SQLModel):
+    edificio_id: int
+    edificio: str
+    at: datetime
+    dia: int
+    aulas: list[LiveAula]
@@ -0,0 +1,77 @@
+"""
+Clases in session right now.
+
+Times are campus local (``settings.TIMEZONE``) and truncated to the minute, so
+every request within the same minute resolves to the same instant and shares
+one cached response.
+"""
+
+from datetime import datetime
+from zoneinfo import ZoneInfo
+
+from app.core.config import settings
+from app.core.exceptions import NotFoundException
+from app.modules.edificio.repositories.edificio_repository import \
+    EdificioRepository
+from app.modules.live.repositories.live_repository import LiveRepository
+from app.modules.live.schemas import LiveAula, LiveEdificio, LiveSession
+
+
+def minute_bucket(at: datetime | None = None) -> datetime:
+    """Naive campus local time of ``at`` (default now), truncated to the minute"""
+    zone = ZoneInfo(settings.TIMEZONE)
+    if at is None:
+        at = datetime.now(zone)
+    elif at.tzinfo is not None:
+        at = at.astimezone(zone)
+    return at.replace(second=0, microsecond=0, tzinfo=None)
+
+
+class LiveService:
+    def __init__(
+        self, repository: LiveRepository, edificio_repository: EdificioRepository
+    ):
+        self.repository = repository
+        self.edificio_repository = edificio_repository
+
+    def edificio(
+        self,
+        edificio_id: int,
+        at: datetime | None = None,
+        calendario_id: int | None = None,
+    ) -> LiveEdificio:
+        """Current and next clase of every aula of an edificio still in use today"""
+        edificio = self.edificio_repository.get(edificio_id)
+        if not edificio:
+            raise NotFoundException("Edificio not found.")
+
+        at = minute_bucket(at)
+        now = at.time()
+
+        aulas: dict[int, LiveAula] = {}
+        for aula_id, aula, *clase in self.repository.remaining(
+            edificio_id, at, calendario_id
+        ):
+            entry = aulas.get(aula_id)
+            if entry is None:
+                entry = aulas[aula_id] = LiveAula(
+                    aula_id=aula_id, aula=aula, actual=None, siguiente=None
+                )
+            if entry.siguiente is not None:
+                continue
+
+            session = LiveSession(
+                **dict(zip(LiveSession.model_fields, clase, strict=True))
+            )
+            if session.hora_inicio <= now and entry.actual is None:
+                entry.actual = session
+            elif session.hora_inicio > now:
+                entry.siguiente = session
+
+        return LiveEdificio(
+            edificio_id=edificio.id,
+            edificio=edificio.name,
+            at=at,
+            dia=at.isoweekday(),
+            aulas=list(aulas.values()),
+        )
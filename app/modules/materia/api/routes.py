@@ -3,15 +3,19 @@ from typing import Annotated
 from fastapi import APIRouter, Depends, Query, status
 
 from app.api.dependencies.auth import user_is_staff
+from app.api.responses import model_response, page_response
+from app.api.routing import cached_route
 from app.api.schemas import Pagination
+from app.modules.materia.models import Materia
 from app.modules.materia.schemas import (MateriaCreate, MateriaRead,
                                          MateriaUpdate)
 from app.modules.materia.services.materia_service import MateriaService
+from app.modules.seccion.models import Seccion
 from app.modules.users.models import User
 
 from .dependencies import get_materia_service
 
-router = APIRouter()
+router = APIRouter(route_class=cached_route(Materia, Seccion))
 
 
 @router.post("/", response_model=MateriaRead, status_code=status.HTTP_201_CREATED)
@@ -28,7 +32,7 @@ async def get_materia(
     materia_id: int,
     service: Annotated[MateriaService, Depends(get_materia_service)],
 ):
-    return service.get_materia(materia_id)
+    return model_response(MateriaRead, service.get_materia(materia_id))
 
 
 @router.get("/", response_model=Pagination[MateriaRead])
@@ -45,10 +49,7 @@ async def list_materias(
         skip=skip,
         limit=limit,
     )
-    return Pagination(
-        total=total,
-        results=materias,
-    )
+    return page_response(MateriaRead, materias, total)
 
 
 @router.put("/{materia_id}", response_model=MateriaRead)
@@ -0,0 +1,21 @@
+from fastapi import Depends
+from sqlmodel import Session
+
+from app.api.dependencies.database import get_session
+from app.modules.calendario.repositories.calendario_repository import \
+    CalendarioRepository
+from app.modules.edificio.repositories.edificio_repository import \
+    EdificioRepository
+from app.modules.occupancy.repositories.occupancy_repository import \
+    OccupancyRepository
+from app.modules.occupancy.services.occupancy_service import OccupancyService
+
+
+def get_occupancy_service(
+    session: Session = Depends(get_session),
+) -> OccupancyService:
+    return OccupancyService(
+        repository=OccupancyRepository(session=session),
+        calendario_repository=CalendarioRepository(session=session),
+        edificio_repository=EdificioRepository(session=session),
+    )
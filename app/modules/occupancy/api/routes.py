@@ -0,0 +1,29 @@
+from typing import Annotated
+
+from fastapi import APIRouter, Depends
+
+from app.api.routing import cached_route
+from app.modules.aula.models import Aula
+from app.modules.calendario.models import Calendario
+from app.modules.clase.models import Clase
+from app.modules.edificio.models import Edificio
+from app.modules.occupancy.schemas import Occupancy
+from app.modules.occupancy.services.occupancy_service import OccupancyService
+from app.modules.seccion.models import Seccion
+
+from .dependencies import get_occupancy_service
+
+# Heatmaps are recomputed only after an import or edit bumps one of these
+router = APIRouter(route_class=cached_route(Calendario, Seccion, Clase, Aula, Edificio))
+
+
+@router.get("/", response_model=Occupancy)
+async def get_occupancy(
+    service: Annotated[OccupancyService, Depends(get_occupancy_service)],
+    calendario_id: int,
+    centro_id: int | None = None,
+    edificio_id: int | None = None,
+):
+    return service.occupancy(
+        calendario_id=calendario_id, centro_id=centro_id, edificio_id=edificio_id
+    )
@@ -0,0 +1,49 @@
+from sqlmodel import Session, select
+
+from app.modules.aula.models import Aula
+from app.modules.clase.models import Clase
+from app.modules.edificio.models import Edificio
+from app.modules.seccion.models import Seccion
+
+
+class OccupancyRepository:
+    def __init__(self, session: Session):
+        self.session = session
+
+    @staticmethod
+    def _edificio_conditions(centro_id: int | None, edificio_id: int | None) -> list:
+        conditions = []
+        if centro_id is not None:
+            conditions.append(Edificio.centro_id == centro_id)
+        if edificio_id is not None:
+            conditions.append(Edificio.id == edificio_id)
+        return conditions
+
+    def aulas(self, centro_id: int | None, edificio_id: int | None) -> list[tuple]:
+        """Aulas as (id, name, edificio_id, edificio name), grouped by edificio"""
+        statement = (
+            select(Aula.id, Aula.name, Edificio.id, Edificio.name)
+            .join(Edificio, Aula.edificio_id == Edificio.id)
+            .where(*self._edificio_conditions(centro_id, edificio_id))
+            .order_by(Edificio.name, Edificio.id, Aula.name, Aula.id)
+        )
+        return list(self.session.exec(statement))
+
+    def intervals(
+        self, calendario_id: int, centro_id: int | None, edificio_id: int | None
+    ) -> list[tuple]:
+        """Scheduled clases of a calendario as (aula_id, dia, hora_inicio, hora_fin)"""
+        statement = (
+            select(Clase.aula_id, Clase.dia, Clase.hora_inicio, Clase.hora_fin)
+            .join(Seccion, Clase.seccion_id == Seccion.id)
+            .join(Aula, Clase.aula_id == Aula.id)
+            .join(Edificio, Aula.edificio_id == Edificio.id)
+            .where(
+                Seccion.calendario_id == calendario_id,
+                Clase.dia.is_not(None),
+                Clase.hora_inicio.is_not(None),
+                Clase.hora_fin.is_not(None),
+                *self._edificio_conditions(centro_id, edificio_id),
+            )
+        )
+        return list(self.session.exec(statement))
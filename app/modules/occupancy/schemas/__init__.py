@@ -0,0 +1,7 @@
+from .occupancy import AulaUtilization, EdificioOccupancy, Occupancy
+
+__all__ = [
+    "AulaUtilization",
+    "EdificioOccupancy",
+    "Occupancy",
+]
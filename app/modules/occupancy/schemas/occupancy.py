@@ -0,0 +1,26 @@
+from datetime import time
+
+from sqlmodel import SQLModel
+
+
+class AulaUtilization(SQLModel):
+    aula_id: int
+    aula: str
+    horas_ocupadas: float
+    utilizacion: float
+
+
+class EdificioOccupancy(SQLModel):
+    edificio_id: int
+    edificio: str
+    utilizacion: float
+    # Percentage of the aulas busy, indexed [dia][hora]
+    ocupacion: list[list[float]]
+    aulas: list[AulaUtilization]
+
+
+class Occupancy(SQLModel):
+    calendario_id: int
+    dias: list[int]
+    horas: list[time]
+    edificios: list[EdificioOccupancy]
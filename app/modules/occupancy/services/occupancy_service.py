@@ -0,0 +1,162 @@
+"""
+Aula occupancy heatmaps.
+
+The clases of a calendario are loaded once as parallel NumPy arrays. Clases
+sharing an aula and dia are trimmed to the part not already covered by an
+earlier one, so double bookings count once, then the minutes each spends
+inside every hour of the grid are computed in a single broadcast against the
+hour edges. A bincount folds them into a busy-minutes cube indexed by (aula,
+dia, hora), from which the edificio heatmaps and aula utilizations are sums.
+"""
+
+from datetime import time
+
+import numpy as np
+
+from app.core.exceptions import BadRequestException, NotFoundException
+from app.modules.calendario.repositories.calendario_repository import \
+    CalendarioRepository
+from app.modules.edificio.repositories.edificio_repository import \
+    EdificioRepository
+from app.modules.occupancy.repositories.occupancy_repository import \
+    OccupancyRepository
+from app.modules.occupancy.schemas import (AulaUtilization, EdificioOccupancy,
+                                           Occupancy)
+
+DIAS = 6
+# Hour buckets of the grid: 07:00-08:00 to 21:00-22:00
+HORAS = np.arange(7, 22)
+# More than the minutes of a day
+ROW_SPAN = 2 * 24 * 60
+
+
+def busy_minutes(
+    aulas: np.ndarray,
+    dias: np.ndarray,
+    starts: np.ndarray,
+    ends: np.ndarray,
+    aula_count: int,
+) -> np.ndarray:
+    """
+    Busy minutes of every (aula, dia, hora) cell, from clases given as aula
+    positions, dias (1 to DIAS) and start/end minutes.
+    """
+    rows = aulas * DIAS + dias - 1
+
+    # Sort by (aula, dia, start) and start each clase no earlier than the
+    # furthest end seen before it in its row; offsetting ends by row keeps the
+    # running maximum from leaking across rows.
+    order = np.lexsort((starts, rows))
+    rows, starts, ends = rows[order], starts[order], ends[order]
+    offset = rows * ROW_SPAN
+    reach = np.maximum.accumulate(ends + offset)
+    covered = np.concatenate(([0], reach[:-1])) - offset
+    starts = np.maximum(starts, covered)
+
+    edges = HORAS * 60
+    overlap = np.minimum(ends[:, None], edges + 60) - np.maximum(starts[:, None], edges)
+    np.clip(overlap, 0, None, out=overlap)
+
+    cells = rows[:, None] * len(HORAS) + np.arange(len(HORAS))
+    busy = np.bincount(
+        cells.ravel(),
+        weights=overlap.ravel(),
+        minlength=aula_count * DIAS * len(HORAS),
+    )
+    return busy.reshape(aula_count, DIAS, len(HORAS))
+
+
+class OccupancyService:
+    def __init__(
+        self,
+        repository: OccupancyRepository,
+        calendario_repository: CalendarioRepository,
+        edificio_repository: EdificioRepository,
+    ):
+        self.repository = repository
+        self.calendario_repository = calendario_repository
+        self.edificio_repository = edificio_repository
+
+    def occupancy(
+        self,
+        calendario_id: int,
+        centro_id: int | None = None,
+        edificio_id: int | None = None,
+    ) -> Occupancy:
+        if centro_id is None and edificio_id is None:
+            raise BadRequestException("centro_id or edificio_id is required.")
+        if not self.calendario_repository.get(calendario_id):
+            raise NotFoundException("Calendario not found.")
+        if edificio_id is not None and not self.edificio_repository.get(edificio_id):
+            raise NotFoundException("Edificio not found.")
+
+        aulas = self.repository.aulas(centro_id, edificio_id)
+        position = {row[0]: index for index, row in enumerate(aulas)}
+
+        rows = [
+            (position[aula_id], dia, inicio, fin)
+            for aula_id, dia, inicio, fin in self.repository.intervals(
+                calendario_id, centro_id, edificio_id
+            )
+            if 1 <= dia <= DIAS
+        ]
+        count = len(rows)
+        busy = busy_minutes(
+            np.fromiter((row[0] for row in rows), dtype=np.int64, count=count),
+            np.fromiter((row[1] for row in rows), dtype=np.int64, count=count),
+            np.fromiter(
+                (row[2].hour * 60 + row[2].minute for row in rows),
+                dtype=np.int64,
+                count=count,
+            ),
+            np.fromiter(
+                (row[3].hour * 60 + row[3].minute for row in rows),
+                dtype=np.int64,
+                count=count,
+            ),
+            len(aulas),
+        )
+
+        # Aulas come grouped by edificio, so each edificio is a slice of the cube
+        capacity = DIAS * len(HORAS) * 60
+        aula_busy = busy.sum(axis=(1, 2))
+        edificios = []
+        start = 0
+        while start < len(aulas):
+            end = start
+            while end < len(aulas) and aulas[end][2] == aulas[start][2]:
+                end += 1
+
+            heatmap = busy[start:end].sum(axis=0) / ((end - start) * 60) * 100
+            edificios.append(
+                EdificioOccupancy(
+                    edificio_id=aulas[start][2],
+                    edificio=aulas[start][3],
+                    utilizacion=round(
+                        float(aula_busy[start:end].sum())
+                        / ((end - start) * capacity)
+                        * 100,
+                        1,
+                    ),
+                    ocupacion=np.round(heatmap, 1).tolist(),
+                    aulas=[
+                        AulaUtilization(
+                            aula_id=aulas[index][0],
+                            aula=aulas[index][1],
+                            horas_ocupadas=round(float(aula_busy[index]) / 60, 2),
+                            utilizacion=round(
+                                float(aula_busy[index]) / capacity * 100, 1
+                            ),
+                        )
+                        for index in range(start, end)
+                    ],
+                )
+            )
+            start = end
+
+        return Occupancy(
+            calendario_id=calendario_id,
+            dias=list(range(1, DIAS + 1)),
+            horas=[time(int(hora)) for hora in HORAS],
+            edificios=edificios,
+        )
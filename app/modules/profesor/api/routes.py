@@ -1,17 +1,22 @@
 from typing import Annotated
 
-from fastapi import APIRouter, Depends, Query, status
+from fastapi import APIRouter, Depends, Query, Request, status
 
 from app.api.dependencies.auth import user_is_staff
+from app.api.exports import ExportFormat, export_response, parse_columns
+from app.api.responses import model_response, page_response
+from app.api.routing import cached_route
 from app.api.schemas import Pagination
+from app.modules.profesor.models import Profesor
 from app.modules.profesor.schemas import (ProfesorCreate, ProfesorRead,
                                           ProfesorUpdate)
 from app.modules.profesor.services.profesor_service import ProfesorService
+from app.modules.seccion.models import Seccion
 from app.modules.users.models import User
 
 from .dependencies import get_profesor_service
 
-router = APIRouter()
+router = APIRouter(route_class=cached_route(Profesor, Seccion))
 
 
 @router.post("/", response_model=ProfesorRead, status_code=status.HTTP_201_CREATED)
@@ -23,32 +28,55 @@ async def create_profesor(
     return service.create_profesor(data)
 
 
+@router.get("/export")
+async def export_profesores(
+    request: Request,
+    service: Annotated[ProfesorService, Depends(get_profesor_service)],
+    format: ExportFormat = ExportFormat.ndjson,
+    columns: str | None = None,
+    name: str | None = None,
+    centro_id: int | None = None,
+    calendario_id: int | None = None,
+    search: str | None = None,
+):
+    selected = parse_columns(Profesor, columns)
+    rows = service.export_profesores(
+        selected,
+        name=name,
+        centro_id=centro_id,
+        calendario_id=calendario_id,
+        search=search,
+    )
+    return export_response(request, rows, selected, format, "profesores")
+
+
 @router.get("/{profesor_id}", response_model=ProfesorRead)
 async def get_profesor(
     profesor_id: int,
     service: Annotated[ProfesorService, Depends(get_profesor_service)],
 ):
-    return service.get_profesor(profesor_id)
+    return model_response(ProfesorRead, service.get_profesor(profesor_id))
 
 
 @router.get("/", response_model=Pagination[ProfesorRead])
 async def list_profesores(
     service: Annotated[ProfesorService, Depends(get_profesor_service)],
     name: str | None = None,
+    calendario_id: int | None = None,
+    centro_id: int | None = None,
     search: str | None = None,
     skip: int = Query(default=0, ge=0),
     limit: int = Query(default=100, ge=1, le=100),
 ):
     profesors, total = service.list_profesores(
         name=name,
+        calendario_id=calendario_id,
+        centro_id=centro_id,
         search=search,
         skip=skip,
         limit=limit,
     )
-    return Pagination(
-        total=total,
-        results=profesors,
-    )
+    return page_response(ProfesorRead, profesors, total)
 
 
 @router.put("/{profesor_id}", response_model=ProfesorRead)
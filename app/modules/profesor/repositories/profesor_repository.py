@@ -1,6 +1,10 @@
+from collections.abc import Iterator
+
 from sqlmodel import Session, func, or_, select
 
+from app.core.database import EXPORT_BATCH_SIZE, stream_rows
 from app.modules.profesor.models import Profesor
+from app.modules.seccion.models import Seccion
 
 
 class ProfesorRepository:
@@ -17,27 +21,49 @@ class ProfesorRepository:
         statement = select(Profesor).where(Profesor.id == profesor_id)
         return self.session.exec(statement).first()
 
-    def list(self, filters: dict) -> tuple[list[Profesor], int]:
-        statement = select(Profesor)
-        total_statement = select(func.count()).select_from(Profesor)
+    def _conditions(self, filters: dict) -> list:
+        conditions = []
 
         if filters.get("name") is not None:
-            statement = statement.where(Profesor.name == filters["name"])
-            total_statement = total_statement.where(Profesor.name == filters["name"])
+            conditions.append(Profesor.name == filters["name"])
 
         if filters.get("search"):
             search = f"%{filters['search']}%"
-            statement = statement.where(
+            conditions.append(
                 or_(
                     Profesor.name.ilike(search),
                 )
             )
-            total_statement = total_statement.where(
-                or_(
-                    Profesor.name.ilike(search),
-                )
+
+        seccion_conditions = []
+
+        if filters.get("calendario_id") is not None:
+            seccion_conditions.append(Seccion.calendario_id == filters["calendario_id"])
+
+        if filters.get("centro_id") is not None:
+            seccion_conditions.append(Seccion.centro_id == filters["centro_id"])
+
+        if seccion_conditions:
+            conditions.append(
+                Profesor.id.in_(select(Seccion.profesor_id).where(*seccion_conditions))
             )
 
+        return conditions
+
+    def stream(self, filters: dict, columns: list[str]) -> Iterator[tuple]:
+        statement = (
+            select(*[getattr(Profesor, column) for column in columns])
+            .where(*self._conditions(filters))
+            .order_by(Profesor.id)
+            .execution_options(yield_per=EXPORT_BATCH_SIZE)
+        )
+        return stream_rows(self.session, statement, len(columns))
+
+    def list(self, filters: dict) -> tuple[list[Profesor], int]:
+        conditions = self._conditions(filters)
+        statement = select(Profesor).where(*conditions)
+        total_statement = select(func.count()).select_from(Profesor).where(*conditions)
+
         statement = statement.offset(filters.get("skip", 0)).limit(
             filters.get("limit", 100)
         )
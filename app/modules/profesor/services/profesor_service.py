@@ -1,3 +1,5 @@
+from collections.abc import Iterator
+
 from app.core.exceptions import ConflictException, NotFoundException
 from app.modules.profesor.models import Profesor
 from app.modules.profesor.repositories.profesor_repository import \
@@ -31,6 +33,9 @@ class ProfesorService:
     def list_profesores(self, **filters) -> tuple[list[Profesor], int]:
         return self.repository.list(filters)
 
+    def export_profesores(self, columns: list[str], **filters) -> Iterator[tuple]:
+        return self.repository.stream(filters, columns)
+
     def update_profesor(self, profesor_id: int, data: ProfesorUpdate) -> Profesor:
         profesor = self.repository.get(profesor_id)
         if not profesor:
@@ -1,9 +1,19 @@
 from typing import Annotated
 
-from fastapi import APIRouter, Depends, Query, status
+from fastapi import APIRouter, Depends, Query, Request, status
 
 from app.api.dependencies.auth import user_is_staff
+from app.api.exports import ExportFormat, export_response, parse_columns
+from app.api.params import parse_slots
+from app.api.responses import model_response, page_response
+from app.api.routing import cached_route
 from app.api.schemas import Pagination
+from app.modules.calendario.models import Calendario
+from app.modules.centro.models import CentroUniversitario
+from app.modules.clase.models import Clase
+from app.modules.materia.models import Materia
+from app.modules.profesor.models import Profesor
+from app.modules.seccion.models import Seccion
 from app.modules.seccion.schemas import (SeccionCreate, SeccionRead,
                                          SeccionUpdate)
 from app.modules.seccion.services.seccion_service import SeccionService
@@ -11,7 +21,11 @@ from app.modules.users.models import User
 
 from .dependencies import get_seccion_service
 
-router = APIRouter()
+router = APIRouter(
+    route_class=cached_route(
+        Seccion, CentroUniversitario, Materia, Profesor, Calendario, Clase
+    )
+)
 
 
 @router.post("/", response_model=SeccionRead, status_code=status.HTTP_201_CREATED)
@@ -23,12 +37,42 @@ async def create_seccion(
     return service.create_seccion(data)
 
 
+@router.get("/export")
+async def export_secciones(
+    request: Request,
+    service: Annotated[SeccionService, Depends(get_seccion_service)],
+    format: ExportFormat = ExportFormat.ndjson,
+    columns: str | None = None,
+    nrc: str | None = None,
+    centro_id: int | None = None,
+    materia_id: int | None = None,
+    profesor_id: int | None = None,
+    calendario_id: int | None = None,
+    search: str | None = None,
+    fits_in: str | None = None,
+    excludes_slots: str | None = None,
+):
+    selected = parse_columns(Seccion, columns)
+    rows = service.export_secciones(
+        selected,
+        nrc=nrc,
+        centro_id=centro_id,
+        materia_id=materia_id,
+        profesor_id=profesor_id,
+        calendario_id=calendario_id,
+        search=search,
+        fits_in=parse_slots(fits_in, "fits_in", whole_cells=True),
+        excludes_slots=parse_slots(excludes_slots, "excludes_slots"),
+    )
+    return export_response(request, rows, selected, format, "secciones")
+
+
 @router.get("/{seccion_id}", response_model=SeccionRead)
 async def get_seccion(
     seccion_id: int,
     service: Annotated[SeccionService, Depends(get_seccion_service)],
 ):
-    return service.get_seccion(seccion_id)
+    return model_response(SeccionRead, service.get_seccion(seccion_id))
 
 
 @router.get("/", response_model=Pagination[SeccionRead])
@@ -40,6 +84,8 @@ async def list_secciones(
     profesor_id: int | None = None,
     calendario_id: int | None = None,
     search: str | None = None,
+    fits_in: str | None = None,
+    excludes_slots: str | None = None,
     skip: int = Query(default=0, ge=0),
     limit: int = Query(default=100, ge=1, le=100),
 ):
@@ -50,13 +96,12 @@ async def list_secciones(
         profesor_id=profesor_id,
         calendario_id=calendario_id,
         search=search,
+        fits_in=parse_slots(fits_in, "fits_in", whole_cells=True),
+        excludes_slots=parse_slots(excludes_slots, "excludes_slots"),
         skip=skip,
         limit=limit,
     )
-    return Pagination(
-        total=total,
-        results=seccions,
-    )
+    return page_response(SeccionRead, seccions, total)
 
 
 @router.put("/{seccion_id}", response_model=SeccionRead)
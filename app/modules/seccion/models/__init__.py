@@ -1,3 +1,4 @@
+from . import slot_sync  # noqa: F401  (registers the flush listener)
 from .seccion import Seccion
 
 __all__ = ["Seccion"]
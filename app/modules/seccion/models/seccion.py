@@ -1,10 +1,14 @@
 from datetime import datetime
 
 from pydantic import ConfigDict
+from sqlalchemy import BigInteger, Index
 from sqlmodel import Field, Relationship, SQLModel
 
 
 class Seccion(SQLModel, table=True):
+    # NRC lookups within a calendario: imports and the batched cupos sync
+    __table_args__ = (Index("ix_seccion_calendario_id_nrc", "calendario_id", "nrc"),)
+
     id: int | None = Field(default=None, primary_key=True)
     name: str
     nrc: str
@@ -13,6 +17,18 @@ class Seccion(SQLModel, table=True):
     periodo_inicio: datetime | None = Field(default=None, nullable=True)
     periodo_fin: datetime | None = Field(default=None, nullable=True)
 
+    # Weekly slot mask of the clases (see app.modules.seccion.slots), kept
+    # current by app.modules.seccion.models.slot_sync
+    slots_0: int = Field(
+        default=0, sa_type=BigInteger, sa_column_kwargs={"server_default": "0"}
+    )
+    slots_1: int = Field(
+        default=0, sa_type=BigInteger, sa_column_kwargs={"server_default": "0"}
+    )
+    slots_2: int = Field(
+        default=0, sa_type=BigInteger, sa_column_kwargs={"server_default": "0"}
+    )
+
     centro_id: int = Field(
         index=True, foreign_key="centrouniversitario.id", ondelete="CASCADE"
     )
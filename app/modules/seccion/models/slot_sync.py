@@ -0,0 +1,108 @@
+"""
+Keeps the slot mask columns of secciones current.
+
+Whenever a flush writes clases, the masks of the secciones they belong to (and
+used to belong to) are recomputed from the clase rows in the same transaction,
+so imports, clase CRUD and any other ORM write path stay consistent without
+calling anything explicitly. Inside ``app.core.events.deferred``, as in imports,
+the secciones are only marked, and recomputed together by its last commit.
+"""
+
+from sqlalchemy import bindparam, event, inspect, select, update
+from sqlalchemy.orm import Session, attributes
+
+from app.core import events
+from app.modules.clase.models import Clase
+from app.modules.seccion.slots import schedule_mask, to_words
+
+from .seccion import Seccion
+
+SLOT_COLUMNS = ("slots_0", "slots_1", "slots_2")
+
+_PENDING_KEY = "slot_masks_pending"
+
+# Secciones recomputed per statement, keeping IN lists small
+CHUNK_SIZE = 500
+
+
+@event.listens_for(Clase.seccion_id, "set", active_history=True)
+def _load_previous_seccion(target, value, oldvalue, initiator) -> None:
+    # Registered for active_history only: moving a clase whose seccion_id was
+    # expired must still tell which seccion it left
+    pass
+
+
+def _touched_secciones(session: Session) -> set[int]:
+    secciones = set()
+    for obj in (*session.new, *session.dirty, *session.deleted):
+        if not isinstance(obj, Clase):
+            continue
+        history = inspect(obj).attrs.seccion_id.history
+        secciones.update(history.deleted)
+        secciones.add(obj.seccion_id)
+    secciones.discard(None)
+    return secciones
+
+
+def refresh_slots(session: Session, seccion_ids: set[int]) -> None:
+    """Recompute the slot masks of the given secciones from their clases"""
+    if not seccion_ids:
+        return
+
+    connection = session.connection()
+    table = Seccion.__table__
+    ids = sorted(seccion_ids)
+    for start in range(0, len(ids), CHUNK_SIZE):
+        chunk = ids[start : start + CHUNK_SIZE]
+        clases = {seccion_id: [] for seccion_id in chunk}
+        rows = connection.execute(
+            select(
+                Clase.seccion_id, Clase.dia, Clase.hora_inicio, Clase.hora_fin
+            ).where(Clase.seccion_id.in_(chunk))
+        )
+        for seccion_id, *schedule in rows:
+            clases[seccion_id].append(schedule)
+
+        parameters = []
+        for seccion_id, schedule in clases.items():
+            words = dict(zip(SLOT_COLUMNS, to_words(schedule_mask(schedule))))
+            parameters.append({"seccion_id": seccion_id, **words})
+
+            # Keep loaded instances in step without marking them as modified
+            seccion = session.identity_map.get(
+                inspect(Seccion).identity_key_from_primary_key((seccion_id,))
+            )
+            if seccion is not None:
+                for column, word in words.items():
+                    attributes.set_committed_value(seccion, column, word)
+
+        connection.execute(
+            update(table)
+            .where(table.c.id == bindparam("seccion_id"))
+            .values({column: bindparam(column) for column in SLOT_COLUMNS}),
+            parameters,
+        )
+
+
+@event.listens_for(Session, "after_flush")
+def _refresh_flushed(session: Session, flush_context) -> None:
+    if events.is_deferred(session):
+        session.info.setdefault(_PENDING_KEY, set()).update(_touched_secciones(session))
+    else:
+        refresh_slots(session, _touched_secciones(session))
+
+
+@event.listens_for(Session, "before_commit")
+def _refresh_pending(session: Session) -> None:
+    if events.is_deferred(session) or _PENDING_KEY not in session.info:
+        return
+    # Commit flushes after this hook; flush first so its writes are included
+    session.flush()
+    refresh_slots(session, session.info.pop(_PENDING_KEY))
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard(session: Session) -> None:
+    # Deferred work keeps its marks: the clases committed so far still count
+    if not events.is_deferred(session):
+        session.info.pop(_PENDING_KEY, None)
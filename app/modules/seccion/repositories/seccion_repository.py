@@ -1,6 +1,24 @@
+from collections.abc import Iterator
+
 from sqlmodel import Session, func, or_, select
 
+from app.core import events
+from app.core.database import EXPORT_BATCH_SIZE, stream_rows
+from app.modules.historial.models.cupos_sync import record_cupos
 from app.modules.seccion.models import Seccion
+from app.modules.seccion.models.slot_sync import SLOT_COLUMNS
+from app.modules.seccion.slots import FULL_MASK, to_words
+
+# Secciones per cupos UPDATE; three parameters each stays under SQLite's limit
+CUPOS_BATCH_SIZE = 5000
+
+CUPOS_UPDATE = """
+WITH cupos (id, cupos, cupos_disponibles) AS (VALUES {rows})
+UPDATE seccion
+SET cupos = cupos.cupos, cupos_disponibles = cupos.cupos_disponibles
+FROM cupos
+WHERE seccion.id = cupos.id
+"""
 
 
 class SeccionRepository:
@@ -17,53 +35,58 @@ class SeccionRepository:
         statement = select(Seccion).where(Seccion.id == seccion_id)
         return self.session.exec(statement).first()
 
-    def list(self, filters: dict) -> tuple[list[Seccion], int]:
-        statement = select(Seccion)
-        total_statement = select(func.count()).select_from(Seccion)
+    def _conditions(self, filters: dict) -> list:
+        conditions = []
 
         if filters.get("nrc") is not None:
-            statement = statement.where(Seccion.nrc == filters["nrc"])
-            total_statement = total_statement.where(Seccion.nrc == filters["nrc"])
+            conditions.append(Seccion.nrc == filters["nrc"])
 
         if filters.get("centro_id") is not None:
-            statement = statement.where(Seccion.centro_id == filters["centro_id"])
-            total_statement = total_statement.where(
-                Seccion.centro_id == filters["centro_id"]
-            )
+            conditions.append(Seccion.centro_id == filters["centro_id"])
 
         if filters.get("materia_id") is not None:
-            statement = statement.where(Seccion.materia_id == filters["materia_id"])
-            total_statement = total_statement.where(
-                Seccion.materia_id == filters["materia_id"]
-            )
+            conditions.append(Seccion.materia_id == filters["materia_id"])
 
         if filters.get("profesor_id") is not None:
-            statement = statement.where(Seccion.profesor_id == filters["profesor_id"])
-            total_statement = total_statement.where(
-                Seccion.profesor_id == filters["profesor_id"]
-            )
+            conditions.append(Seccion.profesor_id == filters["profesor_id"])
 
         if filters.get("calendario_id") is not None:
-            statement = statement.where(
-                Seccion.calendario_id == filters["calendario_id"]
-            )
-            total_statement = total_statement.where(
-                Seccion.calendario_id == filters["calendario_id"]
-            )
+            conditions.append(Seccion.calendario_id == filters["calendario_id"])
+
+        # Cells the clases must not take: outside the free time, or excluded
+        forbidden = 0
+        if filters.get("fits_in") is not None:
+            forbidden |= FULL_MASK & ~filters["fits_in"]
+        if filters.get("excludes_slots") is not None:
+            forbidden |= filters["excludes_slots"]
+        for column, word in zip(SLOT_COLUMNS, to_words(forbidden)):
+            if word:
+                conditions.append(getattr(Seccion, column).bitwise_and(word) == 0)
 
         if filters.get("search"):
             search = f"%{filters['search']}%"
-            statement = statement.where(
-                or_(
-                    Seccion.name.ilike(search),
-                )
-            )
-            total_statement = total_statement.where(
+            conditions.append(
                 or_(
                     Seccion.name.ilike(search),
                 )
             )
 
+        return conditions
+
+    def stream(self, filters: dict, columns: list[str]) -> Iterator[tuple]:
+        statement = (
+            select(*[getattr(Seccion, column) for column in columns])
+            .where(*self._conditions(filters))
+            .order_by(Seccion.id)
+            .execution_options(yield_per=EXPORT_BATCH_SIZE)
+        )
+        return stream_rows(self.session, statement, len(columns))
+
+    def list(self, filters: dict) -> tuple[list[Seccion], int]:
+        conditions = self._conditions(filters)
+        statement = select(Seccion).where(*conditions)
+        total_statement = select(func.count()).select_from(Seccion).where(*conditions)
+
         statement = statement.offset(filters.get("skip", 0)).limit(
             filters.get("limit", 100)
         )
@@ -81,3 +104,67 @@ class SeccionRepository:
     def delete(self, seccion: Seccion) -> None:
         self.session.delete(seccion)
         self.session.commit()
+
+    def update_cupos(
+        self, calendario_id: int, centro_id: int, cupos: dict[str, tuple[int, int]]
+    ) -> int:
+        """
+        Apply (cupos, cupos_disponibles) by NRC, writing only the secciones
+        whose values differ with one UPDATE ... FROM (VALUES ...) per batch and
+        recording the cupos_disponibles changes in the history; returns how
+        many secciones changed
+        """
+        connection = self.session.connection()
+        current = connection.execute(
+            select(
+                Seccion.id,
+                Seccion.nrc,
+                Seccion.cupos,
+                Seccion.cupos_disponibles,
+                Seccion.materia_id,
+            ).where(
+                Seccion.calendario_id == calendario_id, Seccion.centro_id == centro_id
+            )
+        )
+        changes = []
+        for seccion_id, nrc, cup, dis, materia_id in current:
+            fresh = cupos.get(nrc)
+            if fresh is not None and fresh != (cup, dis):
+                changes.append((seccion_id, *fresh, dis, nrc, materia_id))
+
+        # Sent as driver SQL: compiling a VALUES construct with thousands of
+        # parameters costs SQLAlchemy far more than running the statement
+        placeholder = "?" if connection.dialect.paramstyle == "qmark" else "%s"
+        row = f"({placeholder}, {placeholder}, {placeholder})"
+        for start in range(0, len(changes), CUPOS_BATCH_SIZE):
+            end = start + CUPOS_BATCH_SIZE
+            batch = changes[start:end]
+            connection.exec_driver_sql(
+                CUPOS_UPDATE.format(rows=", ".join([row] * len(batch))),
+                tuple(value for change in batch for value in change[:3]),
+            )
+
+        # Core writes bypass change tracking; ids and values keep the change
+        # log, the availability index and seccion streams incremental
+        for seccion_id, cup, dis, _, nrc, materia_id in changes:
+            events.track(
+                self.session,
+                Seccion.__tablename__,
+                events.UPDATE,
+                seccion_id,
+                {
+                    "id": seccion_id,
+                    "nrc": nrc,
+                    "cupos": cup,
+                    "cupos_disponibles": dis,
+                    "calendario_id": calendario_id,
+                    "centro_id": centro_id,
+                    "materia_id": materia_id,
+                },
+            )
+        record_cupos(
+            self.session,
+            [(change[0], change[2]) for change in changes if change[2] != change[3]],
+        )
+        self.session.commit()
+        return len(changes)
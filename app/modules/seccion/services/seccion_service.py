@@ -1,3 +1,5 @@
+from collections.abc import Iterator
+
 from app.core.exceptions import ConflictException, NotFoundException
 from app.modules.calendario.repositories.calendario_repository import \
     CalendarioRepository
@@ -71,6 +73,9 @@ class SeccionService:
     def list_secciones(self, **filters) -> tuple[list[Seccion], int]:
         return self.repository.list(filters)
 
+    def export_secciones(self, columns: list[str], **filters) -> Iterator[tuple]:
+        return self.repository.stream(filters, columns)
+
     def update_seccion(self, seccion_id: int, data: SeccionUpdate) -> Seccion:
         seccion = self.repository.get(seccion_id)
         if not seccion:
@@ -84,6 +89,11 @@ class SeccionService:
 
         return self.repository.update(seccion)
 
+    def update_cupos(
+        self, calendario_id: int, centro_id: int, cupos: dict[str, tuple[int, int]]
+    ) -> int:
+        return self.repository.update_cupos(calendario_id, centro_id, cupos)
+
     def delete_seccion(self, seccion_id) -> None:
         seccion = self.repository.get(seccion_id)
         if not seccion:
@@ -0,0 +1,112 @@
+"""
+Weekly slot bitmasks.
+
+A week is a grid of 30 minute cells, ``SLOTS_PER_DAY`` cells per dia starting
+at 07:00, for dias 1 (lunes) to 6 (sábado). Bit ``(dia - 1) * SLOTS_PER_DAY +
+slot`` is set when a clase takes any part of that cell, so two schedules can
+only overlap if their masks share a bit. Times outside the grid are clamped to
+its first and last cells.
+
+The database stores a mask as ``WORDS`` signed 64-bit words, two dias each, so
+overlap tests are plain integer ``&`` predicates on every backend.
+"""
+
+from collections.abc import Iterable
+from datetime import time
+
+SLOT_MINUTES = 30
+DAY_START = 7 * 60
+SLOTS_PER_DAY = 32
+DIAS = 6
+WIDTH = DIAS * SLOTS_PER_DAY
+
+DAY_MASK = (1 << SLOTS_PER_DAY) - 1
+FULL_MASK = (1 << WIDTH) - 1
+
+WORD_BITS = 64
+WORDS = WIDTH // WORD_BITS
+WORD_MASK = (1 << WORD_BITS) - 1
+
+
+def _slot(minutes: int) -> int:
+    return min(max((minutes - DAY_START) // SLOT_MINUTES, 0), SLOTS_PER_DAY - 1)
+
+
+def clase_mask(dia: int | None, hora_inicio: time | None, hora_fin: time | None) -> int:
+    """Cells taken by a single clase, 0 when it has no schedule"""
+    if not dia or not 1 <= dia <= DIAS or hora_inicio is None or hora_fin is None:
+        return 0
+
+    start = hora_inicio.hour * 60 + hora_inicio.minute
+    end = hora_fin.hour * 60 + hora_fin.minute
+    if end <= start:
+        return 0
+
+    first, last = _slot(start), _slot(end - 1)
+    cells = ((1 << (last - first + 1)) - 1) << first
+    return cells << ((dia - 1) * SLOTS_PER_DAY)
+
+
+def window_mask(dia: int, hora_inicio: time, hora_fin: time) -> int:
+    """Cells lying entirely inside a time window of a dia"""
+    if not 1 <= dia <= DIAS:
+        return 0
+
+    start = hora_inicio.hour * 60 + hora_inicio.minute - DAY_START
+    end = hora_fin.hour * 60 + hora_fin.minute - DAY_START
+    first = max(-(-start // SLOT_MINUTES), 0)
+    last = min(end // SLOT_MINUTES, SLOTS_PER_DAY) - 1
+    if last < first:
+        return 0
+
+    cells = ((1 << (last - first + 1)) - 1) << first
+    return cells << ((dia - 1) * SLOTS_PER_DAY)
+
+
+def schedule_mask(clases: Iterable[tuple[int | None, time | None, time | None]]) -> int:
+    """Cells taken by a set of (dia, hora_inicio, hora_fin) clases"""
+    mask = 0
+    for dia, hora_inicio, hora_fin in clases:
+        mask |= clase_mask(dia, hora_inicio, hora_fin)
+    return mask
+
+
+def dias_mask(dias: Iterable[int]) -> int:
+    """Every cell of the given dias"""
+    mask = 0
+    for dia in dias:
+        if 1 <= dia <= DIAS:
+            mask |= DAY_MASK << ((dia - 1) * SLOTS_PER_DAY)
+    return mask
+
+
+def dias_used(mask: int) -> int:
+    """Number of dias with at least one cell taken"""
+    return sum(1 for dia in range(DIAS) if (mask >> (dia * SLOTS_PER_DAY)) & DAY_MASK)
+
+
+def span(mask: int) -> int:
+    """Cells between the first and last clase of each dia, summed over the week"""
+    total = 0
+    for dia in range(DIAS):
+        day = (mask >> (dia * SLOTS_PER_DAY)) & DAY_MASK
+        if day:
+            total += day.bit_length() - (day & -day).bit_length() + 1
+    return total
+
+
+def to_words(mask: int) -> tuple[int, ...]:
+    """Split a mask into signed 64-bit words, lowest dias first"""
+    words = []
+    for index in range(WORDS):
+        word = (mask >> (index * WORD_BITS)) & WORD_MASK
+        words.append(word - (1 << WORD_BITS) if word >> (WORD_BITS - 1) else word)
+    return tuple(words)
+
+
+def from_words(words: Iterable[int]) -> int:
+    """Inverse of ``to_words``"""
+    mask = 0
+    for index, word in enumerate(words):
+        mask |= (word & WORD_MASK) << (index * WORD_BITS)
+    return mask
@@ -0,0 +1,29 @@
+from fastapi import Depends
+from sqlmodel import Session
+
+from app.api.dependencies.database import get_session
+from app.core.config import settings
+from app.modules.calendario.repositories.calendario_repository import \
+    CalendarioRepository
+from app.modules.centro.repositories.centro_repository import \
+    CentroUniversitarioRepository
+from app.modules.snapshot.repositories.snapshot_repository import \
+    SnapshotRepository
+from app.modules.snapshot.services.snapshot_service import (SnapshotService,
+                                                            SnapshotStore)
+
+
+def get_snapshot_store() -> SnapshotStore:
+    return SnapshotStore(settings.SNAPSHOT_DIR)
+
+
+def get_snapshot_service(
+    session: Session = Depends(get_session),
+    store: SnapshotStore = Depends(get_snapshot_store),
+) -> SnapshotService:
+    return SnapshotService(
+        repository=SnapshotRepository(session=session),
+        calendario_repository=CalendarioRepository(session=session),
+        centro_repository=CentroUniversitarioRepository(session=session),
+        store=store,
+    )
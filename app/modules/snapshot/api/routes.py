@@ -0,0 +1,95 @@
+from typing import Annotated
+
+from fastapi import APIRouter, Depends, Request, Response, status
+from fastapi.responses import FileResponse
+
+from app.api.dependencies.auth import user_is_staff
+from app.api.routing import etag_matches
+from app.core.config import settings
+from app.core.exceptions import NotFoundException
+from app.modules.snapshot.schemas import Snapshot, SnapshotManifest
+from app.modules.snapshot.services.snapshot_service import (IDENTITY,
+                                                            SnapshotService,
+                                                            SnapshotStore)
+from app.modules.users.models import User
+
+from .dependencies import get_snapshot_service, get_snapshot_store
+
+router = APIRouter()
+
+
+def negotiate_encoding(accept_encoding: str, available: list[str]) -> str:
+    """Smallest available encoding the client accepts"""
+    accepted = set()
+    for part in accept_encoding.lower().split(","):
+        coding, _, params = part.strip().partition(";")
+        if params.strip().replace(" ", "") in ("q=0", "q=0.0", "q=0.00", "q=0.000"):
+            continue
+        accepted.add(coding.strip())
+
+    for encoding in available:
+        if encoding != IDENTITY and (encoding in accepted or "*" in accepted):
+            return encoding
+    return IDENTITY
+
+
+@router.get(
+    "/{calendario_id}/{centro_id}",
+    response_model=Snapshot,
+    responses={206: {"description": "Partial content"}, 304: {}},
+)
+async def get_snapshot(
+    calendario_id: int,
+    centro_id: int,
+    request: Request,
+    store: Annotated[SnapshotStore, Depends(get_snapshot_store)],
+):
+    manifest = store.manifest(calendario_id, centro_id)
+    if not manifest:
+        raise NotFoundException("Snapshot not found.")
+
+    encoding = negotiate_encoding(
+        request.headers.get("accept-encoding", ""),
+        [encoding for encoding in store.encodings() if encoding in manifest.sizes],
+    )
+    headers = {
+        "etag": f'"{manifest.version}-{encoding}"',
+        "cache-control": settings.CACHE_CONTROL,
+        "vary": "Accept-Encoding",
+        "x-snapshot-version": manifest.version,
+    }
+
+    if etag_matches(request.headers.get("if-none-match"), headers["etag"]):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+
+    if encoding != IDENTITY:
+        headers["content-encoding"] = encoding
+
+    return FileResponse(
+        store.path(calendario_id, centro_id, manifest.version, encoding),
+        media_type="application/json",
+        headers=headers,
+    )
+
+
+@router.get("/{calendario_id}/{centro_id}/manifest", response_model=SnapshotManifest)
+async def get_snapshot_manifest(
+    calendario_id: int,
+    centro_id: int,
+    store: Annotated[SnapshotStore, Depends(get_snapshot_store)],
+):
+    manifest = store.manifest(calendario_id, centro_id)
+    if not manifest:
+        raise NotFoundException("Snapshot not found.")
+
+    return manifest
+
+
+@router.post("/{calendario_id}/{centro_id}", response_model=SnapshotManifest)
+async def publish_snapshot(
+    calendario_id: int,
+    centro_id: int,
+    service: Annotated[SnapshotService, Depends(get_snapshot_service)],
+    user: Annotated[User, Depends(user_is_staff)],
+):
+    return service.publish(calendario_id, centro_id)
@@ -0,0 +1,44 @@
+from collections.abc import Iterator
+
+from sqlalchemy.orm import selectinload
+from sqlmodel import Session, select
+
+from app.core.database import EXPORT_BATCH_SIZE
+from app.modules.aula.models import Aula
+from app.modules.clase.models import Clase
+from app.modules.seccion.models import Seccion
+
+
+class SnapshotRepository:
+    def __init__(self, session: Session):
+        self.session = session
+
+    def secciones(self, calendario_id: int, centro_id: int) -> Iterator[Seccion]:
+        """Secciones with everything a snapshot inlines, loaded batch by batch"""
+        # Keyset batches instead of yield_per: chained selectin loads cannot
+        # be combined with yield_per.
+        last_id = 0
+        while True:
+            statement = (
+                select(Seccion)
+                .where(
+                    Seccion.calendario_id == calendario_id,
+                    Seccion.centro_id == centro_id,
+                    Seccion.id > last_id,
+                )
+                .options(
+                    selectinload(Seccion.materia),
+                    selectinload(Seccion.profesor),
+                    selectinload(Seccion.clases)
+                    .selectinload(Clase.aula)
+                    .selectinload(Aula.edificio),
+                )
+                .order_by(Seccion.id)
+                .limit(EXPORT_BATCH_SIZE)
+            )
+            batch = self.session.exec(statement).all()
+            yield from batch
+
+            if len(batch) < EXPORT_BATCH_SIZE:
+                return
+            last_id = batch[-1].id
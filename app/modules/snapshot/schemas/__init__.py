@@ -0,0 +1,10 @@
+from .snapshot import (Snapshot, SnapshotAula, SnapshotClase, SnapshotManifest,
+                       SnapshotSeccion)
+
+__all__ = [
+    "Snapshot",
+    "SnapshotAula",
+    "SnapshotClase",
+    "SnapshotManifest",
+    "SnapshotSeccion",
+]
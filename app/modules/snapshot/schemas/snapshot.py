@@ -0,0 +1,42 @@
+from datetime import datetime
+from typing import Optional
+
+from sqlmodel import SQLModel
+
+from app.modules.aula.schemas.aula import AulaReadMinimal
+from app.modules.calendario.schemas.calendario import CalendarioReadMinimal
+from app.modules.centro.schemas.centro import CentroUniversitarioReadMinimal
+from app.modules.clase.schemas.clase import ClaseReadMinimal
+from app.modules.edificio.schemas.edificio import EdificioReadMinimal
+from app.modules.materia.schemas.materia import MateriaReadMinimal
+from app.modules.profesor.schemas.profesor import ProfesorReadMinimal
+from app.modules.seccion.schemas.seccion import SeccionReadMinimal
+
+
+class SnapshotAula(AulaReadMinimal):
+    edificio: EdificioReadMinimal
+
+
+class SnapshotClase(ClaseReadMinimal):
+    aula: Optional[SnapshotAula]
+
+
+class SnapshotSeccion(SeccionReadMinimal):
+    materia: MateriaReadMinimal
+    profesor: Optional[ProfesorReadMinimal]
+    clases: list[SnapshotClase]
+
+
+class Snapshot(SQLModel):
+    calendario: CalendarioReadMinimal
+    centro: CentroUniversitarioReadMinimal
+    secciones: list[SnapshotSeccion]
+
+
+class SnapshotManifest(SQLModel):
+    calendario_id: int
+    centro_id: int
+    version: str
+    generated_at: datetime
+    secciones: int
+    sizes: dict[str, int]
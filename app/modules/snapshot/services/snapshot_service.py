@@ -0,0 +1,205 @@
+"""
+Precompiled seccion snapshots.
+
+A snapshot is the whole denormalized timetable of a (calendario, centro) pair
+rendered once per import and stored next to its gzip and brotli encodings, so
+clients that need everything download a static file instead of paging through
+the API. Snapshots are content addressed: the version is a digest of the JSON
+document, so republishing unchanged data keeps the same version and ETag.
+"""
+
+import hashlib
+import os
+import tempfile
+import zlib
+from collections.abc import Iterable
+from datetime import datetime, timezone
+from pathlib import Path
+
+from pydantic_core import to_json
+
+from app.api.responses import row_builder
+from app.core.exceptions import NotFoundException
+from app.modules.calendario.repositories.calendario_repository import \
+    CalendarioRepository
+from app.modules.calendario.schemas.calendario import CalendarioReadMinimal
+from app.modules.centro.repositories.centro_repository import \
+    CentroUniversitarioRepository
+from app.modules.centro.schemas.centro import CentroUniversitarioReadMinimal
+from app.modules.snapshot.repositories.snapshot_repository import \
+    SnapshotRepository
+from app.modules.snapshot.schemas import SnapshotManifest, SnapshotSeccion
+
+try:
+    import brotli
+except ImportError:  # pragma: no cover - brotli is optional
+    brotli = None
+
+IDENTITY = "identity"
+GZIP = "gzip"
+BROTLI = "br"
+
+SUFFIXES = {IDENTITY: ".json", GZIP: ".json.gz", BROTLI: ".json.br"}
+
+# Versions kept on disk; the previous one survives a publish so downloads that
+# started before it can finish.
+KEEP_VERSIONS = 2
+
+
+class _Encoder:
+    def __init__(self, encoding: str):
+        self.encoding = encoding
+        if encoding == GZIP:
+            compressor = zlib.compressobj(9, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+            self.compress, self.flush = compressor.compress, compressor.flush
+        elif encoding == BROTLI:
+            compressor = brotli.Compressor(quality=9)
+            self.compress = compressor.process
+            self.flush = compressor.finish
+        else:
+            self.compress, self.flush = bytes, bytes
+
+
+class SnapshotStore:
+    """Snapshot files of every (calendario, centro) pair under a directory"""
+
+    def __init__(self, root: str | os.PathLike):
+        self.root = Path(root)
+
+    @staticmethod
+    def encodings() -> list[str]:
+        return [BROTLI, GZIP, IDENTITY] if brotli else [GZIP, IDENTITY]
+
+    def directory(self, calendario_id: int, centro_id: int) -> Path:
+        return self.root / f"{calendario_id}-{centro_id}"
+
+    def path(
+        self, calendario_id: int, centro_id: int, version: str, encoding: str
+    ) -> Path:
+        return self.directory(calendario_id, centro_id) / (version + SUFFIXES[encoding])
+
+    def manifest(self, calendario_id: int, centro_id: int) -> SnapshotManifest | None:
+        try:
+            data = (
+                self.directory(calendario_id, centro_id) / "manifest.json"
+            ).read_bytes()
+        except FileNotFoundError:
+            return None
+        return SnapshotManifest.model_validate_json(data)
+
+    def write(
+        self, calendario_id: int, centro_id: int, chunks: Iterable[bytes]
+    ) -> tuple[str, dict[str, int]]:
+        """
+        Encode a document into every supported encoding in a single pass.
+        Returns the content version and the size of each encoding.
+        """
+        directory = self.directory(calendario_id, centro_id)
+        directory.mkdir(parents=True, exist_ok=True)
+
+        digest = hashlib.sha256()
+        outputs = []
+        for encoding in self.encodings():
+            fd, name = tempfile.mkstemp(dir=directory, suffix=".tmp")
+            outputs.append((_Encoder(encoding), os.fdopen(fd, "wb"), name))
+
+        try:
+            for chunk in chunks:
+                digest.update(chunk)
+                for encoder, file, _ in outputs:
+                    file.write(encoder.compress(chunk))
+            for encoder, file, _ in outputs:
+                file.write(encoder.flush())
+                file.close()
+
+            version = digest.hexdigest()[:16]
+            sizes = {}
+            for encoder, _, name in outputs:
+                sizes[encoder.encoding] = os.path.getsize(name)
+                os.replace(
+                    name, self.path(calendario_id, centro_id, version, encoder.encoding)
+                )
+        finally:
+            for _, file, name in outputs:
+                file.close()
+                if os.path.exists(name):
+                    os.remove(name)
+
+        return version, sizes
+
+    def save_manifest(self, manifest: SnapshotManifest) -> None:
+        """Point readers at a new version and drop the versions no longer kept"""
+        directory = self.directory(manifest.calendario_id, manifest.centro_id)
+        previous = self.manifest(manifest.calendario_id, manifest.centro_id)
+
+        fd, name = tempfile.mkstemp(dir=directory, suffix=".tmp")
+        with os.fdopen(fd, "wb") as file:
+            file.write(manifest.model_dump_json().encode())
+        os.replace(name, directory / "manifest.json")
+
+        keep = {manifest.version}
+        if previous and len(keep) < KEEP_VERSIONS:
+            keep.add(previous.version)
+
+        for path in directory.iterdir():
+            version = path.name.split(".", 1)[0]
+            if path.name != "manifest.json" and version not in keep:
+                path.unlink(missing_ok=True)
+
+
+class SnapshotService:
+    def __init__(
+        self,
+        repository: SnapshotRepository,
+        calendario_repository: CalendarioRepository,
+        centro_repository: CentroUniversitarioRepository,
+        store: SnapshotStore,
+    ):
+        self.repository = repository
+        self.calendario_repository = calendario_repository
+        self.centro_repository = centro_repository
+        self.store = store
+
+    def publish(self, calendario_id: int, centro_id: int) -> SnapshotManifest:
+        calendario = self.calendario_repository.get(calendario_id)
+        if not calendario:
+            raise NotFoundException("Calendario not found.")
+
+        centro = self.centro_repository.get(centro_id)
+        if not centro:
+            raise NotFoundException("Centro Universitario not found.")
+
+        build = row_builder(SnapshotSeccion)
+        secciones = 0
+
+        def document() -> Iterable[bytes]:
+            nonlocal secciones
+            yield b'{"calendario":' + to_json(
+                row_builder(CalendarioReadMinimal)(calendario)
+            )
+            yield b',"centro":' + to_json(
+                row_builder(CentroUniversitarioReadMinimal)(centro)
+            )
+            yield b',"secciones":['
+            for seccion in self.repository.secciones(calendario_id, centro_id):
+                yield (b"," if secciones else b"") + to_json(build(seccion))
+                secciones += 1
+            yield b"]}"
+
+        version, sizes = self.store.write(calendario_id, centro_id, document())
+
+        current = self.store.manifest(calendario_id, centro_id)
+        if current and current.version == version:
+            return current
+
+        manifest = SnapshotManifest(
+            calendario_id=calendario_id,
+            centro_id=centro_id,
+            version=version,
+            generated_at=datetime.now(timezone.utc),
+            secciones=secciones,
+            sizes=sizes,
+        )
+        self.store.save_manifest(manifest)
+
+        return manifest
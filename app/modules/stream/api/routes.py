@@ -0,0 +1,52 @@
+from collections.abc import AsyncIterator
+
+from fastapi import APIRouter
+from fastapi.responses import StreamingResponse
+
+from app.core.config import settings
+from app.core.exceptions import BadRequestException
+from app.modules.stream.services.seccion_hub import SeccionFilter, seccion_hub
+
+# Most NRCs a stream can follow, e.g. a student's whole schedule or a carrera
+MAX_NRCS = 500
+
+router = APIRouter()
+
+
+async def _stream(filter: SeccionFilter) -> AsyncIterator[str]:
+    # Subscribed once streaming starts, so the finally clause always runs
+    subscriber = seccion_hub.subscribe(filter)
+    try:
+        # Lets EventSource clients know the stream is open
+        yield ": connected\n\n"
+        async for message in subscriber.messages(settings.STREAM_HEARTBEAT):
+            yield message
+    finally:
+        seccion_hub.unsubscribe(subscriber)
+
+
+@router.get("/secciones")
+async def stream_secciones(
+    calendario_id: int | None = None,
+    centro_id: int | None = None,
+    materia_id: int | None = None,
+    nrc: str | None = None,
+):
+    nrcs = None
+    if nrc is not None:
+        nrcs = frozenset(value.strip() for value in nrc.split(",") if value.strip())
+        if not nrcs or len(nrcs) > MAX_NRCS:
+            raise BadRequestException(f"Provide between 1 and {MAX_NRCS} NRCs.")
+
+    filter = SeccionFilter(
+        calendario_id=calendario_id,
+        centro_id=centro_id,
+        materia_id=materia_id,
+        nrcs=nrcs,
+    )
+    return StreamingResponse(
+        _stream(filter),
+        media_type="text/event-stream",
+        # Proxies must pass events through as they come
+        headers={"cache-control": "no-cache", "x-accel-buffering": "no"},
+    )
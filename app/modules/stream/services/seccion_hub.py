@@ -0,0 +1,184 @@
+"""
+In-process broadcast of committed seccion changes to Server-Sent Events clients.
+
+Commits that write secciones (CRUD, imports, the cupos sync) reach ``publish``
+through app.core.events once the transaction is durable. Each changed seccion
+is serialized once, and every subscriber whose filter matches receives a
+single ``secciones`` message per commit with the matching ones, so any number
+of dashboards cost one write path and no queries. Imports, which commit every
+seccion on its own, send one message when they finish, with the last change
+of each seccion they wrote.
+
+Messages are handed to each subscriber's event loop and buffered there up to
+STREAM_BUFFER_SIZE. A client that falls that far behind is dropped: its buffer
+is discarded and its stream ends with a ``dropped`` event, so a stalled
+connection can neither hold memory nor delay the others. Clients reconnect and
+refetch what they show.
+
+The hub only sees commits of its own process. With several workers, streams
+follow the writes of the worker they are connected to.
+"""
+
+import asyncio
+import json
+import threading
+from collections import deque
+from collections.abc import AsyncIterator, Iterable
+from dataclasses import dataclass
+from typing import Any
+
+from app.core import events
+from app.core.config import settings
+from app.modules.seccion.models import Seccion
+
+# Seccion columns sent to clients
+FIELDS = (
+    "nrc",
+    "name",
+    "cupos",
+    "cupos_disponibles",
+    "calendario_id",
+    "centro_id",
+    "materia_id",
+)
+
+
+@dataclass(frozen=True)
+class SeccionFilter:
+    calendario_id: int | None = None
+    centro_id: int | None = None
+    materia_id: int | None = None
+    nrcs: frozenset[str] | None = None
+
+    def matches(self, values: dict[str, Any]) -> bool:
+        return (
+            (
+                self.calendario_id is None
+                or values.get("calendario_id") == self.calendario_id
+            )
+            and (self.centro_id is None or values.get("centro_id") == self.centro_id)
+            and (self.materia_id is None or values.get("materia_id") == self.materia_id)
+            and (self.nrcs is None or values.get("nrc") in self.nrcs)
+        )
+
+
+def message(event: str, data: str) -> str:
+    return f"event: {event}\ndata: {data}\n\n"
+
+
+class Subscriber:
+    def __init__(
+        self,
+        filter: SeccionFilter,
+        loop: asyncio.AbstractEventLoop,
+        buffer_size: int,
+    ):
+        self.filter = filter
+        self.loop = loop
+        self.buffer_size = buffer_size
+        self.buffer: deque[str] = deque()
+        self.dropped = False
+        self.ready = asyncio.Event()
+
+    def push(self, data: str) -> None:
+        """Buffer a message; runs on the subscriber's loop"""
+        if self.dropped:
+            return
+        if len(self.buffer) >= self.buffer_size:
+            self.dropped = True
+            self.buffer.clear()
+        else:
+            self.buffer.append(data)
+        self.ready.set()
+
+    async def messages(self, heartbeat: float) -> AsyncIterator[str]:
+        """Buffered messages, keep-alive comments while idle, until dropped"""
+        while True:
+            try:
+                await asyncio.wait_for(self.ready.wait(), heartbeat)
+            except asyncio.TimeoutError:
+                yield ": keep-alive\n\n"
+                continue
+            self.ready.clear()
+            while self.buffer:
+                yield self.buffer.popleft()
+            if self.dropped:
+                yield message("dropped", "{}")
+                return
+
+
+class SeccionHub:
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.subscribers: set[Subscriber] = set()
+
+    def subscribe(
+        self, filter: SeccionFilter, buffer_size: int | None = None
+    ) -> Subscriber:
+        subscriber = Subscriber(
+            filter,
+            asyncio.get_running_loop(),
+            buffer_size or settings.STREAM_BUFFER_SIZE,
+        )
+        with self.lock:
+            self.subscribers.add(subscriber)
+        return subscriber
+
+    def unsubscribe(self, subscriber: Subscriber) -> None:
+        with self.lock:
+            self.subscribers.discard(subscriber)
+
+    def publish(self, changes: Iterable[events.Change]) -> None:
+        with self.lock:
+            subscribers = list(self.subscribers)
+        if not subscribers:
+            return
+
+        # Last change of every seccion in the commit, or the deferred block
+        latest: dict[int, events.Change] = {}
+        for change in changes:
+            if change.table == Seccion.__tablename__ and change.id is not None:
+                latest.pop(change.id, None)
+                latest[change.id] = change
+        if not latest:
+            return
+
+        secciones = [
+            (
+                change.values,
+                json.dumps(
+                    {
+                        "id": change.id,
+                        "op": change.op,
+                        **{
+                            field: change.values[field]
+                            for field in FIELDS
+                            if field in change.values
+                        },
+                    },
+                    separators=(",", ":"),
+                ),
+            )
+            for change in latest.values()
+        ]
+        for subscriber in subscribers:
+            matched = [
+                data for values, data in secciones if subscriber.filter.matches(values)
+            ]
+            if not matched:
+                continue
+            try:
+                subscriber.loop.call_soon_threadsafe(
+                    subscriber.push, message("secciones", f"[{','.join(matched)}]")
+                )
+            except RuntimeError:
+                # The client's loop is gone
+                self.unsubscribe(subscriber)
+
+
+seccion_hub = SeccionHub()
+
+
+@events.on_commit_batched
+def _publish_changes(changes: list[events.Change]) -> None:
+    seccion_hub.publish(changes)
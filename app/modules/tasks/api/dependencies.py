@@ -1,5 +1,13 @@
-from fastapi import Depends
+from collections.abc import AsyncIterator
+from pathlib import PurePath
+from tempfile import SpooledTemporaryFile
+from typing import Optional
 
+from fastapi import Depends, Request
+from starlette.datastructures import UploadFile
+
+from app.core.exceptions import (BadRequestException,
+                                 UnsupportedMediaTypeException)
 from app.modules.aula.api.dependencies import get_aula_service
 from app.modules.aula.services.aula_service import AulaService
 from app.modules.calendario.api.dependencies import get_calendario_service
@@ -10,14 +18,23 @@ from app.modules.centro.services.centro_service import \
     CentroUniversitarioService
 from app.modules.clase.api.dependencies import get_clase_service
 from app.modules.clase.services.clase_service import ClaseService
+from app.modules.conflicto.api.dependencies import get_conflicto_service
+from app.modules.conflicto.services.conflicto_service import ConflictoService
 from app.modules.edificio.api.dependencies import get_edificio_service
 from app.modules.edificio.services.edificio_service import EdificioService
+from app.modules.historial.api.dependencies import get_cupos_service
+from app.modules.historial.services.cupos_service import CuposService
 from app.modules.materia.api.dependencies import get_materia_service
 from app.modules.materia.services.materia_service import MateriaService
 from app.modules.profesor.api.dependencies import get_profesor_service
 from app.modules.profesor.services.profesor_service import ProfesorService
 from app.modules.seccion.api.dependencies import get_seccion_service
 from app.modules.seccion.services.seccion_service import SeccionService
+from app.modules.snapshot.api.dependencies import get_snapshot_service
+from app.modules.snapshot.services.snapshot_service import SnapshotService
+from app.modules.tasks.services.manual_import import FORMATS, ManualImport
+from app.modules.tasks.services.siiau_client import (SiiauClient,
+                                                     get_siiau_client)
 from app.modules.tasks.services.task_service import TasksService
 
 
@@ -30,6 +47,10 @@ def get_tasks_service(
     seccion_service: SeccionService = Depends(get_seccion_service),
     aula_service: AulaService = Depends(get_aula_service),
     clase_service: ClaseService = Depends(get_clase_service),
+    snapshot_service: SnapshotService = Depends(get_snapshot_service),
+    conflicto_service: ConflictoService = Depends(get_conflicto_service),
+    cupos_service: CuposService = Depends(get_cupos_service),
+    siiau_client: SiiauClient = Depends(get_siiau_client),
 ) -> TasksService:
     return TasksService(
         centro_service=centro_service,
@@ -40,4 +61,62 @@ def get_tasks_service(
         seccion_service=seccion_service,
         aula_service=aula_service,
         clase_service=clase_service,
+        snapshot_service=snapshot_service,
+        conflicto_service=conflicto_service,
+        cupos_service=cupos_service,
+        siiau_client=siiau_client,
     )
+
+
+# Bytes of a raw upload kept in memory before it spills to a temporary file
+SPOOL_SIZE = 1024 * 1024
+
+UPLOAD_FORMATS = {
+    "application/x-ndjson": "ndjson",
+    "application/ndjson": "ndjson",
+    "application/jsonl": "ndjson",
+    "text/csv": "csv",
+    ".ndjson": "ndjson",
+    ".jsonl": "ndjson",
+    ".csv": "csv",
+}
+
+
+async def get_upload(
+    request: Request, formato: Optional[str] = None
+) -> AsyncIterator[Optional[ManualImport]]:
+    """
+    Records uploaded as NDJSON or CSV, in the body or as the ``archivo`` file
+    of a form, spooled to a temporary file; None for JSON bodies
+    """
+    content_type = request.headers.get("content-type", "").split(";")[0].strip()
+    if content_type in ("", "application/json"):
+        yield None
+        return
+
+    if content_type == "multipart/form-data":
+        form = await request.form()
+        archivo = form.get("archivo")
+        if not isinstance(archivo, UploadFile):
+            raise BadRequestException("Send the records as the 'archivo' file.")
+        file = archivo.file
+        formato = (
+            formato
+            or UPLOAD_FORMATS.get(archivo.content_type or "")
+            or UPLOAD_FORMATS.get(PurePath(archivo.filename or "").suffix.lower())
+        )
+    else:
+        file = SpooledTemporaryFile(max_size=SPOOL_SIZE)
+        async for chunk in request.stream():
+            file.write(chunk)
+        file.seek(0)
+        formato = formato or UPLOAD_FORMATS.get(content_type)
+
+    try:
+        if formato not in FORMATS:
+            raise UnsupportedMediaTypeException(
+                "Upload JSON, NDJSON (application/x-ndjson) or CSV (text/csv)."
+            )
+        yield ManualImport(file, formato)
+    finally:
+        file.close()
@@ -1,12 +1,40 @@
-from typing import Annotated
+import json
+from typing import Annotated, Optional
 
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Request
+from fastapi.exceptions import RequestValidationError
+from fastapi.responses import StreamingResponse
+from pydantic import TypeAdapter, ValidationError
 
 from app.api.dependencies.auth import user_is_staff
+from app.modules.tasks.services.manual_import import ManualImport
 from app.modules.tasks.services.task_service import TasksService
 from app.modules.users.models import User
 
-from .dependencies import get_tasks_service
+from .dependencies import get_tasks_service, get_upload
+
+# Body of JSON manual imports
+RECORDS = TypeAdapter(list[dict])
+
+MANUAL_IMPORT_BODY = {
+    "requestBody": {
+        "required": True,
+        "content": {
+            "application/json": {
+                "schema": {"type": "array", "items": {"type": "object"}}
+            },
+            "application/x-ndjson": {"schema": {"type": "string"}},
+            "text/csv": {"schema": {"type": "string"}},
+            "multipart/form-data": {
+                "schema": {
+                    "type": "object",
+                    "properties": {"archivo": {"type": "string", "format": "binary"}},
+                    "required": ["archivo"],
+                }
+            },
+        },
+    }
+}
 
 router = APIRouter()
 
@@ -17,10 +45,14 @@ async def importar_secciones(
     centro_id: int,
     service: Annotated[TasksService, Depends(get_tasks_service)],
     user: Annotated[User, Depends(user_is_staff)],
+    detect_conflicts: bool = False,
+    dry_run: bool = False,
 ):
     return service.get_secciones(
         calendario_id=calendario_id,
         centro_id=centro_id,
+        detect_conflicts=detect_conflicts,
+        dry_run=dry_run,
     )
 
 
@@ -31,28 +63,80 @@ async def actualizar_secciones(
     service: Annotated[TasksService, Depends(get_tasks_service)],
     user: Annotated[User, Depends(user_is_staff)],
     full_update: bool = False,
+    detect_conflicts: bool = False,
+    dry_run: bool = False,
 ):
     return service.update_all_secciones(
         calendario_id=calendario_id,
         centro_id=centro_id,
         full_update=full_update,
+        detect_conflicts=detect_conflicts,
+        dry_run=dry_run,
     )
 
 
-@router.post("/importar-secciones-manual")
+@router.get("/actualizar-cupos")
+async def actualizar_cupos(
+    calendario_id: int,
+    centro_id: int,
+    service: Annotated[TasksService, Depends(get_tasks_service)],
+    user: Annotated[User, Depends(user_is_staff)],
+):
+    return service.sync_cupos(calendario_id=calendario_id, centro_id=centro_id)
+
+
+@router.post("/importar-secciones-manual", openapi_extra=MANUAL_IMPORT_BODY)
 async def importar_secciones_manual(
-    data: list[dict],
+    request: Request,
     calendario_id: int,
     centro_id: int,
     service: Annotated[TasksService, Depends(get_tasks_service)],
     user: Annotated[User, Depends(user_is_staff)],
+    upload: Annotated[Optional[ManualImport], Depends(get_upload)],
     update: bool = False,
     full_update: bool = False,
+    detect_conflicts: bool = False,
+    progreso: bool = False,
+    dry_run: bool = False,
 ):
-    return service.save_secciones(
-        data=data,
+    if upload is None:
+        try:
+            data = RECORDS.validate_json(await request.body())
+        except ValidationError as e:
+            raise RequestValidationError(e.errors(include_url=False))
+        return service.save_secciones(
+            data=data,
+            calendario_id=calendario_id,
+            centro_id=centro_id,
+            update_if_exists=update,
+            full_update=full_update,
+            detect_conflicts=detect_conflicts,
+            dry_run=dry_run,
+        )
+
+    if dry_run:
+        return service.plan_upload(
+            upload,
+            calendario_id=calendario_id,
+            centro_id=centro_id,
+            update_if_exists=update,
+            full_update=full_update,
+        )
+
+    progress = service.import_upload(
+        upload,
         calendario_id=calendario_id,
         centro_id=centro_id,
         update_if_exists=update,
         full_update=full_update,
+        detect_conflicts=detect_conflicts,
     )
+    if progreso:
+        # One line of totals per batch saved
+        return StreamingResponse(
+            (json.dumps(stats) + "\n" for stats in progress),
+            media_type="application/x-ndjson",
+        )
+    for stats in progress:
+        pass
+    return stats
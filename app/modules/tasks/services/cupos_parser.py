@@ -0,0 +1,90 @@
+"""
+Cupos-only parsing of the SIIAU oferta page.
+
+Registration week only moves ``CUP`` and ``DIS``, so instead of building the
+whole document tree this streams the HTML once and keeps the text of the NRC,
+CUP and DIS cells of the first table's rows. Cells of nested tables (horario,
+profesor) are skipped without being collected, and missing end tags, common in
+SIIAU's markup, are closed implicitly by the next cell or row.
+"""
+
+import re
+from html.parser import HTMLParser
+
+NRC_PATTERN = re.compile(r"^\d{4,}")
+# Positions of the NRC, CUP and DIS cells in a seccion row
+NRC, CUP, DIS = 0, 5, 6
+
+
+class CuposParser(HTMLParser):
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.cupos: dict[str, tuple[int, int]] = {}
+        self._depth = 0
+        self._done = False
+        self._row: list[str] | None = None
+        self._cell: list[str] | None = None
+
+    def handle_starttag(self, tag, attrs):
+        if self._done:
+            return
+        if tag == "table":
+            self._depth += 1
+            if self._depth > 1:
+                self._close_cell()
+        elif self._depth != 1:
+            return
+        elif tag == "tr":
+            self._close_row()
+            self._row = []
+        elif tag == "td" and self._row is not None:
+            self._close_cell()
+            # Cells after DIS are not needed
+            if len(self._row) <= DIS:
+                self._cell = []
+
+    def handle_endtag(self, tag):
+        if self._done:
+            return
+        if tag == "table":
+            self._depth -= 1
+            if self._depth == 0:
+                self._close_row()
+                self._done = True
+        elif self._depth != 1:
+            return
+        elif tag == "td":
+            self._close_cell()
+        elif tag == "tr":
+            self._close_row()
+
+    def handle_data(self, data):
+        if self._cell is not None and self._depth == 1:
+            self._cell.append(data)
+
+    def close(self):
+        super().close()
+        self._close_row()
+
+    def _close_cell(self):
+        if self._cell is not None:
+            self._row.append(" ".join("".join(self._cell).split()))
+            self._cell = None
+
+    def _close_row(self):
+        self._close_cell()
+        row, self._row = self._row, None
+        if not row or len(row) <= DIS or not NRC_PATTERN.match(row[NRC]):
+            return
+        try:
+            self.cupos[row[NRC]] = (int(row[CUP]), int(row[DIS]))
+        except ValueError:
+            pass
+
+
+def parse_cupos(html: str) -> dict[str, tuple[int, int]]:
+    """(cupos, cupos_disponibles) by NRC from a SIIAU oferta page"""
+    parser = CuposParser()
+    parser.feed(html)
+    parser.close()
+    return parser.cupos
@@ -0,0 +1,293 @@
+"""
+Dry-run plans of seccion imports.
+
+An import resolves each seccion against the database one lookup at a time (its
+seccion, materia, profesor, edificios and aulas) and writes as it goes. A plan
+takes the same decisions without writing anything: for each page of secciones
+it loads the rows they refer to with a few ``IN`` selects, and remembers what
+it has read and what the import would create, so later pages resolve against
+both. The counts, and a few samples of each change, are the import's write
+plan.
+
+Every page is resolved in one read-only transaction, REPEATABLE READ on
+PostgreSQL and an explicit BEGIN on SQLite (whose driver only opens one before
+writes), so the whole plan sees a single snapshot of the tables. It is rolled
+back at the end.
+"""
+
+from collections.abc import Callable, Iterable, Iterator
+from contextlib import contextmanager
+from typing import Any, Optional
+
+from sqlalchemy import Connection
+from sqlmodel import Session, func, select
+
+from app.modules.aula.models import Aula
+from app.modules.clase.models import Clase
+from app.modules.edificio.models import Edificio
+from app.modules.materia.models import Materia
+from app.modules.profesor.models import Profesor
+from app.modules.seccion.models import Seccion
+from app.modules.tasks.services.oferta_parser import SeccionOferta
+
+# Changes of each kind listed in the plan
+MAX_MUESTRAS = 10
+# Values per IN (...) lookup; stays under SQLite's parameter limit
+LOOKUP_BATCH_SIZE = 500
+
+SNAPSHOT_OPTIONS = {
+    "postgresql": {"isolation_level": "REPEATABLE READ", "postgresql_readonly": True},
+}
+
+ACTIONS = {
+    "secciones": ("crear", "actualizar", "sin_cambios", "errores"),
+    "clases": ("crear", "eliminar"),
+    "materias": ("crear",),
+    "profesores": ("crear",),
+    "edificios": ("crear",),
+    "aulas": ("crear",),
+}
+
+
+@contextmanager
+def read_snapshot(session: Session) -> Iterator[Connection]:
+    """A connection in a read-only transaction, rolled back on exit"""
+    # Whatever the session read so far belongs to another transaction
+    session.rollback()
+    dialect = session.get_bind().dialect.name
+    connection = session.connection(execution_options=SNAPSHOT_OPTIONS.get(dialect, {}))
+    if dialect == "sqlite":
+        connection.exec_driver_sql("BEGIN")
+    try:
+        yield connection
+    finally:
+        session.rollback()
+
+
+def _batches(values: Iterable[Any]) -> Iterator[list[Any]]:
+    values = list(values)
+    for start in range(0, len(values), LOOKUP_BATCH_SIZE):
+        yield values[start : start + LOOKUP_BATCH_SIZE]
+
+
+class ImportPlan:
+    """
+    What an import of some pages of secciones would write. Pages are added
+    with ``add`` and ``report`` returns the plan.
+    """
+
+    def __init__(
+        self,
+        connection: Connection,
+        calendario_id: int,
+        centro_id: int,
+        update_if_exists: bool = False,
+        full_update: bool = False,
+        validate: Optional[Callable[[SeccionOferta], Optional[str]]] = None,
+    ):
+        self.connection = connection
+        self.calendario_id = calendario_id
+        self.centro_id = centro_id
+        self.update_if_exists = update_if_exists
+        self.full_update = full_update
+        self.validate = validate or (lambda data: None)
+        self.counts = {
+            entity: dict.fromkeys(actions, 0) for entity, actions in ACTIONS.items()
+        }
+        self.muestras: dict[str, dict[str, list]] = {
+            entity: {action: [] for action in actions if action != "sin_cambios"}
+            for entity, actions in ACTIONS.items()
+        }
+        # Rows read so far by key: True when in the database or already
+        # planned, False when the import would create them
+        self._materias: dict[str, bool] = {}
+        self._profesores: dict[str, bool] = {}
+        self._edificios: dict[str, bool] = {}
+        self._aulas: dict[tuple[str, str], bool] = {}
+        # Clases of the existing secciones, by seccion id
+        self._clases: dict[int, int] = {}
+
+    def _record(self, entity: str, action: str, muestra: Any = None, n: int = 1):
+        self.counts[entity][action] += n
+        muestras = self.muestras[entity].get(action)
+        if muestras is not None and len(muestras) < MAX_MUESTRAS:
+            muestras.append(muestra)
+
+    def _existing(self, statement, column, values: set) -> set:
+        """The values of ``column`` found among ``values``"""
+        found = set()
+        for batch in _batches(values):
+            rows = self.connection.execute(statement.where(column.in_(batch)))
+            found.update(tuple(row) for row in rows)
+        return found
+
+    def _load(self, page: dict[str, SeccionOferta]) -> dict[str, tuple]:
+        """Read the rows a page refers to; returns its existing secciones by NRC"""
+        claves = {data.clave for data in page.values() if data.clave}
+        claves.difference_update(self._materias)
+        existing = self._existing(select(Materia.clave), Materia.clave, claves)
+        self._materias.update((clave, (clave,) in existing) for clave in claves)
+
+        nombres = {data.profesor for data in page.values() if data.profesor}
+        nombres.difference_update(self._profesores)
+        existing = self._existing(select(Profesor.name), Profesor.name, nombres)
+        self._profesores.update((nombre, (nombre,) in existing) for nombre in nombres)
+
+        if self.full_update:
+            sesiones = [
+                sesion
+                for data in page.values()
+                for sesion in data.sesiones
+                if sesion.has_horario and sesion.edificio
+            ]
+            edificios = {sesion.edificio for sesion in sesiones}
+            edificios.difference_update(self._edificios)
+            existing = self._existing(
+                select(Edificio.name).where(Edificio.centro_id == self.centro_id),
+                Edificio.name,
+                edificios,
+            )
+            self._edificios.update(
+                (edificio, (edificio,) in existing) for edificio in edificios
+            )
+
+            aulas = {
+                (sesion.edificio, sesion.aula) for sesion in sesiones if sesion.aula
+            }
+            aulas.difference_update(self._aulas)
+            existing = self._existing(
+                select(Edificio.name, Aula.name)
+                .select_from(Aula)
+                .join(Edificio, Aula.edificio_id == Edificio.id)
+                .where(Edificio.centro_id == self.centro_id),
+                Edificio.name,
+                {edificio for edificio, _ in aulas},
+            )
+            self._aulas.update((aula, aula in existing) for aula in aulas)
+
+        secciones = {}
+        for batch in _batches(page):
+            rows = self.connection.execute(
+                select(
+                    Seccion.nrc,
+                    Seccion.id,
+                    Seccion.name,
+                    Seccion.cupos,
+                    Seccion.cupos_disponibles,
+                    Seccion.periodo_inicio,
+                    Seccion.periodo_fin,
+                    Materia.clave,
+                    Profesor.name,
+                )
+                .join(Materia, Seccion.materia_id == Materia.id)
+                .outerjoin(Profesor, Seccion.profesor_id == Profesor.id)
+                .where(
+                    Seccion.calendario_id == self.calendario_id,
+                    Seccion.nrc.in_(batch),
+                )
+            )
+            for row in rows:
+                # The first match, as the import's lookup
+                secciones.setdefault(row[0], row[1:])
+
+        if self.full_update:
+            for batch in _batches(row[0] for row in secciones.values()):
+                rows = self.connection.execute(
+                    select(Clase.seccion_id, func.count())
+                    .where(Clase.seccion_id.in_(batch))
+                    .group_by(Clase.seccion_id)
+                )
+                self._clases.update(tuple(row) for row in rows)
+        return secciones
+
+    def _resolve(self, known: dict, entity: str, key: Any, muestra: Any) -> None:
+        if not known[key]:
+            known[key] = True
+            self._record(entity, "crear", muestra)
+
+    def add(self, page: dict[str, SeccionOferta]) -> None:
+        secciones = self._load(page)
+        for data in page.values():
+            error = self.validate(data)
+            current = secciones.get(data.nrc)
+            if not error and current and not self.update_if_exists:
+                error = "NRC already in use in that Calendario"
+            if error:
+                self._record("secciones", "errores", {"nrc": data.nrc, "error": error})
+                continue
+
+            self._resolve(
+                self._materias,
+                "materias",
+                data.clave,
+                {"clave": data.clave, "name": data.materia},
+            )
+            if data.profesor:
+                self._resolve(
+                    self._profesores, "profesores", data.profesor, data.profesor
+                )
+
+            if current:
+                cambios = self._changes(data, current)
+                if cambios:
+                    self._record(
+                        "secciones", "actualizar", {"nrc": data.nrc, "cambios": cambios}
+                    )
+                else:
+                    self._record("secciones", "sin_cambios")
+                clases = self._clases.get(current[0], 0) if self.full_update else 0
+                if clases:
+                    self._record(
+                        "clases",
+                        "eliminar",
+                        {"nrc": data.nrc, "clases": clases},
+                        clases,
+                    )
+            else:
+                self._record("secciones", "crear", data.nrc)
+
+            if self.full_update:
+                self._plan_clases(data)
+
+    def _changes(self, data: SeccionOferta, current: tuple) -> dict[str, list]:
+        """Fields the import would change, as [current, new]"""
+        _, name, cupos, disponibles, inicio, fin, clave, profesor = current
+        periodo_inicio, periodo_fin = data.periodo
+        fields = (
+            ("name", name, data.sec),
+            ("cupos", cupos, data.cup),
+            ("cupos_disponibles", disponibles, data.dis),
+            ("periodo_inicio", inicio, periodo_inicio),
+            ("periodo_fin", fin, periodo_fin),
+            ("materia", clave, data.clave),
+            ("profesor", profesor, data.profesor or None),
+        )
+        # Like the update, None leaves a field as it is
+        return {
+            field: [old, new]
+            for field, old, new in fields
+            if new is not None and new != old
+        }
+
+    def _plan_clases(self, data: SeccionOferta) -> None:
+        clases = 0
+        for sesion in data.sesiones:
+            if not sesion.has_horario:
+                continue
+            if sesion.edificio:
+                self._resolve(
+                    self._edificios, "edificios", sesion.edificio, sesion.edificio
+                )
+                if sesion.aula:
+                    self._resolve(
+                        self._aulas,
+                        "aulas",
+                        (sesion.edificio, sesion.aula),
+                        {"edificio": sesion.edificio, "aula": sesion.aula},
+                    )
+            clases += len(sesion.dias)
+        if clases:
+            self._record("clases", "crear", {"nrc": data.nrc, "clases": clases}, clases)
+
+    def report(self) -> dict[str, Any]:
+        return {"dry_run": True, **self.counts, "muestras": self.muestras}
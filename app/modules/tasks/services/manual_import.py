@@ -0,0 +1,127 @@
+"""
+Streaming manual imports.
+
+Uploads carry the same session records as the JSON list of the manual
+import (the SeccionSiiau fields, one record per session) as NDJSON or CSV.
+They are read line by line from a spooled file and validated one record at a
+time, then grouped by NRC as they are read. A seccion's records are expected
+together, as the oferta lists them, so a seccion is complete when the next
+NRC starts. Complete secciones are handed over in batches of
+IMPORT_BATCH_SIZE, so memory holds one batch however large the upload is.
+
+Invalid records don't fail the upload: they are counted and the first few
+are reported with their line. The same goes for records of an NRC whose
+seccion was already handed over.
+"""
+
+import csv
+import io
+import json
+from collections.abc import Iterator
+from typing import Any, BinaryIO
+
+from pydantic import ValidationError
+
+from app.modules.tasks.schemas.siiau import SeccionSiiau
+from app.modules.tasks.services.oferta_parser import SeccionOferta, group_siiau
+
+FORMATS = ("ndjson", "csv")
+# Secciones saved between progress reports
+IMPORT_BATCH_SIZE = 500
+# Invalid records reported with their line
+MAX_RECHAZADOS = 20
+
+
+class ManualImport:
+    """
+    Records of an upload. Iterating it yields batches of complete secciones
+    keyed by NRC.
+    """
+
+    def __init__(self, file: BinaryIO, formato: str, batch_size: int | None = None):
+        self.file = file
+        self.formato = formato
+        self.batch_size = batch_size or IMPORT_BATCH_SIZE
+        self.registros = 0
+        self.invalidos = 0
+        self.lotes = 0
+        self.rechazados: list[dict[str, Any]] = []
+        self._done: set[str] = set()
+
+    def _reject(self, linea: int, error: str) -> None:
+        self.invalidos += 1
+        if len(self.rechazados) < MAX_RECHAZADOS:
+            self.rechazados.append({"linea": linea, "error": error})
+
+    def _records(self) -> Iterator[tuple[int, Any]]:
+        text = io.TextIOWrapper(self.file, encoding="utf-8-sig", newline="")
+        try:
+            if self.formato == "csv":
+                reader = csv.DictReader(text)
+                for record in reader:
+                    yield reader.line_num, record
+            else:
+                for linea, line in enumerate(text, 1):
+                    if not line.strip():
+                        continue
+                    try:
+                        yield linea, json.loads(line)
+                    except json.JSONDecodeError as e:
+                        self.registros += 1
+                        self._reject(linea, f"Invalid JSON: {e.msg}")
+        finally:
+            # Leaves the underlying file to its owner
+            text.detach()
+
+    def _valid(self) -> Iterator[SeccionSiiau]:
+        for linea, record in self._records():
+            self.registros += 1
+            try:
+                registro = SeccionSiiau.model_validate(record)
+            except ValidationError as e:
+                self._reject(
+                    linea,
+                    "; ".join(
+                        f"{'.'.join(map(str, error['loc'])) or 'record'}: {error['msg']}"
+                        for error in e.errors()
+                    ),
+                )
+                continue
+            if registro.NRC in self._done:
+                self._reject(
+                    linea, f"Records of NRC {registro.NRC} are not consecutive"
+                )
+                continue
+            yield registro
+
+    def __iter__(self) -> Iterator[dict[str, SeccionOferta]]:
+        batch: dict[str, SeccionOferta] = {}
+        registros: list[SeccionSiiau] = []
+
+        def close_seccion():
+            batch.update(group_siiau(registros))
+            self._done.add(registros[0].NRC)
+            registros.clear()
+
+        for registro in self._valid():
+            if registros and registro.NRC != registros[0].NRC:
+                close_seccion()
+                if len(batch) >= self.batch_size:
+                    self.lotes += 1
+                    yield batch
+                    batch = {}
+            registros.append(registro)
+
+        if registros:
+            close_seccion()
+        if batch:
+            self.lotes += 1
+            yield batch
+
+    def report(self) -> dict[str, Any]:
+        return {
+            "registros": self.registros,
+            "registros_invalidos": self.invalidos,
+            "lotes": self.lotes,
+            "rechazados": self.rechazados,
+        }
@@ -0,0 +1,143 @@
+"""
+Paged pulls of a calendario and centro's oferta from SIIAU.
+
+Instead of one response with every seccion, which SIIAU is slow to generate
+and silently cuts at its row limit, the oferta is asked for in pages of
+SIIAU_PAGE_SIZE secciones (``mostrarp`` rows of page ``p``). Pages are
+fetched a few at a time, within the client's politeness limit, and handed
+over as each arrives, so the first secciones are saved while later pages are
+still being generated.
+
+Pages are requested in order until one brings no NRC not seen before: past
+the end SIIAU answers an empty table. A seccion moving between pages while the
+pull runs may be read twice; only its first occurrence is kept. A full page
+without new rows means SIIAU ignored ``p`` and answered the first page again,
+so the secciones past it would never arrive; the pull then falls back to
+fetching the oferta in one response.
+
+A page with fewer rows than asked for should be the last one. If a later page
+still brings new secciones, SIIAU cut that page short, secciones may be
+missing, and the pull is reported as truncated. With SIIAU_PAGE_SIZE=0 the
+oferta is fetched in one response, which is reported as truncated when it
+fills the row limit.
+"""
+
+import logging
+from collections.abc import Callable, Generator, Iterator
+from concurrent.futures import (FIRST_COMPLETED, Future, ThreadPoolExecutor,
+                                wait)
+from typing import Generic, TypeVar
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+# Rows asked for when the oferta is fetched in one response
+LIMITE = 15000
+
+T = TypeVar("T")
+
+
+class OfertaPull(Generic[T]):
+    """
+    One pull of an oferta. Iterating it yields, page by page, the secciones
+    (parsed and keyed by NRC) not seen in earlier pages.
+    """
+
+    def __init__(
+        self,
+        fetch: Callable[[int, int | None], str],
+        parse: Callable[[str], dict[str, T]],
+        page_size: int | None = None,
+        concurrency: int | None = None,
+    ):
+        self.fetch = fetch
+        self.parse = parse
+        self.page_size = settings.SIIAU_PAGE_SIZE if page_size is None else page_size
+        self.concurrency = concurrency or settings.SIIAU_CONCURRENCY
+        self.paginas = 0
+        self.nrcs = 0
+        self.duplicados = 0
+        self.truncado = False
+        self._seen: set[str] = set()
+
+    def __iter__(self) -> Iterator[dict[str, T]]:
+        if self.page_size <= 0:
+            yield from self._single()
+        elif not (yield from self._pages()):
+            logger.warning("SIIAU ignored the page number; fetching in one response")
+            yield from self._single()
+
+        logger.info(
+            f"Pulled {self.nrcs} secciones in {self.paginas} pages "
+            f"({self.duplicados} read twice)"
+        )
+        if self.truncado:
+            logger.warning(
+                f"SIIAU cut the oferta short; {self.nrcs} secciones read "
+                f"in {self.paginas} pages may be incomplete"
+            )
+
+    def _single(self) -> Iterator[dict[str, T]]:
+        rows = self.parse(self.fetch(LIMITE, None))
+        self.paginas += 1
+        self.truncado = len(rows) >= LIMITE
+        new = self._new(rows)
+        if new:
+            yield new
+
+    def _pages(self) -> Generator[dict[str, T], None, bool]:
+        """Yields the pages; returns whether SIIAU paged the oferta"""
+        executor = ThreadPoolExecutor(max_workers=self.concurrency)
+        pending: dict[Future, int] = {}
+        next_page = 1
+        end: int | None = None
+        short: list[int] = []
+        last_new = 0
+        paged = True
+
+        def submit():
+            nonlocal next_page
+            pending[executor.submit(self.fetch, self.page_size, next_page)] = next_page
+            next_page += 1
+
+        try:
+            for _ in range(self.concurrency):
+                submit()
+            while pending:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in sorted(done, key=pending.get):
+                    page = pending.pop(future)
+                    rows = self.parse(future.result())
+                    self.paginas += 1
+                    if len(rows) < self.page_size:
+                        short.append(page)
+                    new = self._new(rows)
+                    if new:
+                        last_new = max(last_new, page)
+                        yield new
+                    else:
+                        # A full page read before: p was ignored
+                        paged = paged and len(rows) < self.page_size
+                        if end is None or page < end:
+                            end = page
+                    # Past a short page, one more page tells whether it was
+                    # the last one or cut short
+                    limit = max(last_new, min(short)) + 1 if short else next_page
+                    if end is None and next_page <= limit:
+                        submit()
+        finally:
+            executor.shutdown(wait=True, cancel_futures=True)
+
+        self.truncado = any(page < last_new for page in short)
+        return paged
+
+    def _new(self, rows: dict[str, T]) -> dict[str, T]:
+        new = {nrc: row for nrc, row in rows.items() if nrc not in self._seen}
+        self._seen.update(new)
+        self.nrcs += len(new)
+        self.duplicados += len(rows) - len(new)
+        return new
+
+    def report(self) -> dict[str, int | bool]:
+        return {"paginas_siiau": self.paginas, "truncado": self.truncado}
@@ -0,0 +1,412 @@
+"""
+Typed parsing of the SIIAU oferta page.
+
+Each top-level row of the oferta table is one seccion, with its sessions in a
+nested horario table. Like the cupos parser, ``OfertaParser`` streams the HTML
+once instead of building a document tree, which took most of the time and
+memory of an import's parsing, and keeps only the texts of the cells read.
+``parse_oferta`` groups the rows by NRC as they are read, into ``SeccionOferta``
+records holding their ``Sesion`` records: slotted objects and named tuples
+instead of one dict per session.
+
+Parsing is CPU-bound, so large pages (SIIAU_PARSE_THRESHOLD characters, a
+single-response pull of a big centro) are cut into chunks just before
+top-level ``<tr>`` tags, each made a table of its own, and parsed in a process
+pool; their rows are concatenated in page order, the same rows a serial parse
+returns. Smaller pages, such as those of paged pulls, are not worth shipping
+to another process and are parsed in place.
+
+Horas, dias and periodo strings repeat across thousands of sessions (a few
+dozen time slots, day patterns and a single periodo per calendario), so they
+are converted to times, day numbers and dates through memoized converters,
+once per distinct string.
+"""
+
+import logging
+import multiprocessing
+import os
+import re
+import threading
+from collections.abc import Iterable
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from datetime import datetime, time
+from functools import lru_cache
+from html.parser import HTMLParser
+from typing import NamedTuple, Optional
+
+from app.core.config import settings
+from app.modules.tasks.schemas.siiau import SeccionSiiau
+
+logger = logging.getLogger(__name__)
+
+NRC_PATTERN = re.compile(r"^\d{4,}")
+TAG_PATTERN = re.compile(r"<(/?)(table|tr)\b", re.IGNORECASE)
+# Distinct strings kept by each converter
+CACHE_SIZE = 4096
+
+# Process pool for large pages, started on first use
+_pool: Optional[ProcessPoolExecutor] = None
+_pool_lock = threading.Lock()
+
+
+@lru_cache(maxsize=CACHE_SIZE)
+def parse_horas(horas: Optional[str]) -> tuple[Optional[time], Optional[time]]:
+    """Start and end times of a "0700-0855" string"""
+    if not horas:
+        return None, None
+    inicio, fin = horas.split("-")
+    return time(int(inicio[:2]), int(inicio[2:])), time(int(fin[:2]), int(fin[2:]))
+
+
+@lru_cache(maxsize=CACHE_SIZE)
+def parse_dias(dias: Optional[str]) -> tuple[int, ...]:
+    """Day numbers (1 = Monday) of a "L . I . . ." string, (0,) when missing"""
+    if not dias:
+        return (0,)
+    return tuple(i + 1 for i, dia in enumerate(dias.split()) if dia != ".")
+
+
+@lru_cache(maxsize=CACHE_SIZE)
+def parse_periodo(
+    periodo: Optional[str],
+) -> tuple[Optional[datetime], Optional[datetime]]:
+    """Start and end dates of a "18/08/25 - 12/12/25" string"""
+    if not periodo:
+        return None, None
+    inicio, fin = periodo.split(" - ")
+    return datetime.strptime(inicio, "%d/%m/%y"), datetime.strptime(fin, "%d/%m/%y")
+
+
+class Sesion(NamedTuple):
+    numero: Optional[int]
+    hora_inicio: Optional[time]
+    hora_fin: Optional[time]
+    dias: tuple[int, ...]
+    edificio: Optional[str]
+    aula: Optional[str]
+    periodo_inicio: Optional[datetime]
+    periodo_fin: Optional[datetime]
+
+    @property
+    def has_horario(self) -> bool:
+        return self.hora_inicio is not None and self.dias != (0,)
+
+
+def sesion(partes: list[Optional[str]]) -> Sesion:
+    """
+    Sesion of the numero, horas, dias, edificio, aula and periodo strings.
+    Horas that cannot be read leave the session without horario.
+    """
+    numero, horas, dias, edificio, aula, periodo = partes
+    try:
+        hora_inicio, hora_fin = parse_horas(horas or None)
+    except ValueError:
+        hora_inicio = hora_fin = None
+    return Sesion(
+        int(numero) if numero and numero.isdigit() else None,
+        hora_inicio,
+        hora_fin,
+        parse_dias(dias) if hora_inicio is not None and dias else (0,),
+        edificio or None,
+        aula or None,
+        *parse_periodo(periodo or None),
+    )
+
+
+class SeccionOferta:
+    __slots__ = (
+        "nrc",
+        "clave",
+        "materia",
+        "sec",
+        "cr",
+        "cup",
+        "dis",
+        "profesor",
+        "sesiones",
+    )
+
+    def __init__(
+        self,
+        nrc: str,
+        clave: Optional[str],
+        materia: Optional[str],
+        sec: Optional[str],
+        cr: int,
+        cup: int,
+        dis: int,
+        profesor: Optional[str],
+        sesiones: list[Sesion],
+    ):
+        self.nrc = nrc
+        self.clave = clave
+        self.materia = materia
+        self.sec = sec
+        self.cr = cr
+        self.cup = cup
+        self.dis = dis
+        self.profesor = profesor
+        self.sesiones = sesiones
+
+    @property
+    def periodo(self) -> tuple[Optional[datetime], Optional[datetime]]:
+        """Periodo of the seccion, that of its first session"""
+        if not self.sesiones:
+            return None, None
+        return self.sesiones[0].periodo_inicio, self.sesiones[0].periodo_fin
+
+    def __repr__(self) -> str:
+        return f"SeccionOferta(nrc={self.nrc!r}, sesiones={len(self.sesiones)})"
+
+
+# Base cells (NRC to DIS), profesor and session parts of a seccion row
+Row = tuple[list[Optional[str]], Optional[str], list[list[Optional[str]]]]
+
+
+def _text(chunks: list[str]) -> str:
+    """Text of an element's strings, stripped and joined by spaces"""
+    return " ".join(stripped for chunk in chunks if (stripped := chunk.strip()))
+
+
+def split_sesiones(horario: Optional[str]) -> list[list[Optional[str]]]:
+    """Numero, horas, dias, edificio, aula and periodo of each session"""
+    sesiones = []
+    if horario and horario.strip():
+        for parte in horario.split(";"):
+            partes = [p.strip() for p in parte.split("|")]
+            sesiones.append([partes[i] if len(partes) > i else None for i in range(6)])
+    return sesiones
+
+
+class _Cell:
+    __slots__ = ("chunks", "rows")
+
+    def __init__(self):
+        self.chunks: list[str] = []
+        # Rows of a table nested in the cell: their cells' and all their strings
+        self.rows: Optional[list[tuple[list[list[str]], list[str]]]] = None
+
+
+class OfertaParser(HTMLParser):
+    """
+    Streams the rows of the first table of an oferta page, reading the horario
+    and profesor tables nested in their cells, without building a document
+    tree. Missing end tags are closed implicitly by the next cell or row.
+    """
+
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.rows: list[Row] = []
+        self._depth = 0
+        self._done = False
+        self._row: Optional[list[_Cell]] = None
+        self._cell: Optional[_Cell] = None
+        # Nested table being read, and its current row and cell
+        self._inner: Optional[_Cell] = None
+        self._inner_row: Optional[tuple[list[list[str]], list[str]]] = None
+        self._inner_cell: Optional[list[str]] = None
+
+    def handle_starttag(self, tag, attrs):
+        if self._done:
+            return
+        if tag == "table":
+            self._depth += 1
+            if self._depth == 2 and self._cell is not None and self._cell.rows is None:
+                self._cell.rows = []
+                self._inner = self._cell
+        elif self._depth == 1:
+            if tag == "tr":
+                self._close_row()
+                self._row = []
+            elif tag == "td" and self._row is not None:
+                self._cell = _Cell()
+                self._row.append(self._cell)
+        elif self._inner is not None:
+            if tag == "tr":
+                self._inner_cell = None
+                self._inner_row = ([], [])
+                self._inner.rows.append(self._inner_row)
+            elif tag == "td" and self._inner_row is not None:
+                self._inner_cell = []
+                self._inner_row[0].append(self._inner_cell)
+
+    def handle_endtag(self, tag):
+        if self._done:
+            return
+        if tag == "table":
+            self._depth -= 1
+            if self._depth == 1:
+                self._inner = self._inner_row = self._inner_cell = None
+            elif self._depth == 0:
+                self._close_row()
+                self._done = True
+        elif self._depth == 1:
+            if tag == "td":
+                self._cell = None
+            elif tag == "tr":
+                self._close_row()
+        elif self._inner is not None:
+            if tag == "td":
+                self._inner_cell = None
+            elif tag == "tr":
+                self._inner_row = self._inner_cell = None
+
+    def handle_data(self, data):
+        if self._depth == 1:
+            if self._cell is not None:
+                self._cell.chunks.append(data)
+        elif self._inner_row is not None:
+            self._inner_row[1].append(data)
+            if self._inner_cell is not None:
+                self._inner_cell.append(data)
+
+    def close(self):
+        super().close()
+        self._close_row()
+
+    def _close_row(self):
+        cells, self._row, self._cell = self._row, None, None
+        if not cells or not NRC_PATTERN.match("".join(cells[0].chunks).strip()):
+            return
+
+        base = [_text(cells[i].chunks) if len(cells) > i else None for i in range(7)]
+
+        profesor = None
+        if len(cells) > 8:
+            rows = cells[8].rows
+            if rows is None:
+                profesor = _text(cells[8].chunks)
+            elif rows:
+                inner_cells, chunks = rows[0]
+                profesor = _text(inner_cells[1] if len(inner_cells) >= 2 else chunks)
+
+        horario = None
+        if len(cells) > 7:
+            rows = cells[7].rows
+            if rows is None:
+                horario = _text(cells[7].chunks)
+            else:
+                parts = [
+                    " | ".join(_text(chunks) for chunks in inner_cells)
+                    for inner_cells, _ in rows
+                ]
+                horario = " ; ".join(p for p in parts if p.strip())
+
+        self.rows.append((base, profesor, split_sesiones(horario)))
+
+
+def _rows(html: str) -> list[Row]:
+    parser = OfertaParser()
+    parser.feed(html)
+    parser.close()
+    return parser.rows
+
+
+def row_offsets(html: str) -> list[int]:
+    """Offsets of the ``<tr>`` tags of the first table's own rows"""
+    offsets = []
+    depth = 0
+    for match in TAG_PATTERN.finditer(html):
+        closing, tag = match.groups()
+        if tag.lower() == "table":
+            if not closing:
+                depth += 1
+            elif depth == 1:
+                break
+            elif depth > 1:
+                depth -= 1
+        elif depth == 1 and not closing:
+            offsets.append(match.start())
+    return offsets
+
+
+def split_rows(html: str, parts: int) -> list[str]:
+    """
+    The page cut before top-level rows into at most ``parts`` documents of
+    about as many rows, each a table the parser reads on its own: the first
+    keeps what precedes the rows, the last what follows them.
+    """
+    offsets = row_offsets(html)
+    step = -(-len(offsets) // parts) or 1
+    cuts = [0, *offsets[step::step], len(html)]
+    chunks = [html[start:end] for start, end in zip(cuts, cuts[1:])]
+    if len(chunks) == 1:
+        return chunks
+    return [
+        chunks[0] + "</table>",
+        *(f"<table>{chunk}</table>" for chunk in chunks[1:-1]),
+        "<table>" + chunks[-1],
+    ]
+
+
+def _get_pool(processes: int) -> ProcessPoolExecutor:
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            # Spawned, not forked: the app runs threads that a fork would copy
+            _pool = ProcessPoolExecutor(
+                processes, mp_context=multiprocessing.get_context("spawn")
+            )
+        return _pool
+
+
+def _reset_pool() -> None:
+    global _pool
+    with _pool_lock:
+        _pool = None
+
+
+def oferta_rows(
+    html: str, processes: Optional[int] = None, threshold: Optional[int] = None
+) -> list[Row]:
+    """
+    Seccion rows of a SIIAU oferta page, in order. Pages of at least
+    SIIAU_PARSE_THRESHOLD characters are split at their rows and parsed in
+    SIIAU_PARSE_PROCESSES processes (0 for one per CPU).
+    """
+    processes = processes or settings.SIIAU_PARSE_PROCESSES or os.cpu_count() or 1
+    threshold = settings.SIIAU_PARSE_THRESHOLD if threshold is None else threshold
+    if processes < 2 or len(html) < threshold:
+        return _rows(html)
+
+    chunks = split_rows(html, processes)
+    if len(chunks) == 1:
+        return _rows(html)
+    try:
+        parsed = list(_get_pool(processes).map(_rows, chunks))
+    except BrokenProcessPool:
+        _reset_pool()
+        logger.warning("Oferta parsing pool broke; parsing serially")
+        return _rows(html)
+    return [row for rows in parsed for row in rows]
+
+
+def parse_oferta(html: str) -> dict[str, SeccionOferta]:
+    """Secciones of a SIIAU oferta page by NRC"""
+    secciones: dict[str, SeccionOferta] = {}
+    for base, profesor, sesiones in oferta_rows(html):
+        nrc, clave, materia, sec, cr, cup, dis = base
+        seccion = secciones.get(nrc)
+        if seccion is None:
+            seccion = secciones[nrc] = SeccionOferta(
+                nrc, clave, materia, sec, int(cr), int(cup), int(dis), profesor, []
+            )
+        seccion.sesiones.extend(sesion(partes) for partes in sesiones)
+    return secciones
+
+
+def group_siiau(registros: Iterable[SeccionSiiau]) -> dict[str, SeccionOferta]:
+    """Secciones by NRC of flat session records, as manual imports send them"""
+    secciones: dict[str, SeccionOferta] = {}
+    for d in registros:
+        seccion = secciones.get(d.NRC)
+        if seccion is None:
+            seccion = secciones[d.NRC] = SeccionOferta(
+                d.NRC, d.Clave, d.Materia, d.Sec, d.CR, d.CUP, d.DIS, d.Profesor, []
+            )
+        if d.SesionNum or d.Horas or d.Dias or d.Edificio or d.Aula or d.Periodo:
+            seccion.sesiones.append(
+                sesion([d.SesionNum, d.Horas, d.Dias, d.Edificio, d.Aula, d.Periodo])
+            )
+    return secciones
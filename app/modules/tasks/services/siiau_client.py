@@ -0,0 +1,189 @@
+"""
+HTTP client for SIIAU.
+
+Requests go through one pooled keep-alive ``requests.Session`` per client, so
+consecutive imports reuse connections instead of paying a TCP and TLS
+handshake each, and ask for gzip so the multi-megabyte oferta pages travel
+compressed. Every request has a connect and a read timeout: a hung connection
+fails after SIIAU_READ_TIMEOUT seconds of silence instead of blocking a worker.
+
+Connection errors, timeouts, broken transfers, 429 and 5xx responses are retried up to
+SIIAU_RETRIES times, sleeping a random time between zero and an exponentially
+growing bound ("full jitter"), or the Retry-After SIIAU asks for, so workers
+retrying together do not hit it in lockstep.
+
+A request that still fails counts towards the circuit breaker. After
+SIIAU_BREAKER_THRESHOLD consecutive failures it opens, and requests fail at
+once with 503 for SIIAU_BREAKER_RESET seconds; then a single trial request is
+let through, which closes it again on success.
+
+Out of politeness, at most SIIAU_CONCURRENCY requests of a client are in
+flight at once, however many pages or imports run in parallel.
+"""
+
+import logging
+import random
+import threading
+import time
+from functools import lru_cache
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from app.core.config import settings
+from app.core.exceptions import (BadGatewayException,
+                                 ServiceUnavailableException)
+
+logger = logging.getLogger(__name__)
+
+RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+
+
+class CircuitBreaker:
+    def __init__(self, threshold: int, reset_timeout: float):
+        self.threshold = threshold
+        self.reset_timeout = reset_timeout
+        self.lock = threading.Lock()
+        self.failures = 0
+        self.opened_at: float | None = None
+        self.trial = False
+
+    def allow(self) -> bool:
+        """Whether a request may be sent now"""
+        with self.lock:
+            if self.opened_at is None:
+                return True
+            if self.trial or time.monotonic() - self.opened_at < self.reset_timeout:
+                return False
+            # Half open: let one request through to probe SIIAU
+            self.trial = True
+            return True
+
+    def record_success(self) -> None:
+        with self.lock:
+            self.failures = 0
+            self.opened_at = None
+            self.trial = False
+
+    def record_failure(self) -> None:
+        with self.lock:
+            self.failures += 1
+            if self.trial or self.failures >= self.threshold:
+                if self.opened_at is None or self.trial:
+                    logger.warning("SIIAU circuit breaker opened")
+                self.opened_at = time.monotonic()
+                self.trial = False
+
+    @property
+    def is_open(self) -> bool:
+        with self.lock:
+            return self.opened_at is not None
+
+
+class SiiauClient:
+    def __init__(
+        self,
+        url: str | None = None,
+        connect_timeout: float | None = None,
+        read_timeout: float | None = None,
+        retries: int | None = None,
+        backoff: float | None = None,
+        backoff_max: float | None = None,
+        pool_size: int | None = None,
+        concurrency: int | None = None,
+        breaker: CircuitBreaker | None = None,
+    ):
+        self.url = url or settings.SIIAU_URL
+        self.timeout = (
+            connect_timeout or settings.SIIAU_CONNECT_TIMEOUT,
+            read_timeout or settings.SIIAU_READ_TIMEOUT,
+        )
+        self.retries = settings.SIIAU_RETRIES if retries is None else retries
+        self.backoff = settings.SIIAU_BACKOFF if backoff is None else backoff
+        self.backoff_max = backoff_max or settings.SIIAU_BACKOFF_MAX
+        self.breaker = breaker or CircuitBreaker(
+            settings.SIIAU_BREAKER_THRESHOLD, settings.SIIAU_BREAKER_RESET
+        )
+
+        self.concurrency = concurrency or settings.SIIAU_CONCURRENCY
+        self.slots = threading.BoundedSemaphore(self.concurrency)
+
+        pool_size = pool_size or settings.SIIAU_POOL_SIZE
+        self.session = requests.Session()
+        # Retries are handled here, with backoff and the breaker
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=pool_size, max_retries=0)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+        self.session.headers["Accept-Encoding"] = "gzip, deflate"
+
+    def _delay(self, attempt: int, response: requests.Response | None) -> float:
+        retry_after = (
+            response.headers.get("Retry-After") if response is not None else None
+        )
+        if retry_after and retry_after.isdigit():
+            return min(float(retry_after), self.backoff_max)
+        return random.uniform(0, min(self.backoff_max, self.backoff * 2**attempt))
+
+    def post(self, data: dict) -> str:
+        """POST a form to SIIAU and return the decoded page"""
+        if not self.breaker.allow():
+            raise ServiceUnavailableException(
+                "SIIAU is unavailable; retry in a few minutes."
+            )
+
+        error = None
+        for attempt in range(self.retries + 1):
+            response = None
+            try:
+                with self.slots:
+                    response = self.session.post(
+                        self.url, data=data, timeout=self.timeout
+                    )
+            except requests.RequestException as e:
+                error = f"{type(e).__name__}: {e}"
+            else:
+                if response.status_code not in RETRY_STATUSES:
+                    break
+                error = f"HTTP {response.status_code}"
+
+            if attempt < self.retries:
+                delay = self._delay(attempt, response)
+                logger.warning(
+                    f"SIIAU request failed ({error}), retrying in {delay:.1f}s"
+                )
+                time.sleep(delay)
+        else:
+            self.breaker.record_failure()
+            raise BadGatewayException(f"SIIAU request failed: {error}")
+
+        if not response.ok:
+            # Not worth retrying (e.g. 4xx), but SIIAU did answer
+            self.breaker.record_success()
+            raise BadGatewayException(
+                f"SIIAU request failed: HTTP {response.status_code}"
+            )
+
+        self.breaker.record_success()
+        return response.text
+
+    def fetch_oferta(
+        self,
+        calendario: str,
+        centro: str,
+        limite: int = 15000,
+        pagina: int | None = None,
+    ) -> str:
+        """The oferta page of a calendario and centro, of ``limite`` rows"""
+        data = {"ciclop": calendario, "cup": centro, "mostrarp": limite}
+        if pagina is not None:
+            data["p"] = pagina
+        return self.post(data)
+
+    def close(self) -> None:
+        self.session.close()
+
+
+@lru_cache
+def get_siiau_client() -> SiiauClient:
+    """Client shared by the process, so its connections and breaker are too"""
+    return SiiauClient()
@@ -1,10 +1,9 @@
-import re
-from datetime import datetime, time
-from typing import Any, Optional
+from collections.abc import Callable, Iterable, Iterator
+from typing import Any, Optional, TypeVar
 
-import requests
 from bs4 import BeautifulSoup
 
+from app.core import events
 from app.core.config import settings
 from app.core.exceptions import NotFoundException
 from app.modules.aula.schemas import AulaCreate
@@ -15,15 +14,33 @@ from app.modules.centro.services.centro_service import \
     CentroUniversitarioService
 from app.modules.clase.schemas import ClaseCreate
 from app.modules.clase.services.clase_service import ClaseService
+from app.modules.conflicto.services.conflicto_service import ConflictoService
 from app.modules.edificio.schemas import EdificioCreate
 from app.modules.edificio.services.edificio_service import EdificioService
+from app.modules.historial.services.cupos_service import CuposService
 from app.modules.materia.schemas import MateriaCreate
 from app.modules.materia.services.materia_service import MateriaService
 from app.modules.profesor.schemas import ProfesorCreate
 from app.modules.profesor.services.profesor_service import ProfesorService
 from app.modules.seccion.schemas import SeccionCreate, SeccionUpdate
 from app.modules.seccion.services.seccion_service import SeccionService
+from app.modules.snapshot.services.snapshot_service import SnapshotService
 from app.modules.tasks.schemas.siiau import SeccionSiiau
+from app.modules.tasks.services.cupos_parser import parse_cupos
+from app.modules.tasks.services.import_plan import ImportPlan, read_snapshot
+from app.modules.tasks.services.manual_import import ManualImport
+from app.modules.tasks.services.oferta_fetcher import OfertaPull
+from app.modules.tasks.services.oferta_parser import (SeccionOferta, Sesion,
+                                                      group_siiau, oferta_rows,
+                                                      parse_oferta)
+from app.modules.tasks.services.siiau_client import (SiiauClient,
+                                                     get_siiau_client)
+
+T = TypeVar("T")
+
+# SeccionSiiau fields of the base cells and of each session's parts
+BASE_FIELDS = ("NRC", "Clave", "Materia", "Sec", "CR", "CUP", "DIS")
+SESION_FIELDS = ("SesionNum", "Horas", "Dias", "Edificio", "Aula", "Periodo")
 
 
 class TasksService:
@@ -37,6 +54,10 @@ class TasksService:
         seccion_service: SeccionService,
         aula_service: AulaService,
         clase_service: ClaseService,
+        snapshot_service: Optional[SnapshotService] = None,
+        conflicto_service: Optional[ConflictoService] = None,
+        cupos_service: Optional[CuposService] = None,
+        siiau_client: Optional[SiiauClient] = None,
     ):
         self.centro_service = centro_service
         self.calendario_service = calendario_service
@@ -46,107 +67,53 @@ class TasksService:
         self.seccion_service = seccion_service
         self.aula_service = aula_service
         self.clase_service = clase_service
+        self.snapshot_service = snapshot_service
+        self.conflicto_service = conflicto_service
+        self.cupos_service = cupos_service
+        self.siiau_client = siiau_client or get_siiau_client()
 
     def parse_table(self, soup: BeautifulSoup) -> list[dict]:
-        tabla = soup.find("table")
-        if not tabla:
-            return []
-
-        filas = tabla.find_all("tr", recursive=False)
-        datos_finales = []
-        for tr in filas:
-            tds = tr.find_all("td", recursive=False)
-            if not tds or not re.match(r"^\d{4,}", tds[0].get_text(strip=True)):
-                continue
-
-            def txt(cell):
-                return cell.get_text(" ", strip=True)
-
-            base_info = {
-                "NRC": txt(tds[0]),
-                "Clave": txt(tds[1]) if len(tds) > 1 else None,
-                "Materia": txt(tds[2]) if len(tds) > 2 else None,
-                "Sec": txt(tds[3]) if len(tds) > 3 else None,
-                "CR": txt(tds[4]) if len(tds) > 4 else None,
-                "CUP": txt(tds[5]) if len(tds) > 5 else None,
-                "DIS": txt(tds[6]) if len(tds) > 6 else None,
+        """One flat dict per session of the oferta table, as SeccionSiiau fields"""
+        sesion_vacia = [None] * 6
+        return [
+            {
+                **dict(zip(BASE_FIELDS, base)),
+                "Profesor": profesor,
+                **dict(zip(SESION_FIELDS, partes)),
             }
+            for base, profesor, sesiones in oferta_rows(str(soup))
+            for partes in sesiones or [sesion_vacia]
+        ]
 
-            profesor = None
-            if len(tds) > 8:
-                inner_prof = tds[8].find("table")
-                if inner_prof:
-                    prof_tr = inner_prof.find("tr")
-                    if prof_tr and len(prof_tr.find_all("td")) >= 2:
-                        profesor = prof_tr.find_all("td")[1].get_text(" ", strip=True)
-                    elif prof_tr:
-                        profesor = txt(prof_tr)
-                else:
-                    profesor = txt(tds[8])
-
-            base_info["Profesor"] = profesor
-
-            horario_str = None
-            if len(tds) > 7:
-                inner_table = tds[7].find("table")
-                if inner_table:
-                    parts = []
-                    for ir in inner_table.find_all("tr"):
-                        parts.append(
-                            " | ".join(
-                                [c.get_text(" ", strip=True) for c in ir.find_all("td")]
-                            )
-                        )
-                    horario_str = " ; ".join(p for p in parts if p.strip())
-                else:
-                    horario_str = txt(tds[7])
-
-            if horario_str and horario_str.strip():
-                sesiones = horario_str.split(";")
-                for sesion in sesiones:
-                    partes = [p.strip() for p in sesion.split("|")]
-                    fila_expandida = base_info.copy()
-                    fila_expandida.update(
-                        {
-                            "SesionNum": partes[0] if len(partes) > 0 else None,
-                            "Horas": partes[1] if len(partes) > 1 else None,
-                            "Dias": partes[2] if len(partes) > 2 else None,
-                            "Edificio": partes[3] if len(partes) > 3 else None,
-                            "Aula": partes[4] if len(partes) > 4 else None,
-                            "Periodo": partes[5] if len(partes) > 5 else None,
-                        }
-                    )
-                    datos_finales.append(fila_expandida)
-            else:
-                fila_vacia = base_info.copy()
-                fila_vacia.update(
-                    {
-                        "SesionNum": None,
-                        "Horas": None,
-                        "Dias": None,
-                        "Edificio": None,
-                        "Aula": None,
-                        "Periodo": None,
-                    }
-                )
-                datos_finales.append(fila_vacia)
-
-        return datos_finales
-
-    def make_request(
-        self, calendario: str, centro: str, limite: int = 15000
-    ) -> list[dict]:
-        """Make request to SIIAU and return parsed data as list of dicts"""
-        payload = {
-            "ciclop": calendario,
-            "cup": centro,
-            "mostrarp": limite,
-        }
-
-        response = requests.post(settings.SIIAU_URL, data=payload)
-        soup = BeautifulSoup(response.text, "html.parser")
+    def fetch_oferta(
+        self,
+        calendario: str,
+        centro: str,
+        limite: int = 15000,
+        pagina: Optional[int] = None,
+    ) -> str:
+        """Request the oferta page of a calendario and centro from SIIAU"""
+        return self.siiau_client.fetch_oferta(calendario, centro, limite, pagina)
+
+    def pull_oferta(
+        self, calendario: str, centro: str, parse: Callable[[str], dict[str, T]]
+    ) -> OfertaPull[T]:
+        """Paged, concurrent pull of an oferta, parsed page by page"""
+        return OfertaPull(
+            lambda limite, pagina: self.fetch_oferta(
+                calendario, centro, limite, pagina
+            ),
+            parse,
+            concurrency=self.siiau_client.concurrency,
+        )
 
-        return self.parse_table(soup)
+    def make_request(self, calendario: str, centro: str) -> dict[str, SeccionOferta]:
+        """Make request to SIIAU and return the parsed secciones by NRC"""
+        return {
+            nrc: seccion
+            for page in self.pull_oferta(calendario, centro, parse_oferta)
+            for nrc, seccion in page.items()
+        }
 
     def _get_or_create_materia(
         self, clave: str, nombre: str, creditos: int
@@ -194,76 +161,44 @@ class TasksService:
             return aula, True
         return aulas_db[0], False
 
-    def _parse_periodo(
-        self, periodo_str: Optional[str]
-    ) -> tuple[Optional[datetime], Optional[datetime]]:
-        """Parse periodo string into start and end dates"""
-        if not periodo_str or periodo_str == "":
-            return None, None
-        inicio_str, fin_str = periodo_str.split(" - ")
-        periodo_inicio = datetime.strptime(inicio_str, "%d/%m/%y")
-        periodo_fin = datetime.strptime(fin_str, "%d/%m/%y")
-        return periodo_inicio, periodo_fin
-
-    def _parse_horas(
-        self, horas_str: Optional[str]
-    ) -> tuple[Optional[time], Optional[time]]:
-        """Parse horas string into start and end times"""
-        if not horas_str or horas_str == "":
-            return None, None
-        inicio_str, fin_str = horas_str.split("-")
-        hora_inicio = time(int(inicio_str[:2]), int(inicio_str[2:]))
-        hora_fin = time(int(fin_str[:2]), int(fin_str[2:]))
-        return hora_inicio, hora_fin
-
-    def _parse_dias(self, dias_str: Optional[str]) -> list[int]:
-        """Parse dias string into list of day numbers"""
-        if not dias_str or dias_str == "":
-            return [0]
-        valores = dias_str.split()
-        return [i + 1 for i, dia in enumerate(valores) if dia != "."]
-
-    def _validate_seccion_data(self, data: SeccionSiiau) -> Optional[str]:
+    def _validate_seccion_data(self, data: SeccionOferta) -> Optional[str]:
         """Validate required fields. Returns error message or None"""
-        if not data.NRC or data.NRC == "":
+        if not data.nrc:
             return "NRC is null"
-        if not data.Clave or data.Clave == "":
+        if not data.clave:
             return "Clave is null"
-        if not data.Materia or data.Materia == "":
+        if not data.materia:
             return "Materia is null"
-        if not data.Sec or data.Sec == "":
+        if not data.sec:
             return "Sec is null"
         return None
 
     def _create_clases_for_seccion(
-        self, data_list: list[SeccionSiiau], seccion_id: int, centro_id: int
+        self, sesiones: list[Sesion], seccion_id: int, centro_id: int
     ) -> int:
-        """Create clases for a seccion from multiple session records. Returns number of clases created"""
+        """Create clases for a seccion from its sessions. Returns number of clases created"""
         clases_creadas = 0
 
-        for data in data_list:
+        for sesion in sesiones:
             # Skip if no schedule data
-            if not data.Horas or not data.Dias:
+            if not sesion.has_horario:
                 continue
 
-            hora_inicio, hora_fin = self._parse_horas(data.Horas)
-            dias = self._parse_dias(data.Dias)
-
             # Get or create edificio and aula for this session
             aula_id = None
-            if data.Edificio and data.Edificio != "":
-                edificio, _ = self._get_or_create_edificio(data.Edificio, centro_id)
+            if sesion.edificio:
+                edificio, _ = self._get_or_create_edificio(sesion.edificio, centro_id)
 
-                if data.Aula and data.Aula != "":
-                    aula, _ = self._get_or_create_aula(data.Aula, edificio.id)
+                if sesion.aula:
+                    aula, _ = self._get_or_create_aula(sesion.aula, edificio.id)
                     aula_id = aula.id
 
-            for dia in dias:
+            for dia in sesion.dias:
                 self.clase_service.create_clase(
                     ClaseCreate(
-                        sesion=int(data.SesionNum) if data.SesionNum else None,
-                        hora_inicio=hora_inicio,
-                        hora_fin=hora_fin,
+                        sesion=sesion.numero,
+                        hora_inicio=sesion.hora_inicio,
+                        hora_fin=sesion.hora_fin,
                         dia=dia if dia != 0 else None,
                         seccion_id=seccion_id,
                         aula_id=aula_id,
@@ -274,13 +209,13 @@ class TasksService:
 
     def _process_seccion(
         self,
-        data_list: list[SeccionSiiau],
+        data: SeccionOferta,
         calendario_id: int,
         centro_id: int,
         update_if_exists: bool = False,
         full_update: bool = False,
     ) -> dict:
-        """Process a seccion with all its session records. Returns stats dict"""
+        """Process a seccion with all its sessions. Returns stats dict"""
         stats = {
             "materias_creadas": 0,
             "profesores_creados": 0,
@@ -292,9 +227,6 @@ class TasksService:
             "error": None,
         }
 
-        # Use first record for base seccion data
-        data = data_list[0]
-
         # Validate data
         error = self._validate_seccion_data(data)
         if error:
@@ -303,7 +235,7 @@ class TasksService:
 
         # Check if seccion exists
         secciones_db, count = self.seccion_service.list_secciones(
-            nrc=data.NRC, calendario_id=calendario_id
+            nrc=data.nrc, calendario_id=calendario_id
         )
         seccion_exists = count > 0
 
@@ -313,20 +245,20 @@ class TasksService:
 
         # Get or create materia
         materia, created = self._get_or_create_materia(
-            data.Clave, data.Materia, int(data.CR)
+            data.clave, data.materia, data.cr
         )
         if created:
             stats["materias_creadas"] += 1
 
         # Get or create profesor
         profesor = None
-        if data.Profesor and data.Profesor != "":
-            profesor, created = self._get_or_create_profesor(data.Profesor)
+        if data.profesor:
+            profesor, created = self._get_or_create_profesor(data.profesor)
             if created:
                 stats["profesores_creados"] += 1
 
-        # Parse periodo from first record
-        periodo_inicio, periodo_fin = self._parse_periodo(data.Periodo)
+        # Periodo of the first session
+        periodo_inicio, periodo_fin = data.periodo
 
         # Create or update seccion
         if seccion_exists:
@@ -334,9 +266,9 @@ class TasksService:
             if seccion.id:
                 # Update only the fields that can change
                 update_data = SeccionUpdate(
-                    name=data.Sec,
-                    cupos=int(data.CUP),
-                    cupos_disponibles=int(data.DIS),
+                    name=data.sec,
+                    cupos=data.cup,
+                    cupos_disponibles=data.dis,
                     periodo_inicio=periodo_inicio,
                     periodo_fin=periodo_fin,
                     materia_id=materia.id,
@@ -356,10 +288,10 @@ class TasksService:
         else:
             seccion = self.seccion_service.create_seccion(
                 SeccionCreate(
-                    name=data.Sec,
-                    nrc=data.NRC,
-                    cupos=int(data.CUP),
-                    cupos_disponibles=int(data.DIS),
+                    name=data.sec,
+                    nrc=data.nrc,
+                    cupos=data.cup,
+                    cupos_disponibles=data.dis,
                     periodo_inicio=periodo_inicio,
                     periodo_fin=periodo_fin,
                     centro_id=centro_id,
@@ -373,33 +305,33 @@ class TasksService:
         # Create clases for all sessions
         if seccion.id and full_update:
             clases_creadas = self._create_clases_for_seccion(
-                data_list, seccion.id, centro_id
+                data.sesiones, seccion.id, centro_id
             )
             stats["clases_creadas"] = clases_creadas
 
             # Count unique edificios and aulas created
             edificios_vistos = set()
             aulas_vistas = set()
-            for session_data in data_list:
-                if session_data.Edificio and session_data.Edificio != "":
-                    if session_data.Edificio not in edificios_vistos:
-                        edificios_vistos.add(session_data.Edificio)
+            for sesion in data.sesiones:
+                if sesion.edificio:
+                    if sesion.edificio not in edificios_vistos:
+                        edificios_vistos.add(sesion.edificio)
                         edificios_db, count = self.edificio_service.list_edificios(
-                            name=session_data.Edificio, centro_id=centro_id
+                            name=sesion.edificio, centro_id=centro_id
                         )
                         if count == 0:
                             stats["edificios_creados"] += 1
 
-                    if session_data.Aula and session_data.Aula != "":
-                        aula_key = f"{session_data.Edificio}:{session_data.Aula}"
+                    if sesion.aula:
+                        aula_key = f"{sesion.edificio}:{sesion.aula}"
                         if aula_key not in aulas_vistas:
                             aulas_vistas.add(aula_key)
                             edificios_db, _ = self.edificio_service.list_edificios(
-                                name=session_data.Edificio, centro_id=centro_id
+                                name=sesion.edificio, centro_id=centro_id
                             )
                             if edificios_db:
                                 aulas_db, count = self.aula_service.list_aulas(
-                                    name=session_data.Aula,
+                                    name=sesion.aula,
                                     edificio_id=edificios_db[0].id,
                                 )
                                 if count == 0:
@@ -414,8 +346,124 @@ class TasksService:
         centro_id: int,
         update_if_exists: bool = False,
         full_update: bool = False,
+        detect_conflicts: bool = False,
+        dry_run: bool = False,
     ) -> dict[str, int]:
         """Save or update secciones from SIIAU data"""
+        # Group records by NRC - multiple records with same NRC represent different sessions
+        secciones_agrupadas = group_siiau(SeccionSiiau(**item) for item in data)
+
+        if dry_run:
+            return self.plan_pages(
+                [secciones_agrupadas],
+                calendario_id,
+                centro_id,
+                update_if_exists,
+                full_update,
+            )
+        return self._save_pages(
+            [secciones_agrupadas],
+            calendario_id,
+            centro_id,
+            update_if_exists,
+            full_update,
+            detect_conflicts,
+        )
+
+    def import_upload(
+        self,
+        upload: ManualImport,
+        calendario_id: int,
+        centro_id: int,
+        update_if_exists: bool = False,
+        full_update: bool = False,
+        detect_conflicts: bool = False,
+    ) -> Iterator[dict[str, Any]]:
+        """
+        Save or update secciones from an NDJSON or CSV upload, batch by batch.
+        Yields the totals so far after each batch, the last time with
+        ``terminado``.
+        """
+        saving = self._saving(
+            upload,
+            calendario_id,
+            centro_id,
+            update_if_exists,
+            full_update,
+            detect_conflicts,
+        )
+        for stats, terminado in saving:
+            yield {"terminado": terminado, **upload.report(), **stats}
+
+    def plan_upload(
+        self,
+        upload: ManualImport,
+        calendario_id: int,
+        centro_id: int,
+        update_if_exists: bool = False,
+        full_update: bool = False,
+    ) -> dict[str, Any]:
+        """Write plan of an NDJSON or CSV upload, without saving anything"""
+        plan = self.plan_pages(
+            upload, calendario_id, centro_id, update_if_exists, full_update
+        )
+        return {**upload.report(), **plan}
+
+    def plan_pages(
+        self,
+        pages: Iterable[dict[str, SeccionOferta]],
+        calendario_id: int,
+        centro_id: int,
+        update_if_exists: bool,
+        full_update: bool,
+    ) -> dict[str, Any]:
+        """
+        What saving the pages would create, update and delete, resolved in one
+        read-only transaction
+        """
+        with read_snapshot(self.seccion_service.repository.session) as connection:
+            plan = ImportPlan(
+                connection,
+                calendario_id,
+                centro_id,
+                update_if_exists=update_if_exists,
+                full_update=full_update,
+                validate=self._validate_seccion_data,
+            )
+            for page in pages:
+                plan.add(page)
+        return plan.report()
+
+    def _save_pages(
+        self,
+        pages: Iterable[dict[str, SeccionOferta]],
+        calendario_id: int,
+        centro_id: int,
+        update_if_exists: bool,
+        full_update: bool,
+        detect_conflicts: bool,
+    ) -> dict[str, int]:
+        for stats, _ in self._saving(
+            pages,
+            calendario_id,
+            centro_id,
+            update_if_exists,
+            full_update,
+            detect_conflicts,
+        ):
+            pass
+        return stats
+
+    def _saving(
+        self,
+        pages: Iterable[dict[str, SeccionOferta]],
+        calendario_id: int,
+        centro_id: int,
+        update_if_exists: bool,
+        full_update: bool,
+        detect_conflicts: bool,
+    ) -> Iterator[tuple[dict[str, int], bool]]:
+        """Totals after each page, then once more when finished"""
         total_stats = {
             "secciones_creadas": 0,
             "secciones_actualizadas": 0,
@@ -427,36 +475,43 @@ class TasksService:
             "errores": 0,
         }
 
-        # Group records by NRC - multiple records with same NRC represent different sessions
-        secciones_agrupadas: dict[str, list[SeccionSiiau]] = {}
-        for item in data:
-            d = SeccionSiiau(**item)
-            nrc = d.NRC
-            if nrc not in secciones_agrupadas:
-                secciones_agrupadas[nrc] = []
-            secciones_agrupadas[nrc].append(d)
-
-        # Process each seccion with all its session records
-        for nrc, registros in secciones_agrupadas.items():
-            stats = self._process_seccion(
-                registros, calendario_id, centro_id, update_if_exists, full_update
-            )
+        # Process each seccion with all its session records as its page
+        # arrives; the slot masks, horarios, cupos history and change log are
+        # brought up to date once at the end rather than on every commit
+        with events.deferred(self.seccion_service.repository.session):
+            for page in pages:
+                for seccion in page.values():
+                    stats = self._process_seccion(
+                        seccion,
+                        calendario_id,
+                        centro_id,
+                        update_if_exists,
+                        full_update,
+                    )
 
-            if stats["error"]:
-                total_stats["errores"] += 1
-            else:
-                for key in [
-                    "secciones_creadas",
-                    "secciones_actualizadas",
-                    "materias_creadas",
-                    "profesores_creados",
-                    "edificios_creados",
-                    "aulas_creadas",
-                    "clases_creadas",
-                ]:
-                    total_stats[key] += stats[key]
-
-        return total_stats
+                    if stats["error"]:
+                        total_stats["errores"] += 1
+                    else:
+                        for key in [
+                            "secciones_creadas",
+                            "secciones_actualizadas",
+                            "materias_creadas",
+                            "profesores_creados",
+                            "edificios_creados",
+                            "aulas_creadas",
+                            "clases_creadas",
+                        ]:
+                            total_stats[key] += stats[key]
+                yield dict(total_stats), False
+
+        if self.snapshot_service and settings.SNAPSHOT_ENABLED:
+            self.snapshot_service.publish(calendario_id, centro_id)
+
+        if detect_conflicts and self.conflicto_service:
+            summary = self.conflicto_service.detect_conflictos(calendario_id)
+            total_stats["conflictos"] = summary.total
+
+        yield total_stats, True
 
     def get_secciones(
         self,
@@ -464,6 +519,8 @@ class TasksService:
         centro_id: int,
         update_existing: bool = False,
         full_update: bool = False,
+        detect_conflicts: bool = False,
+        dry_run: bool = False,
     ):
         """
         Fetch and save secciones from SIIAU.
@@ -472,6 +529,8 @@ class TasksService:
             calendario_id: ID of the calendario
             centro_id: ID of the centro universitario
             update_existing: If True, updates existing secciones instead of skipping them
+            detect_conflicts: If True, recomputes the calendario's conflictos afterwards
+            dry_run: If True, only returns the write plan of the import
 
         Returns:
             Dictionary with statistics of the operation
@@ -482,35 +541,78 @@ class TasksService:
         if not calendario.id or not centro.id:
             raise NotFoundException("Calendario or Centro not found")
 
-        # Single request to SIIAU for all secciones
-        secciones = self.make_request(calendario.siiau_id, centro.siiau_id)
+        # Secciones are saved page by page while later pages are fetched
+        pull = self.pull_oferta(calendario.siiau_id, centro.siiau_id, parse_oferta)
+        if dry_run:
+            # Pulled first, so the read transaction stays short
+            pages = list(pull)
+            plan = self.plan_pages(
+                pages, calendario.id, centro.id, update_existing, full_update
+            )
+            return {**plan, **pull.report()}
 
-        # Process all secciones with update flag
-        return self.save_secciones(
-            secciones,
+        stats = self._save_pages(
+            pull,
             calendario.id,
             centro.id,
             update_if_exists=update_existing,
             full_update=full_update,
+            detect_conflicts=detect_conflicts,
+        )
+        stats.update(pull.report())
+        return stats
+
+    def sync_cupos(self, calendario_id: int, centro_id: int) -> dict[str, int]:
+        """
+        Refresh only cupos and cupos_disponibles of existing secciones from
+        SIIAU, for frequent runs during registration.
+
+        Returns:
+            Dictionary with the NRCs read and the secciones whose cupos changed
+        """
+        calendario = self.calendario_service.get_calendario(calendario_id)
+        centro = self.centro_service.get_centro(centro_id)
+
+        pull = self.pull_oferta(calendario.siiau_id, centro.siiau_id, parse_cupos)
+        cupos = {nrc: valores for page in pull for nrc, valores in page.items()}
+        actualizadas = self.seccion_service.update_cupos(
+            calendario.id, centro.id, cupos
         )
+        if self.cupos_service:
+            # Keeps the raw cupos history within its retention window
+            self.cupos_service.compact_if_due()
+        return {
+            "nrcs_leidos": len(cupos),
+            "secciones_actualizadas": actualizadas,
+            **pull.report(),
+        }
 
     def update_all_secciones(
         self,
         calendario_id: int,
         centro_id: int,
         full_update: bool = False,
+        detect_conflicts: bool = False,
+        dry_run: bool = False,
     ) -> dict[str, int]:
         """
         Update all existing secciones with fresh data from SIIAU.
-        Makes a single request and updates all matching NRCs.
+        Pulls the oferta once and updates all matching NRCs.
 
         Args:
             calendario_id: ID of the calendario
             centro_id: ID of the centro universitario
+            detect_conflicts: If True, recomputes the calendario's conflictos afterwards
+            dry_run: If True, only returns the write plan of the update
 
         Returns:
             Dictionary with statistics of the operation
         """
         return self.get_secciones(
-            calendario_id, centro_id, update_existing=True, full_update=full_update
+            calendario_id,
+            centro_id,
+            update_existing=True,
+            full_update=full_update,
+            detect_conflicts=detect_conflicts,
+            dry_run=dry_run,
         )
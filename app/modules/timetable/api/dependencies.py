@@ -0,0 +1,13 @@
+from fastapi import Depends
+from sqlmodel import Session
+
+from app.api.dependencies.database import get_session
+from app.modules.timetable.repositories.timetable_repository import \
+    TimetableRepository
+from app.modules.timetable.services.timetable_service import TimetableService
+
+
+def get_timetable_service(
+    session: Session = Depends(get_session),
+) -> TimetableService:
+    return TimetableService(repository=TimetableRepository(session=session))
@@ -0,0 +1,63 @@
+from datetime import time
+from typing import Annotated
+
+from fastapi import APIRouter, Depends, Query, Request
+from fastapi.responses import StreamingResponse
+
+from app.api.exports import ndjson_response
+from app.api.params import parse_int_list, parse_list
+from app.modules.timetable.schemas import TimetableResult
+from app.modules.timetable.services.timetable_service import TimetableService
+
+from .dependencies import get_timetable_service
+
+router = APIRouter()
+
+
+@router.get(
+    "/",
+    response_class=StreamingResponse,
+    responses={
+        200: {
+            "content": {
+                "application/x-ndjson": {"schema": TimetableResult.model_json_schema()}
+            },
+            "description": "One TimetableResult per line, best first",
+            "headers": {
+                "x-search-complete": {
+                    "description": "false when the search cap was reached first",
+                    "schema": {"type": "string", "enum": ["true", "false"]},
+                }
+            },
+        }
+    },
+)
+async def build_timetables(
+    request: Request,
+    calendario_id: int,
+    centro_id: int,
+    service: Annotated[TimetableService, Depends(get_timetable_service)],
+    claves: str | None = None,
+    materia_ids: str | None = None,
+    dias_excluidos: str | None = None,
+    hora_desde: time | None = None,
+    hora_hasta: time | None = None,
+    profesores: str | None = None,
+    limit: int = Query(default=50, ge=1, le=500),
+):
+    results, finished = service.build_timetables(
+        calendario_id=calendario_id,
+        centro_id=centro_id,
+        claves=parse_list(claves),
+        materia_ids=parse_int_list(materia_ids, "materia_ids"),
+        dias_excluidos=parse_int_list(dias_excluidos, "dias_excluidos"),
+        hora_desde=hora_desde,
+        hora_hasta=hora_hasta,
+        profesores=parse_int_list(profesores, "profesores"),
+        limit=limit,
+    )
+    return ndjson_response(
+        request,
+        (result.model_dump(mode="json") for result in results),
+        {"x-search-complete": "true" if finished else "false"},
+    )
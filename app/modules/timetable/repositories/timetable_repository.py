@@ -0,0 +1,31 @@
+from sqlalchemy.orm import selectinload
+from sqlmodel import Session, or_, select
+
+from app.modules.materia.models import Materia
+from app.modules.seccion.models import Seccion
+
+
+class TimetableRepository:
+    def __init__(self, session: Session):
+        self.session = session
+
+    def materias(self, claves: list[str], ids: list[int]) -> list[Materia]:
+        statement = select(Materia).where(
+            or_(Materia.clave.in_(claves), Materia.id.in_(ids))
+        )
+        return list(self.session.exec(statement))
+
+    def secciones(
+        self, calendario_id: int, centro_id: int, materia_ids: list[int]
+    ) -> list[Seccion]:
+        statement = (
+            select(Seccion)
+            .where(
+                Seccion.calendario_id == calendario_id,
+                Seccion.centro_id == centro_id,
+                Seccion.materia_id.in_(materia_ids),
+            )
+            .options(selectinload(Seccion.clases), selectinload(Seccion.profesor))
+            .order_by(Seccion.id)
+        )
+        return list(self.session.exec(statement))
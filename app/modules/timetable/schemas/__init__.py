@@ -0,0 +1,7 @@
+from .timetable import TimetableMateria, TimetableResult, TimetableSeccion
+
+__all__ = [
+    "TimetableMateria",
+    "TimetableResult",
+    "TimetableSeccion",
+]
@@ -0,0 +1,25 @@
+from sqlmodel import SQLModel
+
+
+class TimetableSeccion(SQLModel):
+    id: int
+    nrc: str
+    name: str
+    cupos_disponibles: int
+    profesor_id: int | None
+    profesor: str | None
+
+
+class TimetableMateria(SQLModel):
+    materia_id: int
+    clave: str
+    name: str
+    secciones: list[TimetableSeccion]
+
+
+class TimetableResult(SQLModel):
+    rank: int
+    preferidos: int
+    dias: int
+    horas: float
+    materias: list[TimetableMateria]
@@ -0,0 +1,175 @@
+"""
+Branch and bound search over seccion combinations.
+
+Every materia contributes a list of options: distinct weekly slot masks (see
+``app.modules.seccion.slots``) together with the secciones sharing them, so
+secciones with the same schedule are explored once. The search assigns the
+materias with fewest options first, rejects an option as soon as its mask ANDs
+with the cells already taken, and keeps the best ``limit`` timetables in a heap.
+The cost of a partial timetable never decreases as materias are added, so a
+branch whose cost already reaches the worst kept timetable is cut.
+"""
+
+import heapq
+from dataclasses import dataclass, field
+from typing import Any
+
+from app.modules.seccion.slots import DAY_MASK, DIAS, SLOTS_PER_DAY, span
+
+# Search nodes visited before giving up on finding better timetables
+MAX_NODES = 2_000_000
+
+Cost = tuple[int, int, int]
+
+POPCOUNT = [bin(days).count("1") for days in range(1 << DIAS)]
+
+
+@dataclass
+class Option:
+    mask: int
+    preferred: bool = False
+    secciones: list[Any] = field(default_factory=list)
+
+
+@dataclass
+class Solution:
+    cost: Cost
+    options: list[Option]
+
+
+def week_days(mask: int) -> int:
+    """Bit set of the dias a mask takes"""
+    return sum(
+        1 << dia for dia in range(DIAS) if (mask >> (dia * SLOTS_PER_DAY)) & DAY_MASK
+    )
+
+
+def cost(mask: int, missed_preferences: int) -> Cost:
+    """Unmet profesor preferences, dias on campus, then cells spent on campus"""
+    return missed_preferences, POPCOUNT[week_days(mask)], span(mask)
+
+
+def _negated(value: Cost) -> Cost:
+    return tuple(-component for component in value)
+
+
+def solve(
+    groups: list[list[Option]], limit: int, max_nodes: int = MAX_NODES
+) -> tuple[list[Solution], bool]:
+    """
+    Best ``limit`` conflict-free choices of one option per group, cheapest
+    first, and whether the search finished within ``max_nodes``.
+    """
+    if not groups or any(not options for options in groups):
+        return [], True
+
+    order = sorted(range(len(groups)), key=lambda index: len(groups[index]))
+    # Promising options first, so good timetables are found early and cut more
+    levels = [
+        [
+            (option, week_days(option.mask))
+            for option in sorted(
+                groups[index],
+                key=lambda option: (not option.preferred, cost(option.mask, 0)),
+            )
+        ]
+        for index in order
+    ]
+    wants_preference = [
+        any(option.preferred for option, _ in options) for options in levels
+    ]
+    last = len(levels) - 1
+
+    # Max-heap on cost through negated keys; the root is the worst kept solution
+    best: list[tuple[Cost, int, list[Option]]] = []
+    # Worst kept cost once the heap is full, the bar a branch has to beat
+    worst: Cost | None = None
+    chosen: list[Option] = []
+    nodes = 0
+
+    def lookahead(
+        depth: int, mask: int, taken: int, missed: int, dias: int
+    ) -> tuple[int, int] | None:
+        """
+        Lower bound of (missed preferences, dias) of any completion: every
+        remaining materia must still fit one of its options, adding at least
+        its cheapest new dias and, when it has preferred options, a missed
+        preference if none of them fits. None when some materia has no option
+        left.
+        """
+        for position in range(depth, last + 1):
+            fewest = DIAS + 1
+            preferred = False
+            for option, days in levels[position]:
+                if option.mask & mask:
+                    continue
+                preferred = preferred or option.preferred
+                count = POPCOUNT[taken | days]
+                if count < fewest:
+                    fewest = count
+            if fewest > DIAS:
+                return None
+            missed += wants_preference[position] and not preferred
+            dias = max(dias, fewest)
+        return missed, dias
+
+    def search(depth: int, mask: int, taken: int, missed: int) -> bool:
+        nonlocal nodes, worst
+
+        for option, days in levels[depth]:
+            nodes += 1
+            if nodes > max_nodes:
+                return False
+            if option.mask & mask:
+                continue
+
+            combined = mask | option.mask
+            combined_days = taken | days
+            # Span is the costly component, so compare on the cheap ones first
+            partial = (
+                missed + (wants_preference[depth] and not option.preferred),
+                POPCOUNT[combined_days],
+            )
+            if worst is not None and partial > worst[:2]:
+                continue
+
+            if depth < last:
+                nodes += last - depth
+                bound = lookahead(depth + 1, combined, combined_days, *partial)
+                if bound is None or (worst is not None and bound > worst[:2]):
+                    continue
+
+            current = (*partial, span(combined))
+            if worst is not None and current >= worst:
+                continue
+
+            chosen.append(option)
+            if depth < last:
+                finished = search(depth + 1, combined, combined_days, partial[0])
+                chosen.pop()
+                if not finished:
+                    return False
+                continue
+
+            entry = (_negated(current), -nodes, list(chosen))
+            chosen.pop()
+            if len(best) < limit:
+                heapq.heappush(best, entry)
+            else:
+                heapq.heapreplace(best, entry)
+            if len(best) == limit:
+                worst = _negated(best[0][0])
+
+        return True
+
+    finished = search(0, 0, 0, 0)
+
+    solutions = []
+    for key, _, options in sorted(best, reverse=True):
+        # Report options in the caller's group order
+        by_group: list[Option] = [None] * len(groups)
+        for position, option in zip(order, options):
+            by_group[position] = option
+        solutions.append(Solution(cost=_negated(key), options=by_group))
+
+    return solutions, finished
@@ -0,0 +1,128 @@
+from collections import defaultdict
+from collections.abc import Iterator
+from datetime import time
+
+from app.core.exceptions import BadRequestException, NotFoundException
+from app.modules.materia.models import Materia
+from app.modules.seccion.models import Seccion
+from app.modules.seccion.slots import SLOT_MINUTES, schedule_mask
+from app.modules.timetable.repositories.timetable_repository import \
+    TimetableRepository
+from app.modules.timetable.schemas import (TimetableMateria, TimetableResult,
+                                           TimetableSeccion)
+from app.modules.timetable.services.solver import MAX_NODES, Option, solve
+
+MAX_MATERIAS = 12
+
+
+class TimetableService:
+    def __init__(self, repository: TimetableRepository, max_nodes: int = MAX_NODES):
+        self.repository = repository
+        self.max_nodes = max_nodes
+
+    @staticmethod
+    def _allowed(
+        seccion: Seccion,
+        dias_excluidos: set[int],
+        hora_desde: time | None,
+        hora_hasta: time | None,
+    ) -> bool:
+        for clase in seccion.clases:
+            if clase.dia in dias_excluidos:
+                return False
+            if hora_desde and clase.hora_inicio and clase.hora_inicio < hora_desde:
+                return False
+            if hora_hasta and clase.hora_fin and clase.hora_fin > hora_hasta:
+                return False
+        return True
+
+    def _materias(self, claves: list[str], materia_ids: list[int]) -> list[Materia]:
+        materias = self.repository.materias(claves, materia_ids)
+
+        missing = set(claves) - {materia.clave for materia in materias}
+        missing |= {str(id) for id in set(materia_ids) - {m.id for m in materias}}
+        if missing:
+            raise NotFoundException(
+                f"Materias not found: {', '.join(sorted(missing))}."
+            )
+
+        if not materias:
+            raise BadRequestException("At least one materia is required.")
+        if len(materias) > MAX_MATERIAS:
+            raise BadRequestException(f"At most {MAX_MATERIAS} materias are allowed.")
+
+        return sorted(materias, key=lambda materia: materia.clave)
+
+    def build_timetables(
+        self,
+        calendario_id: int,
+        centro_id: int,
+        claves: list[str] | None = None,
+        materia_ids: list[int] | None = None,
+        dias_excluidos: list[int] | None = None,
+        hora_desde: time | None = None,
+        hora_hasta: time | None = None,
+        profesores: list[int] | None = None,
+        limit: int = 50,
+    ) -> tuple[Iterator[TimetableResult], bool]:
+        """
+        Conflict-free seccion combinations, one seccion per materia, best first.
+        Returns the results and whether the search covered every combination.
+        """
+        materias = self._materias(claves or [], materia_ids or [])
+        excluded = set(dias_excluidos or [])
+        preferred = set(profesores or [])
+
+        by_materia: dict[int, dict[tuple[int, bool], Option]] = defaultdict(dict)
+        for seccion in self.repository.secciones(
+            calendario_id, centro_id, [materia.id for materia in materias]
+        ):
+            if not self._allowed(seccion, excluded, hora_desde, hora_hasta):
+                continue
+            mask = schedule_mask(
+                (clase.dia, clase.hora_inicio, clase.hora_fin)
+                for clase in seccion.clases
+            )
+            key = (mask, seccion.profesor_id in preferred)
+            option = by_materia[seccion.materia_id].setdefault(
+                key, Option(mask=mask, preferred=key[1])
+            )
+            option.secciones.append(seccion)
+
+        groups = [list(by_materia[materia.id].values()) for materia in materias]
+        solutions, finished = solve(groups, limit, self.max_nodes)
+
+        def results() -> Iterator[TimetableResult]:
+            for rank, solution in enumerate(solutions, start=1):
+                _, dias, cells = solution.cost
+                yield TimetableResult(
+                    rank=rank,
+                    preferidos=sum(option.preferred for option in solution.options),
+                    dias=dias,
+                    horas=cells * SLOT_MINUTES / 60,
+                    materias=[
+                        TimetableMateria(
+                            materia_id=materia.id,
+                            clave=materia.clave,
+                            name=materia.name,
+                            secciones=[
+                                TimetableSeccion(
+                                    id=seccion.id,
+                                    nrc=seccion.nrc,
+                                    name=seccion.name,
+                                    cupos_disponibles=seccion.cupos_disponibles,
+                                    profesor_id=seccion.profesor_id,
+                                    profesor=(
+                                        seccion.profesor.name
+                                        if seccion.profesor
+                                        else None
+                                    ),
+                                )
+                                for seccion in option.secciones
+                            ],
+                        )
+                        for materia, option in zip(materias, solution.options)
+                    ],
+                )
+
+        return results(), finished
@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+"""
+Measure the cupos-only sync against the full oferta parser.
+
+Renders a synthetic SIIAU oferta page for a populated calendario, then times
+the full table parser, the cupos parser and the batched cupos UPDATE with a
+share of the NRCs changed, as a registration week run would see them.
+
+Usage:
+    python scripts/benchmark_cupos.py [--secciones 15000] [--changed 0.1]
+"""
+
+import argparse
+import random
+import sys
+import time
+from pathlib import Path
+
+# Add project root to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from bs4 import BeautifulSoup  # noqa: E402
+from sqlmodel import Session, select  # noqa: E402
+from synthetic import memory_engine, populate  # noqa: E402
+
+from app.main import app  # noqa: E402, F401  (loads every module in order)
+from app.modules.seccion.models import Seccion  # noqa: E402
+from app.modules.seccion.repositories.seccion_repository import \
+    SeccionRepository  # noqa: E402
+from app.modules.tasks.services.cupos_parser import parse_cupos  # noqa: E402
+from app.modules.tasks.services.task_service import TasksService  # noqa: E402
+
+
+def oferta(cupos: dict[str, tuple[int, int]]) -> str:
+    rows = "".join(
+        f"<tr><td>{nrc}</td><td>I5247</td><td>CÁLCULO</td><td>D01</td>"
+        f"<td>8</td><td>{cup}</td><td>{dis}</td>"
+        "<td><table><tr><td>01</td><td>0700-0855</td><td>L . I . . .</td>"
+        "<td>DEDX</td><td>A001</td><td>18/08/25 - 12/12/25</td></tr>"
+        "<tr><td>02</td><td>0900-1055</td><td>. M . J . .</td>"
+        "<td>DEDT</td><td>T001</td><td>18/08/25 - 12/12/25</td></tr></table></td>"
+        "<td><table><tr><td>01</td><td>PROFESOR</td></tr></table></td></tr>"
+        for nrc, (cup, dis) in cupos.items()
+    )
+    return f"<html><body><table>{rows}</table></body></html>"
+
+
+def timed(label: str, function):
+    start = time.perf_counter()
+    result = function()
+    print(f"  {label:14} {(time.perf_counter() - start) * 1000:8.1f} ms")
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--secciones", type=int, default=15000)
+    parser.add_argument("--changed", type=float, default=0.1)
+    args = parser.parse_args()
+
+    rng = random.Random(0)
+    engine = memory_engine()
+    with Session(engine) as session:
+        ids = populate(session, secciones=args.secciones, clases_por_seccion=2)
+        current = {
+            seccion.nrc: (seccion.cupos, seccion.cupos_disponibles)
+            for seccion in session.exec(select(Seccion))
+        }
+
+        fresh = {
+            nrc: (cup, max(dis - 1, 0) if rng.random() < args.changed else dis)
+            for nrc, (cup, dis) in current.items()
+        }
+        html = oferta(fresh)
+        print(f"{len(fresh)} NRCs, {len(html) / 1e6:.1f} MB of HTML")
+
+        timed(
+            "full parser",
+            lambda: TasksService.parse_table(None, BeautifulSoup(html, "html.parser")),
+        )
+        cupos = timed("cupos parser", lambda: parse_cupos(html))
+
+        repository = SeccionRepository(session=session)
+        changed = timed(
+            "cupos update",
+            lambda: repository.update_cupos(
+                ids["calendario_id"], ids["centro_id"], cupos
+            ),
+        )
+        print(f"  {changed} secciones changed")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
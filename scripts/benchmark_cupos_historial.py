@@ -0,0 +1,103 @@
+#!/usr/bin/env python3
+"""
+Measure the storage cost of the cupos history over a registration period.
+
+Populates a calendario, then replays a registration period synced every
+``--intervalo`` seconds in which a share of the secciones lose a seat per
+sync, recording the changes as the cupos sync does. Reports the raw rows, the
+runs left by compaction, the bytes per sample of both and the time taken by
+compaction and by a materia-wide series.
+
+Usage:
+    python scripts/benchmark_cupos_historial.py [--secciones 5000] [--dias 5]
+        [--intervalo 60] [--changed 0.02]
+"""
+
+import argparse
+import random
+import sys
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+
+# Add project root to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from sqlmodel import Session, select, update  # noqa: E402
+from synthetic import memory_engine, populate  # noqa: E402
+
+from app.main import app  # noqa: E402, F401  (loads every module in order)
+from app.modules.historial.models import CuposRegistro  # noqa: E402
+from app.modules.historial.models.cupos_sync import record_cupos  # noqa: E402
+from app.modules.historial.repositories.cupos_repository import \
+    CuposRepository  # noqa: E402
+from app.modules.historial.services.cupos_service import \
+    CuposService  # noqa: E402
+from app.modules.seccion.models import Seccion  # noqa: E402
+
+
+def timed(label: str, function):
+    start = time.perf_counter()
+    result = function()
+    print(f"  {label:14} {(time.perf_counter() - start) * 1000:8.1f} ms")
+    return result
+
+
+def report(label: str, service: CuposService) -> None:
+    stats = service.stats()
+    stored = stats.bytes_registros + stats.bytes_tramos
+    print(
+        f"  {label:14} {stats.registros} rows, {stats.tramos} runs, "
+        f"{stats.muestras} samples, {stored / 1e6:.2f} MB "
+        f"({stored / max(stats.muestras, 1):.1f} bytes/sample)"
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--secciones", type=int, default=5000)
+    parser.add_argument("--dias", type=int, default=5)
+    parser.add_argument("--intervalo", type=int, default=60)
+    parser.add_argument("--changed", type=float, default=0.02)
+    args = parser.parse_args()
+
+    rng = random.Random(0)
+    engine = memory_engine()
+    with Session(engine) as session:
+        populate(session, secciones=args.secciones, clases_por_seccion=1)
+        disponibles = {
+            seccion.id: seccion.cupos_disponibles
+            for seccion in session.exec(select(Seccion))
+        }
+        materia_id = session.exec(select(Seccion.materia_id)).first()
+        service = CuposService(CuposRepository(session=session))
+
+        start = datetime(2025, 8, 1)
+        # The samples of the populated secciones open the period
+        session.exec(update(CuposRegistro).values(registrado_at=start))
+        syncs = args.dias * 86400 // args.intervalo
+        for sync in range(syncs):
+            changes = [
+                (seccion_id, disponibles[seccion_id] - 1)
+                for seccion_id in rng.sample(
+                    list(disponibles), int(len(disponibles) * args.changed)
+                )
+                if disponibles[seccion_id] > 0
+            ]
+            disponibles.update(changes)
+            at = start + timedelta(seconds=(sync + 1) * args.intervalo)
+            record_cupos(session, changes, at=at)
+        session.commit()
+        print(f"{len(disponibles)} secciones, {syncs} syncs")
+
+        report("raw", service)
+        after = start + timedelta(days=args.dias + 30)
+        timed("compaction", lambda: service.compact(now=after))
+        report("compacted", service)
+        timed("materia serie", lambda: service.serie(materia_id=materia_id))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,71 @@
+#!/usr/bin/env python3
+"""
+Measure time and peak Python memory of a whole-calendario export.
+
+Exports every clase of a synthetic calendario (15k secciones, ~60k clases by
+default) through GET /api/v1/clases/export in one request and reports the peak
+traced allocation while the response streams.
+
+Usage:
+    python scripts/benchmark_export.py [--secciones 15000] [--format csv]
+"""
+
+import argparse
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+# Add project root to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from fastapi.testclient import TestClient  # noqa: E402
+from sqlmodel import Session  # noqa: E402
+from synthetic import memory_engine, populate  # noqa: E402
+
+from app.api.dependencies.database import get_session  # noqa: E402
+from app.main import app  # noqa: E402
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--secciones", type=int, default=15000)
+    parser.add_argument("--format", default="ndjson", choices=["ndjson", "csv"])
+    args = parser.parse_args()
+
+    engine = memory_engine()
+    with Session(engine) as session:
+        ids = populate(session, secciones=args.secciones)
+
+    def get_session_override():
+        with Session(engine) as session:
+            yield session
+
+    app.dependency_overrides[get_session] = get_session_override
+    client = TestClient(app)
+
+    tracemalloc.start()
+    start = time.perf_counter()
+    received = 0
+    with client.stream(
+        "GET",
+        "/api/v1/clases/export",
+        params={"calendario_id": ids["calendario_id"], "format": args.format},
+        headers={"Accept-Encoding": "gzip"},
+    ) as response:
+        for chunk in response.iter_raw():
+            received += len(chunk)
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    print(f"Exported clases of {args.secciones} secciones as {args.format}")
+    print(f"  time:        {elapsed:.2f} s")
+    print(f"  gzip bytes:  {received}")
+    print(f"  peak memory: {peak / 1024 / 1024:.1f} MB")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+"""
+Measure a full SIIAU import and a full update of the same secciones.
+
+Serves a synthetic oferta from the local SIIAU stand-in and runs
+actualizar-secciones twice against a temporary SQLite database: first on the
+empty tables, creating every seccion with its clases, then again, replacing
+them. Reports the time and the SQL statements of each run; the read models and
+logs kept by the session listeners are part of both.
+
+Usage:
+    python scripts/benchmark_import.py [--secciones 500]
+"""
+
+import argparse
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+# Add project root to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from fastapi.testclient import TestClient  # noqa: E402
+from sqlalchemy import event  # noqa: E402
+from sqlmodel import Session, SQLModel, create_engine  # noqa: E402
+
+from app.api.dependencies.auth import user_is_staff  # noqa: E402
+from app.api.dependencies.database import get_session  # noqa: E402
+from app.core.config import settings  # noqa: E402
+from app.main import app  # noqa: E402, F401  (loads every module in order)
+from app.modules.calendario.models import Calendario  # noqa: E402
+from app.modules.centro.models import CentroUniversitario  # noqa: E402
+from app.modules.tasks.services.siiau_client import SiiauClient  # noqa: E402
+from app.modules.tasks.services.siiau_client import \
+    get_siiau_client  # noqa: E402
+from tests.siiau_server import SiiauServer  # noqa: E402
+
+URL = "/api/v1/tasks/actualizar-secciones"
+
+
+def run(label: str, client: TestClient, params: dict, statements: list) -> None:
+    statements.clear()
+    start = time.perf_counter()
+    response = client.get(URL, params=params)
+    elapsed = time.perf_counter() - start
+    result = response.json()
+    print(
+        f"  {label:8} {elapsed:7.2f} s  {len(statements):7} statements  "
+        f"{result['secciones_creadas']} creadas, "
+        f"{result['secciones_actualizadas']} actualizadas, "
+        f"{result['clases_creadas']} clases"
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--secciones", type=int, default=500)
+    args = parser.parse_args()
+
+    with (
+        tempfile.TemporaryDirectory() as directory,
+        SiiauServer(secciones=args.secciones) as server,
+    ):
+        engine = create_engine(
+            f"sqlite:///{directory}/import.db",
+            connect_args={"check_same_thread": False},
+        )
+        SQLModel.metadata.create_all(engine)
+        settings.SNAPSHOT_DIR = f"{directory}/snapshots"
+        statements = []
+        event.listen(
+            engine,
+            "before_cursor_execute",
+            lambda *args: statements.append(args[2]),
+        )
+        with Session(engine) as session:
+            centro = CentroUniversitario(name="CUCEI", siiau_id="D")
+            calendario = Calendario(name="2025 B", siiau_id="202520")
+            session.add_all([centro, calendario])
+            session.commit()
+            params = {
+                "calendario_id": calendario.id,
+                "centro_id": centro.id,
+                "full_update": True,
+            }
+
+        def get_session_override():
+            with Session(engine) as session:
+                yield session
+
+        app.dependency_overrides[get_session] = get_session_override
+        app.dependency_overrides[user_is_staff] = lambda: None
+        app.dependency_overrides[get_siiau_client] = lambda: SiiauClient(url=server.url)
+
+        print(f"{args.secciones} secciones, full update")
+        client = TestClient(app)
+        run("create", client, params, statements)
+        run("update", client, params, statements)
+        app.dependency_overrides.clear()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
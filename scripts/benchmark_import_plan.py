@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+"""
+Compare a dry run of actualizar-secciones with the import it plans.
+
+Serves a synthetic oferta from the local SIIAU stand-in and runs a full update
+against a temporary SQLite database three times: a dry run on the empty tables,
+the import itself, and a dry run on the imported secciones. Reports the time
+of each and what it planned or wrote.
+
+Usage:
+    python scripts/benchmark_import_plan.py [--secciones 2000]
+"""
+
+import argparse
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+# Add project root to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from fastapi.testclient import TestClient  # noqa: E402
+from sqlmodel import Session, SQLModel, create_engine  # noqa: E402
+
+from app.api.dependencies.auth import user_is_staff  # noqa: E402
+from app.api.dependencies.database import get_session  # noqa: E402
+from app.core.config import settings  # noqa: E402
+from app.main import app  # noqa: E402, F401  (loads every module in order)
+from app.modules.calendario.models import Calendario  # noqa: E402
+from app.modules.centro.models import CentroUniversitario  # noqa: E402
+from app.modules.tasks.services.siiau_client import SiiauClient  # noqa: E402
+from app.modules.tasks.services.siiau_client import \
+    get_siiau_client  # noqa: E402
+from tests.siiau_server import SiiauServer  # noqa: E402
+
+URL = "/api/v1/tasks/actualizar-secciones"
+
+
+def run(label: str, client: TestClient, params: dict) -> None:
+    start = time.perf_counter()
+    response = client.get(URL, params=params)
+    elapsed = time.perf_counter() - start
+    result = response.json()
+    if params.get("dry_run"):
+        summary = ", ".join(
+            f"{entity} {result[entity]}"
+            for entity in ("secciones", "clases", "aulas", "profesores")
+        )
+    else:
+        summary = (
+            f"{result['secciones_creadas']} secciones, "
+            f"{result['clases_creadas']} clases"
+        )
+    print(f"  {label:12} {elapsed * 1000:9.1f} ms  {summary}")
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--secciones", type=int, default=2000)
+    args = parser.parse_args()
+
+    with (
+        tempfile.TemporaryDirectory() as directory,
+        SiiauServer(secciones=args.secciones) as server,
+    ):
+        engine = create_engine(
+            f"sqlite:///{directory}/plan.db", connect_args={"check_same_thread": False}
+        )
+        SQLModel.metadata.create_all(engine)
+        settings.SNAPSHOT_DIR = f"{directory}/snapshots"
+        with Session(engine) as session:
+            centro = CentroUniversitario(name="CUCEI", siiau_id="D")
+            calendario = Calendario(name="2025 B", siiau_id="202520")
+            session.add_all([centro, calendario])
+            session.commit()
+            params = {
+                "calendario_id": calendario.id,
+                "centro_id": centro.id,
+                "full_update": True,
+            }
+
+        def get_session_override():
+            with Session(engine) as session:
+                yield session
+
+        app.dependency_overrides[get_session] = get_session_override
+        app.dependency_overrides[user_is_staff] = lambda: None
+        app.dependency_overrides[get_siiau_client] = lambda: SiiauClient(url=server.url)
+
+        print(f"{args.secciones} secciones, full update")
+        client = TestClient(app)
+        run("plan (empty)", client, {**params, "dry_run": True})
+        run("import", client, params)
+        run("plan (again)", client, {**params, "dry_run": True})
+        app.dependency_overrides.clear()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
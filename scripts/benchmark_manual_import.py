@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+"""
+Measure the memory of reading a manual import: JSON list against NDJSON stream.
+
+Writes the session records of a synthetic oferta to temporary JSON and NDJSON
+files and prepares them for saving both ways: loading the JSON list and
+grouping it, as JSON bodies are, and reading the NDJSON upload batch by batch.
+Reports the time and peak memory of each for growing uploads; the streamed
+peak stays at about one batch.
+
+Usage:
+    python scripts/benchmark_manual_import.py [--secciones 2000 8000 32000]
+"""
+
+import argparse
+import json
+import sys
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+
+# Add project root to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from bs4 import BeautifulSoup  # noqa: E402
+
+from app.main import app  # noqa: E402, F401  (loads every module in order)
+from app.modules.tasks.schemas.siiau import SeccionSiiau  # noqa: E402
+from app.modules.tasks.services.manual_import import ManualImport  # noqa: E402
+from app.modules.tasks.services.oferta_parser import group_siiau  # noqa: E402
+from app.modules.tasks.services.task_service import TasksService  # noqa: E402
+from tests.siiau_server import generate_rows, render  # noqa: E402
+
+
+def measure(label: str, function) -> None:
+    tracemalloc.start()
+    start = time.perf_counter()
+    secciones = function()
+    elapsed = time.perf_counter() - start
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    print(
+        f"  {label:8} {elapsed * 1000:9.1f} ms, peak {peak / 1e6:7.1f} MB, "
+        f"{secciones} secciones"
+    )
+
+
+def from_json(path: Path) -> int:
+    data = json.loads(path.read_text())
+    return len(group_siiau(SeccionSiiau(**item) for item in data))
+
+
+def from_ndjson(path: Path) -> int:
+    with path.open("rb") as file:
+        return sum(len(batch) for batch in ManualImport(file, "ndjson"))
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--secciones", type=int, nargs="+", default=[2000, 8000, 32000])
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        for secciones in args.secciones:
+            html = render([row for _, row in generate_rows(secciones)])
+            records = TasksService.parse_table(None, BeautifulSoup(html, "html.parser"))
+            json_path = Path(directory, "oferta.json")
+            ndjson_path = Path(directory, "oferta.ndjson")
+            json_path.write_text(json.dumps(records))
+            ndjson_path.write_text("".join(json.dumps(r) + "\n" for r in records))
+            del html, records
+            print(f"{secciones} secciones, {ndjson_path.stat().st_size / 1e6:.1f} MB")
+            measure("json", lambda: from_json(json_path))
+            measure("ndjson", lambda: from_ndjson(ndjson_path))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
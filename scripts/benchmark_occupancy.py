@@ -0,0 +1,70 @@
+#!/usr/bin/env python3
+"""
+Measure the occupancy heatmaps of a full centro.
+
+Populates a synthetic calendario and times GET /api/v1/occupancy/ for its
+centro twice: cold (computed) and warm (served from the response cache).
+
+Usage:
+    python scripts/benchmark_occupancy.py [--secciones 15000] [--clases 4]
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+# Add project root to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from fastapi.testclient import TestClient  # noqa: E402
+from sqlmodel import Session  # noqa: E402
+from synthetic import memory_engine, populate  # noqa: E402
+
+from app.api.dependencies.database import get_session  # noqa: E402
+from app.main import app  # noqa: E402
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--secciones", type=int, default=15000)
+    parser.add_argument("--clases", type=int, default=4)
+    args = parser.parse_args()
+
+    engine = memory_engine()
+    with Session(engine) as session:
+        ids = populate(
+            session,
+            secciones=args.secciones,
+            clases_por_seccion=args.clases,
+            edificios=20,
+            aulas_por_edificio=40,
+        )
+
+    def get_session_override():
+        with Session(engine) as session:
+            yield session
+
+    app.dependency_overrides[get_session] = get_session_override
+    client = TestClient(app)
+
+    # Warm up the application so the cold figure is the computation alone
+    client.get("/api/v1/")
+
+    params = {"calendario_id": ids["calendario_id"], "centro_id": ids["centro_id"]}
+
+    print(f"{args.secciones * args.clases} clases")
+    for label in ("cold", "cached"):
+        start = time.perf_counter()
+        response = client.get("/api/v1/occupancy/", params=params)
+        elapsed = time.perf_counter() - start
+        print(
+            f"  {label:7} {elapsed * 1000:8.1f} ms  "
+            f"{response.headers.get('x-cache', 'MISS')}"
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+"""
+Measure parse-plus-prepare of an oferta page: flat rows against typed records.
+
+Renders a synthetic oferta page like the local SIIAU stand-in's and prepares
+it for saving both ways: as imports did, through a BeautifulSoup tree into
+flat session dicts validated into SeccionSiiau and grouped by NRC, with horas,
+dias and periodo converted per session; and with the streaming typed parser,
+which groups while parsing and converts each distinct string once. Reports
+the time taken, the peak memory and the memory held by the prepared secciones.
+
+Usage:
+    python scripts/benchmark_oferta_parse.py [--secciones 15000]
+"""
+
+import argparse
+import gc
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+# Add project root to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from bs4 import BeautifulSoup  # noqa: E402
+
+from app.main import app  # noqa: E402, F401  (loads every module in order)
+from app.modules.tasks.schemas.siiau import SeccionSiiau  # noqa: E402
+from app.modules.tasks.services.oferta_parser import parse_dias  # noqa: E402
+from app.modules.tasks.services.oferta_parser import parse_horas  # noqa: E402
+from app.modules.tasks.services.oferta_parser import parse_oferta  # noqa: E402
+from app.modules.tasks.services.oferta_parser import \
+    parse_periodo  # noqa: E402
+from app.modules.tasks.services.task_service import TasksService  # noqa: E402
+from tests.siiau_server import generate_rows, render  # noqa: E402
+
+
+def flat(html: str) -> dict:
+    """Secciones prepared the way imports used to"""
+    secciones: dict[str, list] = {}
+    for item in TasksService.parse_table(None, BeautifulSoup(html, "html.parser")):
+        d = SeccionSiiau(**item)
+        secciones.setdefault(d.NRC, []).append(
+            (
+                d,
+                parse_horas.__wrapped__(d.Horas),
+                parse_dias.__wrapped__(d.Dias),
+                parse_periodo.__wrapped__(d.Periodo),
+            )
+        )
+    return secciones
+
+
+def measure(label: str, prepare, html: str) -> None:
+    parse_horas.cache_clear()
+    parse_dias.cache_clear()
+    parse_periodo.cache_clear()
+    gc.collect()
+    start = time.perf_counter()
+    prepare(html)
+    elapsed = time.perf_counter() - start
+
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    secciones = prepare(html)
+    gc.collect()
+    current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(
+        f"  {label:8} {elapsed * 1000:8.1f} ms, peak {(peak - before) / 1e6:6.1f} MB, "
+        f"{(current - before) / 1e6:6.1f} MB held for {len(secciones)} secciones"
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--secciones", type=int, default=15000)
+    args = parser.parse_args()
+
+    html = render([row for _, row in generate_rows(args.secciones)])
+    print(f"{args.secciones} secciones, {len(html) / 1e6:.1f} MB of HTML")
+    measure("flat", flat, html)
+    measure("typed", parse_oferta, html)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,63 @@
+#!/usr/bin/env python3
+"""
+Measure oferta parsing in a process pool against a serial parse.
+
+Renders a synthetic oferta page like the local SIIAU stand-in's and parses it
+in place and then split at its rows across pools of increasing size, checking
+every run returns the rows of the serial parse. The first run of each pool
+includes starting its processes, so each size is timed twice.
+
+Usage:
+    python scripts/benchmark_parallel_parse.py [--secciones 100000]
+        [--processes 2 4 8]
+"""
+
+import argparse
+import os
+import sys
+import time
+from pathlib import Path
+
+# Add project root to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from app.modules.tasks.services import oferta_parser  # noqa: E402
+from app.modules.tasks.services.oferta_parser import oferta_rows  # noqa: E402
+from tests.siiau_server import generate_rows, render  # noqa: E402
+
+
+def timed(label: str, function):
+    start = time.perf_counter()
+    result = function()
+    print(f"  {label:22} {(time.perf_counter() - start) * 1000:9.1f} ms")
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--secciones", type=int, default=100000)
+    parser.add_argument("--processes", type=int, nargs="+")
+    args = parser.parse_args()
+    processes = args.processes or sorted({2, 4, os.cpu_count() or 1} - {1})
+
+    html = render([row for _, row in generate_rows(args.secciones)])
+    print(
+        f"{args.secciones} secciones, {len(html) / 1e6:.1f} MB of HTML, "
+        f"{os.cpu_count()} CPUs"
+    )
+    serial = timed("serial", lambda: oferta_rows(html, processes=1))
+    for count in processes:
+        for run in ("start", "warm"):
+            rows = timed(
+                f"{count} processes ({run})",
+                lambda: oferta_rows(html, processes=count, threshold=0),
+            )
+            assert rows == serial
+        oferta_parser._get_pool(count).shutdown()
+        oferta_parser._reset_pool()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
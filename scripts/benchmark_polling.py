@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+"""
+Measure what conditional requests save on a timetable polling workload.
+
+Simulates front-ends polling the seccion list of a calendario: every client
+re-sends the ETag it got last, as browsers do. The same workload is replayed
+with the response cache disabled to compare bytes sent and latency.
+
+Usage:
+    python scripts/benchmark_polling.py [--secciones 2000] [--polls 200]
+"""
+
+import argparse
+import statistics
+import sys
+import time
+from pathlib import Path
+
+# Add project root to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from fastapi.testclient import TestClient  # noqa: E402
+from sqlmodel import Session  # noqa: E402
+from synthetic import memory_engine, populate  # noqa: E402
+
+from app.api.dependencies.database import get_session  # noqa: E402
+from app.core.cache import response_cache  # noqa: E402
+from app.core.config import settings  # noqa: E402
+from app.main import app  # noqa: E402
+
+
+def poll(client: TestClient, url: str, polls: int, conditional: bool):
+    sent = 0
+    latencies = []
+    etag = None
+    for _ in range(polls):
+        headers = {"If-None-Match": etag} if conditional and etag else {}
+        start = time.perf_counter()
+        response = client.get(url, headers=headers)
+        latencies.append(time.perf_counter() - start)
+        sent += len(response.content)
+        etag = response.headers.get("etag", etag)
+    return sent, latencies
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--secciones", type=int, default=2000)
+    parser.add_argument("--polls", type=int, default=200)
+    args = parser.parse_args()
+
+    engine = memory_engine()
+    with Session(engine) as session:
+        ids = populate(session, secciones=args.secciones)
+
+        app.dependency_overrides[get_session] = lambda: session
+        client = TestClient(app)
+        url = f"/api/v1/secciones/?calendario_id={ids['calendario_id']}&limit=100"
+
+        settings.CACHE_ENABLED = False
+        base_bytes, base_latencies = poll(client, url, args.polls, conditional=False)
+
+        settings.CACHE_ENABLED = True
+        response_cache.clear()
+        bytes_sent, latencies = poll(client, url, args.polls, conditional=True)
+
+    base_ms = statistics.mean(base_latencies) * 1000
+    cached_ms = statistics.mean(latencies) * 1000
+    stats = response_cache.stats()
+
+    print(f"Polls: {args.polls} on {url}")
+    print(f"Without cache: {base_bytes} bytes, {base_ms:.2f} ms/request")
+    print(f"With ETags:    {bytes_sent} bytes, {cached_ms:.2f} ms/request")
+    print(
+        f"Bytes saved:   {base_bytes - bytes_sent} (cache reports {stats['bytes_saved']})"
+    )
+    print(
+        f"Latency saved: {(base_ms - cached_ms) * args.polls:.1f} ms total "
+        f"(cache reports {stats['latency_saved'] * 1000:.1f} ms)"
+    )
+    print(f"304 responses: {stats['not_modified']}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,78 @@
+#!/usr/bin/env python3
+"""
+Microbenchmark of response serialization for a page of 100 secciones.
+
+Compares FastAPI's response_model path (validate ORM rows into
+Pagination[SeccionRead], then dump) with the direct row builders of
+app.api.responses. Rows and relationships are loaded up front so only
+serialization is timed.
+
+Usage:
+    python scripts/benchmark_serialization.py [--rows 100] [--repeat 200]
+"""
+
+import argparse
+import sys
+import timeit
+from pathlib import Path
+
+# Add project root to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from pydantic import TypeAdapter  # noqa: E402
+from sqlalchemy.orm import selectinload  # noqa: E402
+from sqlmodel import Session, select  # noqa: E402
+from synthetic import memory_engine, populate  # noqa: E402
+
+from app.api.responses import page_response  # noqa: E402
+from app.api.schemas import Pagination  # noqa: E402
+from app.modules.seccion.models import Seccion  # noqa: E402
+from app.modules.seccion.schemas import SeccionRead  # noqa: E402
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--rows", type=int, default=100)
+    parser.add_argument("--repeat", type=int, default=200)
+    args = parser.parse_args()
+
+    engine = memory_engine()
+    with Session(engine) as session:
+        populate(session, secciones=args.rows)
+        rows = session.exec(
+            select(Seccion).options(
+                selectinload(Seccion.centro),
+                selectinload(Seccion.materia),
+                selectinload(Seccion.profesor),
+                selectinload(Seccion.calendario),
+                selectinload(Seccion.clases),
+            )
+        ).all()
+
+        adapter = TypeAdapter(Pagination[SeccionRead])
+
+        def response_model_path():
+            # Route builds the Pagination, FastAPI validates it again and dumps
+            page = Pagination[SeccionRead](total=len(rows), results=rows)
+            value = adapter.validate_python(page, from_attributes=True)
+            return adapter.dump_json(value)
+
+        def direct_path():
+            return page_response(SeccionRead, rows, len(rows)).body
+
+        assert response_model_path() == direct_path()
+
+        before = min(timeit.repeat(response_model_path, number=args.repeat, repeat=3))
+        after = min(timeit.repeat(direct_path, number=args.repeat, repeat=3))
+
+    before_ms = before / args.repeat * 1000
+    after_ms = after / args.repeat * 1000
+    print(f"Serialization of {args.rows} secciones with nested clases:")
+    print(f"  response_model: {before_ms:.3f} ms")
+    print(f"  row builders:   {after_ms:.3f} ms ({before_ms / after_ms:.1f}x faster)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
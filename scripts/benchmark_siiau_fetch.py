@@ -0,0 +1,70 @@
+#!/usr/bin/env python3
+"""
+Compare a single-response oferta pull with a paged, concurrent one.
+
+Serves a synthetic oferta from the local SIIAU stand-in, with ``--latency``
+seconds added to every response, and pulls it both ways, parsing cupos as the
+cupos sync does. Reports the time until the first secciones are available,
+the total time and the requests made.
+
+Usage:
+    python scripts/benchmark_siiau_fetch.py [--secciones 15000] [--page-size 1000]
+        [--concurrency 3] [--latency 0.5]
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+# Add project root to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from app.modules.tasks.services.cupos_parser import parse_cupos  # noqa: E402
+from app.modules.tasks.services.oferta_fetcher import OfertaPull  # noqa: E402
+from app.modules.tasks.services.siiau_client import SiiauClient  # noqa: E402
+from tests.siiau_server import Faults, SiiauServer  # noqa: E402
+
+
+def run(label: str, server: SiiauServer, page_size: int, concurrency: int) -> None:
+    siiau = SiiauClient(url=server.url, retries=0, concurrency=concurrency)
+    pull = OfertaPull(
+        lambda limite, pagina: siiau.fetch_oferta("202520", "D", limite, pagina),
+        parse_cupos,
+        page_size=page_size,
+        concurrency=concurrency,
+    )
+    server.requests.clear()
+    start = time.perf_counter()
+    first = None
+    for _ in pull:
+        if first is None:
+            first = time.perf_counter() - start
+    total = time.perf_counter() - start
+    print(
+        f"  {label:8} first rows {first * 1000:8.1f} ms, total {total * 1000:8.1f} ms, "
+        f"{pull.nrcs} secciones, {len(server.requests)} requests"
+    )
+    siiau.close()
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--secciones", type=int, default=15000)
+    parser.add_argument("--page-size", type=int, default=1000)
+    parser.add_argument("--concurrency", type=int, default=3)
+    parser.add_argument("--latency", type=float, default=0.5)
+    args = parser.parse_args()
+
+    with SiiauServer(
+        secciones=args.secciones, faults=Faults(latency=args.latency)
+    ) as server:
+        print(f"{args.secciones} secciones, {args.latency}s latency per response")
+        run("single", server, 0, 1)
+        run("paged", server, args.page_size, args.concurrency)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+"""
+Measure the timetable builder on a synthetic calendario.
+
+Builds timetables for the first N materias of a synthetic calendario where
+every materia has S secciones, through GET /api/v1/timetables/, and reports the
+time until the last result line arrives.
+
+Usage:
+    python scripts/benchmark_timetable.py [--materias 8] [--secciones 30]
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+# Add project root to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from fastapi.testclient import TestClient  # noqa: E402
+from sqlmodel import Session  # noqa: E402
+from synthetic import memory_engine, populate  # noqa: E402
+
+from app.api.dependencies.database import get_session  # noqa: E402
+from app.main import app  # noqa: E402
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--materias", type=int, default=8)
+    parser.add_argument("--secciones", type=int, default=30)
+    parser.add_argument("--limit", type=int, default=100)
+    args = parser.parse_args()
+
+    engine = memory_engine()
+    with Session(engine) as session:
+        ids = populate(
+            session,
+            secciones=200 * args.secciones,
+            clases_por_seccion=2,
+            materias=200,
+        )
+
+    def get_session_override():
+        with Session(engine) as session:
+            yield session
+
+    app.dependency_overrides[get_session] = get_session_override
+    client = TestClient(app)
+
+    params = {
+        "calendario_id": ids["calendario_id"],
+        "centro_id": ids["centro_id"],
+        "claves": ",".join(f"I{i:04d}" for i in range(args.materias)),
+        "profesores": ",".join(str(i) for i in range(1, 40)),
+        "limit": args.limit,
+    }
+
+    start = time.perf_counter()
+    response = client.get("/api/v1/timetables/", params=params)
+    lines = response.content.splitlines()
+    elapsed = time.perf_counter() - start
+
+    print(f"{args.materias} materias x {args.secciones} secciones")
+    print(f"  time:     {elapsed:.2f} s")
+    print(f"  results:  {len(lines)}")
+    print(f"  complete: {response.headers['x-search-complete']}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,109 @@
+"""
+Synthetic catalog data shared by the benchmark scripts.
+"""
+
+import random
+from datetime import datetime, time
+
+from sqlmodel import Session, SQLModel, create_engine
+from sqlmodel.pool import StaticPool
+
+import app.modules.users.models  # noqa: F401
+from app.modules.aula.models import Aula
+from app.modules.calendario.models import Calendario
+from app.modules.centro.models import CentroUniversitario
+from app.modules.clase.models import Clase
+from app.modules.edificio.models import Edificio
+from app.modules.materia.models import Materia
+from app.modules.profesor.models import Profesor
+from app.modules.seccion.models import Seccion
+
+HORAS = [(h, 0, h + 1, 55) for h in range(7, 21, 2)]
+
+
+def memory_engine():
+    engine = create_engine(
+        "sqlite:///:memory:",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+    SQLModel.metadata.create_all(engine)
+    return engine
+
+
+def populate(
+    session: Session,
+    secciones: int = 1000,
+    clases_por_seccion: int = 4,
+    materias: int = 200,
+    profesores: int = 300,
+    edificios: int = 10,
+    aulas_por_edificio: int = 20,
+    seed: int = 0,
+) -> dict[str, int]:
+    """Insert a calendario/centro with a realistic seccion offer"""
+    rng = random.Random(seed)
+
+    calendario = Calendario(name="2025 B", siiau_id="202520")
+    centro = CentroUniversitario(name="CUCEI", siiau_id="D")
+    session.add(calendario)
+    session.add(centro)
+    session.flush()
+
+    materias_db = [
+        Materia(name=f"Materia {i}", creditos=rng.choice([5, 8, 10]), clave=f"I{i:04d}")
+        for i in range(materias)
+    ]
+    profesores_db = [Profesor(name=f"Profesor {i}") for i in range(profesores)]
+    edificios_db = [
+        Edificio(name=f"DED{chr(65 + i % 26)}{i // 26 or ''}", centro_id=centro.id)
+        for i in range(edificios)
+    ]
+    session.add_all(materias_db + profesores_db + edificios_db)
+    session.flush()
+
+    aulas_db = [
+        Aula(name=f"A{j:03d}", edificio_id=edificio.id)
+        for edificio in edificios_db
+        for j in range(aulas_por_edificio)
+    ]
+    session.add_all(aulas_db)
+    session.flush()
+
+    secciones_db = [
+        Seccion(
+            name=f"D{i % 20:02d}",
+            nrc=f"{100000 + i}",
+            cupos=40,
+            cupos_disponibles=rng.randint(0, 40),
+            periodo_inicio=datetime(2025, 8, 18),
+            periodo_fin=datetime(2025, 12, 12),
+            centro_id=centro.id,
+            materia_id=materias_db[i % materias].id,
+            profesor_id=rng.choice(profesores_db).id,
+            calendario_id=calendario.id,
+        )
+        for i in range(secciones)
+    ]
+    session.add_all(secciones_db)
+    session.flush()
+
+    clases_db = []
+    for seccion in secciones_db:
+        h1, m1, h2, m2 = rng.choice(HORAS)
+        aula = rng.choice(aulas_db)
+        for sesion in range(clases_por_seccion):
+            clases_db.append(
+                Clase(
+                    sesion=1,
+                    hora_inicio=time(h1, m1),
+                    hora_fin=time(h2, m2),
+                    dia=1 + (sesion * 2 + seccion.id) % 6,
+                    seccion_id=seccion.id,
+                    aula_id=aula.id,
+                )
+            )
+    session.add_all(clases_db)
+    session.commit()
+
+    return {"calendario_id": calendario.id, "centro_id": centro.id}
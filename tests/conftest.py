@@ -11,12 +11,15 @@ from sqlmodel import Session, SQLModel, create_engine
 from sqlmodel.pool import StaticPool
 
 from app.api.dependencies.database import get_session
+from app.core.cache import response_cache
+from app.core.config import settings
 from app.core.database import engine as production_engine
 from app.core.security import create_access_token, hash_password
 from app.main import app
 from app.modules.auth.models import RefreshToken
 from app.modules.auth.schemas import AccessTokenData
 from app.modules.users.models import User
+from tests.siiau_server import SiiauServer
 
 
 # Test database engine with in-memory SQLite
@@ -143,3 +146,24 @@ def reset_database(session: Session):
     yield
     # Cleanup after test
     session.rollback()
+
+
+@pytest.fixture(autouse=True)
+def reset_response_cache():
+    """Start every test with an empty response cache"""
+    response_cache.clear()
+    yield
+    response_cache.clear()
+
+
+@pytest.fixture(autouse=True)
+def snapshot_dir(tmp_path, monkeypatch):
+    """Publish the snapshots of imports under the test's temporary directory"""
+    monkeypatch.setattr(settings, "SNAPSHOT_DIR", str(tmp_path / "snapshots"))
+
+
+@pytest.fixture(name="siiau_server")
+def siiau_server_fixture() -> Generator[SiiauServer, None, None]:
+    """A local SIIAU stand-in with 100 generated secciones and no faults"""
+    with SiiauServer(secciones=100) as server:
+        yield server
@@ -0,0 +1,251 @@
+"""
+Local stand-in for the SIIAU oferta endpoint.
+
+Answers the ``ciclop`` / ``cup`` / ``mostrarp`` form with generated oferta
+pages, laid out like SIIAU's (one top-level row per seccion with nested
+horario and profesor tables), or with a recorded page. ``p`` selects a page of
+``mostrarp`` rows (1-based) and ``crsep`` a materia clave, and ``cap`` silently
+limits the rows of any response like SIIAU does with very large centros. With
+``ignore_page`` every request gets the first page, as from a SIIAU that
+doesn't know ``p``.
+
+``Faults`` injects latency, throttling (429 with Retry-After), 5xx errors and
+bodies cut off mid-transfer, each with a probability, so imports can be tested
+and benchmarked offline. Responses are gzip compressed when the client asks.
+
+Used by the ``siiau_server`` pytest fixture, and from the command line:
+
+    python -m tests.siiau_server --port 8080 --secciones 15000 --latency 0.5 \\
+        --error-rate 0.1
+"""
+
+import argparse
+import gzip
+import random
+import threading
+import time
+from dataclasses import dataclass, field
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from urllib.parse import parse_qs
+
+DIAS = ["L . I . . .", ". M . J . .", ". . . . V .", ". . . . . S", "L M I J V ."]
+HORAS = [f"{h:02d}00-{h + 1:02d}55" for h in range(7, 21, 2)]
+EDIFICIOS = ["DEDX", "DEDT", "DEDR", "DUCT1", "DBETA"]
+
+
+def generate_rows(secciones: int, seed: int = 0) -> list[tuple[str, str]]:
+    """(clave, row HTML) of a synthetic oferta, ordered by clave like SIIAU"""
+    rng = random.Random(seed)
+    rows = []
+    for i in range(secciones):
+        clave = f"I{i // 4:04d}"
+        cupos = rng.choice([20, 30, 40, 60])
+        sesiones = "".join(
+            f"<tr><td>{sesion:02d}</td><td>{rng.choice(HORAS)}</td>"
+            f"<td>{rng.choice(DIAS)}</td><td>{rng.choice(EDIFICIOS)}</td>"
+            f"<td>A{rng.randint(1, 30):03d}</td><td>18/08/25 - 12/12/25</td></tr>"
+            for sesion in range(1, rng.randint(1, 2) + 1)
+        )
+        rows.append(
+            (
+                clave,
+                f"<tr><td>{100000 + i}</td><td>{clave}</td>"
+                f"<td>MATERIA {i // 4}</td><td>D{i % 4 + 1:02d}</td>"
+                f"<td>{rng.choice([5, 8, 10])}</td><td>{cupos}</td>"
+                f"<td>{rng.randint(0, cupos)}</td>"
+                f"<td><table>{sesiones}</table></td>"
+                f"<td><table><tr><td>01</td><td>PROFESOR {i % 300}</td></tr>"
+                "</table></td></tr>",
+            )
+        )
+    return rows
+
+
+def render(rows: list[str]) -> str:
+    return (
+        "<html><head><title>Consulta de Oferta</title></head><body>"
+        "<table><tr><th>NRC</th><th>Clave</th><th>Materia</th><th>Sec</th>"
+        "<th>CR</th><th>CUP</th><th>DIS</th><th>Ses/Hora/Días/Edif/Aula/Periodo</th>"
+        f"<th>Ses/Profesor</th></tr>{''.join(rows)}</table></body></html>"
+    )
+
+
+@dataclass
+class Faults:
+    """Seconds of latency and probabilities of each failure per request"""
+
+    latency: float = 0.0
+    throttle_rate: float = 0.0
+    retry_after: int = 1
+    error_rate: float = 0.0
+    truncate_rate: float = 0.0
+    seed: int = 0
+    rng: random.Random = field(init=False, repr=False)
+
+    def __post_init__(self):
+        self.rng = random.Random(self.seed)
+
+    def roll(self, rate: float) -> bool:
+        return rate > 0 and self.rng.random() < rate
+
+
+class SiiauServer:
+    def __init__(
+        self,
+        host: str = "127.0.0.1",
+        port: int = 0,
+        secciones: int = 100,
+        seed: int = 0,
+        recorded: str | Path | None = None,
+        cap: int | None = None,
+        ignore_page: bool = False,
+        faults: Faults | None = None,
+    ):
+        self.rows = generate_rows(secciones, seed)
+        self.recorded = Path(recorded).read_text() if recorded else None
+        self.cap = cap
+        self.ignore_page = ignore_page
+        self.faults = faults or Faults()
+        self.requests: list[dict[str, str]] = []
+        self.lock = threading.Lock()
+
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def do_POST(self):
+                length = int(self.headers.get("Content-Length", 0))
+                form = {
+                    key: values[0]
+                    for key, values in parse_qs(
+                        self.rfile.read(length).decode()
+                    ).items()
+                }
+                server.handle(self, form)
+
+            def log_message(self, format, *args):
+                pass
+
+        self.httpd = ThreadingHTTPServer((host, port), Handler)
+        self.thread: threading.Thread | None = None
+
+    @property
+    def url(self) -> str:
+        host, port = self.httpd.server_address[:2]
+        return f"http://{host}:{port}/wal/sspseca.consulta_oferta"
+
+    def page(self, form: dict[str, str]) -> str:
+        if self.recorded is not None:
+            return self.recorded
+
+        rows = self.rows
+        if form.get("crsep"):
+            rows = [row for row in rows if row[0] == form["crsep"]]
+        size = int(form.get("mostrarp") or 20)
+        if self.cap is not None:
+            size = min(size, self.cap)
+        page = 1 if self.ignore_page else int(form.get("p") or 1)
+        start = (page - 1) * size
+        end = start + size
+        return render([html for _, html in rows[start:end]])
+
+    def handle(self, handler: BaseHTTPRequestHandler, form: dict[str, str]) -> None:
+        faults = self.faults
+        with self.lock:
+            self.requests.append(form)
+            throttled = faults.roll(faults.throttle_rate)
+            failed = not throttled and faults.roll(faults.error_rate)
+            truncated = faults.roll(faults.truncate_rate)
+        if faults.latency:
+            time.sleep(faults.latency)
+
+        if throttled or failed:
+            body = b"Servicio no disponible"
+            handler.send_response(429 if throttled else 503)
+            if throttled:
+                handler.send_header("Retry-After", str(faults.retry_after))
+            handler.send_header("Content-Length", str(len(body)))
+            handler.end_headers()
+            handler.wfile.write(body)
+            return
+
+        body = self.page(form).encode()
+        handler.send_response(200)
+        handler.send_header("Content-Type", "text/html; charset=utf-8")
+        if "gzip" in handler.headers.get("Accept-Encoding", ""):
+            body = gzip.compress(body, compresslevel=5)
+            handler.send_header("Content-Encoding", "gzip")
+        handler.send_header("Content-Length", str(len(body)))
+        handler.end_headers()
+        if truncated:
+            # The declared length never arrives
+            half = len(body) // 2
+            handler.wfile.write(body[:half])
+            handler.close_connection = True
+            return
+        handler.wfile.write(body)
+
+    def start(self) -> "SiiauServer":
+        self.thread = threading.Thread(target=self.httpd.serve_forever, daemon=True)
+        self.thread.start()
+        return self
+
+    def stop(self) -> None:
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+    def __enter__(self) -> "SiiauServer":
+        return self.start()
+
+    def __exit__(self, *exc_info) -> None:
+        self.stop()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8080)
+    parser.add_argument("--secciones", type=int, default=15000)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--recorded", help="Serve this HTML page to every request")
+    parser.add_argument("--cap", type=int, help="Most rows in any response")
+    parser.add_argument(
+        "--ignore-page", action="store_true", help="Answer every page with the first"
+    )
+    parser.add_argument("--latency", type=float, default=0.0)
+    parser.add_argument("--throttle-rate", type=float, default=0.0)
+    parser.add_argument("--retry-after", type=int, default=1)
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--truncate-rate", type=float, default=0.0)
+    args = parser.parse_args()
+
+    server = SiiauServer(
+        host=args.host,
+        port=args.port,
+        secciones=args.secciones,
+        seed=args.seed,
+        recorded=args.recorded,
+        cap=args.cap,
+        ignore_page=args.ignore_page,
+        faults=Faults(
+            latency=args.latency,
+            throttle_rate=args.throttle_rate,
+            retry_after=args.retry_after,
+            error_rate=args.error_rate,
+            truncate_rate=args.truncate_rate,
+            seed=args.seed,
+        ),
+    )
+    print(f"SIIAU stand-in serving {len(server.rows)} secciones at {server.url}")
+    try:
+        server.httpd.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.httpd.server_close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,139 @@
+"""
+Unit tests for streaming NDJSON / CSV exports
+"""
+
+import csv
+import io
+import json
+from datetime import time
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlmodel import Session
+
+from app.modules.aula.models import Aula
+from app.modules.calendario.models import Calendario
+from app.modules.centro.models import CentroUniversitario
+from app.modules.clase.models import Clase
+from app.modules.edificio.models import Edificio
+from app.modules.materia.models import Materia
+from app.modules.profesor.models import Profesor
+from app.modules.seccion.models import Seccion
+
+
+@pytest.fixture(name="offer")
+def offer_fixture(session: Session) -> dict:
+    """Create two calendarios with secciones and clases"""
+    centro = CentroUniversitario(name="CUCEI", siiau_id="D")
+    calendarios = [
+        Calendario(name="2025 A", siiau_id="202510"),
+        Calendario(name="2025 B", siiau_id="202520"),
+    ]
+    materia = Materia(name="Cálculo", creditos=8, clave="I5247")
+    profesor = Profesor(name="Pérez")
+    session.add_all([centro, materia, profesor, *calendarios])
+    session.flush()
+    edificio = Edificio(name="DEDX", centro_id=centro.id)
+    session.add(edificio)
+    session.flush()
+    aula = Aula(name="A001", edificio_id=edificio.id)
+    session.add(aula)
+    session.flush()
+
+    for i in range(30):
+        seccion = Seccion(
+            name=f"D{i:02d}",
+            nrc=f"{100000 + i}",
+            cupos=40,
+            cupos_disponibles=i,
+            centro_id=centro.id,
+            materia_id=materia.id,
+            profesor_id=profesor.id if i < 20 else None,
+            calendario_id=calendarios[i % 2].id,
+        )
+        session.add(seccion)
+        session.flush()
+        for dia in (1, 3):
+            session.add(
+                Clase(
+                    sesion=1,
+                    hora_inicio=time(7, 0),
+                    hora_fin=time(8, 55),
+                    dia=dia,
+                    seccion_id=seccion.id,
+                    aula_id=aula.id if i % 2 else None,
+                )
+            )
+    session.commit()
+    return {"calendario_id": calendarios[1].id, "centro_id": centro.id}
+
+
+@pytest.mark.unit
+class TestExports:
+    """Test export endpoints of the catalog"""
+
+    def test_ndjson_export_applies_filters(self, client: TestClient, offer: dict):
+        """Test NDJSON rows honour the list filters"""
+        response = client.get(
+            "/api/v1/secciones/export",
+            params={"calendario_id": offer["calendario_id"]},
+            headers={"Accept-Encoding": "identity"},
+        )
+
+        rows = [json.loads(line) for line in response.text.splitlines()]
+
+        assert response.status_code == 200
+        assert response.headers["content-type"] == "application/x-ndjson"
+        assert len(rows) == 15
+        assert all(row["calendario_id"] == offer["calendario_id"] for row in rows)
+
+    def test_csv_export_with_column_selection(self, client: TestClient, offer: dict):
+        """Test CSV output only carries the selected columns"""
+        response = client.get(
+            "/api/v1/clases/export",
+            params={
+                "format": "csv",
+                "columns": "id,dia,hora_inicio",
+                "calendario_id": offer["calendario_id"],
+            },
+        )
+
+        rows = list(csv.reader(io.StringIO(response.text)))
+
+        assert rows[0] == ["id", "dia", "hora_inicio"]
+        assert len(rows) == 31
+        assert rows[1][2] == "07:00:00"
+
+    def test_gzip_export(self, client: TestClient, offer: dict):
+        """Test the stream is gzip compressed when accepted"""
+        response = client.get(
+            "/api/v1/aulas/export",
+            params={"calendario_id": offer["calendario_id"]},
+            headers={"Accept-Encoding": "gzip"},
+        )
+
+        assert response.headers["content-encoding"] == "gzip"
+        assert json.loads(response.text)["name"] == "A001"
+
+    def test_profesores_of_calendario(self, client: TestClient, offer: dict):
+        """Test profesores are filtered through their secciones"""
+        response = client.get(
+            "/api/v1/profesores/export",
+            params={"calendario_id": offer["calendario_id"], "columns": "name"},
+        )
+
+        assert response.text == '{"name":"Pérez"}\n'
+
+    def test_conditional_request(self, client: TestClient, offer: dict):
+        """Test exports, never cached, are sent whatever If-None-Match says"""
+        first = client.get("/api/v1/profesores/export")
+        second = client.get("/api/v1/profesores/export", headers={"If-None-Match": "*"})
+
+        assert first.status_code == second.status_code == 200
+        assert second.text == '{"id":1,"name":"Pérez"}\n'
+
+    def test_unknown_column(self, client: TestClient, offer: dict):
+        """Test unknown columns are rejected"""
+        response = client.get("/api/v1/secciones/export", params={"columns": "nope"})
+
+        assert response.status_code == 400
@@ -0,0 +1,126 @@
+"""
+Unit tests for direct ORM row serialization
+"""
+
+from datetime import datetime, time
+
+import pytest
+from fastapi.testclient import TestClient
+from pydantic import TypeAdapter
+from pydantic_core import to_json
+from sqlmodel import Session, select
+
+from app.api.responses import row_builder
+from app.api.schemas import Pagination
+from app.modules.aula.models import Aula
+from app.modules.aula.schemas import AulaRead
+from app.modules.calendario.models import Calendario
+from app.modules.calendario.schemas import CalendarioRead
+from app.modules.centro.models import CentroUniversitario
+from app.modules.centro.schemas import CentroUniversitarioRead
+from app.modules.clase.models import Clase
+from app.modules.clase.schemas import ClaseRead
+from app.modules.edificio.models import Edificio
+from app.modules.edificio.schemas import EdificioRead
+from app.modules.materia.models import Materia
+from app.modules.materia.schemas import MateriaRead
+from app.modules.profesor.models import Profesor
+from app.modules.profesor.schemas import ProfesorRead
+from app.modules.seccion.models import Seccion
+from app.modules.seccion.schemas import SeccionRead
+
+
+@pytest.fixture(name="catalog")
+def catalog_fixture(session: Session) -> Session:
+    """Create a small catalog with more than ten secciones per parent"""
+    centro = CentroUniversitario(name="CUCEI", siiau_id="D")
+    calendario = Calendario(name="2025 B", siiau_id="202520")
+    materia = Materia(name="Cálculo", creditos=8, clave="I5247")
+    profesor = Profesor(name="Ñoño Pérez")
+    session.add_all([centro, calendario, materia, profesor])
+    session.flush()
+
+    edificio = Edificio(name="DEDX", centro_id=centro.id)
+    session.add(edificio)
+    session.flush()
+    aula = Aula(name="A001", edificio_id=edificio.id)
+    session.add(aula)
+    session.flush()
+
+    for i in range(12):
+        seccion = Seccion(
+            name=f"D{i:02d}",
+            nrc=f"{100000 + i}",
+            cupos=40,
+            cupos_disponibles=i,
+            periodo_inicio=datetime(2025, 8, 18),
+            periodo_fin=None if i % 2 else datetime(2025, 12, 12, 23, 59, 1),
+            centro_id=centro.id,
+            materia_id=materia.id,
+            profesor_id=profesor.id if i % 3 else None,
+            calendario_id=calendario.id,
+        )
+        session.add(seccion)
+        session.flush()
+        session.add(
+            Clase(
+                sesion=1,
+                hora_inicio=time(7, 0),
+                hora_fin=time(8, 55, 30),
+                dia=i % 6 + 1,
+                seccion_id=seccion.id,
+                aula_id=aula.id if i % 4 else None,
+            )
+        )
+    session.commit()
+    return session
+
+
+@pytest.mark.unit
+class TestRowBuilder:
+    """Test the row builders reproduce the response_model serialization"""
+
+    @pytest.mark.parametrize(
+        "model,schema",
+        [
+            (Seccion, SeccionRead),
+            (Clase, ClaseRead),
+            (Materia, MateriaRead),
+            (Profesor, ProfesorRead),
+            (Calendario, CalendarioRead),
+            (CentroUniversitario, CentroUniversitarioRead),
+            (Edificio, EdificioRead),
+            (Aula, AulaRead),
+        ],
+    )
+    def test_same_json_as_pydantic(self, catalog: Session, model, schema):
+        """Test every read schema dumps byte for byte the same JSON"""
+        adapter = TypeAdapter(schema)
+        for row in catalog.exec(select(model)).all():
+            expected = adapter.dump_json(
+                adapter.validate_python(row, from_attributes=True)
+            )
+            assert to_json(row_builder(schema)(row)) == expected
+
+    def test_before_validators_are_applied(self, catalog: Session):
+        """Test list limiting validators still cut nested lists to ten items"""
+        materia = catalog.exec(select(Materia)).first()
+
+        assert len(row_builder(MateriaRead)(materia)["secciones"]) == 10
+
+    def test_list_endpoint_matches_pagination(
+        self, client: TestClient, catalog: Session
+    ):
+        """Test the list endpoint body equals the Pagination dump"""
+        rows = catalog.exec(select(Seccion).limit(100)).all()
+        adapter = TypeAdapter(Pagination[SeccionRead])
+        expected = adapter.dump_json(
+            adapter.validate_python(
+                {"total": len(rows), "results": rows}, from_attributes=True
+            )
+        )
+
+        response = client.get("/api/v1/secciones/")
+
+        assert response.status_code == 200
+        assert response.content == expected
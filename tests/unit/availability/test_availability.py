@@ -0,0 +1,239 @@
+"""
+Unit tests for the room availability index
+"""
+
+from datetime import time
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlmodel import Session
+
+from app.core.cache import response_cache
+from app.modules.aula.models import Aula
+from app.modules.availability.services.availability_index import (
+    availability_index, free_windows)
+from app.modules.calendario.models import Calendario
+from app.modules.centro.models import CentroUniversitario
+from app.modules.clase.models import Clase
+from app.modules.edificio.models import Edificio
+from app.modules.materia.models import Materia
+from app.modules.seccion.models import Seccion
+
+
+@pytest.fixture(autouse=True)
+def reset_index():
+    """Start every test with an empty index"""
+    availability_index.reset()
+    yield
+    availability_index.reset()
+
+
+@pytest.fixture(name="campus")
+def campus_fixture(session: Session) -> dict:
+    """Two aulas of one edificio, one of them busy on lunes 07:00-08:55 and 11:00-12:55"""
+    centro = CentroUniversitario(name="CUCEI", siiau_id="D")
+    calendario = Calendario(name="2025 B", siiau_id="202520")
+    materia = Materia(name="Cálculo", creditos=8, clave="I5247")
+    session.add_all([centro, calendario, materia])
+    session.flush()
+    edificio = Edificio(name="DEDX", centro_id=centro.id)
+    session.add(edificio)
+    session.flush()
+    aulas = [
+        Aula(name="A001", edificio_id=edificio.id),
+        Aula(name="A002", edificio_id=edificio.id),
+    ]
+    session.add_all(aulas)
+    session.flush()
+    seccion = Seccion(
+        name="D01",
+        nrc="100001",
+        cupos=40,
+        cupos_disponibles=10,
+        centro_id=centro.id,
+        materia_id=materia.id,
+        calendario_id=calendario.id,
+    )
+    session.add(seccion)
+    session.flush()
+    for inicio, fin in ((time(7, 0), time(8, 55)), (time(11, 0), time(12, 55))):
+        session.add(
+            Clase(
+                sesion=1,
+                hora_inicio=inicio,
+                hora_fin=fin,
+                dia=1,
+                seccion_id=seccion.id,
+                aula_id=aulas[0].id,
+            )
+        )
+    session.commit()
+    return {
+        "calendario_id": calendario.id,
+        "edificio_id": edificio.id,
+        "seccion_id": seccion.id,
+        "aulas": [aula.id for aula in aulas],
+    }
+
+
+@pytest.mark.unit
+class TestFreeWindows:
+    """Test gap computation over sorted busy intervals"""
+
+    def test_gaps_between_intervals(self):
+        """Test gaps are clipped to the range and overlapping intervals merge"""
+        intervals = [(420, 535, 1), (500, 600, 2), (660, 775, 3)]
+
+        assert list(free_windows(intervals, 400, 800)) == [
+            (400, 420),
+            (600, 660),
+            (775, 800),
+        ]
+
+    def test_fully_busy_range(self):
+        """Test a range covered by intervals has no gaps"""
+        assert list(free_windows([(420, 600, 1)], 450, 550)) == []
+
+    def test_empty_aula(self):
+        """Test an aula without clases is free for the whole range"""
+        assert list(free_windows([], 420, 1260)) == [(420, 1260)]
+
+
+@pytest.mark.unit
+class TestAvailabilityEndpoints:
+    """Test free aula and free window queries"""
+
+    def test_free_aulas(self, client: TestClient, campus: dict):
+        """Test only aulas free for the whole range are listed"""
+        response = client.get(
+            "/api/v1/availability/aulas",
+            params={
+                "calendario_id": campus["calendario_id"],
+                "dia": 1,
+                "hora_inicio": "08:00",
+                "hora_fin": "10:00",
+            },
+        )
+
+        assert response.status_code == 200
+        assert [free["aula"] for free in response.json()] == ["A002"]
+
+    def test_free_aulas_with_duracion(self, client: TestClient, campus: dict):
+        """Test aulas with a long enough window inside the range are listed"""
+        response = client.get(
+            "/api/v1/availability/aulas",
+            params={
+                "calendario_id": campus["calendario_id"],
+                "edificio_id": campus["edificio_id"],
+                "dia": 1,
+                "hora_inicio": "08:00",
+                "hora_fin": "12:00",
+                "duracion": 120,
+            },
+        )
+
+        data = response.json()
+        assert [free["aula"] for free in data] == ["A001", "A002"]
+        assert data[0]["ventanas"] == [
+            {"hora_inicio": "08:55:00", "hora_fin": "11:00:00"}
+        ]
+
+    def test_aula_windows(self, client: TestClient, campus: dict):
+        """Test free windows of one aula for a dia"""
+        response = client.get(
+            f"/api/v1/availability/aulas/{campus['aulas'][0]}",
+            params={"calendario_id": campus["calendario_id"], "dia": 1},
+        )
+
+        assert response.status_code == 200
+        assert response.json() == [
+            {
+                "dia": 1,
+                "ventanas": [
+                    {"hora_inicio": "08:55:00", "hora_fin": "11:00:00"},
+                    {"hora_inicio": "12:55:00", "hora_fin": "21:00:00"},
+                ],
+            }
+        ]
+
+    def test_invalid_range(self, client: TestClient, campus: dict):
+        """Test an empty time range is rejected"""
+        response = client.get(
+            "/api/v1/availability/aulas",
+            params={
+                "calendario_id": campus["calendario_id"],
+                "dia": 1,
+                "hora_inicio": "10:00",
+                "hora_fin": "09:00",
+            },
+        )
+
+        assert response.status_code == 400
+
+    def test_unknown_aula(self, client: TestClient, campus: dict):
+        """Test windows of a missing aula return 404"""
+        response = client.get(
+            "/api/v1/availability/aulas/999",
+            params={"calendario_id": campus["calendario_id"]},
+        )
+
+        assert response.status_code == 404
+
+
+@pytest.mark.unit
+class TestIncrementalUpdates:
+    """Test the index follows committed clase writes"""
+
+    def params(self, campus: dict) -> dict:
+        return {
+            "calendario_id": campus["calendario_id"],
+            "dia": 1,
+            "hora_inicio": "15:00",
+            "hora_fin": "16:00",
+        }
+
+    def test_clase_writes_update_index(
+        self, client: TestClient, session: Session, campus: dict
+    ):
+        """Test created, moved and deleted clases are applied without a reload"""
+        url = "/api/v1/availability/aulas"
+        assert len(client.get(url, params=self.params(campus)).json()) == 2
+        loaded = availability_index._calendarios[campus["calendario_id"]]
+
+        clase = Clase(
+            sesion=2,
+            hora_inicio=time(15, 0),
+            hora_fin=time(16, 55),
+            dia=1,
+            seccion_id=campus["seccion_id"],
+            aula_id=campus["aulas"][1],
+        )
+        session.add(clase)
+        session.commit()
+        assert [
+            a["aula"] for a in client.get(url, params=self.params(campus)).json()
+        ] == ["A001"]
+
+        clase.aula_id = campus["aulas"][0]
+        session.add(clase)
+        session.commit()
+        assert [
+            a["aula"] for a in client.get(url, params=self.params(campus)).json()
+        ] == ["A002"]
+
+        session.delete(clase)
+        session.commit()
+        assert len(client.get(url, params=self.params(campus)).json()) == 2
+
+        assert availability_index._calendarios[campus["calendario_id"]] is loaded
+
+    def test_foreign_writes_trigger_reload(self, client: TestClient, campus: dict):
+        """Test a version bump not seen by this process reloads the index"""
+        url = "/api/v1/availability/aulas"
+        client.get(url, params=self.params(campus))
+        loaded = availability_index._calendarios[campus["calendario_id"]]
+
+        response_cache.versions.bump(["clase"])
+        client.get(url, params=self.params(campus))
+
+        assert availability_index._calendarios[campus["calendario_id"]] is not loaded
@@ -0,0 +1,229 @@
+"""
+Unit tests for the change log and the change feed
+"""
+
+from datetime import datetime, time, timedelta
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlmodel import Session, select
+
+from app.core.events import deferred
+from app.modules.calendario.models import Calendario
+from app.modules.centro.models import CentroUniversitario
+from app.modules.changes.models import ChangeCounter, ChangeLog
+from app.modules.changes.models.change_sync import prune
+from app.modules.clase.models import Clase
+from app.modules.materia.models import Materia
+from app.modules.seccion.models import Seccion
+from app.modules.seccion.repositories.seccion_repository import \
+    SeccionRepository
+
+URL = "/api/v1/changes/"
+
+
+@pytest.fixture(name="catalog")
+def catalog_fixture(session: Session) -> dict:
+    """A materia and secciones D01 (2025 A, with a clase) and D02 (2025 B)"""
+    centro = CentroUniversitario(name="CUCEI", siiau_id="D")
+    a = Calendario(name="2025 A", siiau_id="202510")
+    b = Calendario(name="2025 B", siiau_id="202520")
+    materia = Materia(name="Cálculo", creditos=8, clave="I5247")
+    session.add_all([centro, a, b, materia])
+    session.flush()
+    ids = {"centro": centro.id, "a": a.id, "b": b.id, "materia": materia.id}
+    for name, nrc, calendario in (("D01", "100001", a), ("D02", "100002", b)):
+        seccion = Seccion(
+            name=name,
+            nrc=nrc,
+            cupos=40,
+            cupos_disponibles=10,
+            centro_id=centro.id,
+            materia_id=materia.id,
+            calendario_id=calendario.id,
+        )
+        session.add(seccion)
+        session.flush()
+        ids[name] = seccion.id
+    clase = Clase(
+        dia=1, hora_inicio=time(7), hora_fin=time(8, 55), seccion_id=ids["D01"]
+    )
+    session.add(clase)
+    session.commit()
+    ids["clase"] = clase.id
+    return ids
+
+
+def latest_version(session: Session) -> int:
+    return max(session.exec(select(ChangeLog.version)))
+
+
+def by_table(feed: dict) -> dict[str, dict]:
+    return {change_set["table"]: change_set for change_set in feed["changes"]}
+
+
+@pytest.mark.unit
+class TestChangeLog:
+    """Test writes are appended to the change log"""
+
+    def test_logs_writes_with_calendario(self, session: Session, catalog: dict):
+        """Test secciones and clases carry their calendario, materias none"""
+        entries = {
+            (entry.table_name, entry.record_id): (entry.op, entry.calendario_id)
+            for entry in session.exec(select(ChangeLog))
+        }
+
+        assert entries == {
+            ("materia", catalog["materia"]): ("create", None),
+            ("seccion", catalog["D01"]): ("create", catalog["a"]),
+            ("seccion", catalog["D02"]): ("create", catalog["b"]),
+            ("clase", catalog["clase"]): ("create", catalog["a"]),
+        }
+
+    def test_rolled_back_writes_are_not_logged(self, session: Session, catalog: dict):
+        """Test the log commits or rolls back with the writes"""
+        version = latest_version(session)
+        seccion = session.get(Seccion, catalog["D01"])
+        seccion.name = "D01A"
+        session.flush()
+        session.rollback()
+
+        assert latest_version(session) == version
+
+    def test_bulk_cupos_sync_logs_ids(self, session: Session, catalog: dict):
+        """Test the batched cupos update logs every changed seccion"""
+        version = latest_version(session)
+
+        SeccionRepository(session).update_cupos(
+            catalog["a"], catalog["centro"], {"100001": (40, 9)}
+        )
+        entries = list(
+            session.exec(select(ChangeLog).where(ChangeLog.version > version))
+        )
+
+        assert [(e.table_name, e.record_id, e.calendario_id) for e in entries] == [
+            ("seccion", catalog["D01"], catalog["a"])
+        ]
+
+    def test_versions_follow_commits(self, session: Session, catalog: dict):
+        """Test each commit takes the versions right after the last one"""
+        version = latest_version(session)
+        seccion = session.get(Seccion, catalog["D01"])
+        seccion.name = "D01A"
+        session.get(Seccion, catalog["D02"]).name = "D02A"
+        session.commit()
+        prune(session, datetime.now() + timedelta(days=1))
+        session.commit()
+        seccion.name = "D01B"
+        session.commit()
+
+        assert list(session.exec(select(ChangeLog.version))) == [
+            version + 2,
+            version + 3,
+        ]
+        assert session.exec(select(ChangeCounter.version)).one() == version + 3
+
+    def test_deferred_commits(self, session: Session, catalog: dict):
+        """Test deferred commits are logged together when the block ends"""
+        version = latest_version(session)
+        with deferred(session):
+            seccion = session.get(Seccion, catalog["D01"])
+            seccion.name = "D01A"
+            session.commit()
+            seccion.name = "D01B"
+            session.commit()
+            session.get(Seccion, catalog["D02"]).name = "D02A"
+            session.flush()
+            session.rollback()
+            assert latest_version(session) == version
+
+        entries = session.exec(select(ChangeLog).where(ChangeLog.version > version))
+        assert [(e.version, e.table_name, e.record_id, e.op) for e in entries] == [
+            (version + 1, "seccion", catalog["D01"], "update")
+        ]
+
+    def test_prune_keeps_newest(self, session: Session, catalog: dict):
+        """Test pruning always leaves the newest entry"""
+        version = latest_version(session)
+
+        prune(session, datetime.now() + timedelta(days=1))
+        session.commit()
+
+        assert list(session.exec(select(ChangeLog.version))) == [version]
+
+
+@pytest.mark.unit
+class TestChangeFeed:
+    """Test the changes endpoint"""
+
+    def test_compacts_per_row(
+        self, client: TestClient, session: Session, catalog: dict
+    ):
+        """Test several writes of a row collapse into its last operation"""
+        version = latest_version(session)
+        seccion = session.get(Seccion, catalog["D01"])
+        seccion.cupos_disponibles = 9
+        session.commit()
+        seccion.cupos_disponibles = 8
+        session.commit()
+        session.delete(session.get(Seccion, catalog["D02"]))
+        session.commit()
+
+        feed = client.get(URL, params={"since": version}).json()
+
+        assert feed["since"] == version
+        assert feed["version"] == latest_version(session)
+        assert feed["more"] is False
+        assert feed["changes"] == [
+            {
+                "table": "seccion",
+                "upserted": [catalog["D01"]],
+                "deleted": [catalog["D02"]],
+                "reload": False,
+                "rows": None,
+            }
+        ]
+
+    def test_filters_by_calendario(self, client: TestClient, catalog: dict):
+        """Test a calendario's feed skips other calendarios but keeps shared tables"""
+        feed = client.get(URL, params={"calendario_id": catalog["b"]}).json()
+
+        assert {
+            table: change_set["upserted"]
+            for table, change_set in by_table(feed).items()
+        } == {"materia": [catalog["materia"]], "seccion": [catalog["D02"]]}
+
+    def test_rows(self, client: TestClient, catalog: dict):
+        """Test rows=true returns the current rows of upserted ids"""
+        feed = client.get(
+            URL, params={"calendario_id": catalog["a"], "rows": True}
+        ).json()
+
+        rows = by_table(feed)["seccion"]["rows"]
+        assert [(row["id"], row["nrc"]) for row in rows] == [(catalog["D01"], "100001")]
+        assert by_table(feed)["clase"]["rows"][0]["hora_inicio"] == "07:00:00"
+
+    def test_pages(self, client: TestClient, session: Session, catalog: dict):
+        """Test limit pages through the log and version resumes the next page"""
+        first = client.get(URL, params={"limit": 2}).json()
+        second = client.get(URL, params={"since": first["version"]}).json()
+
+        assert first["more"] is True
+        assert sum(len(c["upserted"]) for c in first["changes"]) == 2
+        assert second["more"] is False
+        assert second["version"] == latest_version(session)
+        assert sum(len(c["upserted"]) for c in second["changes"]) == 2
+
+    def test_resync(self, client: TestClient, session: Session, catalog: dict):
+        """Test versions pruned from or ahead of the log return 410"""
+        version = latest_version(session)
+        seccion = session.get(Seccion, catalog["D01"])
+        seccion.name = "D01A"
+        session.commit()
+        prune(session, datetime.now() + timedelta(days=1))
+        session.commit()
+
+        assert client.get(URL, params={"since": version}).status_code == 200
+        assert client.get(URL, params={"since": version - 1}).status_code == 410
+        assert client.get(URL, params={"since": version + 5}).status_code == 410
+        assert client.get(f"{URL}version").json() == {"version": version + 1}
@@ -0,0 +1,124 @@
+"""
+Unit tests for the clase list filters
+"""
+
+from datetime import time
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlmodel import Session
+
+from app.modules.aula.models import Aula
+from app.modules.calendario.models import Calendario
+from app.modules.centro.models import CentroUniversitario
+from app.modules.clase.models import Clase
+from app.modules.edificio.models import Edificio
+from app.modules.materia.models import Materia
+from app.modules.seccion.models import Seccion
+
+
+@pytest.fixture(name="campus")
+def campus_fixture(session: Session) -> dict:
+    """
+    Clases of one seccion: DEDX/A001 lunes, martes and jueves 07:00-08:55,
+    DEDX/A002 martes 11:00-12:55 and DEDT/T001 jueves 09:00-10:55.
+    """
+    centro = CentroUniversitario(name="CUCEI", siiau_id="D")
+    calendario = Calendario(name="2025 B", siiau_id="202520")
+    materia = Materia(name="Cálculo", creditos=8, clave="I5247")
+    session.add_all([centro, calendario, materia])
+    session.flush()
+    dedx = Edificio(name="DEDX", centro_id=centro.id)
+    dedt = Edificio(name="DEDT", centro_id=centro.id)
+    session.add_all([dedx, dedt])
+    session.flush()
+    a001 = Aula(name="A001", edificio_id=dedx.id)
+    a002 = Aula(name="A002", edificio_id=dedx.id)
+    t001 = Aula(name="T001", edificio_id=dedt.id)
+    session.add_all([a001, a002, t001])
+    session.flush()
+    seccion = Seccion(
+        name="D01",
+        nrc="100001",
+        cupos=40,
+        cupos_disponibles=10,
+        centro_id=centro.id,
+        materia_id=materia.id,
+        calendario_id=calendario.id,
+    )
+    session.add(seccion)
+    session.flush()
+    for aula, dia, hora in (
+        (a001, 1, 7),
+        (a001, 2, 7),
+        (a001, 4, 7),
+        (a002, 2, 11),
+        (t001, 4, 9),
+    ):
+        session.add(
+            Clase(
+                dia=dia,
+                hora_inicio=time(hora, 0),
+                hora_fin=time(hora + 1, 55),
+                seccion_id=seccion.id,
+                aula_id=aula.id,
+            )
+        )
+    session.commit()
+    return {
+        "dedx": dedx.id,
+        "aulas": [a001.id, a002.id, t001.id],
+        "centro_id": centro.id,
+    }
+
+
+@pytest.mark.unit
+class TestClaseFilters:
+    """Test range, multi-value, edificio and search filters"""
+
+    url = "/api/v1/clases/"
+
+    def slots(self, client: TestClient, **params) -> list[tuple[int, str]]:
+        response = client.get(self.url, params=params)
+        assert response.status_code == 200
+        data = response.json()
+        assert data["total"] == len(data["results"])
+        return [(clase["dia"], clase["hora_inicio"]) for clase in data["results"]]
+
+    def test_room_search(self, client: TestClient, campus: dict):
+        """Test martes/jueves clases between 07:00 and 11:00 in DEDX"""
+        slots = self.slots(
+            client,
+            dia="2,4",
+            hora_desde="07:00",
+            hora_hasta="11:00",
+            edificio_id=campus["dedx"],
+        )
+
+        assert slots == [(2, "07:00:00"), (4, "07:00:00")]
+
+    def test_aula_list(self, client: TestClient, campus: dict):
+        """Test aula_id accepts several aulas"""
+        a001, a002, t001 = campus["aulas"]
+
+        assert len(self.slots(client, aula_id=f"{a002},{t001}")) == 2
+        assert len(self.slots(client, aula_id=a001)) == 3
+
+    def test_search(self, client: TestClient, campus: dict):
+        """Test search matches aula, edificio, NRC and materia"""
+        assert len(self.slots(client, search="DEDT")) == 1
+        assert len(self.slots(client, search="A00")) == 4
+        assert len(self.slots(client, search="I5247")) == 5
+        assert self.slots(client, search="nothing") == []
+
+    def test_centro_filter(self, client: TestClient, campus: dict):
+        """Test centro and hour filters combine"""
+        slots = self.slots(client, centro_id=campus["centro_id"], hora_desde="09:00")
+
+        assert slots == [(2, "11:00:00"), (4, "09:00:00")]
+
+    def test_invalid_list(self, client: TestClient, campus: dict):
+        """Test malformed dia lists return 400"""
+        response = client.get(self.url, params={"dia": "martes"})
+
+        assert response.status_code == 400
@@ -0,0 +1,211 @@
+"""
+Unit tests for schedule conflict detection
+"""
+
+from datetime import datetime, time
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlmodel import Session
+
+from app.api.dependencies.auth import user_is_staff
+from app.main import app
+from app.modules.aula.models import Aula
+from app.modules.calendario.models import Calendario
+from app.modules.centro.models import CentroUniversitario
+from app.modules.clase.models import Clase
+from app.modules.conflicto.services.conflicto_service import sweep
+from app.modules.edificio.models import Edificio
+from app.modules.materia.models import Materia
+from app.modules.profesor.models import Profesor
+from app.modules.seccion.models import Seccion
+from app.modules.snapshot.api.dependencies import get_snapshot_store
+from app.modules.snapshot.services.snapshot_service import SnapshotStore
+from app.modules.users.models import User
+
+
+@pytest.fixture(name="staff")
+def staff_fixture(client: TestClient, test_superuser: User, tmp_path) -> User:
+    """Authenticate staff only requests as the test superuser"""
+    app.dependency_overrides[user_is_staff] = lambda: test_superuser
+    app.dependency_overrides[get_snapshot_store] = lambda: SnapshotStore(tmp_path)
+    return test_superuser
+
+
+@pytest.fixture(name="schedule")
+def schedule_fixture(session: Session) -> dict:
+    """
+    Three secciones on lunes: two double-book aula A001 and share a profesor,
+    the third uses the same aula in a disjoint periodo.
+    """
+    centro = CentroUniversitario(name="CUCEI", siiau_id="D")
+    calendario = Calendario(name="2025 B", siiau_id="202520")
+    materia = Materia(name="Cálculo", creditos=8, clave="I5247")
+    profesor = Profesor(name="Pérez")
+    session.add_all([centro, calendario, materia, profesor])
+    session.flush()
+    edificio = Edificio(name="DEDX", centro_id=centro.id)
+    session.add(edificio)
+    session.flush()
+    aula = Aula(name="A001", edificio_id=edificio.id)
+    session.add(aula)
+    session.flush()
+
+    rows = [
+        ("100001", time(7, 0), time(8, 55), aula.id, profesor.id, 8),
+        ("100002", time(8, 0), time(9, 55), aula.id, profesor.id, 8),
+        ("100003", time(7, 0), time(8, 55), aula.id, None, 10),
+    ]
+    for nrc, inicio, fin, aula_id, profesor_id, mes in rows:
+        seccion = Seccion(
+            name="D01",
+            nrc=nrc,
+            cupos=40,
+            cupos_disponibles=10,
+            periodo_inicio=datetime(2025, mes, 1),
+            periodo_fin=datetime(2025, mes + 1, 15),
+            centro_id=centro.id,
+            materia_id=materia.id,
+            profesor_id=profesor_id,
+            calendario_id=calendario.id,
+        )
+        session.add(seccion)
+        session.flush()
+        session.add(
+            Clase(
+                sesion=1,
+                hora_inicio=inicio,
+                hora_fin=fin,
+                dia=1,
+                seccion_id=seccion.id,
+                aula_id=aula_id,
+            )
+        )
+    session.commit()
+    return {
+        "calendario_id": calendario.id,
+        "centro_id": centro.id,
+        "aula_id": aula.id,
+        "profesor_id": profesor.id,
+    }
+
+
+@pytest.mark.unit
+class TestSweep:
+    """Test the sweep-line pass over a group of clases"""
+
+    def clase(self, id: int, inicio: int, fin: int) -> tuple:
+        return (id, 1, time(inicio), time(fin), None, id, str(id), None, None, None)
+
+    def test_reports_every_overlapping_pair(self):
+        """Test nested and chained overlaps are all reported"""
+        clases = [
+            self.clase(1, 7, 12),
+            self.clase(2, 8, 9),
+            self.clase(3, 10, 11),
+            self.clase(4, 12, 13),
+        ]
+
+        pairs = {(a[0], b[0]) for a, b in sweep(clases)}
+
+        assert pairs == {(1, 2), (1, 3)}
+
+    def test_touching_intervals_do_not_overlap(self):
+        """Test a clase ending when the next starts is not a conflict"""
+        assert list(sweep([self.clase(1, 7, 9), self.clase(2, 9, 11)])) == []
+
+
+@pytest.mark.unit
+class TestConflictoEndpoints:
+    """Test conflict detection and persisted results"""
+
+    def test_detect_and_list(
+        self, client: TestClient, schedule: dict, staff: User, session: Session
+    ):
+        """Test aula and profesor conflicts are detected and stored"""
+        response = client.post(
+            "/api/v1/conflictos/detectar",
+            params={"calendario_id": schedule["calendario_id"]},
+        )
+
+        assert response.status_code == 200
+        assert response.json() == {
+            "calendario_id": schedule["calendario_id"],
+            "aulas": 1,
+            "profesores": 1,
+            "total": 2,
+        }
+
+        response = client.get(
+            "/api/v1/conflictos/",
+            params={"calendario_id": schedule["calendario_id"], "tipo": "aula"},
+        )
+        data = response.json()
+        assert data["total"] == 1
+        conflicto = data["results"][0]
+        assert (conflicto["nrc"], conflicto["otro_nrc"]) == ("100001", "100002")
+        assert conflicto["aula_id"] == schedule["aula_id"]
+        assert (conflicto["hora_inicio"], conflicto["hora_fin"]) == (
+            "08:00:00",
+            "08:55:00",
+        )
+
+    def test_results_are_replaced_on_detection(
+        self, client: TestClient, schedule: dict, staff: User, session: Session
+    ):
+        """Test a new detection replaces the stored conflictos"""
+        params = {"calendario_id": schedule["calendario_id"]}
+        client.post("/api/v1/conflictos/detectar", params=params)
+        client.post("/api/v1/conflictos/detectar", params=params)
+
+        response = client.get("/api/v1/conflictos/", params=params)
+
+        assert response.json()["total"] == 2
+
+    def test_list_requires_authentication(self, client: TestClient):
+        """Test anonymous clients cannot read conflictos"""
+        response = client.get("/api/v1/conflictos/")
+
+        assert response.status_code == 401
+
+    def test_unknown_calendario(self, client: TestClient, staff: User):
+        """Test detection for a missing calendario returns 404"""
+        response = client.post(
+            "/api/v1/conflictos/detectar", params={"calendario_id": 999}
+        )
+
+        assert response.status_code == 404
+
+    def test_post_import_stage(self, client: TestClient, schedule: dict, staff: User):
+        """Test imports can run conflict detection afterwards"""
+        response = client.post(
+            "/api/v1/tasks/importar-secciones-manual",
+            params={
+                "calendario_id": schedule["calendario_id"],
+                "centro_id": schedule["centro_id"],
+                "full_update": True,
+                "detect_conflicts": True,
+            },
+            json=[
+                {
+                    "NRC": "100004",
+                    "Clave": "I5247",
+                    "Materia": "Cálculo",
+                    "Sec": "D02",
+                    "CR": 8,
+                    "CUP": 40,
+                    "DIS": 5,
+                    "Profesor": "Pérez",
+                    "SesionNum": "1",
+                    "Horas": "0900-0955",
+                    "Dias": "L . . . . .",
+                    "Edificio": "DEDY",
+                    "Aula": "B001",
+                    "Periodo": "01/08/25 - 15/09/25",
+                }
+            ],
+        )
+
+        assert response.status_code == 200
+        # The new seccion overlaps 100002 for the same profesor
+        assert response.json()["conflictos"] == 3
@@ -0,0 +1,158 @@
+"""
+Unit tests for the versioned response cache
+"""
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlmodel import Session
+
+from app.core.cache import (DataVersions, LocalCacheClient, MemoryCacheBackend,
+                            ResponseCache, SharedCacheBackend, response_cache)
+from app.modules.centro.models import CentroUniversitario
+
+
+@pytest.mark.unit
+class TestMemoryCacheBackend:
+    """Test the in-process LRU backend"""
+
+    def test_evicts_least_recently_used_entry(self):
+        """Test entries over the count limit are evicted in LRU order"""
+        backend = MemoryCacheBackend(max_entries=2)
+        backend.set("a", b"1")
+        backend.set("b", b"2")
+        backend.get("a")
+        backend.set("c", b"3")
+
+        assert backend.get("a") == b"1"
+        assert backend.get("b") is None
+        assert backend.get("c") == b"3"
+
+    def test_evicts_to_stay_under_memory_limit(self):
+        """Test the total stored size never exceeds max_bytes"""
+        backend = MemoryCacheBackend(max_bytes=10)
+        backend.set("a", b"12345")
+        backend.set("b", b"12345")
+        backend.set("c", b"123")
+
+        assert backend.get("a") is None
+        assert backend.usage() == {"entries": 2, "bytes": 8}
+
+    def test_oversized_value_is_not_stored(self):
+        """Test a value larger than the whole cache is skipped"""
+        backend = MemoryCacheBackend(max_bytes=4)
+        backend.set("a", b"12345")
+
+        assert backend.get("a") is None
+
+
+@pytest.mark.unit
+class TestResponseCache:
+    """Test keys, versions and counters of the response cache"""
+
+    @pytest.fixture(params=["memory", "shared"])
+    def cache(self, request) -> ResponseCache:
+        if request.param == "memory":
+            return ResponseCache(MemoryCacheBackend())
+        return ResponseCache(SharedCacheBackend(LocalCacheClient()))
+
+    def test_query_params_are_normalized(self, cache: ResponseCache):
+        """Test parameter order does not change the cache key"""
+        first = cache.key("/api/secciones/", [("a", "1"), ("b", "2")], ["seccion"])
+        second = cache.key("/api/secciones/", [("b", "2"), ("a", "1")], ["seccion"])
+
+        assert first == second
+
+    def test_bump_invalidates_only_dependent_keys(self, cache: ResponseCache):
+        """Test a version bump changes keys of routes reading that table only"""
+        secciones = cache.key("/api/secciones/", [], ["seccion", "materia"])
+        aulas = cache.key("/api/aulas/", [], ["aula"])
+
+        cache.versions.bump(["materia"])
+
+        assert cache.key("/api/secciones/", [], ["seccion", "materia"]) != secciones
+        assert cache.key("/api/aulas/", [], ["aula"]) == aulas
+
+    def test_hit_and_miss_counters(self, cache: ResponseCache):
+        """Test hits and misses are counted"""
+        key = cache.key("/api/aulas/", [], ["aula"])
+
+        assert cache.get(key) is None
+        cache.set(key, "application/json", b"{}")
+        cached = cache.get(key)
+
+        assert cached.body == b"{}"
+        assert cached.content_type == "application/json"
+        assert cache.stats()["hits"] == 1
+        assert cache.stats()["misses"] == 1
+
+    def test_epoch_changes_after_clear(self):
+        """Test lost counters never reproduce an earlier version stamp"""
+        versions = DataVersions(MemoryCacheBackend())
+        before = versions.stamp(["aula"])
+        versions.backend.clear()
+
+        assert versions.stamp(["aula"]) != before
+
+
+@pytest.mark.unit
+class TestCachedRoutes:
+    """Test cached GET endpoints are invalidated by committed writes"""
+
+    def test_write_invalidates_cached_list(self, client: TestClient, session: Session):
+        """Test a committed write is visible on the next request"""
+        session.add(CentroUniversitario(name="CUCEI", siiau_id="D"))
+        session.commit()
+
+        first = client.get("/api/v1/centros/")
+        second = client.get("/api/v1/centros/")
+
+        assert first.headers["x-cache"] == "MISS"
+        assert second.headers["x-cache"] == "HIT"
+        assert second.json() == first.json()
+
+        session.add(CentroUniversitario(name="CUCEA", siiau_id="A"))
+        session.commit()
+
+        third = client.get("/api/v1/centros/")
+
+        assert third.headers["x-cache"] == "MISS"
+        assert third.json()["total"] == 2
+
+    def test_rolled_back_write_keeps_cache(self, client: TestClient, session: Session):
+        """Test flushed but rolled back writes do not bump versions"""
+        client.get("/api/v1/centros/")
+        session.add(CentroUniversitario(name="CUCEI", siiau_id="D"))
+        session.flush()
+        session.rollback()
+
+        assert client.get("/api/v1/centros/").headers["x-cache"] == "HIT"
+
+    def test_matching_etag_returns_not_modified(
+        self, client: TestClient, session: Session
+    ):
+        """Test If-None-Match with the current ETag is answered with 304"""
+        session.add(CentroUniversitario(name="CUCEI", siiau_id="D"))
+        session.commit()
+
+        first = client.get("/api/v1/centros/")
+        second = client.get(
+            "/api/v1/centros/", headers={"If-None-Match": first.headers["etag"]}
+        )
+
+        assert second.status_code == 304
+        assert second.content == b""
+        assert second.headers["etag"] == first.headers["etag"]
+        assert second.headers["cache-control"] == "no-cache"
+        assert response_cache.stats()["bytes_saved"] == len(first.content)
+
+    def test_etag_changes_after_write(self, client: TestClient, session: Session):
+        """Test a stale ETag gets the new body instead of 304"""
+        etag = client.get("/api/v1/centros/").headers["etag"]
+        session.add(CentroUniversitario(name="CUCEI", siiau_id="D"))
+        session.commit()
+
+        response = client.get("/api/v1/centros/", headers={"If-None-Match": etag})
+
+        assert response.status_code == 200
+        assert response.headers["etag"] != etag
+        assert response.json()["total"] == 1
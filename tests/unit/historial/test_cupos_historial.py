@@ -0,0 +1,237 @@
+"""
+Unit tests for the cupos history
+"""
+
+from datetime import datetime, timedelta
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlmodel import Session, func, select
+
+from app.api.dependencies.auth import user_is_staff
+from app.core.events import deferred
+from app.main import app
+from app.modules.calendario.models import Calendario
+from app.modules.centro.models import CentroUniversitario
+from app.modules.historial.encoding import decode, encode, thin
+from app.modules.historial.models import CuposRegistro, CuposTramo
+from app.modules.historial.models.cupos_sync import record_cupos
+from app.modules.historial.repositories.cupos_repository import CuposRepository
+from app.modules.historial.services.cupos_service import CuposService
+from app.modules.materia.models import Materia
+from app.modules.seccion.models import Seccion
+
+START = datetime(2025, 8, 1, 9, 0)
+
+
+@pytest.fixture(name="secciones")
+def secciones_fixture(session: Session) -> dict:
+    """Secciones D01 (NRC 100001, 10 disponibles) and D02 (100002, 30) of a materia"""
+    centro = CentroUniversitario(name="CUCEI", siiau_id="D")
+    calendario = Calendario(name="2025 B", siiau_id="202520")
+    materia = Materia(name="Cálculo", creditos=8, clave="I5247")
+    session.add_all([centro, calendario, materia])
+    session.flush()
+    ids = {"materia": materia.id, "calendario": calendario.id}
+    for name, nrc, disponibles in (("D01", "100001", 10), ("D02", "100002", 30)):
+        seccion = Seccion(
+            name=name,
+            nrc=nrc,
+            cupos=40,
+            cupos_disponibles=disponibles,
+            centro_id=centro.id,
+            materia_id=materia.id,
+            calendario_id=calendario.id,
+        )
+        session.add(seccion)
+        session.flush()
+        ids[name] = seccion.id
+    session.commit()
+    return ids
+
+
+def registros(session: Session) -> list[tuple[int, int]]:
+    return [
+        (registro.seccion_id, registro.cupos_disponibles)
+        for registro in session.exec(select(CuposRegistro).order_by(CuposRegistro.id))
+    ]
+
+
+def backdate(session: Session, at: datetime) -> None:
+    """Move every raw sample to ``at``, a minute apart in insertion order"""
+    for i, registro in enumerate(session.exec(select(CuposRegistro))):
+        registro.registrado_at = at + timedelta(minutes=i)
+    session.commit()
+
+
+@pytest.mark.unit
+class TestEncoding:
+    """Test the delta encoding of runs"""
+
+    def test_round_trip(self):
+        """Test runs decode to the samples they encode"""
+        samples = [
+            (START, 40),
+            (START + timedelta(seconds=60), 38),
+            (START + timedelta(seconds=90), 41),
+            (START + timedelta(days=3), 0),
+        ]
+
+        deltas = encode(samples)
+
+        assert decode(START, 40, deltas) == samples
+        assert len(deltas) == 8
+
+    def test_thin(self):
+        """Test thinning keeps the last sample per window and drops repeats"""
+        samples = [
+            (START, 40),
+            (START + timedelta(seconds=10), 39),
+            (START + timedelta(seconds=50), 38),
+            (START + timedelta(seconds=70), 38),
+            (START + timedelta(seconds=130, microseconds=5), 37),
+        ]
+
+        assert thin(samples, 60) == [
+            (START + timedelta(seconds=50), 38),
+            (START + timedelta(seconds=130), 37),
+        ]
+
+
+@pytest.mark.unit
+class TestCuposRecording:
+    """Test samples are recorded on change only"""
+
+    def test_records_changes(self, session: Session, secciones: dict):
+        """Test new secciones and changed cupos_disponibles are recorded"""
+        seccion = session.get(Seccion, secciones["D01"])
+        seccion.cupos_disponibles = 10
+        seccion.name = "D01A"
+        session.commit()
+        seccion.cupos_disponibles = 9
+        session.commit()
+
+        assert registros(session) == [
+            (secciones["D01"], 10),
+            (secciones["D02"], 30),
+            (secciones["D01"], 9),
+        ]
+
+    def test_deferred_samples(self, session: Session, secciones: dict):
+        """Test deferred commits record their samples when the block ends"""
+        with deferred(session):
+            seccion = session.get(Seccion, secciones["D01"])
+            seccion.cupos_disponibles = 9
+            session.commit()
+            seccion.cupos_disponibles = 8
+            session.flush()
+            session.rollback()
+            assert len(registros(session)) == 2
+
+        assert registros(session) == [
+            (secciones["D01"], 10),
+            (secciones["D02"], 30),
+            (secciones["D01"], 9),
+        ]
+
+    def test_compaction(self, session: Session, secciones: dict):
+        """Test old samples become one delta-encoded run per seccion"""
+        seccion = session.get(Seccion, secciones["D01"])
+        for value in (9, 8, 7):
+            seccion.cupos_disponibles = value
+            session.commit()
+        backdate(session, START)
+        record_cupos(session, [(secciones["D01"], 6)], at=START + timedelta(days=30))
+        session.commit()
+        service = CuposService(CuposRepository(session))
+
+        result = service.compact(now=START + timedelta(days=30))
+        tramos = list(session.exec(select(CuposTramo).order_by(CuposTramo.seccion_id)))
+
+        assert result.model_dump() == {
+            "secciones": 2,
+            "registros": 5,
+            "tramos": 2,
+            "muestras": 5,
+        }
+        assert registros(session) == [(secciones["D01"], 6)]
+        assert [(t.seccion_id, t.muestras, t.valor_inicial) for t in tramos] == [
+            (secciones["D01"], 4, 10),
+            (secciones["D02"], 1, 30),
+        ]
+        assert [value for _, value in decode(START, 10, tramos[0].deltas)] == [
+            10,
+            9,
+            8,
+            7,
+        ]
+        assert service.compact(now=START + timedelta(days=30)).registros == 0
+        assert session.exec(select(func.count()).select_from(CuposTramo)).one() == 2
+
+
+@pytest.mark.unit
+class TestCuposEndpoints:
+    """Test the cupos history endpoints"""
+
+    url = "/api/v1/historial/cupos"
+
+    @pytest.fixture(autouse=True)
+    def staff(self, test_superuser):
+        app.dependency_overrides[user_is_staff] = lambda: test_superuser
+
+    def test_series(self, client: TestClient, session: Session, secciones: dict):
+        """Test series are downsampled and summed over the materia's secciones"""
+        backdate(session, START)
+        record_cupos(session, [(secciones["D01"], 4)], at=START + timedelta(minutes=2))
+        session.commit()
+        client.post(f"{self.url}/compactar")
+
+        nrc = client.get(self.url, params={"nrc": "100001", "puntos": 3}).json()
+        materia = client.get(
+            self.url,
+            params={
+                "materia_id": secciones["materia"],
+                "desde": (START - timedelta(minutes=1)).isoformat(),
+                "hasta": (START + timedelta(minutes=2)).isoformat(),
+                "puntos": 4,
+            },
+        ).json()
+
+        assert [p["cupos_disponibles"] for p in nrc["puntos"]] == [10, 10, 4]
+        assert nrc["secciones"] == 1
+        assert [p["cupos_disponibles"] for p in materia["puntos"]] == [
+            None,
+            10,
+            40,
+            34,
+        ]
+
+    def test_invalid_requests(self, client: TestClient, secciones: dict):
+        """Test nrc and materia_id are exclusive and unknown NRCs return 404"""
+        assert client.get(self.url).status_code == 400
+        assert (
+            client.get(
+                self.url, params={"nrc": "100001", "materia_id": secciones["materia"]}
+            ).status_code
+            == 400
+        )
+        assert client.get(self.url, params={"nrc": "999999"}).status_code == 404
+        assert client.get(self.url, params={"nrc": "1", "puntos": 1}).status_code == 422
+
+    def test_stats(self, client: TestClient, session: Session, secciones: dict):
+        """Test storage stats count raw samples and compacted runs"""
+        backdate(session, START)
+        client.post(f"{self.url}/compactar")
+        record_cupos(session, [(secciones["D02"], 29)])
+        session.commit()
+
+        stats = client.get(
+            f"{self.url}/estadisticas",
+            params={"calendario_id": secciones["calendario"]},
+        ).json()
+
+        assert stats["secciones"] == 2
+        assert stats["registros"] == 1
+        assert stats["tramos"] == 2
+        assert stats["muestras"] == 3
+        assert stats["bytes_tramos"] == 2 * 40
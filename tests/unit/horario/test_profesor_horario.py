@@ -0,0 +1,256 @@
+"""
+Unit tests for the profesor horario read model
+"""
+
+import time as clock
+from datetime import datetime, time
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlmodel import Session, select
+
+from app.api.dependencies.auth import user_is_staff
+from app.core.config import settings
+from app.core.events import deferred
+from app.core.exceptions import BadGatewayException
+from app.main import app
+from app.modules.aula.models import Aula
+from app.modules.calendario.models import Calendario
+from app.modules.centro.models import CentroUniversitario
+from app.modules.clase.models import Clase
+from app.modules.edificio.models import Edificio
+from app.modules.horario.models import ProfesorHorario
+from app.modules.materia.models import Materia
+from app.modules.profesor.models import Profesor
+from app.modules.seccion.models import Seccion
+from app.modules.tasks.services.task_service import TasksService
+
+
+@pytest.fixture(name="campus")
+def campus_fixture(session: Session) -> dict:
+    """
+    Profesor Pérez teaching D01 (Cálculo, 8 creditos; lunes and miércoles
+    07:00-08:55 in DEDX/A001) and D02 (Física, 6 creditos; martes 11:00-12:55,
+    no aula), and profesor López without secciones.
+    """
+    centro = CentroUniversitario(name="CUCEI", siiau_id="D")
+    calendario = Calendario(name="2025 B", siiau_id="202520")
+    calculo = Materia(name="Cálculo", creditos=8, clave="I5247")
+    fisica = Materia(name="Física", creditos=6, clave="I5288")
+    perez = Profesor(name="Pérez")
+    lopez = Profesor(name="López")
+    session.add_all([centro, calendario, calculo, fisica, perez, lopez])
+    session.flush()
+    edificio = Edificio(name="DEDX", centro_id=centro.id)
+    session.add(edificio)
+    session.flush()
+    aula = Aula(name="A001", edificio_id=edificio.id)
+    session.add(aula)
+    session.flush()
+
+    secciones = {}
+    for name, materia, clases in (
+        ("D01", calculo, [(1, 7, aula.id), (3, 7, aula.id)]),
+        ("D02", fisica, [(2, 11, None)]),
+    ):
+        seccion = Seccion(
+            name=name,
+            nrc=f"10000{len(secciones)}",
+            cupos=40,
+            cupos_disponibles=10,
+            periodo_inicio=datetime(2025, 8, 18),
+            periodo_fin=datetime(2025, 12, 6),
+            centro_id=centro.id,
+            materia_id=materia.id,
+            profesor_id=perez.id,
+            calendario_id=calendario.id,
+        )
+        session.add(seccion)
+        session.flush()
+        for dia, hora, aula_id in clases:
+            session.add(
+                Clase(
+                    dia=dia,
+                    hora_inicio=time(hora, 0),
+                    hora_fin=time(hora + 1, 55),
+                    seccion_id=seccion.id,
+                    aula_id=aula_id,
+                )
+            )
+        secciones[name] = seccion.id
+    session.commit()
+    return {
+        "perez": perez.id,
+        "lopez": lopez.id,
+        "calendario_id": calendario.id,
+        "aula": aula.id,
+        **secciones,
+    }
+
+
+def horario(session: Session, profesor_id: int) -> ProfesorHorario | None:
+    session.expire_all()
+    return session.exec(
+        select(ProfesorHorario).where(ProfesorHorario.profesor_id == profesor_id)
+    ).first()
+
+
+@pytest.mark.unit
+class TestHorarioMaintenance:
+    """Test the read model follows seccion and clase writes"""
+
+    def test_built_on_commit(self, session: Session, campus: dict):
+        """Test the timetable and workload are stored on commit"""
+        stored = horario(session, campus["perez"])
+
+        assert stored.secciones == 2
+        assert stored.creditos == 14
+        assert stored.horas_semana == round(3 * 115 / 60, 2)
+        assert [(c["dia"], c["nrc"]) for c in stored.clases] == [
+            (1, "100000"),
+            (2, "100001"),
+            (3, "100000"),
+        ]
+        assert stored.clases[0]["aula"] == "A001"
+        assert stored.clases[0]["edificio"] == "DEDX"
+        assert stored.clases[1]["aula"] is None
+
+    def test_follows_writes(self, session: Session, campus: dict):
+        """Test reassigning secciones and renaming aulas rebuild the rows"""
+        seccion = session.get(Seccion, campus["D02"])
+        seccion.profesor_id = campus["lopez"]
+        session.add(seccion)
+        session.commit()
+
+        assert horario(session, campus["perez"]).creditos == 8
+        assert horario(session, campus["lopez"]).clases[0]["materia"] == "Física"
+
+        aula = session.get(Aula, campus["aula"])
+        aula.name = "A101"
+        session.add(aula)
+        session.commit()
+
+        assert horario(session, campus["perez"]).clases[0]["aula"] == "A101"
+
+        session.delete(session.get(Seccion, campus["D02"]))
+        session.commit()
+
+        assert horario(session, campus["lopez"]) is None
+
+    def test_cupos_updates_are_ignored(self, session: Session, campus: dict):
+        """Test seccion writes not shown in the timetable leave the rows alone"""
+        before = horario(session, campus["perez"]).updated_at
+
+        seccion = session.get(Seccion, campus["D01"])
+        seccion.cupos_disponibles = 5
+        session.add(seccion)
+        session.commit()
+
+        assert horario(session, campus["perez"]).updated_at == before
+
+    def test_deferred(self, session: Session, campus: dict):
+        """Test deferred commits rebuild once, when the block ends"""
+        with deferred(session):
+            session.add(
+                Clase(
+                    dia=5,
+                    hora_inicio=time(9, 0),
+                    hora_fin=time(10, 55),
+                    seccion_id=campus["D01"],
+                )
+            )
+            session.commit()
+            assert len(horario(session, campus["perez"]).clases) == 3
+
+        assert len(horario(session, campus["perez"]).clases) == 4
+
+    def test_deferred_failure(self, session: Session, campus: dict):
+        """Test commits before a failure in a deferred block are rebuilt"""
+        with pytest.raises(RuntimeError), deferred(session):
+            session.add(
+                Clase(
+                    dia=5,
+                    hora_inicio=time(9, 0),
+                    hora_fin=time(10, 55),
+                    seccion_id=campus["D01"],
+                )
+            )
+            session.commit()
+            session.add(Clase(dia=6, seccion_id=campus["D01"]))
+            session.flush()
+            raise RuntimeError("SIIAU failed")
+
+        assert len(horario(session, campus["perez"]).clases) == 4
+
+    def test_failed_import(
+        self,
+        client: TestClient,
+        session: Session,
+        campus: dict,
+        siiau_server,
+        test_superuser,
+        monkeypatch,
+    ):
+        """Test an import failing midway rebuilds the profesores it saved"""
+
+        def fetch_oferta(self, calendario, centro, limite=15000, pagina=None):
+            if pagina != 1:
+                # After the first page is saved
+                clock.sleep(0.2)
+                raise BadGatewayException("SIIAU request failed: HTTP 503")
+            return siiau_server.page({"mostrarp": limite, "p": pagina})
+
+        monkeypatch.setattr(settings, "SIIAU_PAGE_SIZE", 10)
+        monkeypatch.setattr(TasksService, "fetch_oferta", fetch_oferta)
+        app.dependency_overrides[user_is_staff] = lambda: test_superuser
+
+        response = client.get(
+            "/api/v1/tasks/importar-secciones",
+            params={"calendario_id": campus["calendario_id"], "centro_id": 1},
+        )
+
+        assert response.status_code == 502
+        profesor = session.exec(
+            select(Profesor).where(Profesor.name == "PROFESOR 5")
+        ).one()
+        assert horario(session, profesor.id).secciones == 1
+
+
+@pytest.mark.unit
+class TestHorarioEndpoints:
+    """Test the horario endpoints"""
+
+    def url(self, profesor_id: int) -> str:
+        return f"/api/v1/horarios/profesores/{profesor_id}"
+
+    def test_profesor_horario(self, client: TestClient, campus: dict):
+        """Test the stored horarios are served"""
+        response = client.get(
+            self.url(campus["perez"]),
+            params={"calendario_id": campus["calendario_id"]},
+        )
+
+        assert response.status_code == 200
+        (data,) = response.json()
+        assert data["creditos"] == 14
+        assert data["clases"][0]["hora_inicio"] == "07:00:00"
+        assert data["clases"][0]["clave"] == "I5247"
+
+    def test_profesor_without_secciones(self, client: TestClient, campus: dict):
+        """Test profesores without secciones get an empty list, unknown ones 404"""
+        assert client.get(self.url(campus["lopez"])).json() == []
+        assert client.get(self.url(999)).status_code == 404
+
+    def test_rebuild(
+        self, client: TestClient, session: Session, campus: dict, test_superuser
+    ):
+        """Test the staff rebuild restores every horario"""
+        session.delete(horario(session, campus["perez"]))
+        session.commit()
+        app.dependency_overrides[user_is_staff] = lambda: test_superuser
+
+        response = client.post("/api/v1/horarios/reconstruir")
+
+        assert response.status_code == 200
+        assert response.json() == {"profesores": 1, "horarios": 1}
+        assert horario(session, campus["perez"]).secciones == 2
@@ -0,0 +1,197 @@
+"""
+Unit tests for the iCalendar feeds
+"""
+
+from datetime import datetime, time
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlmodel import Session
+
+from app.modules.aula.models import Aula
+from app.modules.calendario.models import Calendario
+from app.modules.centro.models import CentroUniversitario
+from app.modules.clase.models import Clase
+from app.modules.edificio.models import Edificio
+from app.modules.ics.calendar import escape, first_occurrence, fold
+from app.modules.ics.schemas import IcsClase
+from app.modules.materia.models import Materia
+from app.modules.profesor.models import Profesor
+from app.modules.seccion.models import Seccion
+
+
+@pytest.fixture(name="campus")
+def campus_fixture(session: Session) -> dict:
+    """
+    Seccion D01 (NRC 100001, profesor Pérez) with clases lunes and miércoles
+    07:00-08:55 in DEDX/A001 from 2025-08-18 to 2025-12-06, and seccion D02
+    (NRC 100002) without a periodo.
+    """
+    centro = CentroUniversitario(name="CUCEI", siiau_id="D")
+    calendario = Calendario(name="2025 B", siiau_id="202520")
+    materia = Materia(name="Cálculo, Diferencial", creditos=8, clave="I5247")
+    profesor = Profesor(name="Pérez")
+    session.add_all([centro, calendario, materia, profesor])
+    session.flush()
+    edificio = Edificio(name="DEDX", centro_id=centro.id)
+    session.add(edificio)
+    session.flush()
+    aula = Aula(name="A001", edificio_id=edificio.id)
+    session.add(aula)
+    session.flush()
+
+    ids = {"profesor": profesor.id, "aula": aula.id}
+    for name, nrc, periodo in (
+        ("D01", "100001", (datetime(2025, 8, 18), datetime(2025, 12, 6))),
+        ("D02", "100002", (None, None)),
+    ):
+        seccion = Seccion(
+            name=name,
+            nrc=nrc,
+            cupos=40,
+            cupos_disponibles=10,
+            periodo_inicio=periodo[0],
+            periodo_fin=periodo[1],
+            centro_id=centro.id,
+            materia_id=materia.id,
+            profesor_id=profesor.id,
+            calendario_id=calendario.id,
+        )
+        session.add(seccion)
+        session.flush()
+        for dia in (1, 3):
+            session.add(
+                Clase(
+                    dia=dia,
+                    hora_inicio=time(7, 0),
+                    hora_fin=time(8, 55),
+                    seccion_id=seccion.id,
+                    aula_id=aula.id,
+                )
+            )
+        ids[name] = seccion.id
+    session.commit()
+    return ids
+
+
+def events(body: str) -> list[dict[str, str]]:
+    """VEVENT properties of a feed, unfolded"""
+    lines = body.replace("\r\n ", "").split("\r\n")
+    found = []
+    for line in lines:
+        if line == "BEGIN:VEVENT":
+            found.append({})
+        elif found and ":" in line and line != "END:VEVENT":
+            key, _, value = line.partition(":")
+            found[-1].setdefault(key, value)
+    return found
+
+
+@pytest.mark.unit
+class TestCalendarRendering:
+    """Test the RFC 5545 helpers"""
+
+    def test_first_occurrence(self):
+        """Test clases start on their first dia within the periodo"""
+        clase = IcsClase(
+            clase_id=1,
+            dia=3,
+            hora_inicio=time(7, 0),
+            hora_fin=time(8, 55),
+            aula=None,
+            edificio=None,
+            seccion_id=1,
+            nrc="100001",
+            seccion="D01",
+            clave="I5247",
+            materia="Cálculo",
+            periodo_inicio=datetime(2025, 8, 18),
+            periodo_fin=datetime(2025, 12, 6),
+        )
+
+        assert first_occurrence(clase) == datetime(2025, 8, 20, 7, 0)
+        assert (
+            first_occurrence(clase.model_copy(update={"periodo_inicio": None})) is None
+        )
+
+    def test_escape_and_fold(self):
+        """Test text escaping and folding at 75 octets"""
+        assert escape("a,b;c\\d\ne") == "a\\,b\\;c\\\\d\\ne"
+
+        line = "SUMMARY:" + "á" * 60
+        folded = fold(line).split("\r\n ")
+
+        assert "".join(folded) == line
+        assert all(len(chunk.encode()) <= 75 for chunk in folded)
+        assert all(len(chunk.encode()) <= 74 for chunk in folded[1:])
+
+
+@pytest.mark.unit
+class TestIcsEndpoints:
+    """Test the feed endpoints"""
+
+    def test_seccion_feed(self, client: TestClient, campus: dict):
+        """Test every clase becomes a weekly event bounded by the periodo"""
+        response = client.get(f"/api/v1/ics/secciones/{campus['D01']}.ics")
+
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("text/calendar")
+        assert response.text.startswith("BEGIN:VCALENDAR\r\n")
+        assert "TZOFFSETTO:-0600" in response.text
+
+        lunes, miercoles = events(response.text)
+        assert lunes["DTSTART;TZID=America/Mexico_City"] == "20250818T070000"
+        assert lunes["DTEND;TZID=America/Mexico_City"] == "20250818T085500"
+        assert lunes["RRULE"] == "FREQ=WEEKLY;UNTIL=20251206T145500Z"
+        assert lunes["SUMMARY"] == "I5247 Cálculo\\, Diferencial (D01)"
+        assert lunes["LOCATION"] == "DEDX A001"
+        assert miercoles["DTSTART;TZID=America/Mexico_City"] == "20250820T070000"
+
+    def test_nrcs_feed(self, client: TestClient, campus: dict):
+        """Test NRC sets combine secciones and skip clases without periodo"""
+        response = client.get(
+            "/api/v1/ics/secciones.ics", params={"nrc": "100001,100002"}
+        )
+
+        assert response.status_code == 200
+        assert len(events(response.text)) == 2
+
+        response = client.get("/api/v1/ics/secciones.ics", params={"nrc": "999999"})
+
+        assert response.status_code == 404
+
+        response = client.get(
+            "/api/v1/ics/secciones.ics",
+            params={"nrc": ",".join(str(n) for n in range(51))},
+        )
+
+        assert response.status_code == 400
+
+    def test_profesor_and_aula_feeds(self, client: TestClient, campus: dict):
+        """Test profesor feeds come from the horario read model"""
+        profesor = client.get(f"/api/v1/ics/profesores/{campus['profesor']}.ics")
+        aula = client.get(f"/api/v1/ics/aulas/{campus['aula']}.ics")
+
+        assert profesor.status_code == 200
+        assert "X-WR-CALNAME:Pérez" in profesor.text
+        assert "Profesor: Pérez" in events(profesor.text)[0]["DESCRIPTION"]
+        assert len(events(profesor.text)) == 2
+        assert "X-WR-CALNAME:DEDX A001" in aula.text
+        assert len(events(aula.text)) == 2
+
+    def test_cached_and_conditional(self, client: TestClient, campus: dict):
+        """Test repeated polls hit the cache and matching ETags get a 304"""
+        url = f"/api/v1/ics/profesores/{campus['profesor']}.ics"
+        first = client.get(url)
+        second = client.get(url)
+        conditional = client.get(url, headers={"if-none-match": first.headers["etag"]})
+
+        assert first.headers["x-cache"] == "MISS"
+        assert second.headers["x-cache"] == "HIT"
+        assert second.text == first.text
+        assert conditional.status_code == 304
+
+    def test_unknown_ids(self, client: TestClient, campus: dict):
+        """Test unknown secciones, profesores and aulas return 404"""
+        for path in ("secciones/999.ics", "profesores/999.ics", "aulas/999.ics"):
+            assert client.get(f"/api/v1/ics/{path}").status_code == 404
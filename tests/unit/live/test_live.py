@@ -0,0 +1,135 @@
+"""
+Unit tests for the clases in session endpoint
+"""
+
+from datetime import datetime, time
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlmodel import Session
+
+from app.modules.aula.models import Aula
+from app.modules.calendario.models import Calendario
+from app.modules.centro.models import CentroUniversitario
+from app.modules.clase.models import Clase
+from app.modules.edificio.models import Edificio
+from app.modules.live.services.live_service import minute_bucket
+from app.modules.materia.models import Materia
+from app.modules.profesor.models import Profesor
+from app.modules.seccion.models import Seccion
+
+# A martes (dia 2) inside the periodo of the running secciones
+MARTES = "2025-09-02T10:15:30"
+
+
+@pytest.fixture(name="edificio")
+def edificio_fixture(session: Session) -> int:
+    """
+    Edificio DEDX with A001 (martes 09:00-10:55 then 11:00-12:55), A002
+    (martes 13:00-14:55) and A003 (martes 10:00-11:55 of a seccion whose
+    periodo is over).
+    """
+    centro = CentroUniversitario(name="CUCEI", siiau_id="D")
+    calendario = Calendario(name="2025 B", siiau_id="202520")
+    materia = Materia(name="Cálculo", creditos=8, clave="I5247")
+    profesor = Profesor(name="Pérez")
+    session.add_all([centro, calendario, materia, profesor])
+    session.flush()
+    edificio = Edificio(name="DEDX", centro_id=centro.id)
+    session.add(edificio)
+    session.flush()
+    aulas = [Aula(name=f"A00{i}", edificio_id=edificio.id) for i in (1, 2, 3)]
+    session.add_all(aulas)
+    session.flush()
+
+    schedule = [
+        ("D01", aulas[0], time(9, 0), time(10, 55), datetime(2025, 12, 6)),
+        ("D02", aulas[0], time(11, 0), time(12, 55), datetime(2025, 12, 6)),
+        ("D03", aulas[1], time(13, 0), time(14, 55), datetime(2025, 12, 6)),
+        ("D04", aulas[2], time(10, 0), time(11, 55), datetime(2025, 8, 30)),
+    ]
+    for position, (name, aula, inicio, fin, periodo_fin) in enumerate(schedule):
+        seccion = Seccion(
+            name=name,
+            nrc=f"{100000 + position}",
+            cupos=40,
+            cupos_disponibles=10,
+            periodo_inicio=datetime(2025, 8, 18),
+            periodo_fin=periodo_fin,
+            centro_id=centro.id,
+            materia_id=materia.id,
+            profesor_id=profesor.id if position == 0 else None,
+            calendario_id=calendario.id,
+        )
+        session.add(seccion)
+        session.flush()
+        session.add(
+            Clase(
+                dia=2,
+                hora_inicio=inicio,
+                hora_fin=fin,
+                seccion_id=seccion.id,
+                aula_id=aula.id,
+            )
+        )
+    session.commit()
+    return edificio.id
+
+
+@pytest.mark.unit
+class TestLiveEdificio:
+    """Test the live edificio endpoint"""
+
+    def url(self, edificio_id: int) -> str:
+        return f"/api/v1/live/edificios/{edificio_id}"
+
+    def test_current_and_next(self, client: TestClient, edificio: int):
+        """Test every aula gets its clase in session and the next one today"""
+        response = client.get(self.url(edificio), params={"at": MARTES})
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["dia"] == 2
+        assert data["at"] == "2025-09-02T10:15:00"
+
+        a001, a002 = data["aulas"]
+        assert a001["aula"] == "A001"
+        assert a001["actual"]["seccion"] == "D01"
+        assert a001["actual"]["profesor"] == "Pérez"
+        assert a001["actual"]["clave"] == "I5247"
+        assert a001["siguiente"]["seccion"] == "D02"
+        assert a002["actual"] is None
+        assert a002["siguiente"]["nrc"] == "100002"
+
+    def test_respects_periodo(self, client: TestClient, edificio: int):
+        """Test clases of secciones outside their periodo are left out"""
+        response = client.get(self.url(edificio), params={"at": "2025-08-26T10:30"})
+
+        aulas = {aula["aula"]: aula for aula in response.json()["aulas"]}
+        assert aulas["A003"]["actual"]["seccion"] == "D04"
+
+        response = client.get(self.url(edificio), params={"at": MARTES})
+
+        assert "A003" not in {aula["aula"] for aula in response.json()["aulas"]}
+
+    def test_same_minute_is_cached(self, client: TestClient, edificio: int):
+        """Test requests within the same minute share one cached response"""
+        first = client.get(self.url(edificio), params={"at": MARTES})
+        second = client.get(self.url(edificio), params={"at": "2025-09-02T10:15:59"})
+        later = client.get(self.url(edificio), params={"at": "2025-09-02T10:16:00"})
+
+        assert first.headers["x-cache"] == "MISS"
+        assert second.headers["x-cache"] == "HIT"
+        assert later.headers["x-cache"] == "MISS"
+
+    def test_unknown_edificio(self, client: TestClient, edificio: int):
+        """Test unknown edificios return 404"""
+        response = client.get(self.url(999), params={"at": MARTES})
+
+        assert response.status_code == 404
+
+    def test_minute_bucket_converts_to_campus_time(self):
+        """Test aware timestamps are converted to campus local time"""
+        bucket = minute_bucket(datetime.fromisoformat("2025-09-02T16:15:42+00:00"))
+
+        assert bucket == datetime(2025, 9, 2, 10, 15)
@@ -0,0 +1,159 @@
+"""
+Unit tests for aula occupancy heatmaps
+"""
+
+from datetime import time
+
+import numpy as np
+import pytest
+from fastapi.testclient import TestClient
+from sqlmodel import Session
+
+from app.modules.aula.models import Aula
+from app.modules.calendario.models import Calendario
+from app.modules.centro.models import CentroUniversitario
+from app.modules.clase.models import Clase
+from app.modules.edificio.models import Edificio
+from app.modules.materia.models import Materia
+from app.modules.occupancy.services.occupancy_service import busy_minutes
+from app.modules.seccion.models import Seccion
+
+
+@pytest.fixture(name="campus")
+def campus_fixture(session: Session) -> dict:
+    """
+    Edificio DEDX with aulas A001 (lunes 07:00-08:55 and 08:00-08:55, a
+    double booking) and A002 (idle), and edificio DEDT with aula T001
+    (martes 10:30-11:00).
+    """
+    centro = CentroUniversitario(name="CUCEI", siiau_id="D")
+    calendario = Calendario(name="2025 B", siiau_id="202520")
+    materia = Materia(name="Cálculo", creditos=8, clave="I5247")
+    session.add_all([centro, calendario, materia])
+    session.flush()
+    dedx = Edificio(name="DEDX", centro_id=centro.id)
+    dedt = Edificio(name="DEDT", centro_id=centro.id)
+    session.add_all([dedx, dedt])
+    session.flush()
+    a001 = Aula(name="A001", edificio_id=dedx.id)
+    a002 = Aula(name="A002", edificio_id=dedx.id)
+    t001 = Aula(name="T001", edificio_id=dedt.id)
+    session.add_all([a001, a002, t001])
+    session.flush()
+    seccion = Seccion(
+        name="D01",
+        nrc="100001",
+        cupos=40,
+        cupos_disponibles=10,
+        centro_id=centro.id,
+        materia_id=materia.id,
+        calendario_id=calendario.id,
+    )
+    session.add(seccion)
+    session.flush()
+    for aula, dia, inicio, fin in (
+        (a001, 1, time(7, 0), time(8, 55)),
+        (a001, 1, time(8, 0), time(8, 55)),
+        (t001, 2, time(10, 30), time(11, 0)),
+    ):
+        session.add(
+            Clase(
+                dia=dia,
+                hora_inicio=inicio,
+                hora_fin=fin,
+                seccion_id=seccion.id,
+                aula_id=aula.id,
+            )
+        )
+    session.commit()
+    return {
+        "calendario_id": calendario.id,
+        "centro_id": centro.id,
+        "edificio_id": dedx.id,
+    }
+
+
+@pytest.mark.unit
+class TestBusyMinutes:
+    """Test the vectorized aggregation"""
+
+    def test_splits_clases_across_hours(self):
+        """Test clases are split at hour edges and overlaps count once"""
+        busy = busy_minutes(
+            aulas=np.array([0, 0, 1]),
+            dias=np.array([1, 1, 6]),
+            starts=np.array([7 * 60 + 30, 7 * 60 + 45, 20 * 60]),
+            ends=np.array([9 * 60 + 15, 8 * 60, 23 * 60]),
+            aula_count=2,
+        )
+
+        assert busy.shape == (2, 6, 15)
+        assert busy[0, 0, :3].tolist() == [30, 60, 15]
+        # Clipped to the last hour of the grid
+        assert busy[1, 5, -2:].tolist() == [60, 60]
+        assert busy.sum() == 30 + 60 + 15 + 120
+
+
+@pytest.mark.unit
+class TestOccupancyEndpoint:
+    """Test the occupancy endpoint"""
+
+    url = "/api/v1/occupancy/"
+
+    def test_centro_heatmaps(self, client: TestClient, campus: dict):
+        """Test every edificio of the centro gets a heatmap and aula utilizations"""
+        response = client.get(
+            self.url,
+            params={
+                "calendario_id": campus["calendario_id"],
+                "centro_id": campus["centro_id"],
+            },
+        )
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["dias"] == [1, 2, 3, 4, 5, 6]
+        assert data["horas"][0] == "07:00:00"
+        assert [edificio["edificio"] for edificio in data["edificios"]] == [
+            "DEDT",
+            "DEDX",
+        ]
+
+        dedt, dedx = data["edificios"]
+        assert dedt["ocupacion"][1][3] == 50.0
+        # A001 busy 07:00-08:55 once despite the double booking, A002 idle
+        assert dedx["ocupacion"][0][:3] == [50.0, 45.8, 0.0]
+        a001, a002 = dedx["aulas"]
+        assert a001["horas_ocupadas"] == round(115 / 60, 2)
+        assert a002["utilizacion"] == 0.0
+        assert a001["utilizacion"] == round(115 / (6 * 15 * 60) * 100, 1)
+
+    def test_edificio_filter_and_cache(self, client: TestClient, campus: dict):
+        """Test a single edificio is returned and repeated reads hit the cache"""
+        params = {
+            "calendario_id": campus["calendario_id"],
+            "edificio_id": campus["edificio_id"],
+        }
+
+        first = client.get(self.url, params=params)
+        second = client.get(self.url, params=params)
+
+        assert [e["edificio"] for e in first.json()["edificios"]] == ["DEDX"]
+        assert second.headers.get("x-cache") == "HIT"
+        assert second.json() == first.json()
+
+    def test_requires_scope(self, client: TestClient, campus: dict):
+        """Test centro_id or edificio_id is required"""
+        response = client.get(
+            self.url, params={"calendario_id": campus["calendario_id"]}
+        )
+
+        assert response.status_code == 400
+
+    def test_unknown_calendario(self, client: TestClient, campus: dict):
+        """Test unknown calendarios return 404"""
+        response = client.get(
+            self.url, params={"calendario_id": 999, "centro_id": campus["centro_id"]}
+        )
+
+        assert response.status_code == 404
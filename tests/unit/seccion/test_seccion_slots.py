@@ -0,0 +1,170 @@
+"""
+Unit tests for the seccion slot mask columns and filters
+"""
+
+from datetime import time
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlmodel import Session
+
+from app.core.events import deferred
+from app.modules.calendario.models import Calendario
+from app.modules.centro.models import CentroUniversitario
+from app.modules.clase.models import Clase
+from app.modules.materia.models import Materia
+from app.modules.seccion.models import Seccion
+from app.modules.seccion.slots import (clase_mask, from_words, to_words,
+                                       window_mask)
+
+
+@pytest.fixture(name="secciones")
+def secciones_fixture(session: Session) -> dict[str, int]:
+    """
+    Secciones D01 (lunes 07:00-08:55), D02 (lunes 09:00-10:55 and jueves
+    07:00-08:55), D03 (sábado 20:00-21:55) and D04 without clases.
+    """
+    centro = CentroUniversitario(name="CUCEI", siiau_id="D")
+    calendario = Calendario(name="2025 B", siiau_id="202520")
+    materia = Materia(name="Cálculo", creditos=8, clave="I5247")
+    session.add_all([centro, calendario, materia])
+    session.flush()
+
+    schedules = {
+        "D01": [(1, 7)],
+        "D02": [(1, 9), (4, 7)],
+        "D03": [(6, 20)],
+        "D04": [],
+    }
+    ids = {}
+    for position, (name, clases) in enumerate(schedules.items()):
+        seccion = Seccion(
+            name=name,
+            nrc=f"{100000 + position}",
+            cupos=40,
+            cupos_disponibles=10,
+            centro_id=centro.id,
+            materia_id=materia.id,
+            calendario_id=calendario.id,
+        )
+        session.add(seccion)
+        session.flush()
+        for dia, hora in clases:
+            session.add(
+                Clase(
+                    dia=dia,
+                    hora_inicio=time(hora, 0),
+                    hora_fin=time(hora + 1, 55),
+                    seccion_id=seccion.id,
+                )
+            )
+        ids[name] = seccion.id
+    session.commit()
+    return ids
+
+
+def mask(session: Session, seccion_id: int) -> int:
+    seccion = session.get(Seccion, seccion_id)
+    return from_words((seccion.slots_0, seccion.slots_1, seccion.slots_2))
+
+
+@pytest.mark.unit
+class TestSlotWords:
+    """Test mask encoding"""
+
+    def test_words_round_trip(self):
+        """Test masks survive the split into signed 64-bit words"""
+        value = (
+            clase_mask(2, time(22, 0), time(22, 55))
+            | clase_mask(4, time(7, 0), time(7, 30))
+            | clase_mask(6, time(22, 30), time(23, 0))
+        )
+
+        words = to_words(value)
+
+        assert words[0] < 0
+        assert all(-(1 << 63) <= word < (1 << 63) for word in words)
+        assert from_words(words) == value
+
+    def test_window_mask_takes_whole_cells(self):
+        """Test free windows only cover cells entirely inside them"""
+        assert window_mask(1, time(7, 15), time(8, 0)) == clase_mask(
+            1, time(7, 30), time(8, 0)
+        )
+        assert window_mask(1, time(7, 0), time(7, 20)) == 0
+
+
+@pytest.mark.unit
+class TestSlotMaintenance:
+    """Test masks follow clase writes"""
+
+    def test_masks_follow_clases(self, session: Session, secciones: dict):
+        """Test creating, moving and deleting clases updates the masks"""
+        d01, d02 = secciones["D01"], secciones["D02"]
+        assert mask(session, d01) == clase_mask(1, time(7, 0), time(8, 55))
+
+        clase = Clase(
+            dia=2, hora_inicio=time(7, 0), hora_fin=time(8, 55), seccion_id=d01
+        )
+        session.add(clase)
+        session.commit()
+        assert mask(session, d01) == clase_mask(
+            1, time(7, 0), time(8, 55)
+        ) | clase_mask(2, time(7, 0), time(8, 55))
+
+        clase.seccion_id = d02
+        session.add(clase)
+        session.commit()
+        assert mask(session, d01) == clase_mask(1, time(7, 0), time(8, 55))
+        assert mask(session, d02) & clase_mask(2, time(7, 0), time(8, 55))
+
+        session.delete(clase)
+        session.commit()
+        assert not mask(session, d02) & clase_mask(2, time(7, 0), time(8, 55))
+
+    def test_deferred_masks(self, session: Session, secciones: dict):
+        """Test deferred commits update the masks when the block ends"""
+        d04 = secciones["D04"]
+        with deferred(session):
+            session.add(
+                Clase(
+                    dia=3, hora_inicio=time(7, 0), hora_fin=time(8, 55), seccion_id=d04
+                )
+            )
+            session.commit()
+            assert mask(session, d04) == 0
+
+        assert mask(session, d04) == clase_mask(3, time(7, 0), time(8, 55))
+
+
+@pytest.mark.unit
+class TestSlotFilters:
+    """Test fits_in and excludes_slots on the seccion list"""
+
+    url = "/api/v1/secciones/"
+
+    def names(self, client: TestClient, **params) -> list[str]:
+        response = client.get(self.url, params=params)
+        assert response.status_code == 200
+        return sorted(seccion["name"] for seccion in response.json()["results"])
+
+    def test_fits_in(self, client: TestClient, secciones: dict):
+        """Test only secciones inside the free time are listed"""
+        names = self.names(client, fits_in="1:07:00-11:00,4")
+
+        assert names == ["D01", "D02", "D04"]
+
+        names = self.names(client, fits_in="1:07:00-10:00,4")
+
+        assert names == ["D01", "D04"]
+
+    def test_excludes_slots(self, client: TestClient, secciones: dict):
+        """Test secciones touching excluded cells are dropped"""
+        assert self.names(client, excludes_slots="1:08:30-09:30") == ["D03", "D04"]
+        assert self.names(client, excludes_slots="6") == ["D01", "D02", "D04"]
+
+    def test_invalid_slots(self, client: TestClient, secciones: dict):
+        """Test malformed slot lists return 400"""
+        response = client.get(self.url, params={"fits_in": "7:07:00-09:00"})
+
+        assert response.status_code == 400
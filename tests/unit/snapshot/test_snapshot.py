@@ -0,0 +1,221 @@
+"""
+Unit tests for precompiled seccion snapshots
+"""
+
+import json
+from datetime import time
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlmodel import Session
+
+from app.api.dependencies.auth import user_is_staff
+from app.main import app
+from app.modules.aula.models import Aula
+from app.modules.calendario.models import Calendario
+from app.modules.centro.models import CentroUniversitario
+from app.modules.clase.models import Clase
+from app.modules.edificio.models import Edificio
+from app.modules.materia.models import Materia
+from app.modules.profesor.models import Profesor
+from app.modules.seccion.models import Seccion
+from app.modules.snapshot.api.dependencies import get_snapshot_store
+from app.modules.snapshot.schemas import SnapshotManifest
+from app.modules.snapshot.services.snapshot_service import SnapshotStore
+from app.modules.users.models import User
+
+
+@pytest.fixture(name="store")
+def store_fixture(tmp_path, client: TestClient) -> SnapshotStore:
+    """Snapshot store in a temporary directory"""
+    store = SnapshotStore(tmp_path)
+    app.dependency_overrides[get_snapshot_store] = lambda: store
+    return store
+
+
+@pytest.fixture(name="staff")
+def staff_fixture(client: TestClient, test_superuser: User) -> User:
+    """Authenticate staff only requests as the test superuser"""
+    app.dependency_overrides[user_is_staff] = lambda: test_superuser
+    return test_superuser
+
+
+@pytest.fixture(name="offer")
+def offer_fixture(session: Session) -> dict:
+    """Create a calendario/centro with secciones and clases"""
+    centro = CentroUniversitario(name="CUCEI", siiau_id="D")
+    calendario = Calendario(name="2025 B", siiau_id="202520")
+    materia = Materia(name="Cálculo", creditos=8, clave="I5247")
+    profesor = Profesor(name="Pérez")
+    session.add_all([centro, calendario, materia, profesor])
+    session.flush()
+    edificio = Edificio(name="DEDX", centro_id=centro.id)
+    session.add(edificio)
+    session.flush()
+    aula = Aula(name="A001", edificio_id=edificio.id)
+    session.add(aula)
+    session.flush()
+
+    for i in range(20):
+        seccion = Seccion(
+            name=f"D{i:02d}",
+            nrc=f"{100000 + i}",
+            cupos=40,
+            cupos_disponibles=i,
+            centro_id=centro.id,
+            materia_id=materia.id,
+            profesor_id=profesor.id if i % 2 else None,
+            calendario_id=calendario.id,
+        )
+        session.add(seccion)
+        session.flush()
+        session.add(
+            Clase(
+                sesion=1,
+                hora_inicio=time(7, 0),
+                hora_fin=time(8, 55),
+                dia=1,
+                seccion_id=seccion.id,
+                aula_id=aula.id if i % 2 else None,
+            )
+        )
+    session.commit()
+    return {"calendario_id": calendario.id, "centro_id": centro.id}
+
+
+@pytest.mark.unit
+class TestSnapshots:
+    """Test snapshot publishing and serving"""
+
+    def url(self, offer: dict) -> str:
+        return f"/api/v1/snapshots/{offer['calendario_id']}/{offer['centro_id']}"
+
+    def test_publish_writes_denormalized_snapshot(
+        self,
+        client: TestClient,
+        store: SnapshotStore,
+        offer: dict,
+        staff: User,
+    ):
+        """Test a published snapshot inlines materia, profesor and aulas"""
+        response = client.post(self.url(offer))
+
+        assert response.status_code == 200
+        manifest = response.json()
+        assert manifest["secciones"] == 20
+        assert manifest["sizes"]["gzip"] < manifest["sizes"]["identity"]
+
+        response = client.get(self.url(offer), headers={"Accept-Encoding": "identity"})
+        assert response.status_code == 200
+        assert response.headers["x-snapshot-version"] == manifest["version"]
+
+        document = response.json()
+        assert document["centro"]["name"] == "CUCEI"
+        seccion = document["secciones"][1]
+        assert seccion["materia"]["clave"] == "I5247"
+        assert seccion["profesor"]["name"] == "Pérez"
+        assert seccion["clases"][0]["aula"]["edificio"]["name"] == "DEDX"
+        assert document["secciones"][0]["clases"][0]["aula"] is None
+
+    def test_publish_requires_authentication(
+        self, client: TestClient, store: SnapshotStore, offer: dict
+    ):
+        """Test anonymous clients cannot publish snapshots"""
+        response = client.post(self.url(offer))
+
+        assert response.status_code == 401
+
+    def test_unchanged_data_keeps_version(
+        self,
+        client: TestClient,
+        store: SnapshotStore,
+        offer: dict,
+        session: Session,
+        staff: User,
+    ):
+        """Test republishing identical data keeps the version and a change bumps it"""
+        first = client.post(self.url(offer)).json()
+        second = client.post(self.url(offer)).json()
+        assert first == second
+
+        seccion = session.get(Seccion, 1)
+        seccion.cupos_disponibles = 39
+        session.add(seccion)
+        session.commit()
+
+        third = client.post(self.url(offer)).json()
+        assert third["version"] != first["version"]
+
+    def test_serves_gzip_and_not_modified(
+        self,
+        client: TestClient,
+        store: SnapshotStore,
+        offer: dict,
+        staff: User,
+    ):
+        """Test gzip negotiation and If-None-Match revalidation"""
+        client.post(self.url(offer))
+
+        response = client.get(self.url(offer), headers={"Accept-Encoding": "gzip"})
+        assert response.status_code == 200
+        assert response.headers["content-encoding"] == "gzip"
+        etag = response.headers["etag"]
+        assert etag.endswith('-gzip"')
+
+        response = client.get(
+            self.url(offer),
+            headers={"Accept-Encoding": "gzip", "If-None-Match": etag},
+        )
+        assert response.status_code == 304
+        assert response.content == b""
+
+    def test_range_request(
+        self,
+        client: TestClient,
+        store: SnapshotStore,
+        offer: dict,
+        staff: User,
+    ):
+        """Test byte ranges of the stored representation are served"""
+        manifest = client.post(self.url(offer)).json()
+        path = store.path(
+            offer["calendario_id"], offer["centro_id"], manifest["version"], "identity"
+        )
+
+        response = client.get(
+            self.url(offer),
+            headers={"Accept-Encoding": "identity", "Range": "bytes=0-99"},
+        )
+
+        assert response.status_code == 206
+        assert response.headers["content-range"].startswith("bytes 0-99/")
+        assert response.content == path.read_bytes()[:100]
+
+    def test_missing_snapshot(self, client: TestClient, store: SnapshotStore):
+        """Test unpublished pairs return 404"""
+        response = client.get("/api/v1/snapshots/1/1")
+
+        assert response.status_code == 404
+
+    def test_old_versions_are_pruned(self, store: SnapshotStore):
+        """Test only the current and previous versions stay on disk"""
+        for i in range(4):
+            version, sizes = store.write(1, 1, [json.dumps({"i": i}).encode()])
+            store.save_manifest(
+                SnapshotManifest(
+                    calendario_id=1,
+                    centro_id=1,
+                    version=version,
+                    generated_at="2025-01-01T00:00:00",
+                    secciones=0,
+                    sizes=sizes,
+                )
+            )
+
+        versions = {
+            path.name.split(".")[0]
+            for path in store.directory(1, 1).iterdir()
+            if path.name != "manifest.json"
+        }
+        assert len(versions) == 2
+        assert store.manifest(1, 1).version in versions
@@ -0,0 +1,162 @@
+"""
+Unit tests for the seccion event stream
+"""
+
+import asyncio
+import json
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlmodel import Session
+
+from app.core.events import deferred
+from app.modules.calendario.models import Calendario
+from app.modules.centro.models import CentroUniversitario
+from app.modules.materia.models import Materia
+from app.modules.seccion.models import Seccion
+from app.modules.seccion.repositories.seccion_repository import \
+    SeccionRepository
+from app.modules.stream.services.seccion_hub import SeccionFilter, seccion_hub
+
+
+@pytest.fixture(name="secciones")
+def secciones_fixture(session: Session) -> dict:
+    """Secciones 100001 and 100002 (10 disponibles) of one calendario and centro"""
+    centro = CentroUniversitario(name="CUCEI", siiau_id="D")
+    calendario = Calendario(name="2025 B", siiau_id="202520")
+    materia = Materia(name="Cálculo", creditos=8, clave="I5247")
+    session.add_all([centro, calendario, materia])
+    session.flush()
+    ids = {"calendario": calendario.id, "centro": centro.id}
+    for nrc in ("100001", "100002"):
+        seccion = Seccion(
+            name="D01",
+            nrc=nrc,
+            cupos=40,
+            cupos_disponibles=10,
+            centro_id=centro.id,
+            materia_id=materia.id,
+            calendario_id=calendario.id,
+        )
+        session.add(seccion)
+        session.flush()
+        ids[nrc] = seccion.id
+    session.commit()
+    return ids
+
+
+async def received(subscriber, count: int = 1) -> list[str]:
+    """The next ``count`` messages of a subscriber, ignoring keep-alives"""
+    found = []
+    messages = subscriber.messages(heartbeat=0.05)
+    while len(found) < count:
+        message = await asyncio.wait_for(anext(messages), 1)
+        if not message.startswith(":"):
+            found.append(message)
+    return found
+
+
+def data(message: str) -> list[dict]:
+    event, payload = message.strip().split("\n")
+    assert event == "event: secciones"
+    return json.loads(payload.removeprefix("data: "))
+
+
+@pytest.mark.unit
+class TestSeccionHub:
+    """Test committed seccion changes reach matching subscribers"""
+
+    @pytest.mark.asyncio
+    async def test_publishes_commits(self, session: Session, secciones: dict):
+        """Test one message per commit with the matching secciones only"""
+        following = seccion_hub.subscribe(SeccionFilter(nrcs=frozenset({"100001"})))
+        other = seccion_hub.subscribe(SeccionFilter(calendario_id=999))
+        try:
+            SeccionRepository(session).update_cupos(
+                secciones["calendario"],
+                secciones["centro"],
+                {"100001": (40, 9), "100002": (40, 8)},
+            )
+            seccion = session.get(Seccion, secciones["100001"])
+            seccion.cupos_disponibles = 7
+            session.commit()
+
+            first, second = await received(following, 2)
+            await asyncio.sleep(0)
+
+            assert data(first) == [
+                {
+                    "id": secciones["100001"],
+                    "op": "update",
+                    "nrc": "100001",
+                    "cupos": 40,
+                    "cupos_disponibles": 9,
+                    "calendario_id": secciones["calendario"],
+                    "centro_id": secciones["centro"],
+                    "materia_id": seccion.materia_id,
+                }
+            ]
+            assert data(second)[0]["cupos_disponibles"] == 7
+            assert data(second)[0]["name"] == "D01"
+            assert not other.buffer
+        finally:
+            seccion_hub.unsubscribe(following)
+            seccion_hub.unsubscribe(other)
+
+    @pytest.mark.asyncio
+    async def test_deferred_commits(self, session: Session, secciones: dict):
+        """Test the commits of a deferred block are sent as one message"""
+        subscriber = seccion_hub.subscribe(SeccionFilter(), buffer_size=2)
+        try:
+            with deferred(session):
+                for nrc in ("100001", "100002", "100001"):
+                    seccion = session.get(Seccion, secciones[nrc])
+                    seccion.cupos_disponibles -= 1
+                    session.commit()
+                await asyncio.sleep(0)
+                assert not subscriber.buffer
+
+            (message,) = await received(subscriber)
+
+            assert {
+                seccion["nrc"]: seccion["cupos_disponibles"]
+                for seccion in data(message)
+            } == {"100001": 8, "100002": 9}
+            assert not subscriber.dropped
+        finally:
+            seccion_hub.unsubscribe(subscriber)
+
+    @pytest.mark.asyncio
+    async def test_drops_slow_consumers(self, session: Session, secciones: dict):
+        """Test a subscriber whose buffer fills up is dropped"""
+        slow = seccion_hub.subscribe(SeccionFilter(), buffer_size=2)
+        try:
+            seccion = session.get(Seccion, secciones["100002"])
+            for value in (9, 8, 7):
+                seccion.cupos_disponibles = value
+                session.commit()
+            await asyncio.sleep(0)
+
+            messages = [message async for message in slow.messages(heartbeat=1)]
+
+            assert slow.dropped
+            assert messages == ["event: dropped\ndata: {}\n\n"]
+        finally:
+            seccion_hub.unsubscribe(slow)
+
+
+@pytest.mark.unit
+class TestSeccionStreamEndpoint:
+    """Test the stream endpoint's validation"""
+
+    def test_invalid_nrcs(self, client: TestClient):
+        """Test empty and oversized NRC lists are rejected"""
+        url = "/api/v1/stream/secciones"
+
+        assert client.get(url, params={"nrc": ","}).status_code == 400
+        assert (
+            client.get(
+                url, params={"nrc": ",".join(str(n) for n in range(501))}
+            ).status_code
+            == 400
+        )
@@ -0,0 +1,175 @@
+"""
+Unit tests for the cupos-only SIIAU sync
+"""
+
+import pytest
+from bs4 import BeautifulSoup
+from fastapi.testclient import TestClient
+from sqlmodel import Session, select
+
+from app.api.dependencies.auth import user_is_staff
+from app.main import app
+from app.modules.calendario.models import Calendario
+from app.modules.centro.models import CentroUniversitario
+from app.modules.historial.services import cupos_service
+from app.modules.historial.services.cupos_service import CuposService
+from app.modules.materia.models import Materia
+from app.modules.seccion.models import Seccion
+from app.modules.tasks.services.cupos_parser import parse_cupos
+from app.modules.tasks.services.task_service import TasksService
+
+
+def oferta(*rows: tuple[str, int, int]) -> str:
+    """A SIIAU oferta page with nested horario and profesor tables"""
+    body = "".join(
+        f"<tr><td>{nrc}</td><td>I5247</td><td>CÁLCULO</td><td>D01</td>"
+        f"<td>8</td><td>{cup}</td><td>{dis}</td>"
+        "<td><table><tr><td>01</td><td>0700-0855</td><td>L . I . . .</td>"
+        "<td>DEDX</td><td>A001</td><td>18/08/25 - 06/12/25</td></tr></table></td>"
+        "<td><table><tr><td>01</td><td>PÉREZ</td></tr></table></td></tr>"
+        for nrc, cup, dis in rows
+    )
+    return (
+        "<html><body><table><tr><th>NRC</th><th>Clave</th></tr>"
+        f"{body}</table><table><tr><td>999999</td></tr></table></body></html>"
+    )
+
+
+@pytest.fixture(name="secciones")
+def secciones_fixture(session: Session) -> dict:
+    """Secciones 100001 (40/10) and 100002 (30/30) of one calendario and centro"""
+    centro = CentroUniversitario(name="CUCEI", siiau_id="D")
+    calendario = Calendario(name="2025 B", siiau_id="202520")
+    materia = Materia(name="Cálculo", creditos=8, clave="I5247")
+    session.add_all([centro, calendario, materia])
+    session.flush()
+    for nrc, cupos, disponibles in (("100001", 40, 10), ("100002", 30, 30)):
+        session.add(
+            Seccion(
+                name="D01",
+                nrc=nrc,
+                cupos=cupos,
+                cupos_disponibles=disponibles,
+                centro_id=centro.id,
+                materia_id=materia.id,
+                calendario_id=calendario.id,
+            )
+        )
+    session.commit()
+    return {"calendario_id": calendario.id, "centro_id": centro.id}
+
+
+def cupos(session: Session) -> dict[str, tuple[int, int]]:
+    session.expire_all()
+    return {
+        seccion.nrc: (seccion.cupos, seccion.cupos_disponibles)
+        for seccion in session.exec(select(Seccion))
+    }
+
+
+@pytest.mark.unit
+class TestCuposParser:
+    """Test the streaming cupos parser"""
+
+    def test_matches_full_parser(self):
+        """Test NRC, CUP and DIS agree with the full table parser"""
+        html = oferta(("100001", 40, 5), ("100002", 30, 0))
+
+        expected = {
+            row["NRC"]: (int(row["CUP"]), int(row["DIS"]))
+            for row in TasksService.parse_table(
+                None, BeautifulSoup(html, "html.parser")
+            )
+        }
+
+        assert (
+            parse_cupos(html)
+            == expected
+            == {
+                "100001": (40, 5),
+                "100002": (30, 0),
+            }
+        )
+
+    def test_unclosed_cells(self):
+        """Test rows without end tags are still read"""
+        html = (
+            "<table><tr><td>100001<td>I5247<td>CÁLCULO<td>D01<td>8<td>40<td>7"
+            "<td><table><tr><td>01<td>0700</table>"
+            "<tr><td>100002<td>I5247<td>CÁLCULO<td>D02<td>8<td>n/a<td>1</table>"
+        )
+
+        assert parse_cupos(html) == {"100001": (40, 7)}
+
+
+@pytest.mark.unit
+class TestCuposSync:
+    """Test the actualizar-cupos task"""
+
+    url = "/api/v1/tasks/actualizar-cupos"
+
+    @pytest.fixture(autouse=True)
+    def staff(self, test_superuser):
+        app.dependency_overrides[user_is_staff] = lambda: test_superuser
+
+    def sync(self, client: TestClient, monkeypatch, secciones: dict, html: str):
+        monkeypatch.setattr(TasksService, "fetch_oferta", lambda self, *args: html)
+        response = client.get(self.url, params=secciones)
+        assert response.status_code == 200
+        return response.json()
+
+    def test_updates_changed_nrcs(
+        self, client: TestClient, session: Session, secciones: dict, monkeypatch
+    ):
+        """Test only NRCs whose cupos differ are written and counted"""
+        html = oferta(("100001", 40, 8), ("100002", 30, 30), ("100003", 20, 2))
+
+        result = self.sync(client, monkeypatch, secciones, html)
+
+        assert result == {
+            "nrcs_leidos": 3,
+            "secciones_actualizadas": 1,
+            "paginas_siiau": 3,
+            "truncado": False,
+        }
+        assert cupos(session) == {"100001": (40, 8), "100002": (30, 30)}
+
+        result = self.sync(client, monkeypatch, secciones, html)
+
+        assert result["secciones_actualizadas"] == 0
+
+    def test_invalidates_cached_secciones(
+        self, client: TestClient, secciones: dict, monkeypatch
+    ):
+        """Test changed cupos invalidate cached seccion responses"""
+        client.get("/api/v1/secciones/")
+
+        self.sync(client, monkeypatch, secciones, oferta(("100002", 30, 29)))
+        response = client.get("/api/v1/secciones/")
+
+        disponibles = {
+            seccion["nrc"]: seccion["cupos_disponibles"]
+            for seccion in response.json()["results"]
+        }
+        assert response.headers["x-cache"] == "MISS"
+        assert disponibles["100002"] == 29
+
+    def test_throttles_compaction(
+        self, client: TestClient, secciones: dict, monkeypatch
+    ):
+        """Test the cupos history is compacted at most once per interval"""
+        now = [1000.0]
+        compactions = []
+        monkeypatch.setattr(cupos_service.time, "monotonic", lambda: now[0])
+        monkeypatch.setattr(cupos_service, "_next_compaction", 0.0)
+        monkeypatch.setattr(
+            CuposService, "compact", lambda self: compactions.append(now[0])
+        )
+        html = oferta(("100001", 40, 9))
+
+        for _ in range(3):
+            self.sync(client, monkeypatch, secciones, html)
+        now[0] += cupos_service.COMPACT_INTERVAL
+        self.sync(client, monkeypatch, secciones, html)
+
+        assert compactions == [1000.0, 1000.0 + cupos_service.COMPACT_INTERVAL]
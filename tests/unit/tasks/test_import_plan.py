@@ -0,0 +1,191 @@
+"""
+Unit tests for dry-run import plans
+"""
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlmodel import Session, func, select
+
+from app.api.dependencies.auth import user_is_staff
+from app.main import app
+from app.modules.aula.models import Aula
+from app.modules.calendario.models import Calendario
+from app.modules.centro.models import CentroUniversitario
+from app.modules.clase.models import Clase
+from app.modules.edificio.models import Edificio
+from app.modules.materia.models import Materia
+from app.modules.profesor.models import Profesor
+from app.modules.seccion.models import Seccion
+from app.modules.tasks.services.siiau_client import (SiiauClient,
+                                                     get_siiau_client)
+
+URL = "/api/v1/tasks"
+
+
+def count(session: Session, model) -> int:
+    return session.exec(select(func.count()).select_from(model)).one()
+
+
+def totals(session: Session) -> dict[str, int]:
+    session.expire_all()
+    return {
+        "secciones": count(session, Seccion),
+        "clases": count(session, Clase),
+        "materias": count(session, Materia),
+        "profesores": count(session, Profesor),
+        "edificios": count(session, Edificio),
+        "aulas": count(session, Aula),
+    }
+
+
+@pytest.mark.unit
+class TestImportPlan:
+    """Test dry runs of the SIIAU imports"""
+
+    @pytest.fixture(autouse=True)
+    def setup(self, test_superuser, siiau_server):
+        app.dependency_overrides[user_is_staff] = lambda: test_superuser
+        app.dependency_overrides[get_siiau_client] = lambda: SiiauClient(
+            url=siiau_server.url
+        )
+
+    @pytest.fixture(name="params")
+    def params_fixture(self, session: Session) -> dict:
+        centro = CentroUniversitario(name="CUCEI", siiau_id="D")
+        calendario = Calendario(name="2025 B", siiau_id="202520")
+        session.add_all([centro, calendario])
+        session.commit()
+        return {"calendario_id": calendario.id, "centro_id": centro.id}
+
+    def plan(self, client: TestClient, task: str, params: dict, **options) -> dict:
+        response = client.get(
+            f"{URL}/{task}", params={**params, **options, "dry_run": True}
+        )
+        assert response.status_code == 200
+        return response.json()
+
+    def test_writes_nothing(self, client: TestClient, session: Session, params):
+        """Test a dry run plans the secciones and leaves the tables as they were"""
+        plan = self.plan(client, "importar-secciones", params)
+
+        assert plan["dry_run"] is True
+        assert plan["secciones"] == {
+            "crear": 100,
+            "actualizar": 0,
+            "sin_cambios": 0,
+            "errores": 0,
+        }
+        assert plan["materias"] == {"crear": 25}
+        assert plan["profesores"] == {"crear": 100}
+        # Clases are only written by full updates
+        assert plan["clases"] == {"crear": 0, "eliminar": 0}
+        assert plan["muestras"]["secciones"]["crear"][:2] == ["100000", "100001"]
+        assert plan["muestras"]["materias"]["crear"][0] == {
+            "clave": "I0000",
+            "name": "MATERIA 0",
+        }
+        assert plan["truncado"] is False
+        assert set(totals(session).values()) == {0}
+
+    def test_matches_import(self, client: TestClient, session: Session, params):
+        """Test the planned creations are the rows the import writes"""
+        plan = self.plan(client, "actualizar-secciones", params, full_update=True)
+
+        response = client.get(
+            f"{URL}/actualizar-secciones", params={**params, "full_update": True}
+        )
+
+        assert response.status_code == 200
+        assert totals(session) == {
+            entity: plan[entity]["crear"]
+            for entity in ("secciones", "clases", "materias", "profesores")
+            + ("edificios", "aulas")
+        }
+
+    def test_plans_full_update(self, client: TestClient, session: Session, params):
+        """Test a full update of imported secciones replaces their clases"""
+        client.get(
+            f"{URL}/actualizar-secciones", params={**params, "full_update": True}
+        )
+        before = totals(session)
+
+        plan = self.plan(client, "actualizar-secciones", params, full_update=True)
+
+        assert plan["secciones"]["sin_cambios"] == 100
+        assert plan["clases"] == {
+            "crear": before["clases"],
+            "eliminar": before["clases"],
+        }
+        for entity in ("materias", "profesores", "edificios", "aulas"):
+            assert plan[entity] == {"crear": 0}
+        assert totals(session) == before
+
+    def test_reports_changes(self, client: TestClient, session: Session, params):
+        """Test changed fields are listed with their current and new values"""
+        client.get(f"{URL}/actualizar-secciones", params=params)
+        seccion = session.exec(select(Seccion).where(Seccion.nrc == "100003")).one()
+        cupos = seccion.cupos
+        seccion.cupos = cupos + 5
+        session.add(seccion)
+        session.commit()
+
+        plan = self.plan(client, "actualizar-secciones", params)
+
+        assert plan["secciones"]["actualizar"] == 1
+        assert plan["secciones"]["sin_cambios"] == 99
+        assert plan["muestras"]["secciones"]["actualizar"] == [
+            {"nrc": "100003", "cambios": {"cupos": [cupos + 5, cupos]}}
+        ]
+
+    def test_existing_nrcs(self, client: TestClient, session: Session, params):
+        """Test importing NRCs already in the calendario is planned as errors"""
+        client.get(f"{URL}/importar-secciones", params=params)
+
+        plan = self.plan(client, "importar-secciones", params)
+
+        assert plan["secciones"]["errores"] == 100
+        assert plan["secciones"]["crear"] == 0
+        assert len(plan["muestras"]["secciones"]["errores"]) == 10
+        assert plan["muestras"]["secciones"]["errores"][0] == {
+            "nrc": "100000",
+            "error": "NRC already in use in that Calendario",
+        }
+
+    def test_manual_import(self, client: TestClient, session: Session, params):
+        """Test manual imports plan their records without saving them"""
+        records = [
+            {
+                "NRC": str(nrc),
+                "Clave": "I5247",
+                "Materia": "Cálculo",
+                "Sec": "D01",
+                "CR": 8,
+                "CUP": 40,
+                "DIS": 5,
+                "Profesor": "Pérez",
+                "SesionNum": "1",
+                "Horas": "0700-0855",
+                "Dias": "L . I . . .",
+                "Edificio": "DEDX",
+                "Aula": f"A00{nrc % 2}",
+                "Periodo": "18/08/25 - 12/12/25",
+            }
+            for nrc in range(100001, 100004)
+        ]
+
+        response = client.post(
+            f"{URL}/importar-secciones-manual",
+            params={**params, "full_update": True, "dry_run": True},
+            json=records,
+        )
+
+        plan = response.json()
+        assert response.status_code == 200
+        assert plan["secciones"]["crear"] == 3
+        assert plan["clases"] == {"crear": 6, "eliminar": 0}
+        assert plan["edificios"] == {"crear": 1}
+        assert plan["muestras"]["aulas"]["crear"] == [
+            {"edificio": "DEDX", "aula": "A001"},
+            {"edificio": "DEDX", "aula": "A000"},
+        ]
+        assert set(totals(session).values()) == {0}
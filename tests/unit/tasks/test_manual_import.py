@@ -0,0 +1,207 @@
+"""
+Unit tests for streaming manual imports
+"""
+
+import csv
+import io
+import json
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlmodel import Session, select
+
+from app.api.dependencies.auth import user_is_staff
+from app.main import app
+from app.modules.calendario.models import Calendario
+from app.modules.centro.models import CentroUniversitario
+from app.modules.seccion.models import Seccion
+from app.modules.tasks.services import manual_import
+from app.modules.tasks.services.manual_import import ManualImport
+
+URL = "/api/v1/tasks/importar-secciones-manual"
+FIELDS = [
+    "NRC",
+    "Clave",
+    "Materia",
+    "Sec",
+    "CR",
+    "CUP",
+    "DIS",
+    "Profesor",
+    "SesionNum",
+    "Horas",
+    "Dias",
+    "Edificio",
+    "Aula",
+    "Periodo",
+]
+
+
+def record(nrc: int, sesion: int = 1, **values) -> dict:
+    return {
+        "NRC": str(nrc),
+        "Clave": "I5247",
+        "Materia": "Cálculo",
+        "Sec": "D01",
+        "CR": 8,
+        "CUP": 40,
+        "DIS": 5,
+        "Profesor": "Pérez",
+        "SesionNum": str(sesion),
+        "Horas": "0700-0855",
+        "Dias": "L . I . . .",
+        "Edificio": "DEDX",
+        "Aula": "A001",
+        "Periodo": "18/08/25 - 12/12/25",
+        **values,
+    }
+
+
+def ndjson(*records) -> bytes:
+    return "".join(
+        (line if isinstance(line, str) else json.dumps(line)) + "\n" for line in records
+    ).encode()
+
+
+def to_csv(*records: dict) -> bytes:
+    text = io.StringIO()
+    writer = csv.DictWriter(text, fieldnames=FIELDS)
+    writer.writeheader()
+    writer.writerows(records)
+    return text.getvalue().encode()
+
+
+@pytest.mark.unit
+class TestManualImport:
+    """Test upload records are validated and batched by NRC as they are read"""
+
+    def test_batches_complete_secciones(self):
+        """Test the sessions of a seccion stay together across batches"""
+        body = ndjson(*(record(100000 + i // 2, i % 2 + 1) for i in range(14)))
+        upload = ManualImport(io.BytesIO(body), "ndjson", batch_size=3)
+
+        batches = list(upload)
+
+        assert [len(batch) for batch in batches] == [3, 3, 1]
+        assert all(
+            len(seccion.sesiones) == 2
+            for batch in batches
+            for seccion in batch.values()
+        )
+        assert upload.report() == {
+            "registros": 14,
+            "registros_invalidos": 0,
+            "lotes": 3,
+            "rechazados": [],
+        }
+
+    def test_rejects_invalid_records(self):
+        """Test bad lines are reported with their line number and skipped"""
+        body = ndjson(
+            record(100001),
+            "{not json",
+            record(100002, CR="ocho"),
+            record(100003),
+            record(100001, 2),
+        )
+        upload = ManualImport(io.BytesIO(body), "ndjson")
+
+        nrcs = [nrc for batch in upload for nrc in batch]
+
+        assert nrcs == ["100001", "100003"]
+        assert [rechazado["linea"] for rechazado in upload.rechazados] == [2, 3, 5]
+        assert "CR" in upload.rechazados[1]["error"]
+        assert "not consecutive" in upload.rechazados[2]["error"]
+
+    def test_reads_csv(self):
+        """Test CSV records are coerced like JSON ones"""
+        body = to_csv(record(100001), record(100001, 2, Horas="0900-1055"))
+
+        (batch,) = ManualImport(io.BytesIO(body), "csv")
+
+        seccion = batch["100001"]
+        assert (seccion.cr, seccion.cup, seccion.dis) == (8, 40, 5)
+        assert [sesion.numero for sesion in seccion.sesiones] == [1, 2]
+
+
+@pytest.mark.unit
+class TestManualImportEndpoint:
+    """Test the manual import endpoint accepts JSON, NDJSON and CSV"""
+
+    @pytest.fixture
+    def params(self, session: Session, test_superuser) -> dict:
+        centro = CentroUniversitario(name="CUCEI", siiau_id="D")
+        calendario = Calendario(name="2025 B", siiau_id="202520")
+        session.add_all([centro, calendario])
+        session.commit()
+        app.dependency_overrides[user_is_staff] = lambda: test_superuser
+        return {"calendario_id": calendario.id, "centro_id": centro.id}
+
+    def nrcs(self, session: Session) -> list[str]:
+        return sorted(session.exec(select(Seccion.nrc)).all())
+
+    def test_ndjson_body(self, client: TestClient, session: Session, params: dict):
+        """Test a raw NDJSON body is imported"""
+        response = client.post(
+            URL,
+            params=params,
+            content=ndjson(record(100001), record(100001, 2), record(100002)),
+            headers={"content-type": "application/x-ndjson"},
+        )
+
+        assert response.status_code == 200
+        assert response.json()["secciones_creadas"] == 2
+        assert response.json()["registros"] == 3
+        assert response.json()["terminado"] is True
+        assert self.nrcs(session) == ["100001", "100002"]
+
+    def test_csv_file(self, client: TestClient, session: Session, params: dict):
+        """Test a CSV file of a multipart form is imported"""
+        response = client.post(
+            URL,
+            params={**params, "full_update": True},
+            files={"archivo": ("oferta.csv", to_csv(record(100001)), "text/csv")},
+        )
+
+        assert response.status_code == 200
+        assert response.json()["clases_creadas"] == 2
+        assert self.nrcs(session) == ["100001"]
+
+    def test_progress(
+        self, client: TestClient, session: Session, params: dict, monkeypatch
+    ):
+        """Test progreso streams the totals after every batch"""
+        monkeypatch.setattr(manual_import, "IMPORT_BATCH_SIZE", 2)
+        body = ndjson(*(record(100000 + i) for i in range(5)))
+
+        response = client.post(
+            URL,
+            params={**params, "progreso": True},
+            files={"archivo": ("oferta.ndjson", body, "application/octet-stream")},
+        )
+
+        lines = [json.loads(line) for line in response.text.splitlines()]
+        assert response.headers["content-type"] == "application/x-ndjson"
+        assert [line["secciones_creadas"] for line in lines] == [2, 4, 5, 5]
+        assert [line["terminado"] for line in lines] == [False, False, False, True]
+        assert len(self.nrcs(session)) == 5
+
+    def test_json_body(self, client: TestClient, session: Session, params: dict):
+        """Test JSON lists are still accepted and validated"""
+        response = client.post(URL, params=params, json=[record(100001)])
+        invalid = client.post(URL, params=params, json={"NRC": "100002"})
+
+        assert response.status_code == 200
+        assert response.json()["secciones_creadas"] == 1
+        assert invalid.status_code == 422
+
+    def test_unsupported_format(self, client: TestClient, params: dict):
+        """Test uploads in other formats are refused"""
+        response = client.post(
+            URL,
+            params=params,
+            content=b"<xml/>",
+            headers={"content-type": "application/xml"},
+        )
+
+        assert response.status_code == 415
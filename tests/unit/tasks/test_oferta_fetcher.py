@@ -0,0 +1,88 @@
+"""
+Unit tests for paged oferta pulls
+"""
+
+import pytest
+
+from app.modules.tasks.services import oferta_fetcher
+from app.modules.tasks.services.cupos_parser import parse_cupos
+from app.modules.tasks.services.oferta_fetcher import OfertaPull
+from app.modules.tasks.services.siiau_client import SiiauClient
+from tests.siiau_server import SiiauServer
+
+
+def pull(server: SiiauServer, page_size: int, concurrency: int = 3) -> OfertaPull:
+    siiau = SiiauClient(url=server.url, retries=0, concurrency=concurrency)
+    return OfertaPull(
+        lambda limite, pagina: siiau.fetch_oferta("202520", "D", limite, pagina),
+        parse_cupos,
+        page_size=page_size,
+        concurrency=concurrency,
+    )
+
+
+@pytest.mark.unit
+class TestOfertaPull:
+    """Test pages are fetched concurrently, merged and checked for truncation"""
+
+    def test_merges_pages(self, siiau_server: SiiauServer):
+        """Test every seccion arrives once, page by page"""
+        oferta = pull(siiau_server, page_size=30)
+
+        pages = list(oferta)
+
+        assert [len(page) for page in pages] == [30, 30, 30, 10]
+        assert {nrc for page in pages for nrc in page} == {
+            str(100000 + i) for i in range(100)
+        }
+        assert not oferta.truncado
+        # Pages are requested up to the first empty one, at most a wave past it
+        pages = sorted(int(form["p"]) for form in siiau_server.requests)
+        assert pages[:5] == [1, 2, 3, 4, 5]
+        assert oferta.paginas == len(pages) <= 7
+
+    def test_detects_short_pages(self, siiau_server: SiiauServer):
+        """Test a page cut below the page size followed by more rows is reported"""
+        siiau_server.cap = 20
+
+        oferta = pull(siiau_server, page_size=30)
+        nrcs = {nrc for page in oferta for nrc in page}
+
+        assert len(nrcs) == 100
+        assert oferta.truncado
+
+    def test_detects_full_single_response(self, siiau_server: SiiauServer, monkeypatch):
+        """Test a single response filling the row limit is reported"""
+        monkeypatch.setattr(oferta_fetcher, "LIMITE", 50)
+
+        oferta = pull(siiau_server, page_size=0)
+
+        assert [len(page) for page in oferta] == [50]
+        assert oferta.report() == {"paginas_siiau": 1, "truncado": True}
+        assert "p" not in siiau_server.requests[0]
+
+    def test_falls_back_when_pages_repeat(self, tmp_path):
+        """Test a server ignoring the page number is read in one response"""
+        recorded = tmp_path / "oferta.html"
+        with SiiauServer(secciones=10) as server:
+            recorded.write_text(server.page({"mostrarp": "10"}))
+        with SiiauServer(recorded=recorded) as server:
+            oferta = pull(server, page_size=10, concurrency=1)
+
+            pages = list(oferta)
+
+            assert "p" not in server.requests[-1]
+        assert [len(page) for page in pages] == [10]
+        assert oferta.duplicados == 20
+        assert not oferta.truncado
+
+    def test_ignored_page_number(self):
+        """Test secciones past the first page arrive when SIIAU ignores ``p``"""
+        with SiiauServer(secciones=100, ignore_page=True) as server:
+            oferta = pull(server, page_size=30)
+
+            nrcs = {nrc for page in oferta for nrc in page}
+
+            assert "p" not in server.requests[-1]
+        assert nrcs == {str(100000 + i) for i in range(100)}
+        assert not oferta.truncado
@@ -0,0 +1,187 @@
+"""
+Unit tests for the typed oferta parser
+"""
+
+from datetime import datetime, time
+
+import pytest
+from bs4 import BeautifulSoup
+from fastapi.testclient import TestClient
+from sqlmodel import Session, func, select
+
+from app.api.dependencies.auth import user_is_staff
+from app.main import app
+from app.modules.calendario.models import Calendario
+from app.modules.centro.models import CentroUniversitario
+from app.modules.clase.models import Clase
+from app.modules.tasks.schemas.siiau import SeccionSiiau
+from app.modules.tasks.services import oferta_parser
+from app.modules.tasks.services.oferta_parser import (Sesion, group_siiau,
+                                                      oferta_rows, parse_dias,
+                                                      parse_horas,
+                                                      parse_oferta, sesion,
+                                                      split_rows)
+from app.modules.tasks.services.siiau_client import (SiiauClient,
+                                                     get_siiau_client)
+from app.modules.tasks.services.task_service import TasksService
+from tests.siiau_server import SiiauServer, generate_rows, render
+
+
+@pytest.mark.unit
+class TestOfertaParser:
+    """Test secciones are parsed into typed records grouped by NRC"""
+
+    def test_parses_sessions(self):
+        """Test the cells and the horario table of a row"""
+        html = (
+            "<table><tr><td>100001</td><td>I5247</td><td>CÁLCULO</td><td>D01</td>"
+            "<td>8</td><td>40</td><td>7</td><td><table>"
+            "<tr><td>01</td><td>0700-0855</td><td>L . I . . .</td><td>DEDX</td>"
+            "<td>A001</td><td>18/08/25 - 12/12/25</td></tr>"
+            "<tr><td>02</td><td>1100-1255</td><td>. . . . V .</td><td>DEDT</td>"
+            "<td>T001</td><td>18/08/25 - 12/12/25</td></tr></table></td>"
+            "<td><table><tr><td>01</td><td>PROFESOR UNO</td></tr></table></td></tr>"
+            "<tr><td>100002</td><td>I5247</td><td>CÁLCULO</td><td>D02</td>"
+            "<td>8</td><td>30</td><td>0</td><td></td><td></td></tr></table>"
+        )
+
+        secciones = parse_oferta(html)
+
+        uno, dos = secciones["100001"], secciones["100002"]
+        assert (uno.clave, uno.sec, uno.cr, uno.cup, uno.dis, uno.profesor) == (
+            "I5247",
+            "D01",
+            8,
+            40,
+            7,
+            "PROFESOR UNO",
+        )
+        assert uno.sesiones == [
+            Sesion(
+                1,
+                time(7, 0),
+                time(8, 55),
+                (1, 3),
+                "DEDX",
+                "A001",
+                datetime(2025, 8, 18),
+                datetime(2025, 12, 12),
+            ),
+            Sesion(
+                2,
+                time(11, 0),
+                time(12, 55),
+                (5,),
+                "DEDT",
+                "T001",
+                datetime(2025, 8, 18),
+                datetime(2025, 12, 12),
+            ),
+        ]
+        assert uno.periodo == (datetime(2025, 8, 18), datetime(2025, 12, 12))
+        assert (dos.sesiones, dos.periodo, dos.profesor) == ([], (None, None), "")
+
+    def test_matches_flat_rows(self, siiau_server: SiiauServer):
+        """Test records agree with the flat rows manual imports send"""
+        html = siiau_server.page({"mostrarp": "100"})
+        rows = TasksService.parse_table(None, BeautifulSoup(html, "html.parser"))
+
+        parsed = parse_oferta(html)
+        grouped = group_siiau(SeccionSiiau(**row) for row in rows)
+
+        assert len(parsed) == 100
+        assert list(parsed) == list(grouped)
+        for nrc, seccion in parsed.items():
+            for slot in type(seccion).__slots__:
+                assert getattr(seccion, slot) == getattr(grouped[nrc], slot)
+
+    def test_converts_each_string_once(self, siiau_server: SiiauServer):
+        """Test repeated horas and dias are served from the converters' caches"""
+        parse_horas.cache_clear()
+        parse_dias.cache_clear()
+
+        parse_oferta(siiau_server.page({"mostrarp": "100"}))
+
+        assert parse_horas.cache_info().hits > parse_horas.cache_info().misses
+        assert parse_dias.cache_info().hits > parse_dias.cache_info().misses
+
+    def test_unreadable_horas(self):
+        """Test a session whose horas cannot be read has no horario"""
+        unreadable = sesion(["01", "POR ASIGNAR", "L . . . . .", "DEDX", "", ""])
+
+        assert not unreadable.has_horario
+        assert (unreadable.edificio, unreadable.aula) == ("DEDX", None)
+
+
+@pytest.mark.unit
+class TestImportClases:
+    """Test full updates create the clases of the parsed sessions"""
+
+    def test_full_update(
+        self,
+        client: TestClient,
+        session: Session,
+        siiau_server: SiiauServer,
+        test_superuser,
+    ):
+        """Test one clase is created per session and day"""
+        centro = CentroUniversitario(name="CUCEI", siiau_id="D")
+        calendario = Calendario(name="2025 B", siiau_id="202520")
+        session.add_all([centro, calendario])
+        session.commit()
+        app.dependency_overrides[user_is_staff] = lambda: test_superuser
+        app.dependency_overrides[get_siiau_client] = lambda: SiiauClient(
+            url=siiau_server.url
+        )
+        expected = sum(
+            len(sesion.dias)
+            for seccion in parse_oferta(siiau_server.page({"mostrarp": "100"})).values()
+            for sesion in seccion.sesiones
+        )
+
+        response = client.get(
+            "/api/v1/tasks/actualizar-secciones",
+            params={
+                "calendario_id": calendario.id,
+                "centro_id": centro.id,
+                "full_update": True,
+            },
+        )
+
+        assert response.status_code == 200
+        assert response.json()["clases_creadas"] == expected
+        assert session.exec(select(func.count()).select_from(Clase)).one() == expected
+
+
+@pytest.mark.unit
+class TestParallelParse:
+    """Test large pages parsed in chunks give the rows of a serial parse"""
+
+    @pytest.fixture
+    def html(self) -> str:
+        # Unclosed cells, a nested table per row and a second table after it
+        rows = [row.replace("</td><td>", "<td>", 3) for _, row in generate_rows(300)]
+        return f"<p>Oferta</p>{render(rows)}<table><tr><td>999999</td></tr></table>"
+
+    @pytest.mark.parametrize("parts", [2, 3, 7, 1000])
+    def test_chunks_match_serial(self, html: str, parts: int):
+        """Test the chunks hold every row once, in order"""
+        chunks = split_rows(html, parts)
+
+        # 300 secciones and the header row
+        assert len(chunks) == min(parts, 301)
+        assert [row for chunk in chunks for row in oferta_rows(chunk)] == (
+            oferta_rows(html)
+        )
+
+    def test_process_pool(self, html: str):
+        """Test pages over the threshold are parsed in other processes"""
+        assert oferta_rows(html, processes=2, threshold=0) == oferta_rows(html)
+
+    def test_small_pages_in_place(self, html: str, monkeypatch):
+        """Test pages under the threshold never reach the pool"""
+        monkeypatch.setattr(oferta_parser, "_get_pool", None)
+
+        rows = oferta_rows(html, processes=2, threshold=len(html) + 1)
+
+        assert len(rows) == 300
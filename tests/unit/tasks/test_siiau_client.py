@@ -0,0 +1,151 @@
+"""
+Unit tests for the SIIAU HTTP client
+"""
+
+import pytest
+import requests
+from fastapi import HTTPException
+
+from app.modules.tasks.services import siiau_client
+from app.modules.tasks.services.siiau_client import CircuitBreaker, SiiauClient
+
+
+def response(status: int, text: str = "", headers: dict | None = None):
+    result = requests.Response()
+    result.status_code = status
+    result._content = text.encode()
+    result.encoding = "utf-8"
+    result.headers.update(headers or {})
+    return result
+
+
+class ScriptedSession:
+    """Stands in for requests.Session, answering POSTs from a script"""
+
+    def __init__(self, *outcomes):
+        self.outcomes = list(outcomes)
+        self.calls = []
+
+    def post(self, url, data=None, timeout=None):
+        self.calls.append({"url": url, "data": data, "timeout": timeout})
+        outcome = self.outcomes.pop(0)
+        if isinstance(outcome, Exception):
+            raise outcome
+        return outcome
+
+
+@pytest.fixture(name="sleeps")
+def sleeps_fixture(monkeypatch) -> list[float]:
+    """Backoff delays, recorded instead of slept"""
+    delays = []
+    monkeypatch.setattr(siiau_client.time, "sleep", delays.append)
+    return delays
+
+
+def client(*outcomes, retries: int = 2, breaker: CircuitBreaker | None = None):
+    result = SiiauClient(
+        url="http://siiau.test/oferta",
+        connect_timeout=1,
+        read_timeout=2,
+        retries=retries,
+        backoff=0.5,
+        backoff_max=4,
+        breaker=breaker or CircuitBreaker(threshold=2, reset_timeout=60),
+    )
+    result.session = ScriptedSession(*outcomes)
+    return result
+
+
+@pytest.mark.unit
+class TestSiiauClient:
+    """Test timeouts, retries and the circuit breaker"""
+
+    def test_pooled_session_with_gzip(self):
+        """Test the real session asks for gzip and pools connections"""
+        siiau = SiiauClient(url="http://siiau.test", pool_size=3)
+
+        adapter = siiau.session.get_adapter("https://siiau.test")
+        assert "gzip" in siiau.session.headers["Accept-Encoding"]
+        assert adapter._pool_maxsize == 3
+        assert adapter.max_retries.total == 0
+
+    def test_fetch_oferta(self, sleeps):
+        """Test the oferta form and both timeouts are sent"""
+        siiau = client(response(200, "<table></table>"))
+
+        assert siiau.fetch_oferta("202520", "D", 500) == "<table></table>"
+        assert siiau.session.calls == [
+            {
+                "url": "http://siiau.test/oferta",
+                "data": {"ciclop": "202520", "cup": "D", "mostrarp": 500},
+                "timeout": (1, 2),
+            }
+        ]
+        assert sleeps == []
+
+    def test_retries_with_jittered_backoff(self, sleeps):
+        """Test timeouts and 5xx are retried within growing jitter bounds"""
+        siiau = client(
+            requests.ReadTimeout("read timed out"),
+            response(502),
+            response(200, "ok"),
+        )
+
+        assert siiau.post({}) == "ok"
+        assert len(siiau.session.calls) == 3
+        assert 0 <= sleeps[0] <= 0.5 and 0 <= sleeps[1] <= 1
+
+    def test_honors_retry_after(self, sleeps):
+        """Test throttling responses wait what SIIAU asks, up to the cap"""
+        siiau = client(
+            response(429, headers={"Retry-After": "3"}),
+            response(503, headers={"Retry-After": "120"}),
+            response(200, "ok"),
+        )
+
+        assert siiau.post({}) == "ok"
+        assert sleeps == [3, 4]
+
+    def test_gives_up(self, sleeps):
+        """Test exhausted retries raise 502 and client errors are not retried"""
+        siiau = client(*(response(500) for _ in range(3)))
+
+        with pytest.raises(HTTPException) as error:
+            siiau.post({})
+        assert error.value.status_code == 502
+        assert len(siiau.session.calls) == 3
+
+        siiau = client(response(404))
+        with pytest.raises(HTTPException) as error:
+            siiau.post({})
+        assert error.value.status_code == 502
+        assert len(siiau.session.calls) == 1
+
+    def test_circuit_breaker(self, sleeps, monkeypatch):
+        """Test the breaker fails fast while open and closes after a good trial"""
+        now = [1000.0]
+        monkeypatch.setattr(siiau_client.time, "monotonic", lambda: now[0])
+        breaker = CircuitBreaker(threshold=2, reset_timeout=60)
+        down = requests.ConnectionError("refused")
+        siiau = client(
+            down, down, down, response(200, "ok"), retries=0, breaker=breaker
+        )
+
+        for _ in range(2):
+            with pytest.raises(HTTPException):
+                siiau.post({})
+        with pytest.raises(HTTPException) as error:
+            siiau.post({})
+
+        assert error.value.status_code == 503
+        assert len(siiau.session.calls) == 2
+
+        now[0] += 61
+        with pytest.raises(HTTPException) as error:
+            siiau.post({})
+        assert error.value.status_code == 502
+        assert breaker.is_open
+
+        now[0] += 61
+        assert siiau.post({}) == "ok"
+        assert not breaker.is_open
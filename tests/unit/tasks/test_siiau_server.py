@@ -0,0 +1,106 @@
+"""
+Unit tests for the import against the local SIIAU stand-in
+"""
+
+import pytest
+from fastapi import HTTPException
+from fastapi.testclient import TestClient
+from sqlmodel import Session, func, select
+
+from app.api.dependencies.auth import user_is_staff
+from app.main import app
+from app.modules.calendario.models import Calendario
+from app.modules.centro.models import CentroUniversitario
+from app.modules.seccion.models import Seccion
+from app.modules.tasks.services.cupos_parser import parse_cupos
+from app.modules.tasks.services.siiau_client import (CircuitBreaker,
+                                                     SiiauClient,
+                                                     get_siiau_client)
+from tests.siiau_server import Faults, SiiauServer
+
+
+def siiau(server: SiiauServer, retries: int = 2, read_timeout: float = 5):
+    return SiiauClient(
+        url=server.url,
+        read_timeout=read_timeout,
+        retries=retries,
+        backoff=0.01,
+        breaker=CircuitBreaker(threshold=5, reset_timeout=60),
+    )
+
+
+@pytest.mark.unit
+class TestSiiauServer:
+    """Test the stand-in answers the oferta form like SIIAU"""
+
+    def test_pages_and_cap(self, siiau_server: SiiauServer):
+        """Test mostrarp, p, crsep and the silent row cap"""
+        client = siiau(siiau_server)
+
+        everything = parse_cupos(client.fetch_oferta("202520", "D", 15000))
+        second = parse_cupos(client.post({"mostrarp": 30, "p": 2}))
+        clave = parse_cupos(client.post({"crsep": "I0003", "mostrarp": 500}))
+        siiau_server.cap = 40
+        capped = parse_cupos(client.fetch_oferta("202520", "D", 15000))
+
+        assert len(everything) == 100
+        assert list(second) == [str(100030 + i) for i in range(30)]
+        assert list(clave) == ["100012", "100013", "100014", "100015"]
+        assert len(capped) == 40
+        assert siiau_server.requests[0] == {
+            "ciclop": "202520",
+            "cup": "D",
+            "mostrarp": "15000",
+        }
+
+    def test_retries_injected_faults(self, siiau_server: SiiauServer):
+        """Test throttling and 5xx are retried until the page arrives"""
+        siiau_server.faults = Faults(throttle_rate=0.5, error_rate=0.5, seed=3)
+
+        page = siiau(siiau_server, retries=10).fetch_oferta("202520", "D")
+
+        assert len(parse_cupos(page)) == 100
+        assert len(siiau_server.requests) > 1
+
+    @pytest.mark.parametrize(
+        "faults",
+        [Faults(error_rate=1), Faults(truncate_rate=1), Faults(latency=0.3)],
+        ids=["5xx", "truncated", "timeout"],
+    )
+    def test_gives_up(self, siiau_server: SiiauServer, faults: Faults):
+        """Test persistent errors, cut bodies and timeouts end in a 502"""
+        siiau_server.faults = faults
+
+        with pytest.raises(HTTPException) as error:
+            siiau(siiau_server, read_timeout=0.1).fetch_oferta("202520", "D")
+
+        assert error.value.status_code == 502
+        assert len(siiau_server.requests) == 3
+
+
+@pytest.mark.unit
+class TestImportEndToEnd:
+    """Test the import task against the stand-in"""
+
+    def test_importar_secciones(
+        self,
+        client: TestClient,
+        session: Session,
+        siiau_server: SiiauServer,
+        test_superuser,
+    ):
+        """Test every generated seccion is imported through the SIIAU client"""
+        centro = CentroUniversitario(name="CUCEI", siiau_id="D")
+        calendario = Calendario(name="2025 B", siiau_id="202520")
+        session.add_all([centro, calendario])
+        session.commit()
+        app.dependency_overrides[user_is_staff] = lambda: test_superuser
+        app.dependency_overrides[get_siiau_client] = lambda: siiau(siiau_server)
+
+        response = client.get(
+            "/api/v1/tasks/importar-secciones",
+            params={"calendario_id": calendario.id, "centro_id": centro.id},
+        )
+
+        assert response.status_code == 200
+        assert session.exec(select(func.count()).select_from(Seccion)).one() == 100
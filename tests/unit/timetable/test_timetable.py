@@ -0,0 +1,244 @@
+"""
+Unit tests for the timetable builder
+"""
+
+import json
+from datetime import time
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlmodel import Session
+
+from app.modules.calendario.models import Calendario
+from app.modules.centro.models import CentroUniversitario
+from app.modules.clase.models import Clase
+from app.modules.materia.models import Materia
+from app.modules.profesor.models import Profesor
+from app.modules.seccion.models import Seccion
+from app.modules.seccion.slots import clase_mask, schedule_mask, span
+from app.modules.timetable.services.solver import Option, solve
+
+
+@pytest.fixture(name="offer")
+def offer_fixture(session: Session) -> dict:
+    """
+    Two materias: I5247 with secciones on lunes/miércoles 07:00 and 09:00 and
+    sábado 07:00, I5248 with secciones on lunes 07:00 and martes 09:00.
+    """
+    centro = CentroUniversitario(name="CUCEI", siiau_id="D")
+    calendario = Calendario(name="2025 B", siiau_id="202520")
+    profesor = Profesor(name="Pérez")
+    calculo = Materia(name="Cálculo", creditos=8, clave="I5247")
+    algebra = Materia(name="Álgebra", creditos=8, clave="I5248")
+    session.add_all([centro, calendario, profesor, calculo, algebra])
+    session.flush()
+
+    schedules = [
+        (calculo, "D01", [(1, 7), (3, 7)], None),
+        (calculo, "D02", [(1, 9), (3, 9)], profesor.id),
+        (calculo, "D03", [(6, 7)], None),
+        (algebra, "D01", [(1, 7)], None),
+        (algebra, "D02", [(2, 9)], None),
+    ]
+    for position, (materia, name, clases, profesor_id) in enumerate(schedules):
+        seccion = Seccion(
+            name=name,
+            nrc=f"{100000 + position}",
+            cupos=40,
+            cupos_disponibles=10,
+            centro_id=centro.id,
+            materia_id=materia.id,
+            profesor_id=profesor_id,
+            calendario_id=calendario.id,
+        )
+        session.add(seccion)
+        session.flush()
+        for sesion, (dia, hora) in enumerate(clases, start=1):
+            session.add(
+                Clase(
+                    sesion=sesion,
+                    dia=dia,
+                    hora_inicio=time(hora, 0),
+                    hora_fin=time(hora + 1, 55),
+                    seccion_id=seccion.id,
+                )
+            )
+    session.commit()
+    return {
+        "calendario_id": calendario.id,
+        "centro_id": centro.id,
+        "profesor_id": profesor.id,
+    }
+
+
+def lines(response) -> list[dict]:
+    return [json.loads(line) for line in response.text.splitlines()]
+
+
+@pytest.mark.unit
+class TestSlots:
+    """Test weekly slot masks"""
+
+    def test_overlapping_clases_share_cells(self):
+        """Test clases overlap exactly when their masks share a bit"""
+        a = clase_mask(1, time(7, 0), time(8, 55))
+        b = clase_mask(1, time(8, 30), time(9, 55))
+        c = clase_mask(1, time(9, 0), time(10, 55))
+        d = clase_mask(2, time(7, 0), time(8, 55))
+
+        assert a & b
+        assert not a & c
+        assert not a & d
+
+    def test_span_counts_gaps(self):
+        """Test span covers the cells between the first and last clase of a dia"""
+        mask = schedule_mask(
+            [(1, time(7, 0), time(8, 0)), (1, time(10, 0), time(11, 0))]
+        )
+
+        assert span(mask) == 8
+
+
+@pytest.mark.unit
+class TestSolver:
+    """Test the branch and bound search"""
+
+    def test_conflicting_options_are_never_combined(self):
+        """Test only conflict-free combinations are returned"""
+        lunes = clase_mask(1, time(7, 0), time(8, 55))
+        martes = clase_mask(2, time(7, 0), time(8, 55))
+        groups = [[Option(mask=lunes)], [Option(mask=lunes), Option(mask=martes)]]
+
+        solutions, finished = solve(groups, limit=10)
+
+        assert finished
+        assert len(solutions) == 1
+        assert solutions[0].options[1].mask == martes
+
+    def test_results_are_ranked(self):
+        """Test fewer dias rank first and preferences outrank dias"""
+        lunes = clase_mask(1, time(7, 0), time(8, 55))
+        lunes_tarde = clase_mask(1, time(9, 0), time(10, 55))
+        martes = clase_mask(2, time(7, 0), time(8, 55))
+        groups = [
+            [Option(mask=lunes)],
+            [Option(mask=martes, preferred=True), Option(mask=lunes_tarde)],
+        ]
+
+        solutions, _ = solve(groups, limit=10)
+
+        assert [solution.cost[:2] for solution in solutions] == [(0, 2), (1, 1)]
+
+    def test_node_budget(self):
+        """Test an exhausted budget reports an unfinished search"""
+        groups = [
+            [Option(mask=clase_mask(dia, time(7, 0), time(8, 55)))]
+            for dia in range(1, 7)
+        ]
+
+        solutions, finished = solve(groups, limit=10, max_nodes=3)
+
+        assert not finished
+        assert solutions == []
+
+
+@pytest.mark.unit
+class TestTimetableEndpoint:
+    """Test the timetable endpoint"""
+
+    url = "/api/v1/timetables/"
+
+    def test_streams_ranked_timetables(self, client: TestClient, offer: dict):
+        """Test results stream as NDJSON, fewest dias first"""
+        response = client.get(
+            self.url,
+            params={
+                "calendario_id": offer["calendario_id"],
+                "centro_id": offer["centro_id"],
+                "claves": "I5247,I5248",
+            },
+        )
+
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("application/x-ndjson")
+        assert response.headers["x-search-complete"] == "true"
+        results = lines(response)
+        # D01+D01 overlap on lunes 07:00
+        assert len(results) == 5
+        assert [result["rank"] for result in results] == [1, 2, 3, 4, 5]
+        assert results[0]["dias"] == 2
+        assert results[0]["materias"][0]["clave"] == "I5247"
+        assert [result["dias"] for result in results] == sorted(
+            result["dias"] for result in results
+        )
+
+    def test_documents_ndjson(self, client: TestClient):
+        """Test the OpenAPI schema describes the NDJSON lines, not a JSON array"""
+        operation = client.get("/openapi.json").json()["paths"][self.url]["get"]
+        content = operation["responses"]["200"]["content"]
+
+        assert list(content) == ["application/x-ndjson"]
+        assert content["application/x-ndjson"]["schema"]["title"] == "TimetableResult"
+
+    def test_constraints(self, client: TestClient, offer: dict):
+        """Test excluded dias and hour ranges drop secciones"""
+        response = client.get(
+            self.url,
+            params={
+                "calendario_id": offer["calendario_id"],
+                "centro_id": offer["centro_id"],
+                "claves": "I5247,I5248",
+                "dias_excluidos": "6",
+                "hora_desde": "08:00",
+            },
+        )
+
+        results = lines(response)
+        assert len(results) == 1
+        names = [m["secciones"][0]["name"] for m in results[0]["materias"]]
+        assert names == ["D02", "D02"]
+
+    def test_preferred_profesor_ranks_first(self, client: TestClient, offer: dict):
+        """Test timetables with preferred profesores come first"""
+        response = client.get(
+            self.url,
+            params={
+                "calendario_id": offer["calendario_id"],
+                "centro_id": offer["centro_id"],
+                "claves": "I5247,I5248",
+                "profesores": str(offer["profesor_id"]),
+                "limit": 2,
+            },
+        )
+
+        results = lines(response)
+        assert len(results) == 2
+        assert results[0]["preferidos"] == 1
+        assert results[0]["materias"][0]["secciones"][0]["profesor"] == "Pérez"
+
+    def test_unknown_clave(self, client: TestClient, offer: dict):
+        """Test unknown materias return 404"""
+        response = client.get(
+            self.url,
+            params={
+                "calendario_id": offer["calendario_id"],
+                "centro_id": offer["centro_id"],
+                "claves": "I5247,X0000",
+            },
+        )
+
+        assert response.status_code == 404
+
+    def test_invalid_list(self, client: TestClient, offer: dict):
+        """Test malformed integer lists return 400"""
+        response = client.get(
+            self.url,
+            params={
+                "calendario_id": offer["calendario_id"],
+                "centro_id": offer["centro_id"],
+                "claves": "I5247",
+                "dias_excluidos": "lunes",
+            },
+        )
+
+        assert response.status_code == 400